@@ -41,3 +41,9 @@ value = mbox('Enter the joint to attach an object', entry='3')
 link_id = int(value)
 link = robot.ObjectLink(link_id)
 link.AddShape(tr(Mat(SHAPE)) * 200)  # scale vertices with a factor of 100
+
+##### Mesh files can also be loaded and prepared with NumPy before adding them (requires NumPy):
+#from robodk import robomesh
+#mesh = robomesh.readMesh(getOpenFileName(strfile='', strtitle='Select a mesh file', defaultextension='.stl', filetypes=[('Mesh files', '.stl .ply .obj')]))
+#mesh = mesh.weld(0.01)  # merge vertices closer than 0.01 mm
+#new_object = RDK.AddShape(mesh.triangles(normals=True))
@@ -29,15 +29,17 @@ def joints_changed(j1, j2, tolerance=0.0001):
 
 
 # Infinite loop to record robot joints
+# The subscription provides timestamped samples while the robot moves (up to 100 samples per second)
 joints_last = None
 print("Recording robot joints to file: " + file_path)
-with open(file_path, 'a') as fid:
-    tic()
-    while True:
-        time = toc()
-        joints = robot.Joints().list()
+with open(file_path, 'a') as fid, RDK.Subscribe([robot], ['joints'], rate_hz=100) as subscription:
+    time_start = None
+    for sample in subscription:
+        if time_start is None:
+            time_start = sample['time']
+        time = sample['time'] - time_start
+        joints = sample['joints'][0].list()
         if joints_changed(joints, joints_last):
             print('Time (s): ' + str(time))
             fid.write(str(joints)[1:-1] + (", %.3f" % time) + '\n')
             joints_last = joints
-            pause(0.01)
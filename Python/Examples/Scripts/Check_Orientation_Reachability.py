@@ -33,24 +33,26 @@ robot_tool = robot.PoseTool()
 robot_base = robot.PoseFrame()
 robot_joints = robot.Joints()
 
-# Iterate through all pose combinations and collect all valid poses
-reachable_poses = []
-unreachable_poses = []
+# Iterate through all pose combinations
+poses_test = []
 for rx in Range_RX:
     for ry in Range_RY:
         for rz in Range_RZ:
-            print("Testing rotation: " + str([rx, ry, rz]))
             pose_add = rotx(rx * pi / 180) * roty(ry * pi / 180) * rotz(rz * pi / 180)
-            pose_test = robot_pose_ref * pose_add
-            jnts_sol = robot.SolveIK(pose_test, None, robot_tool, robot_base)
-            print(jnts_sol.list())
-            if len(jnts_sol.list()) <= 1:
-                print("Not reachable")
-                unreachable_poses.append(pose_test)
-                #reachable_poses.append(pose_test)
-            else:
-                print("Reachable")
-                reachable_poses.append(pose_test)
+            poses_test.append(robot_pose_ref * pose_add)
+
+# Solve the inverse kinematics for all poses at once and collect all valid poses
+print("Testing %i orientations" % len(poses_test))
+jnts_sols = robot.SolveIK_Batch(poses_test, None, robot_tool, robot_base)
+reachable_poses = []
+unreachable_poses = []
+for pose_test, jnts_sol in zip(poses_test, jnts_sols):
+    if len(jnts_sol.list()) <= 1:
+        unreachable_poses.append(pose_test)
+    else:
+        reachable_poses.append(pose_test)
+
+print("Reachable: %i, not reachable: %i" % (len(reachable_poses), len(unreachable_poses)))
 
 # Display "ghost" tools in RoboDK
 Display_Default = 1
@@ -0,0 +1,348 @@
+# Copyright 2015-2026 - RoboDK Inc. - https://robodk.com/
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# --------------------------------------------
+# --------------- DESCRIPTION ----------------
+"""This module implements a client for RoboDK events.
+
+RobolinkEvents listens to RoboDK events (EVENT_* in :mod:`~robodk.robolink`) on a dedicated connection and calls the handlers registered for each event type from a background thread.
+Events are decoded in :class:`Event` objects that hold the event data. The item of each event is bound to the Robolink instance provided, so handlers can use it directly.
+
+Frequent events, such as EVENT_ITEM_MOVED_POSE while an object is dragged, are coalesced: if several events of the same type and item are waiting to be handled, only the last one is dispatched.
+
+Listening to specific events (filter_events or handlers registered for specific event types only) requires RoboDK v5.6.4 or later.
+
+.. code-block:: python
+
+    from robodk.robolink import *
+    from robodk.roboevents import RobolinkEvents
+
+    RDK = Robolink()
+
+    def on_moved(event):
+        print(event.item.Name() + ' moved to ' + str(event.pose.Pos()))
+
+    def on_key(event):
+        print('Key ' + str(event.key) + (' pressed' if event.pressed else ' released'))
+
+    events = RobolinkEvents(RDK)
+    events.addHandler(on_moved, EVENT_ITEM_MOVED_POSE)
+    events.addHandler(on_key, EVENT_KEY)
+    events.Start()
+    events.Loop()
+
+More information about the RoboDK API for Python here:
+
+* https://robodk.com/doc/en/RoboDK-API.html
+* https://robodk.com/doc/en/PythonAPI/index.html
+"""
+# --------------------------------------------
+import threading
+import time
+import traceback
+from typing import List
+
+from robodk import robolink, robomath
+from robodk.robolink import EVENT_ITEM_MOVED_POSE, EVENT_3DVIEW_MOVED, EVENT_ROBOT_MOVED
+
+
+class Event:
+    """RoboDK event. Events with additional data are decoded in a subclass of Event.
+
+    :ivar int type: Event type (EVENT_*)
+    :ivar item: Item related to the event (it is not valid if the event is not related to an item)
+    :vartype item: :class:`~robodk.robolink.Item`
+    :ivar float time: Time the event was received (time.time())
+    """
+
+    def __init__(self, event_type: int, item: robolink.Item):
+        self.type = event_type
+        self.item = item
+        self.time = time.time()
+
+    def __repr__(self):
+        return '%s(type=%i, item=%i)' % (type(self).__name__, self.type, self.item.item)
+
+    def _rec(self, link: robolink.Robolink):
+        """Receives the additional data of the event"""
+        pass
+
+
+class SelectionEvent(Event):
+    """EVENT_SELECTION_3D_CHANGED: the selection in the 3D view changed.
+
+    :ivar pose_abs: Absolute pose of the selected item
+    :vartype pose_abs: :class:`~robodk.robomath.Mat`
+    :ivar list xyz: Selected point, with respect to the item
+    :ivar list ijk: Normal of the selected point
+    :ivar int feature_type: Type of the selected feature
+    :ivar int feature_id: Index of the selected feature
+    """
+
+    def _rec(self, link):
+        data = link._rec_array().list()
+        self.pose_abs = robomath.Mat([data[0:4], data[4:8], data[8:12], data[12:16]]).tr()
+        self.xyz = data[16:19]
+        self.ijk = data[19:22]
+        self.feature_type = int(data[22])
+        self.feature_id = int(data[23])
+
+
+class KeyEvent(Event):
+    """EVENT_KEY: a key was pressed or released.
+
+    :ivar bool pressed: True if the key was pressed, False if it was released
+    :ivar int key: Key id, as defined by Qt (Qt::Key)
+    :ivar int modifiers: Modifier flags, as defined by Qt (Qt::KeyboardModifier)
+    """
+
+    def _rec(self, link):
+        self.pressed = link._rec_int() > 0
+        self.key = link._rec_int()
+        self.modifiers = link._rec_int()
+
+
+class ItemMovedEvent(Event):
+    """EVENT_ITEM_MOVED_POSE: an item moved.
+
+    :ivar pose: Pose of the item with respect to its parent
+    :vartype pose: :class:`~robodk.robomath.Mat`
+    """
+
+    def _rec(self, link):
+        nvalues = link._rec_int()
+        self.pose = link._rec_pose()
+        if nvalues > 16:
+            # Values added by future versions of RoboDK
+            link._recv_exact(8 * (nvalues - 16))
+
+
+class CalibMeasurementEvent(Event):
+    """EVENT_CALIB_MEASUREMENT: a robot calibration measurement changed.
+
+    :ivar int status: 0 if the robot is moving to the next point, 1 if the robot completed the movement and 2 if the measurement is done
+    :ivar int measure_id: Measurement number (the first measurement is 1)
+    """
+
+    def _rec(self, link):
+        data = link._rec_array().list()
+        self.status = int(data[0])
+        self.measure_id = int(data[1])
+
+
+class ItemRenamedEvent(Event):
+    """EVENT_ITEM_RENAMED: the name of an item changed.
+
+    :ivar str name: New name of the item
+    """
+
+    def _rec(self, link):
+        self.name = link._rec_line()
+
+
+class VisibilityEvent(Event):
+    """EVENT_ITEM_VISIBILITY: the visibility state of an item changed.
+
+    :ivar int visible: Visibility of the item
+    :ivar int visible_frame: Visibility of the reference frame of the item
+    """
+
+    def _rec(self, link):
+        data = link._rec_array().list()
+        self.visible = int(data[0])
+        self.visible_frame = int(data[1])
+
+
+class ProgSliderEvent(Event):
+    """EVENT_PROGSLIDER_SET: the index of a program slider changed.
+
+    :ivar int index: Index of the program slider
+    """
+
+    def _rec(self, link):
+        self.index = link._rec_int()
+
+
+EVENT_CLASSES = {
+    robolink.EVENT_SELECTION_3D_CHANGED: SelectionEvent,
+    robolink.EVENT_KEY: KeyEvent,
+    robolink.EVENT_ITEM_MOVED_POSE: ItemMovedEvent,
+    robolink.EVENT_CALIB_MEASUREMENT: CalibMeasurementEvent,
+    robolink.EVENT_ITEM_RENAMED: ItemRenamedEvent,
+    robolink.EVENT_ITEM_VISIBILITY: VisibilityEvent,
+    robolink.EVENT_PROGSLIDER_SET: ProgSliderEvent,
+}  #: Event class of the events that provide additional data
+
+COALESCED_EVENTS = [EVENT_ITEM_MOVED_POSE, EVENT_3DVIEW_MOVED, EVENT_ROBOT_MOVED]  #: Events coalesced by default
+
+
+class RobolinkEvents:
+    """Client for RoboDK events. Events are received on a dedicated connection by a background thread and dispatched to the handlers by a second thread, so slow handlers do not block the connection.
+
+    :param link: Robolink instance the items of the events are bound to (a new Robolink instance is created if None)
+    :type link: :class:`~robodk.robolink.Robolink`
+    :param filter_events: Events to listen to (EVENT_*). If None, RoboDK reports the events of the registered handlers when the client starts (all events if a handler is registered for all events).
+    :type filter_events: list of int
+    :param coalesce: Events coalesced per item: only the last event is dispatched if several events are waiting
+    :type coalesce: list of int
+    :param coalesce_interval: Minimum time between two dispatches of coalesced events, in seconds
+    :type coalesce_interval: float
+
+    .. seealso:: :func:`~robodk.robolink.Robolink.Subscribe`
+    """
+
+    def __init__(self, link: robolink.Robolink = None, filter_events: List[int] = None, coalesce: List[int] = COALESCED_EVENTS, coalesce_interval: float = 0.02):
+        self.link = link if link is not None else robolink.Robolink()
+        self.filter_events = filter_events
+        self.coalesce = set(coalesce)
+        self.coalesce_interval = coalesce_interval
+        self.error = None
+        self._handlers = {}  # event type (None for all events) -> list of handlers
+        self._events = None
+        self._pending = []  # events waiting to be dispatched
+        self._pending_key = {}  # (event type, item pointer) -> index in _pending, for coalesced events
+        self._condition = threading.Condition()
+        self._running = False
+        self._reader = None
+        self._dispatcher = None
+
+    def __enter__(self):
+        self.Start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Stop()
+
+    def addHandler(self, handler, event_type: int = None):
+        """Registers a handler called with each :class:`Event` of a type (EVENT_*). If event_type is None, the handler is called for all events.
+        Handlers are called in the order they were registered, from the dispatch thread."""
+        self._handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def removeHandler(self, handler, event_type: int = None):
+        """Removes a handler registered with :func:`addHandler`"""
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def Start(self):
+        """Opens the event connection and starts the event threads. An exception is raised if the event channel can't be started (RoboDK v5.6.4 or later is required to filter events)."""
+        if self._running:
+            return
+
+        filter_events = self.filter_events
+        if filter_events is None:
+            # Listen to all events (no filter) if a handler is registered for all events
+            filter_events = None if self._handlers.get(None) else [evt for evt in self._handlers if evt is not None]
+
+        self._events = self.link._events_connect(filter_events)
+        self._events._item_link = self.link
+        self._running = True
+        self.error = None
+        self._reader = threading.Thread(target=self._read)
+        self._reader.daemon = True
+        self._reader.start()
+        self._dispatcher = threading.Thread(target=self._dispatch)
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def Stop(self):
+        """Closes the event connection and stops the event threads. Events waiting to be dispatched are discarded."""
+        if not self._running:
+            return
+
+        with self._condition:
+            self._running = False
+            self._pending = []
+            self._pending_key = {}
+            self._condition.notify_all()
+
+        try:
+            # Unblock the reader thread before closing the socket
+            import socket
+            self._events.COM.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        self._events.Disconnect()
+        for thread in [self._reader, self._dispatcher]:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def Loop(self):
+        """Blocks until the event connection is closed (by RoboDK or with :func:`Stop`). Raises the error of the event connection, if any."""
+        if self._reader is not None:
+            while self._reader.is_alive():
+                self._reader.join(0.5)
+            self._dispatcher.join()
+        if self.error is not None:
+            raise self.error
+
+    def _read(self):
+        """Receives the events until the event connection is closed"""
+        try:
+            while True:
+                evt = self._events._rec_int()
+                item = self._events._rec_item()
+                event = EVENT_CLASSES.get(evt, Event)(evt, item)
+                event._rec(self._events)
+                self._post(event)
+
+        except Exception as e:
+            if self._running:
+                self.error = e
+
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+
+    def _post(self, event: Event):
+        """Adds an event to the events waiting to be dispatched. A waiting event of the same type and item is replaced if the event is coalesced."""
+        with self._condition:
+            if event.type in self.coalesce:
+                key = (event.type, event.item.item)
+                index = self._pending_key.get(key)
+                if index is not None:
+                    self._pending[index] = event
+                    return
+                self._pending_key[key] = len(self._pending)
+            self._pending.append(event)
+            self._condition.notify()
+
+    def _dispatch(self):
+        """Calls the handlers of the events until the client stops"""
+        last_coalesced = 0
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running and not self._pending:
+                    return
+                coalesced = any(event.type in self.coalesce for event in self._pending)
+
+            # Give coalesced events some time to accumulate
+            delay = last_coalesced + self.coalesce_interval - time.perf_counter()
+            if coalesced and delay > 0:
+                time.sleep(delay)
+
+            with self._condition:
+                events = self._pending
+                self._pending = []
+                self._pending_key = {}
+
+            for event in events:
+                if event.type in self.coalesce:
+                    last_coalesced = time.perf_counter()
+                for handler in self._handlers.get(event.type, []) + self._handlers.get(None, []):
+                    try:
+                        handler(event)
+                    except Exception:
+                        traceback.print_exc()
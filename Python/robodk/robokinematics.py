@@ -0,0 +1,509 @@
+# Copyright 2015-2024 - RoboDK Inc. - https://robodk.com/
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# --------------------------------------------
+# --------------- DESCRIPTION ----------------
+"""This module calculates the kinematics of serial robots defined by Denavit-Hartenberg parameters
+(forward kinematics, Jacobian and inverse kinematics) without a connection to RoboDK.
+
+The robot model can be defined from a DH or DHM table (see :func:`~robodk.robomath.dh` and :func:`~robodk.robomath.dhm`)
+or retrieved once from a robot in RoboDK (see :func:`~robodk.robokinematics.RobotKinematics.fromItem`).
+Calculations are vectorized with NumPy, which is required by this module (pip install robodk[kinematics]).
+
+Joint values are provided in degrees and poses in mm, as in the RoboDK API.
+
+Example:
+
+.. code-block:: python
+
+    from robodk.robolink import *
+    from robodk.robokinematics import RobotKinematics
+
+    RDK = Robolink()
+    robot = RDK.Item('', ITEM_TYPE_ROBOT)
+    kin = RobotKinematics.fromItem(robot)
+
+    # Check the reachability of a path without calling RoboDK
+    joints = kin.SolveIK(poses_numpy, robot.Joints().list())
+
+More information about the RoboDK API for Python here:
+
+* https://robodk.com/doc/en/RoboDK-API.html
+* https://robodk.com/doc/en/PythonAPI/index.html
+"""
+# --------------------------------------------
+import sys
+import math
+from robodk import robomath
+
+import numpy as np
+
+if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
+    # Python 3.5+ type hints. Type hints are stripped for <3.5
+    from typing import List, Union, Tuple
+
+_EPS = 1e-9
+
+
+def _rotx(rx) -> np.ndarray:
+    c, s = math.cos(rx), math.sin(rx)
+    return np.array([[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1.0]])
+
+
+def _transl(x, y, z) -> np.ndarray:
+    pose = np.eye(4)
+    pose[:3, 3] = (x, y, z)
+    return pose
+
+
+def _dhm_array(rx, tx, tz, rz) -> np.ndarray:
+    """Same as robomath.dhm for a vector of rz values (N,). Returns an array of shape (N, 4, 4)."""
+    crx, srx = math.cos(rx), math.sin(rx)
+    crz, srz = np.cos(rz), np.sin(rz)
+    poses = np.zeros(np.shape(rz) + (4, 4))
+    poses[..., 0, 0] = crz
+    poses[..., 0, 1] = -srz
+    poses[..., 0, 3] = tx
+    poses[..., 1, 0] = crx * srz
+    poses[..., 1, 1] = crx * crz
+    poses[..., 1, 2] = -srx
+    poses[..., 1, 3] = -tz * srx
+    poses[..., 2, 0] = srx * srz
+    poses[..., 2, 1] = srx * crz
+    poses[..., 2, 2] = crx
+    poses[..., 2, 3] = tz * crx
+    poses[..., 3, 3] = 1
+    return poses
+
+
+def _inv_poses(poses: np.ndarray) -> np.ndarray:
+    """Inverse of homogeneous matrices of shape (..., 4, 4)"""
+    inv = np.zeros_like(poses)
+    rot_t = np.swapaxes(poses[..., :3, :3], -1, -2)
+    inv[..., :3, :3] = rot_t
+    inv[..., :3, 3] = -np.einsum('...ij,...j->...i', rot_t, poses[..., :3, 3])
+    inv[..., 3, 3] = 1
+    return inv
+
+
+def _pose_array(pose) -> np.ndarray:
+    """Returns a Mat, a list of Mat or a NumPy array as a NumPy array of shape (N, 4, 4)"""
+    if pose is None:
+        return None
+    if isinstance(pose, robomath.Mat):
+        pose = [pose]
+    if not isinstance(pose, np.ndarray):
+        pose = [p.rows if isinstance(p, robomath.Mat) else p for p in pose]
+    return np.asarray(pose, dtype=float).reshape(-1, 4, 4)
+
+
+def _closest_point(p1, z1, p2, z2):
+    """Returns the points of two lines that are closest to each other. Returns None if the lines are parallel."""
+    b = np.dot(z1, z2)
+    denom = 1 - b * b
+    if denom < _EPS:
+        return None
+    w = p1 - p2
+    d = np.dot(z1, w)
+    e = np.dot(z2, w)
+    return p1 + (b * e - d) / denom * z1, p2 + (e - b * d) / denom * z2
+
+
+def _normal_to(vector, z):
+    """Returns the unit vector closest to vector that is perpendicular to z, or None"""
+    vector = vector - np.dot(vector, z) * z
+    norm = np.linalg.norm(vector)
+    if norm < 1e-6:
+        return None
+    return vector / norm
+
+
+class RobotKinematics(object):
+    """Kinematic model of a serial robot with rotative joints, defined by Denavit-Hartenberg parameters.
+
+    The model is stored as a DHM table (Denavit-Hartenberg Modified, Craig 1986). Each row [rx, tx, tz, rz] defines the link transformation
+    dhm(rx, tx, tz, rz + joint), where the joint value is converted to radians (see :func:`~robodk.robomath.dhm`).
+    The pose of the robot flange with respect to the robot base is base * dhm(row 1) * ... * dhm(row n) * tool.
+
+    :param table: DH or DHM table, one row per joint (angles in radians, distances in mm). DHM rows are [rx, tx, tz, rz] and DH rows are [rz, tx, tz, rx], same as :func:`~robodk.robomath.dhm` and :func:`~robodk.robomath.dh`.
+    :type table: list of list of float
+    :param modified: True if the table uses the modified DH convention (DHM), False for the classic DH convention
+    :type modified: bool
+    :param base: pose of the first joint frame with respect to the robot base
+    :type base: :class:`~robodk.robomath.Mat`
+    :param tool: pose of the robot flange with respect to the last joint frame
+    :type tool: :class:`~robodk.robomath.Mat`
+    :param lower_limits: lower joint limits, in degrees
+    :type lower_limits: list of float
+    :param upper_limits: upper joint limits, in degrees
+    :type upper_limits: list of float
+
+    The analytic inverse kinematics is available for 6 axis robots with a spherical wrist (axes 4, 5 and 6 intersect, axes 2 and 3 are parallel and perpendicular to axis 1).
+    """
+
+    def __init__(self, table: List[List[float]], modified: bool = True, base: robomath.Mat = None, tool: robomath.Mat = None, lower_limits: List[float] = None, upper_limits: List[float] = None):
+        table = np.asarray(table, dtype=float).reshape(-1, 4)
+        self.base = np.eye(4) if base is None else _pose_array(base)[0]
+        self.tool = np.eye(4) if tool is None else _pose_array(tool)[0]
+        if not modified:
+            # rotz(rz)*transl(tx,0,tz)*rotx(rx) chain regrouped as rotx(rx)*transl(tx,0,tz)*rotz(rz) links
+            dh_rz, dh_tx, dh_tz, dh_rx = table.T
+            table = np.column_stack([np.concatenate([[0], dh_rx[:-1]]), np.concatenate([[0], dh_tx[:-1]]), dh_tz, dh_rz])
+            self.tool = _transl(dh_tx[-1], 0, 0) @ _rotx(dh_rx[-1]) @ self.tool
+
+        self.table = table
+        self.nDOFs = table.shape[0]
+        self.lower_limits = np.full(self.nDOFs, -np.inf) if lower_limits is None else np.asarray(lower_limits, dtype=float).ravel()
+        self.upper_limits = np.full(self.nDOFs, np.inf) if upper_limits is None else np.asarray(upper_limits, dtype=float).ravel()
+
+    @staticmethod
+    def fromItem(robot, tolerance: float = 0.001, tolerance_deg: float = 0.001) -> 'RobotKinematics':
+        """Creates the kinematic model of a robot in RoboDK. The joint axes are identified from the forward kinematics of the robot
+        and the resulting model is validated against :func:`~robodk.robolink.Item.SolveFK` for random joint values.
+        This requires a single exchange with RoboDK (see :func:`~robodk.robolink.Item.SolveFK_Batch`).
+
+        An exception is raised if the robot can't be modelled with DH parameters (for example, robots with linear axes or coupled joints).
+
+        :param robot: robot item
+        :type robot: :class:`~robodk.robolink.Item`
+        :param tolerance: maximum position error allowed in the validation, in mm
+        :type tolerance: float
+        :param tolerance_deg: maximum orientation error allowed in the validation, in degrees
+        :type tolerance_deg: float
+        """
+        lower, upper, joints_type = robot.JointLimits()
+        lower = np.asarray(lower.list(), dtype=float)
+        upper = np.asarray(upper.list(), dtype=float)
+        ndofs = len(lower)
+
+        # Home position, one rotation of 30 deg per joint and random joints to validate the model
+        delta = 30.0
+        joints = np.zeros((1 + ndofs + 20, ndofs))
+        joints[1:ndofs + 1] = np.eye(ndofs) * delta
+        rng = np.random.default_rng(0)
+        lower_test = np.where(np.isfinite(lower), lower, -180)
+        upper_test = np.where(np.isfinite(upper), upper, 180)
+        joints[ndofs + 1:] = lower_test + rng.random((20, ndofs)) * (upper_test - lower_test)
+        poses = robot.SolveFK_Batch(joints, as_numpy=True)
+
+        flange = poses[0]
+        axes_z = []
+        axes_p = []
+        for i in range(ndofs):
+            # Motion of the flange when joint i moves: rotation around the axis of joint i
+            motion = poses[i + 1] @ _inv_poses(flange)
+            rot = motion[:3, :3]
+            axis = np.array([rot[2, 1] - rot[1, 2], rot[0, 2] - rot[2, 0], rot[1, 0] - rot[0, 1]]) / (2 * math.sin(delta * math.pi / 180))
+            if abs(np.linalg.norm(axis) - 1) > 1e-3:
+                raise Exception('Joint %i is not a rotative joint' % (i + 1))
+            axes_z.append(axis / np.linalg.norm(axis))
+            axes_p.append(np.linalg.lstsq(np.eye(3) - rot, motion[:3, 3], rcond=None)[0])
+
+        kin = RobotKinematics._fromAxes(axes_z, axes_p, flange, lower, upper)
+        poses_kin = kin.SolveFK(joints)
+        error = np.abs(poses_kin[:, :3, 3] - poses[:, :3, 3]).max()
+        if error > tolerance:
+            raise Exception('The kinematics of the robot can not be represented with DH parameters (error of %.3f mm). Coupled joints are not supported.' % error)
+
+        # Angle of the relative rotation between the model and RoboDK
+        cos_angle = (np.einsum('nji,nji->n', poses_kin[:, :3, :3], poses[:, :3, :3]) - 1) / 2
+        error_deg = np.arccos(np.clip(cos_angle, -1, 1)).max() * 180 / math.pi
+        if error_deg > tolerance_deg:
+            raise Exception('The kinematics of the robot can not be represented with DH parameters (error of %.3f deg). Coupled joints are not supported.' % error_deg)
+        return kin
+
+    @staticmethod
+    def _fromAxes(axes_z, axes_p, flange, lower_limits=None, upper_limits=None) -> 'RobotKinematics':
+        """Creates the DHM model given the joint axes (direction and point) and the flange pose at the home position (all joints at 0)"""
+        ndofs = len(axes_z)
+        frames = []
+        origin = np.zeros(3)
+        xaxis = np.array([1.0, 0, 0])
+        for i in range(ndofs):
+            z = axes_z[i]
+            # Origin of frame i: closest point to the next axis, or the previous origin projected on the axis
+            origin = axes_p[i] + np.dot(origin - axes_p[i], z) * z
+            xnext = None
+            if i < ndofs - 1:
+                closest = _closest_point(origin, z, axes_p[i + 1], axes_z[i + 1])
+                if closest is None:
+                    xnext = _normal_to(axes_p[i + 1] - origin, z)
+                else:
+                    origin = closest[0]
+                    xnext = _normal_to(closest[1] - closest[0], z)
+                    if xnext is None:
+                        xnext = np.cross(z, axes_z[i + 1])
+                        xnext /= np.linalg.norm(xnext)
+            else:
+                origin = axes_p[i] + np.dot(flange[:3, 3] - axes_p[i], z) * z
+
+            xaxis = xnext if xnext is not None else (_normal_to(xaxis, z) if _normal_to(xaxis, z) is not None else _normal_to(np.array([0, 0, 1.0]), z))
+            frame = np.eye(4)
+            frame[:3, 0] = xaxis
+            frame[:3, 1] = np.cross(z, xaxis)
+            frame[:3, 2] = z
+            frame[:3, 3] = origin
+            frames.append(frame)
+
+        # The first joint frame at the home position is used as the reference of the DHM table
+        table = [[0.0, 0.0, 0.0, 0.0]]
+        for i in range(1, ndofs):
+            link = _inv_poses(frames[i - 1]) @ frames[i]
+            rx = math.atan2(-link[1, 2], link[2, 2])
+            rz = math.atan2(-link[0, 1], link[0, 0])
+            tz = -link[1, 3] * math.sin(rx) + link[2, 3] * math.cos(rx)
+            table.append([rx, link[0, 3], tz, rz])
+
+        return RobotKinematics(table, True, frames[0], _inv_poses(frames[-1]) @ flange, lower_limits, upper_limits)
+
+    # ------------------------------------------------------------------
+    def _joints_array(self, joints) -> Tuple[np.ndarray, bool]:
+        """Returns the joints as an array of shape (N, nDOFs) and True if a NumPy array was provided"""
+        if isinstance(joints, np.ndarray):
+            return joints.reshape(-1, self.nDOFs).astype(float), True
+        if isinstance(joints, robomath.Mat):
+            joints = joints.list()
+        return np.asarray(joints, dtype=float).reshape(-1, self.nDOFs), False
+
+    def _chain(self, joints: np.ndarray) -> List[np.ndarray]:
+        """Returns the pose of each joint frame with respect to the robot base for joints of shape (N, nDOFs)"""
+        frames = []
+        pose = np.broadcast_to(self.base, (joints.shape[0], 4, 4))
+        for i, (rx, tx, tz, rz) in enumerate(self.table):
+            pose = pose @ _dhm_array(rx, tx, tz, rz + joints[:, i] * (math.pi / 180))
+            frames.append(pose)
+        return frames
+
+    def SolveFK(self, joints: Union[robomath.Mat, List[float]], tool: robomath.Mat = None, reference: robomath.Mat = None) -> robomath.Mat:
+        """Calculates the forward kinematics of the robot. Same as :func:`~robodk.robolink.Item.SolveFK`.
+
+        :param joints: robot joints in degrees. Provide a NumPy array of shape (N, nDOFs) to calculate N poses at once.
+        :type joints: list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Optionally provide the tool used to calculate the forward kinematics. If this parameter is ignored it will use the robot flange.
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Optionally provide the reference frame used to calculate the forward kinematics. If this parameter is ignored it will use the robot base frame.
+        :type reference: :class:`~robodk.robomath.Mat`
+        :return: pose of the robot flange with respect to the robot base (:class:`~robodk.robomath.Mat`), or a NumPy array of shape (N, 4, 4)
+        """
+        joints, as_numpy = self._joints_array(joints)
+        poses = self._chain(joints)[-1] @ self.tool
+        if tool is not None:
+            poses = poses @ _pose_array(tool)[0]
+        if reference is not None:
+            poses = _inv_poses(_pose_array(reference)[0]) @ poses
+        if as_numpy:
+            return poses
+        return robomath.Mat(poses[0].tolist())
+
+    def Jacobian(self, joints: Union[robomath.Mat, List[float]], tool: robomath.Mat = None) -> robomath.Mat:
+        """Calculates the geometric Jacobian of the robot with respect to the robot base.
+        Rows are [vx, vy, vz, wx, wy, wz]: the linear velocity of the flange (or tool) in mm/rad and the angular velocity in rad/rad, for each joint (one column per joint).
+
+        :param joints: robot joints in degrees. Provide a NumPy array of shape (N, nDOFs) to calculate N Jacobians at once.
+        :type joints: list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Optionally provide the tool (TCP) with respect to the robot flange
+        :type tool: :class:`~robodk.robomath.Mat`
+        :return: 6 x nDOFs matrix (:class:`~robodk.robomath.Mat`), or a NumPy array of shape (N, 6, nDOFs)
+        """
+        joints, as_numpy = self._joints_array(joints)
+        frames = self._chain(joints)
+        tcp = frames[-1] @ self.tool
+        if tool is not None:
+            tcp = tcp @ _pose_array(tool)[0]
+
+        jac = np.zeros((joints.shape[0], 6, self.nDOFs))
+        for i, frame in enumerate(frames):
+            axis = frame[:, :3, 2]
+            jac[:, :3, i] = np.cross(axis, tcp[:, :3, 3] - frame[:, :3, 3])
+            jac[:, 3:, i] = axis
+        if as_numpy:
+            return jac
+        return robomath.Mat(jac[0].tolist())
+
+    # ------------------------------------------------------------------
+    def _spherical_wrist(self) -> bool:
+        """Returns True if the analytic inverse kinematics can be used for this robot"""
+        if self.nDOFs != 6:
+            return False
+        rx, tx, tz = self.table[:, 0], self.table[:, 1], self.table[:, 2]
+        perpendicular = [abs(abs(math.sin(rx[i])) - 1) < 1e-6 for i in (1, 3, 4, 5)]
+        a3_d4 = math.hypot(tx[3], tz[3] * math.sin(rx[3]))
+        return all(perpendicular) and abs(math.sin(rx[2])) < 1e-6 and abs(tx[4]) < 1e-6 and abs(tx[5]) < 1e-6 and abs(tz[4]) < 1e-6 and abs(tx[2]) > 1e-6 and a3_d4 > 1e-6
+
+    def _solve_ik(self, poses: np.ndarray) -> np.ndarray:
+        """Analytic inverse kinematics for flange poses with respect to the robot base. Returns an array of shape (N, 8, 6) in degrees, NaN if the solution does not exist."""
+        if not self._spherical_wrist():
+            raise Exception('The analytic inverse kinematics is only available for 6 axis robots with a spherical wrist')
+
+        rx, tx, tz, rz = self.table.T
+        sgn1 = math.copysign(1, math.sin(rx[1]))
+        sgn4 = math.copysign(1, math.sin(rx[4]))
+        sgn5 = math.copysign(1, math.sin(rx[5]))
+        a1, d2, a2, d3, a3, d4, d6 = tx[1], tz[1], tx[2], tz[2], tx[3], tz[3], tz[5]
+
+        # Wrist center with respect to the first joint frame (before the rotation of joint 1)
+        link1 = _rotx(rx[0]) @ _transl(tx[0], 0, tz[0])
+        target = _inv_poses(link1) @ _inv_poses(self.base) @ poses @ _inv_poses(self.tool)
+        wrist = target[:, :3, 3] - d6 * target[:, :3, 2]
+
+        # Wrist center with respect to joint 3: p3 = rotx(rx3) * [a3, 0, d4]
+        p3x, p3y, p3z = a3, -d4 * math.sin(rx[3]), d4 * math.cos(rx[3])
+        # Axes 2 and 3 are parallel (rx2 is 0) or antiparallel (rx2 is 180 deg)
+        sgn2 = math.copysign(1, math.cos(rx[2]))
+        lateral = -sgn1 * (d2 + sgn2 * (d3 + p3z))
+        arm = math.hypot(p3x, p3y)
+        phi = math.atan2(p3y, p3x)
+
+        ndofs = 6
+        solutions = np.full((poses.shape[0], 8, ndofs), np.nan)
+        with np.errstate(invalid='ignore'):
+            radius = np.sqrt(wrist[:, 0]**2 + wrist[:, 1]**2 - lateral**2)
+            isol = 0
+            for sign_rear in (1, -1):
+                x1 = sign_rear * radius
+                t1 = np.arctan2(wrist[:, 1], wrist[:, 0]) - np.arctan2(lateral, x1)
+                ux = x1 - a1
+                uy = sgn1 * wrist[:, 2]
+                cos_elbow = (ux**2 + uy**2 - a2**2 - arm**2) / (2 * a2 * arm)
+                for sign_elbow in (1, -1):
+                    elbow = sign_elbow * np.arccos(cos_elbow)
+                    t3 = elbow - phi
+                    t2 = np.arctan2(uy, ux) - np.arctan2(sgn2 * arm * np.sin(elbow), a2 + arm * np.cos(elbow))
+
+                    # Orientation of the wrist: rotz(t4)*rotx(rx4)*rotz(t5)*rotx(rx5)*rotz(t6)
+                    frame = _dhm_array(0, 0, 0, t1) @ _dhm_array(rx[1], a1, d2, t2) @ _dhm_array(rx[2], a2, d3, t3) @ _rotx(rx[3])
+                    mat = np.swapaxes(frame[:, :3, :3], 1, 2) @ target[:, :3, :3]
+                    cos5 = np.clip(-sgn4 * sgn5 * mat[:, 2, 2], -1, 1)
+                    for sign_flip in (1, -1):
+                        sin5 = sign_flip * np.sqrt(1 - cos5**2)
+                        t5 = np.arctan2(sin5, cos5)
+                        t4 = np.arctan2(sign_flip * sgn5 * mat[:, 1, 2], sign_flip * sgn5 * mat[:, 0, 2])
+                        t6 = np.arctan2(-sign_flip * sgn4 * mat[:, 2, 1], sign_flip * sgn4 * mat[:, 2, 0])
+
+                        # Wrist singularity: joint 6 is set to 0 and joint 4 takes the full rotation
+                        singular = np.abs(sin5) < 1e-9
+                        if singular.any():
+                            rot = mat[singular] @ np.linalg.inv(_rotx(rx[5])[:3, :3]) @ np.swapaxes(_dhm_array(0, 0, 0, t5[singular])[:, :3, :3], 1, 2) @ _rotx(-rx[4])[:3, :3]
+                            t4[singular] = np.arctan2(rot[:, 1, 0], rot[:, 0, 0])
+                            t6[singular] = 0
+
+                        thetas = np.column_stack([t1, t2, t3, t4, t5, t6]) - rz
+                        solutions[:, isol] = np.degrees(np.arctan2(np.sin(thetas), np.cos(thetas)))
+                        isol += 1
+
+        # Apply the joint limits, using +/-360 deg turns if required
+        for turn in (0, -360, 360):
+            turned = solutions + turn
+            inside = (turned >= self.lower_limits - 1e-6) & (turned <= self.upper_limits + 1e-6)
+            outside = (solutions < self.lower_limits - 1e-6) | (solutions > self.upper_limits + 1e-6)
+            solutions = np.where(outside & inside, turned, solutions)
+        outside = (solutions < self.lower_limits - 1e-6) | (solutions > self.upper_limits + 1e-6)
+        solutions[outside.any(axis=2) | np.isnan(solutions).any(axis=2)] = np.nan
+        return solutions
+
+    def _target_poses(self, pose, tool, reference) -> Tuple[np.ndarray, bool]:
+        """Returns the flange poses with respect to the robot base (N, 4, 4) and True if a NumPy array was provided"""
+        as_numpy = isinstance(pose, np.ndarray)
+        poses = _pose_array(pose)
+        if tool is not None:
+            poses = poses @ _inv_poses(_pose_array(tool)[0])
+        if reference is not None:
+            poses = _pose_array(reference)[0] @ poses
+        return poses, as_numpy
+
+    def SolveIK_All(self, pose: robomath.Mat, tool: robomath.Mat = None, reference: robomath.Mat = None) -> robomath.Mat:
+        """Calculates all the inverse kinematics solutions of a 6 axis robot with a spherical wrist. Same as :func:`~robodk.robolink.Item.SolveIK_All`.
+        Solutions outside the joint limits are ignored.
+
+        :param pose: pose of the robot flange with respect to the robot base frame. Provide a NumPy array of shape (N, 4, 4) to calculate the solutions of N poses at once.
+        :type pose: :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Tool pose with respect to the robot flange (TCP)
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Reference pose (reference frame with respect to the robot base)
+        :type reference: :class:`~robodk.robomath.Mat`
+        :return: nDOFs x M matrix (one solution per column), or a NumPy array of shape (N, 8, nDOFs) filled with NaN where the solution does not exist
+        """
+        poses, as_numpy = self._target_poses(pose, tool, reference)
+        solutions = self._solve_ik(poses)
+        if as_numpy:
+            return solutions
+        valid = solutions[0][~np.isnan(solutions[0]).any(axis=1)]
+        if len(valid) == 0:
+            return robomath.Mat(0, 0)
+        return robomath.Mat(valid.T.tolist())
+
+    def SolveIK(self, pose: robomath.Mat, joints_approx: Union[robomath.Mat, List[float]] = None, tool: robomath.Mat = None, reference: robomath.Mat = None) -> robomath.Mat:
+        """Calculates the inverse kinematics of a 6 axis robot with a spherical wrist. Same as :func:`~robodk.robolink.Item.SolveIK`.
+        The solution closest to joints_approx is returned.
+
+        :param pose: pose of the robot flange with respect to the robot base frame. Provide a NumPy array of shape (N, 4, 4) to calculate N poses at once.
+        :type pose: :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param joints_approx: Preferred joint solution (all joints at 0 by default). Provide one set of joints per pose to follow a path.
+        :type joints_approx: list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Tool pose with respect to the robot flange (TCP)
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Reference pose (reference frame with respect to the robot base)
+        :type reference: :class:`~robodk.robomath.Mat`
+        :return: joints in degrees (an empty array if there is no solution), or a NumPy array of shape (N, nDOFs) filled with NaN where there is no solution
+        """
+        poses, as_numpy = self._target_poses(pose, tool, reference)
+        solutions = self._solve_ik(poses)
+        if joints_approx is None:
+            joints_approx = np.zeros((1, self.nDOFs))
+        else:
+            joints_approx = self._joints_array(joints_approx)[0]
+
+        distance = np.linalg.norm(solutions - joints_approx[:, np.newaxis, :], axis=2)
+        distance[np.isnan(distance)] = np.inf
+        best = np.argmin(distance, axis=1)
+        joints = solutions[np.arange(len(best)), best]
+        if as_numpy:
+            return joints
+        if np.isnan(joints[0]).any():
+            return robomath.Mat(0, 0)
+        return robomath.Mat(joints[0].tolist())
+
+    def JointsConfig(self, joints: Union[robomath.Mat, List[float]]) -> robomath.Mat:
+        """Returns the robot configuration state for a set of robot joints: [REAR, LOWERARM, FLIP, turns]. Same as :func:`~robodk.robolink.Item.JointsConfig`.
+
+        - REAR is 1 if the wrist center is behind the first axis
+        - LOWERARM is 1 if the elbow is below the line from the shoulder to the wrist center
+        - FLIP is 1 if joint 5 is negative
+
+        :param joints: robot joints in degrees. Provide a NumPy array of shape (N, nDOFs) to calculate N configurations at once.
+        :type joints: list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :return: configuration flags (:class:`~robodk.robomath.Mat`), or a NumPy array of shape (N, 4)
+        """
+        joints, as_numpy = self._joints_array(joints)
+        if self.nDOFs < 5:
+            raise Exception('The robot configuration requires at least 5 axes')
+
+        frames = self._chain(joints)
+        axis1 = frames[0][:, :3, 2]
+        shoulder = frames[1][:, :3, 3]
+        elbow = frames[2][:, :3, 3]
+        wrist = frames[4][:, :3, 3]
+
+        # Position of the wrist center along the X axis of joint 1 (pointing to joint 2)
+        xaxis1 = frames[0][:, :3, 0]
+        rear = np.einsum('ij,ij->i', wrist - frames[0][:, :3, 3], xaxis1) < 0
+
+        line = wrist - shoulder
+        line /= np.linalg.norm(line, axis=1)[:, np.newaxis]
+        offset = elbow - shoulder
+        offset -= np.einsum('ij,ij->i', offset, line)[:, np.newaxis] * line
+        lower = np.einsum('ij,ij->i', offset, axis1) < 0
+
+        flip = joints[:, 4] < 0
+        configs = np.column_stack([rear, lower, flip, np.zeros(len(flip))]).astype(float)
+        if as_numpy:
+            return configs
+        return robomath.Mat(configs[0].tolist())
@@ -36,6 +36,7 @@ import struct
 import os
 import time
 import threading
+import contextlib
 
 if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
     # Python 3.5+ type hints. Type hints are stripped for <3.5
@@ -298,6 +299,29 @@ SEQUENCE_DISPLAY_COLOR_GOOD = 3  #: Good (green) color sequence display flag
 SEQUENCE_DISPLAY_COLOR_BAD = 4  #: Bad (red) color sequence display flag
 SEQUENCE_DISPLAY_OPTION_RESET = 1024  #: Reset previous sequences (force timeout) sequence display flag
 
+# Events reported by RoboDK on an event channel
+EVENT_SELECTION_TREE_CHANGED = 1  #: The selection in the tree changed
+EVENT_ITEM_MOVED = 2  #: An item moved (obsolete after RoboDK 4.2.0, use EVENT_ITEM_MOVED_POSE instead)
+EVENT_REFERENCE_PICKED = 3  #: A reference frame was picked
+EVENT_REFERENCE_RELEASED = 4  #: A reference frame was released
+EVENT_TOOL_MODIFIED = 5  #: A tool was modified
+EVENT_CREATED_ISOCUBE = 6  #: An ISO cube was created
+EVENT_SELECTION_3D_CHANGED = 7  #: The selection in the 3D view changed
+EVENT_3DVIEW_MOVED = 8  #: The 3D view moved
+EVENT_ROBOT_MOVED = 9  #: A robot moved
+EVENT_KEY = 10  #: A key was pressed or released
+EVENT_ITEM_MOVED_POSE = 11  #: An item moved (the relative pose is provided)
+EVENT_COLLISIONMAP_RESET = 12  #: The collision map was reset
+EVENT_COLLISIONMAP_TOO_LARGE = 13  #: The collision map is too large
+EVENT_CALIB_MEASUREMENT = 14  #: A robot calibration measurement changed
+EVENT_SELECTION_3D_CLICK = 15  #: An object in the 3D view was clicked on
+EVENT_ITEM_CHANGED = 16  #: The state of one or more items changed in the tree (parent/child relationship, added/removed items or instructions, changed the active station)
+EVENT_ITEM_RENAMED = 17  #: The name of an item changed (RoboDK 5.6.3 required)
+EVENT_ITEM_VISIBILITY = 18  #: The visibility state of an item changed (RoboDK 5.6.3 required)
+EVENT_STATION_CHANGED = 19  #: A new RoboDK station was loaded (RoboDK 5.6.3 required)
+EVENT_PROGSLIDER_CHANGED = 20  #: A program slider was opened, changed, or closed (RoboDK 5.6.4 required)
+EVENT_PROGSLIDER_SET = 21  #: The index of a program slider changed (RoboDK 5.6.4 required)
+
 if sys.version_info.major >= 3 and sys.version_info.minor >= 6:
     # To be added in the future. Requires Python 3.6 or later
     from enum import IntFlag
@@ -440,6 +464,16 @@ class LicenseError(Exception):
     pass
 
 
+class PipelineError(Exception):
+    """One or more commands sent in pipeline mode failed (see :func:`~robodk.robolink.Robolink.pipeline`).
+    The errors attribute holds the list of failed calls as (call name, item, exception) tuples, in the order the commands were sent."""
+
+    def __init__(self, errors: List[Tuple[str, 'Item', Exception]]):
+        self.errors = errors
+        msg = '; '.join([call + ': ' + str(e) for call, item, e in errors])
+        super().__init__('%i pipelined command(s) failed. %s' % (len(errors), msg))
+
+
 def RoboDKInstallFound() -> bool:
     """Check if RoboDK is installed"""
     path_install = getPathRoboDK()
@@ -661,6 +695,177 @@ def EmbedWindow(window_name: str, docked_name: str = None, size_w: int = -1, siz
     t.start()
 
 
+# Commands that change the item metadata kept by the cache (see Robolink.setCache). The cache is cleared when this Robolink instance sends them
+_CACHE_INVALIDATE_COMMANDS = frozenset([
+    'Add', 'AddPoints', 'AddShape2', 'AddShape4', 'AddShape5', 'AddToolEmpty', 'AddWir2', 'AddWire', 'Add_FRAME', 'Add_INSMOVE', 'Add_INSMOVEC', 'Add_MACHINING', 'Add_PROG', 'Add_TARGET', 'Attach_Closest2', 'BuildMechanism', 'Cam2D_Add', 'Detach_All', 'Detach_Closest', 'InsCustom2', 'MergeItems', 'NewStation', 'PastN', 'Paste', 'Prog_DelIns', 'Remove', 'RemoveLst', 'RemoveStn', 'S_ActiveStn', 'S_Frame', 'S_Link_ptr', 'S_Name', 'S_Parent', 'S_Parent_Static', 'S_Robot', 'S_Tool', 'S_Tool_ptr'
+])
+
+# Number of vertices of a shape encoded at once when adding shapes from NumPy arrays
+_SHAPE_CHUNK = 1 << 18
+
+# Events used to invalidate the cache
+_CACHE_EVENTS = [EVENT_TOOL_MODIFIED, EVENT_ITEM_CHANGED, EVENT_ITEM_RENAMED, EVENT_STATION_CHANGED]
+
+
+def _is_numpy(value) -> bool:
+    """Returns True if value is a NumPy array (without importing NumPy)"""
+    return type(value).__module__ == 'numpy' and hasattr(value, 'shape')
+
+
+def _joints_rows(joints_list) -> List[List[float]]:
+    """Converts a list of robot joints to a list of lists of float. It accepts a NumPy array (one row per configuration), a Mat (one column per configuration) or a list of lists or Mat."""
+    if _is_numpy(joints_list):
+        if joints_list.ndim == 1:
+            joints_list = joints_list.reshape(1, -1)
+        return joints_list.tolist()
+
+    if isinstance(joints_list, robomath.Mat):
+        return joints_list.Cols()
+
+    return [j.list() if isinstance(j, robomath.Mat) else list(j) for j in joints_list]
+
+
+def _f8_columns(array) -> memoryview:
+    """Returns the values of a 2D NumPy array (or of a stack of 2D arrays) as big endian doubles in column major order, as a flat memoryview of bytes.
+    This is the layout used by RoboDK to send matrices and poses."""
+    import numpy as np
+    return memoryview(np.ascontiguousarray(np.swapaxes(array, -1, -2), dtype='>f8')).cast('B')
+
+
+def _shape_vertices(shape):
+    """Returns the vertices of a shape as a 2D NumPy array with one row per vertex (xyz or xyzijk).
+    Shapes can be provided as a NumPy array (Nx3 or Nx6) or as a Mat (3xN or 6xN). Returns None for a Mat if the NumPy backend is not used."""
+    if _is_numpy(shape):
+        if shape.ndim != 2 or shape.shape[1] not in (3, 6):
+            raise Exception('Shapes must be provided as Nx3 or Nx6 arrays')
+        return shape
+
+    array = shape._a
+    if array is None and robomath._np():
+        array = robomath._np().asarray(shape.rows, dtype=float)
+    return None if array is None else array.T
+
+
+def _float_chunks(vertices, dtype: str, ncols: int = None):
+    """Yields the vertices of a shape (one row per vertex) as float32 bytes of the given byte order.
+    Vertices are converted by chunks of _SHAPE_CHUNK vertices to keep the memory used by large shapes close to the size of the encoded data."""
+    import numpy as np
+    for start in range(0, vertices.shape[0], _SHAPE_CHUNK):
+        yield memoryview(np.ascontiguousarray(vertices[start:start + _SHAPE_CHUNK, :ncols], dtype=dtype)).cast('B')
+
+
+def _floats_bytes(values: List[float], byteorder: str) -> bytes:
+    """Encodes a list of values as float32 bytes ('little' or 'big' byte order)"""
+    from array import array
+    values = array('f', values)
+    if sys.byteorder != byteorder:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _is_shape(value) -> bool:
+    """Returns True if value is a shape provided to AddShape (Mat or 2D NumPy array), as opposed to a color"""
+    return isinstance(value, robomath.Mat) or (_is_numpy(value) and value.ndim == 2)
+
+
+def _decimate_shapes(triangle_points, tolerance: float, max_triangles: int):
+    """Simplifies the shapes provided to AddShape (a shape or a list of shapes and colors), see robomesh.Mesh.decimate. Simplified shapes are returned as NumPy arrays."""
+    from robodk import robomesh
+
+    def simplify(shape):
+        mesh = robomesh.Mesh.fromTriangles(shape)
+        return mesh.decimate(tolerance, max_triangles if max_triangles > 0 else None).triangles(normals=mesh.normals is not None)
+
+    if isinstance(triangle_points, list) and len(triangle_points) > 0 and _is_shape(triangle_points[0]):
+        return [simplify(value) if _is_shape(value) else value for value in triangle_points]
+    return simplify(triangle_points)
+
+
+def _write_rdkcadv(fid, shapes: List[robomath.Mat], colors: List[List[float]]):
+    """Writes shapes to an open .rdkcadv file. Each shape is a list of vertices grouped by triangles (Mat or NumPy array, see _shape_vertices)."""
+    fid.write(struct.pack('<Q', len(shapes)))
+    for shape, color in zip(shapes, colors):
+        vertices = _shape_vertices(shape)
+        nvertices = len(shape.rows[0]) if vertices is None else vertices.shape[0]
+        fid.write(struct.pack('<Q', nvertices // 3))
+        fid.write(struct.pack('<4f', *(color[:4])))
+        if vertices is None:
+            fid.write(_floats_bytes([v for col in zip(*shape.rows[:3]) for v in col], 'little'))
+        else:
+            for chunk in _float_chunks(vertices, '<f4', 3):
+                fid.write(chunk)
+
+
+def _batch_pose_sender(link: 'Robolink', poses, tool: robomath.Mat = None, reference: robomath.Mat = None):
+    """Prepares a list of poses for a batch IK request: the tool and reference are applied as in Item.SolveIK.
+    Returns the number of poses and a function to send pose i."""
+    if _is_numpy(poses) or _is_numpy(tool) or _is_numpy(reference):
+        import numpy as np
+        poses = _poses_numpy(poses)
+        if tool is not None:
+            poses = poses @ np.linalg.inv(_poses_numpy(tool)[0])
+        if reference is not None:
+            poses = _poses_numpy(reference)[0] @ poses
+        data = _f8_columns(poses)
+        return poses.shape[0], lambda i: link._send_raw(data[i * 128:(i + 1) * 128])
+
+    if isinstance(poses, (robomath.Mat, robomath.PoseH)):
+        poses = [poses]
+    if tool is not None:
+        tool_inv = robomath.invH(tool)
+        poses = [pose * tool_inv for pose in poses]
+    if reference is not None:
+        poses = [reference * pose for pose in poses]
+    return len(poses), lambda i: link._send_pose(poses[i])
+
+
+def _poses_numpy(poses):
+    """Returns a list of poses, a Mat, a PoseH or a NumPy array as a NumPy array of shape (N, 4, 4)"""
+    import numpy as np
+    if isinstance(poses, (robomath.Mat, robomath.PoseH)):
+        poses = [poses]
+    if not _is_numpy(poses):
+        poses = [p.rows if isinstance(p, (robomath.Mat, robomath.PoseH)) else p for p in poses]
+    return np.asarray(poses, dtype=float).reshape(-1, 4, 4)
+
+
+class _ComLock:
+    """Lock that protects the communication link with RoboDK (Robolink._lock).
+
+    Outgoing data is buffered by the _send_* helpers. Any pending data is sent when the lock is released so that commands that do not wait for a reply are not delayed.
+    In pipeline mode, pending data is sent when a reply is expected or when the buffer grows larger than PIPELINE_TX_SIZE.
+    If the block exits with an exception, the incomplete command is discarded.
+    """
+
+    def __init__(self, link: 'Robolink'):
+        self.link = link
+        self._lock = threading.Lock()
+
+    def acquire(self, *args, **kwargs) -> bool:
+        return self._lock.acquire(*args, **kwargs)
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.link._tx_mark = len(self.link._tx_buf)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        link = self.link
+        try:
+            if exc_type is not None:
+                del link._tx_buf[link._tx_mark:]
+            elif link._pipeline_depth <= 0 or len(link._tx_buf) >= link.PIPELINE_TX_SIZE:
+                link._send_flush()
+        finally:
+            self._lock.release()
+
+
 class Robolink:
     """
     The Robolink class is the link to RoboDK and allows creating macros for Robodk, simulate applications and generate programs offline.
@@ -763,6 +968,7 @@ class Robolink:
     CAMERA_AS_ITEM: bool = True
 
     # activate nodelay option (faster, requires more resources)
+    # Each command is sent to RoboDK as a single block (see _send_flush), so this option mostly benefits commands that do not wait for a reply
     NODELAY: bool = False
 
     # file path to the robodk program (executable). As an example, on Windows it should be: C:/RoboDK/bin/RoboDK.exe
@@ -792,6 +998,47 @@ class Robolink:
     # Remember last status message
     LAST_STATUS_MESSAGE: str = ''
 
+    # Size of the receive buffer, in bytes. Replies from RoboDK are read in blocks of up to this size and consumed by the _rec_* helpers
+    RECV_BUFFER_SIZE: int = 64 * 1024
+
+    # Outgoing data of the current command. It is sent in one block when a reply is expected or when the lock is released (see _send_flush)
+    _tx_buf: bytearray = None
+    _tx_mark: int = 0  # start of the current command in _tx_buf
+
+    # Maximum number of commands waiting for their status flag in pipeline mode. The status flags are read when this limit is reached (see pipeline)
+    PIPELINE_MAX_PENDING: int = 1000
+
+    # In pipeline mode, outgoing data is sent to RoboDK when it reaches this size, in bytes
+    PIPELINE_TX_SIZE: int = 64 * 1024
+
+    # Pipeline state (see pipeline)
+    _pipeline_depth: int = 0
+    _pending_status: List[Tuple[str, 'Item']] = None
+    _pipeline_errors: List[Tuple[str, 'Item', Exception]] = None
+
+    # Batch commands (such as Poses, Names, TreeSnapshot, SolveFK_Batch, Item.Instructions or ProgramBuilder.Upload) send their requests back to back instead of waiting one round trip per request.
+    # Maximum number of requests waiting for a reply in batch commands (see _exchange_batch)
+    BATCH_WINDOW: int = 128
+
+    # Return poses as robomath.PoseH instead of robomath.Mat in Item.Pose, Item.PoseAbs and Item.SolveFK
+    POSEH: bool = False
+
+    # Cache of item metadata: {(item pointer, key): value}. None if the cache is disabled (see setCache)
+    _cache: Dict = None
+    _cache_gen: int = 0  # incremented every time cached values are invalidated
+    _cache_events: 'Robolink' = None  # connection that receives the RoboDK events that invalidate the cache
+
+    # Link assigned to the items received from RoboDK (this instance if None). RobolinkPool uses it to bind items to the pool
+    _item_link = None
+
+    # Receive buffer state (see _recv_reset)
+    _rx_com = None
+    _rx_buf: bytearray = None
+    _rx_view: memoryview = None
+    _rx_start: int = 0
+    _rx_end: int = 0
+    _rx_use_recv_into: bool = False
+
     #%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     def _setTimeout(self, timeout_sec: float = 30):
         """Set the communication timeout (in seconds)."""
@@ -874,6 +1121,124 @@ class Robolink:
 
         return status
 
+    def _check_status_deferred(self, call: str, item: 'Item' = None, skippable: bool = False):
+        """Checks the status of a command that does not return anything.
+        The status of skippable commands is not sent by RoboDK in skipstatus mode. The status is checked later in pipeline mode (see pipeline)."""
+        if skippable and self._SkipStatus:
+            self._send_flush()
+            return
+
+        if self._pipeline_depth <= 0:
+            self._check_status()
+            return
+
+        self._pending_status.append((call, item))
+        if len(self._pending_status) >= self.PIPELINE_MAX_PENDING:
+            self._pipeline_drain()
+
+    def _pipeline_drain(self):
+        """Reads the status of all pipelined commands. Errors are kept until they are raised by PipelineSync."""
+        self._send_flush()
+        pending = self._pending_status
+        self._pending_status = []
+        for call, item in pending:
+            try:
+                self._check_status()
+            except OSError:
+                # Communication problems (such as a timeout) can't be attributed to a command
+                raise
+            except Exception as e:
+                self._pipeline_errors.append((call, item, e))
+
+    def _check_status_collect(self, errors: list, call: str, item: 'Item' = None):
+        """Checks the status of a command sent in a batch. Errors are appended to errors as (call name, item, exception) tuples, to be raised as a PipelineError once all the replies are received."""
+        try:
+            self._check_status()
+        except OSError:
+            # Communication problems (such as a timeout) can't be attributed to a command
+            raise
+        except Exception as e:
+            errors.append((call, item, e))
+
+    def _exchange_batch(self, count: int, send_one, rec_one, window: int = None) -> list:
+        """Exchanges count requests that RoboDK answers one by one (such as the requests of G_LFK or G_LIK).
+        Up to window requests are kept in flight, so the batch does not wait one round trip per request and unread replies do not fill the socket buffers.
+        send_one(i) sends request i and rec_one(i) receives its reply. Returns the list of replies.
+        If rec_one raises an error after reading its reply, the remaining replies are received before the first error is raised, so the link stays in sync."""
+        window = max(1, window or self.BATCH_WINDOW)
+        nsent = 0
+        while nsent < min(window, count):
+            send_one(nsent)
+            nsent += 1
+
+        results = []
+        error = None
+        for i in range(count):
+            try:
+                results.append(rec_one(i))
+            except OSError:
+                # Communication problems (such as a timeout): the remaining replies can't be received
+                raise
+            except Exception as e:
+                if error is None:
+                    error = e
+                results.append(None)
+
+            if nsent < count:
+                send_one(nsent)
+                nsent += 1
+
+        if error is not None:
+            raise error
+        return results
+
+    def _get_batch(self, items: List['Item'], command: str, rec_value, cache_key=None) -> list:
+        """Sends one request (command followed by the item) per item back to back and returns the values received by rec_value(), see _exchange_batch.
+        Values available in the cache (cache_key) are not requested and received values are stored in the cache.
+        A PipelineError is raised with the failed requests once all the replies are received."""
+        values = [None] * len(items)
+        if cache_key is not None:
+            values = [self._cache_get(item.item, cache_key) for item in items]
+
+        pending = [i for i in range(len(items)) if values[i] is None]
+        if not pending:
+            return values
+
+        errors = []
+        with self._lock:
+            self._check_connection()
+            gen = self._cache_gen
+
+            def send_one(i):
+                self._send_line(command)
+                self._send_item(items[pending[i]])
+
+            def rec_one(i):
+                value = rec_value()
+                self._check_status_collect(errors, command, items[pending[i]])
+                return value
+
+            replies = self._exchange_batch(len(pending), send_one, rec_one)
+
+        if errors:
+            raise PipelineError(errors)
+
+        for i, value in zip(pending, replies):
+            values[i] = value
+            if cache_key is not None:
+                self._cache_set(gen, items[i].item, cache_key, value)
+        return values
+
+    def _get_poses_batch(self, items: List['Item'], command: str, as_numpy: bool):
+        """Retrieves the poses of a list of items with one request per item (G_Hlocal or G_Hlocal_Abs), see _get_batch"""
+        if as_numpy:
+            import numpy as np
+            poses = self._get_batch(items, command, lambda: self._rec_doubles_numpy(16))
+            # Poses are received column by column
+            return np.stack(poses).reshape(-1, 4, 4).swapaxes(1, 2) if poses else np.empty((0, 4, 4))
+
+        return self._get_batch(items, command, self._rec_poseh if self.POSEH else self._rec_pose)
+
     def _check_color(self, color: List[float]) -> List[float]:
         """Formats the color in a vector of size 4x1 and ranges [0,1]"""
         if not isinstance(color, list) or len(color) < 3 or len(color) > 4:
@@ -884,39 +1249,176 @@ class Robolink:
             print("WARNING: Color provided is not in the range [0,1] ([r,g,b,a])")
         return color
 
+    def _recv_reset(self):
+        """Discard any buffered input and bind the receive buffer to the current communication object (COM)"""
+        self._rx_com = self.COM
+        self._rx_buf = bytearray(self.RECV_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_start = 0
+        self._rx_end = 0
+        # Custom communication objects may only implement recv()
+        self._rx_use_recv_into = hasattr(self.COM, 'recv_into')
+
+    def _com_reset(self):
+        """Discard the partial command, the pending status of pipelined commands and the buffered input of the previous communication object (COM)"""
+        self._tx_buf = bytearray()
+        self._tx_mark = 0
+        self._pending_status = []
+        self._recv_reset()
+
+    def _recv_into(self, view: memoryview) -> int:
+        """Reads available bytes from COM into view (at least 1 byte). Returns the number of bytes read."""
+        if self._tx_buf:
+            # Make sure RoboDK received the complete command before waiting for the reply
+            self._send_flush()
+
+        if self._rx_use_recv_into:
+            nbytes = self.COM.recv_into(view)
+        else:
+            data = self.COM.recv(len(view))
+            nbytes = len(data)
+            view[:nbytes] = data
+
+        if nbytes <= 0:
+            raise Exception('Communication problems: the connection with RoboDK was closed')
+        return nbytes
+
+    def _recv_fill(self, nbytes: int):
+        """Makes sure that at least nbytes are available in the receive buffer. nbytes must not exceed the buffer size."""
+        if self._rx_start + nbytes > len(self._rx_buf):
+            # Move the unread data to the start of the buffer
+            navail = self._rx_end - self._rx_start
+            self._rx_buf[:navail] = self._rx_view[self._rx_start:self._rx_end]
+            self._rx_start = 0
+            self._rx_end = navail
+
+        while self._rx_end - self._rx_start < nbytes:
+            self._rx_end += self._recv_into(self._rx_view[self._rx_end:])
+
+    def _recv_exact(self, nbytes: int) -> Union[bytes, bytearray]:
+        """Receives exactly nbytes from RoboDK (blocking). Short reads from the socket are handled transparently."""
+        if self._pending_status:
+            # Replies of pipelined commands come first
+            self._pipeline_drain()
+
+        if self._rx_buf is None or self._rx_com is not self.COM:
+            self._recv_reset()
+
+        if nbytes > len(self._rx_buf):
+            # Large payloads (matrices, files, ...) are read directly into their own buffer
+            return self._recv_buffer(nbytes)
+
+        if self._rx_end - self._rx_start < nbytes:
+            self._recv_fill(nbytes)
+
+        data = bytes(self._rx_view[self._rx_start:self._rx_start + nbytes])
+        self._rx_start += nbytes
+        return data
+
+    def _recv_buffer(self, nbytes: int) -> bytearray:
+        """Receives exactly nbytes from RoboDK into a new writable buffer (blocking). The socket writes directly into the buffer."""
+        if self._pending_status:
+            self._pipeline_drain()
+
+        if self._rx_buf is None or self._rx_com is not self.COM:
+            self._recv_reset()
+
+        data = bytearray(nbytes)
+        navail = min(self._rx_end - self._rx_start, nbytes)
+        data[:navail] = self._rx_view[self._rx_start:self._rx_start + navail]
+        self._rx_start += navail
+        view = memoryview(data)
+        while navail < nbytes:
+            navail += self._recv_into(view[navail:])
+        return data
+
+    def _rec_doubles_numpy(self, count: int):
+        """Receives count doubles as a 1D NumPy array of float64. The array is a view of the received buffer, converted to the native byte order in place."""
+        import numpy as np
+        values = np.frombuffer(self._recv_buffer(8 * count), dtype='>f8')
+        if not values.dtype.isnative:
+            values = values.byteswap(inplace=True).view(float)
+        return values
+
+    def _send_flush(self):
+        """Sends any pending data of the current command to RoboDK"""
+        data = self._tx_buf
+        if data:
+            self._tx_buf = bytearray()
+            self._tx_mark = 0
+            if hasattr(self.COM, 'sendall'):
+                self.COM.sendall(data)
+            else:
+                # Custom communication objects may only implement send()
+                view = memoryview(data)
+                w = 0
+                while w < len(data):
+                    w += self.COM.send(view[w:])
+
+        if hasattr(self.COM, 'flush'):
+            self.COM.flush()
+
     def _send_line(self, string: str = None):
         """Sends a string of characters with a \\n"""
+        if self._cache is not None and string in _CACHE_INVALIDATE_COMMANDS:
+            self._cache_invalidate()
         string = string.replace('\n', '<br>')
         if sys.version_info[0] < 3:
-            self.COM.send(bytes(string + '\n'))  # Python 2.x only
+            self._tx_buf += bytes(string + '\n')  # Python 2.x only
         else:
-            self.COM.send(bytes(string + '\n', 'utf-8'))  # Python 3.x only
+            self._tx_buf += bytes(string + '\n', 'utf-8')  # Python 3.x only
+
+    def _send_raw(self, data: bytes):
+        """Sends data that is already encoded"""
+        self._tx_buf += data
 
     def _rec_line(self) -> str:
         """Receives a string. It reads until if finds LF (\\n)"""
-        bytes_list = []  # this method is significantly faster than a byte string
-        chari = self.COM.recv(1)
-        while chari != b'\n':  # read until LF
-            bytes_list.append(chari)
-            chari = self.COM.recv(1)
-        return str(b''.join(bytes_list).decode('utf-8'))  # python 2 and python 3 compatible
+        if self._pending_status:
+            # Replies of pipelined commands come first
+            self._pipeline_drain()
+
+        if self._rx_buf is None or self._rx_com is not self.COM:
+            self._recv_reset()
+
+        idx_search = self._rx_start
+        while True:
+            idx_lf = self._rx_buf.find(b'\n', idx_search, self._rx_end)
+            if idx_lf >= 0:
+                break
+
+            # Read more data (grow the buffer if the line is longer than the buffer)
+            idx_search = self._rx_end - self._rx_start
+            if idx_search >= len(self._rx_buf):
+                rx_buf = bytearray(2 * len(self._rx_buf))
+                rx_buf[:idx_search] = self._rx_view[self._rx_start:self._rx_end]
+                self._rx_buf = rx_buf
+                self._rx_view = memoryview(rx_buf)
+                self._rx_start = 0
+                self._rx_end = idx_search
+            self._recv_fill(idx_search + 1)
+            idx_search += self._rx_start
+
+        line = bytes(self._rx_view[self._rx_start:idx_lf])
+        self._rx_start = idx_lf + 1
+        return str(line.decode('utf-8'))  # python 2 and python 3 compatible
 
     def _send_item(self, item: Union[int, 'Item']):
         """Sends an item pointer"""
         if isinstance(item, Item):
-            self.COM.send(struct.pack('>Q', item.item))  #q=unsigned long long (64 bits), d=float64
+            self._tx_buf += struct.pack('>Q', item.item)  #q=unsigned long long (64 bits), d=float64
             return
         if item is None:
             item = 0
-        self.COM.send(struct.pack('>Q', item))  #q=unsigned long long (64 bits), d=float64
+        self._tx_buf += struct.pack('>Q', item)  #q=unsigned long long (64 bits), d=float64
 
     def _rec_item(self) -> 'Item':
         """Receives an item pointer"""
-        buffer = self.COM.recv(8)
-        item = struct.unpack('>Q', buffer)  #q=unsigned long long (64 bits), d=float64
-        buffer2 = self.COM.recv(4)
-        itemtype = struct.unpack('>i', buffer2)
-        return Item(self, item[0], itemtype[0])
+        buffer = self._recv_exact(12)
+        item, itemtype = struct.unpack('>Qi', buffer)  #q=unsigned long long (64 bits), d=float64
+        if self._cache is not None and item != 0:
+            self._cache_set(self._cache_gen, item, 'type', itemtype)
+        return Item(self if self._item_link is None else self._item_link, item, itemtype)
 
     def _send_bytes(self, data: Union[bytes, str]):
         """Sends a byte array"""
@@ -925,46 +1427,46 @@ class Robolink:
         if not isinstance(data, bytes):
             data = bytes(data)
 
-        self.COM.send(struct.pack('>I', len(data)))  #q=unsigned long long (64 bits), d=float64
-        self.COM.send(data)
+        self._tx_buf += struct.pack('>I', len(data))  #q=unsigned long long (64 bits), d=float64
+        self._tx_buf += data
 
     def _rec_bytes(self) -> bytes:
         """Receives a byte array"""
-        buffer = self.COM.recv(4)
+        buffer = self._recv_exact(4)
         bytes_len = struct.unpack('>I', buffer)[0]  #q=unsigned long long (64 bits), d=float64
-        bytes_list = []  # this method is significantly faster than a byte string
-        bytes_count = 0
-        bytes_remaining = bytes_len
-        while bytes_remaining > 0:
-            data = self.COM.recv(bytes_remaining)
-            bytes_list.append(data)
-            bytes_count += len(data)
-            bytes_remaining = bytes_len - bytes_count
-        return b''.join(bytes_list)
+        return bytes(self._recv_exact(bytes_len))
 
     def _send_ptr(self, ptr_h: int):
         """Sends a generic pointer"""
-        self.COM.send(struct.pack('>Q', ptr_h))  #q=unsigned long long (64 bits), d=float64
+        self._tx_buf += struct.pack('>Q', ptr_h)  #q=unsigned long long (64 bits), d=float64
 
     def _rec_ptr(self) -> int:
         """Receives a generic pointer"""
-        buffer = self.COM.recv(8)
+        buffer = self._recv_exact(8)
         ptr_h = struct.unpack('>Q', buffer)  #q=unsigned long long (64 bits), d=float64
         return ptr_h[0]  #return ptr_h
 
     def _send_pose(self, pose: robomath.Mat):
         """Sends a pose (4x4 matrix)"""
+        if isinstance(pose, robomath.PoseH):
+            self._tx_buf += pose.toBytes()
+            return
+        if _is_numpy(pose):
+            self._tx_buf += _f8_columns(pose)
+            return
+        if pose._a is not None:
+            self._tx_buf += _f8_columns(pose._a)
+            return
         #if not pose.isHomogeneous(): # this check is expansive!
         #    print("Warning: pose is not homogeneous!")
         #    print(pose)
         lst2 = list(map(list, zip(*pose.rows)))
         data = [struct.pack('>4d', *(lst2[i])) for i in range(4)]
-        data_all = b''.join(data)
-        self.COM.send(data_all)
+        self._tx_buf += b''.join(data)
 
     def _rec_pose(self) -> robomath.Mat:
         """Receives a pose (4x4 matrix)"""
-        posebytes = self.COM.recv(16 * 8)
+        posebytes = self._recv_exact(16 * 8)
         posenums = struct.unpack('>16d', posebytes)
         pose = robomath.Mat(4, 4)
         cnt = 0
@@ -974,16 +1476,20 @@ class Robolink:
                 cnt = cnt + 1
         return pose
 
+    def _rec_poseh(self) -> robomath.PoseH:
+        """Receives a pose as a PoseH"""
+        return robomath.PoseH.fromBytes(self._recv_exact(16 * 8))
+
     def _send_xyz(self, pos: List[float]):
         """Sends an xyz vector"""
         posbytes = b''
         for i in range(3):
             posbytes = posbytes + struct.pack('>d', pos[i])
-        self.COM.send(posbytes)
+        self._tx_buf += posbytes
 
     def _rec_xyz(self) -> List[float]:
         """Receives an xyz vector"""
-        posbytes = self.COM.recv(3 * 8)
+        posbytes = self._recv_exact(3 * 8)
         posnums = struct.unpack('>3d', posbytes)
         pos = [0, 0, 0]
         for i in range(3):
@@ -996,11 +1502,11 @@ class Robolink:
             num = round(num)
         elif not isinstance(num, int):
             num = num[0]
-        self.COM.send(struct.pack('>i', num))
+        self._tx_buf += struct.pack('>i', num)
 
     def _rec_int(self) -> int:
         """Receives an int (32 bits)"""
-        buffer = self.COM.recv(4)
+        buffer = self._recv_exact(4)
         num = struct.unpack('>i', buffer)
         return num[0]
 
@@ -1011,18 +1517,21 @@ class Robolink:
         nval = len(values)
         self._send_int(nval)
         if nval > 0:
-            data = struct.pack('>' + str(nval) + 'd', *values)
-            self.COM.send(data)
+            self._tx_buf += struct.pack('>' + str(nval) + 'd', *values)
 
     def _send_array_float_data(self, values: List[float]):
         nval = len(values)
         return struct.pack('>i', nval) + struct.pack('>' + str(nval) + 'f', *values)
 
-    def _rec_array(self) -> robomath.Mat:
-        """Receives an array of doubles"""
+    def _rec_array(self, as_numpy: bool = False) -> robomath.Mat:
+        """Receives an array of doubles. Returns a 1D NumPy array if as_numpy is True."""
         nvalues = self._rec_int()
+        if as_numpy:
+            return self._rec_doubles_numpy(nvalues)
+        if nvalues > 0 and robomath._np():
+            return robomath.Mat._fromArray(self._rec_doubles_numpy(nvalues).reshape(nvalues, 1))
         if nvalues > 0:
-            buffer = self.COM.recv(8 * nvalues)
+            buffer = self._recv_exact(8 * nvalues)
             values = list(struct.unpack('>' + str(nvalues) + 'd', buffer))
         else:
             values = [0]
@@ -1036,6 +1545,15 @@ class Robolink:
             return
         if type(mat) == list:
             mat = robomath.Mat(mat).tr()
+        array = mat if _is_numpy(mat) else mat._a
+        if array is not None:
+            # NumPy arrays and array backed matrices are encoded in one step
+            if array.ndim != 2:
+                raise Exception('The matrix must be 2 dimensional')
+            self._send_int(array.shape[0])
+            self._send_int(array.shape[1])
+            self._tx_buf += _f8_columns(array)
+            return
         # size = mat.size()
         #self._send_int(size[0])
         #self._send_int(size[1])
@@ -1043,46 +1561,43 @@ class Robolink:
         sz2 = len(mat.rows[0])
         self._send_int(sz1)
         self._send_int(sz2)
-        # list(map(list, zip(*mat.rows)))
-        lst2 = list(map(list, zip(*mat.rows)))
-        data = [struct.pack('>' + str(sz1) + 'd', *(lst2[i])) for i in range(sz2)]
-        data_all = b''.join(data)
-        data_size = len(data_all)
-        w = 0
-        b_sz = 4096 * 2
-        while w < data_size:
-            w += self.COM.send(data_all[w:min(w + b_sz, data_size)])
+        self._tx_buf += struct.pack('>' + str(sz1 * sz2) + 'd', *[v for col in zip(*mat.rows) for v in col])
 
     def _send_matrix_float_data(self, mat: robomath.Mat):
         """Sends a 2 dimensional matrix (nxm)"""
         sz1 = len(mat.rows)
         sz2 = len(mat.rows[0])
-        lst2 = list(map(list, zip(*mat.rows)))
-        data = [struct.pack('>' + str(sz1) + 'f', *(lst2[i])) for i in range(sz2)]
-        return struct.pack('>i', sz1) + struct.pack('>i', sz2) + b''.join(data)
+        return struct.pack('>i', sz1) + struct.pack('>i', sz2) + _floats_bytes([v for col in zip(*mat.rows) for v in col], 'big')
 
-    def _rec_matrix(self) -> robomath.Mat:
-        """Receives a 2 dimensional matrix (nxm)"""
+    def _send_shape_float(self, shape: robomath.Mat):
+        """Sends the vertices of a shape as a matrix of floats (3xN or 6xN). The shape can be a Mat (3xN or 6xN) or a NumPy array (Nx3 or Nx6)."""
+        vertices = _shape_vertices(shape)
+        if vertices is None:
+            self._tx_buf += self._send_matrix_float_data(shape)
+            return
+
+        # One row per vertex is the column major layout of the 3xN or 6xN matrix
+        self._send_int(vertices.shape[1])
+        self._send_int(vertices.shape[0])
+        for chunk in _float_chunks(vertices, '>f4'):
+            self._tx_buf += chunk
+
+    def _rec_matrix(self, as_numpy: bool = False) -> robomath.Mat:
+        """Receives a 2 dimensional matrix (nxm). Returns a NumPy array of shape (n, m) if as_numpy is True."""
         size1 = self._rec_int()
         size2 = self._rec_int()
+        return self._rec_matrix_values(size1, size2, as_numpy)
+
+    def _rec_matrix_values(self, size1: int, size2: int, as_numpy: bool = False) -> robomath.Mat:
+        """Receives the values of a size1 x size2 matrix (or of size2 columns of a matrix), sent column by column"""
         recvsize = size1 * size2 * 8
-        BUFFER_SIZE = 512
+        if as_numpy or (recvsize > 0 and robomath._np()):
+            # Values are sent column by column: view the buffer as a transposed array
+            array = self._rec_doubles_numpy(size1 * size2).reshape(size2, size1).T
+            return array if as_numpy else robomath.Mat._fromArray(array)
         if recvsize > 0:
-            bytes_list = []  # this method is significantly faster than a byte string
-            bytes_count = 0
-            bytes_remaining = min(recvsize, BUFFER_SIZE)
-            while bytes_remaining > 0:
-                data = self.COM.recv(bytes_remaining)
-                bytes_list.append(data)
-                bytes_count += len(data)
-                bytes_remaining = min(recvsize - bytes_count, BUFFER_SIZE)
-            matnums = struct.unpack('>' + str(size1 * size2) + 'd', b''.join(bytes_list))
-            mat = robomath.Mat(size1, size2)
-            cnt = 0
-            for j in range(size2):
-                for i in range(size1):
-                    mat.rows[i][j] = matnums[cnt]
-                    cnt = cnt + 1
+            matnums = struct.unpack('>' + str(size1 * size2) + 'd', self._recv_exact(recvsize))
+            mat = robomath.Mat([list(matnums[i::size1]) for i in range(size1)])
         else:
             mat = robomath.Mat(0, 0)
         return mat
@@ -1199,7 +1714,11 @@ class Robolink:
         """
         self._SkipStatus = skipstatus
         self._customCOM = com_object
-        self._lock = threading.Lock()
+        self._tx_buf = bytearray()
+        self._pending_status = []
+        self._pipeline_errors = []
+        self._lock = _ComLock(self)
+        self._cache_lock = threading.Lock()
         with self._lock:
             if type(args) is str:
                 if args != "":
@@ -1309,7 +1828,7 @@ class Robolink:
 
             #fprintf(self.COM, sprintf('%i %i'), self.SAFE_MODE, self.AUTO_UPDATE))# appends LF
             if self._SkipStatus:
-                self.COM.flush()
+                self._send_flush()
                 return True
 
             response = self._rec_line()
@@ -1345,6 +1864,9 @@ class Robolink:
                     self.NEW_INSTANCE.wait()
                 self.NEW_INSTANCE = None
 
+        if self._cache_events is not None:
+            self.setCache(False)
+
         with self._lock:
             if self.COM:
                 self.COM.close()
@@ -1355,6 +1877,259 @@ class Robolink:
         .. seealso:: :func:`~robodk.robolink.Robolink.setRunMode`, :func:`~robodk.robolink.Robolink.AddProgram`, :func:`~robodk.robolink.Robolink.ProgramStart`"""
         self.Disconnect()
 
+    @contextlib.contextmanager
+    def pipeline(self):
+        """Context manager to send commands that only return a status flag without waiting for RoboDK to reply (pipeline mode).
+        Commands such as setPose, setVisible, setColor or setParam are queued and sent back-to-back. Their status flags are read when another command waits for a reply, when PipelineSync is called or when the block ends.
+        A :class:`PipelineError` is raised at the end of the block (or by PipelineSync) if any of the queued commands failed. The error lists the calls that caused it.
+
+        Pipeline mode applies to the Robolink instance, including calls made from other threads while the block is active. Pipeline blocks can be nested.
+        Commands are not checked if the skipstatus flag is set (see :class:`Robolink`).
+
+        Example:
+
+        .. code-block:: python
+
+            from robodk.robolink import *
+            from robodk.robomath import *
+            RDK = Robolink()
+            objects = RDK.ItemList(ITEM_TYPE_OBJECT)
+            with RDK.pipeline():
+                for obj in objects:
+                    obj.setPose(obj.Pose() * transl(0, 0, 10))  # Pose() waits for a reply, setPose() does not
+                    obj.setVisible(True)
+
+        .. seealso:: :func:`~robodk.robolink.Robolink.PipelineSync`
+        """
+        with self._lock:
+            self._pipeline_depth += 1
+
+        try:
+            yield self
+
+        except BaseException:
+            with self._lock:
+                self._pipeline_depth -= 1
+                if self._pipeline_depth <= 0:
+                    # Keep the communication consistent and report failed commands, the original exception is raised
+                    self._pipeline_drain()
+                    for call, item, e in self._pipeline_errors:
+                        print('WARNING: Pipelined command ' + call + ' failed: ' + str(e))
+                    self._pipeline_errors = []
+            raise
+
+        with self._lock:
+            self._pipeline_depth -= 1
+            sync = self._pipeline_depth <= 0
+
+        if sync:
+            self.PipelineSync()
+
+    def PipelineSync(self):
+        """Sends all pipelined commands and waits for their status flags. Raises a :class:`PipelineError` if any command failed since the last call.
+
+        .. seealso:: :func:`~robodk.robolink.Robolink.pipeline`
+        """
+        with self._lock:
+            self._pipeline_drain()
+            errors = self._pipeline_errors
+            self._pipeline_errors = []
+
+        if errors:
+            raise PipelineError(errors)
+
+    def setCache(self, enable: bool = True):
+        """Enables or disables the client side cache of item metadata that rarely changes: :func:`~robodk.robolink.Item.Type`, :func:`~robodk.robolink.Item.Name`, :func:`~robodk.robolink.Item.Parent`, :func:`~robodk.robolink.Item.Childs`, :func:`~robodk.robolink.Item.PoseTool` and :func:`~robodk.robolink.Item.getLink`.
+        Cached values are returned without communicating with RoboDK. The types and names of all the items in the station are retrieved in bulk when the cache is enabled, other values are cached the first time they are retrieved.
+
+        A dedicated connection listens to RoboDK events and invalidates the cache when the station changes (EVENT_ITEM_CHANGED, EVENT_ITEM_RENAMED, EVENT_TOOL_MODIFIED and EVENT_STATION_CHANGED).
+        Changes made through this Robolink instance (setName, setParent, Delete, AddFrame, ...) clear the cache immediately. The cache is disabled if the event connection is lost.
+
+        Requires RoboDK v5.6.4 or later. An exception is raised if the event channel can't be started.
+
+        :param enable: Set to False to disable the cache and close the event connection
+        :type enable: bool
+
+        Example:
+
+        .. code-block:: python
+
+            from robodk.robolink import *
+            RDK = Robolink()
+            RDK.setCache()
+            robot = RDK.Item('', ITEM_TYPE_ROBOT)
+            frame = robot.Parent()          # retrieved from RoboDK and cached
+            print(frame.Name())             # cached when the cache was enabled
+            print(robot.Parent().Name())    # no communication with RoboDK
+
+        .. seealso:: :func:`~robodk.robolink.Robolink.ClearCache`
+        """
+        with self._cache_lock:
+            events = self._cache_events
+            self._cache = None
+            self._cache_events = None
+            self._cache_gen += 1
+
+        if events is not None:
+            try:
+                # Unblock the event thread before closing the socket
+                import socket
+                events.COM.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+            events.Disconnect()
+
+        if not enable:
+            return
+
+        events = self._events_connect(_CACHE_EVENTS)
+        with self._cache_lock:
+            self._cache = {}
+            self._cache_events = events
+        t = threading.Thread(target=self._cache_listen, args=(events,))
+        t.daemon = True
+        t.start()
+
+        # Retrieve the types and the names of all items in bulk
+        gen = self._cache_gen
+        items = self.ItemList()
+        names = self.ItemList(list_names=True)
+        if len(items) == len(names):
+            for item, name in zip(items, names):
+                self._cache_set(gen, item.item, 'name', name)
+
+    def _events_connect(self, filter_events: List[int] = None) -> 'Robolink':
+        """Opens a new connection to RoboDK and starts it as an event channel that reports the events in filter_events (EVENT_*), or all events if filter_events is empty.
+        The connection does not time out. Read each event with _rec_int (event) followed by _rec_item (item) and the event data, if any.
+        Filtering events requires RoboDK v5.6.4 or later: an exception is raised if the event channel can't be started."""
+        events = Robolink(self.IP, self.PORT, close_std_out=True, com_object=self._customCOM, skipstatus=self._SkipStatus)
+        with events._lock:
+            if not filter_events:
+                events._send_line('RDK_EVT')
+            else:
+                events._send_line('RDK_EVT_FILTER')
+                events._send_int(len(filter_events))
+                for evt in filter_events:
+                    events._send_int(evt)
+            events._send_int(0)
+            response = events._rec_line()
+            events._rec_int()  # version of the events
+            status = events._rec_int()
+
+        if response != 'RDK_EVT' or status != 0:
+            events.Disconnect()
+            if filter_events:
+                raise Exception('Unable to listen to RoboDK events (RoboDK v5.6.4 or later is required to filter events)')
+            raise Exception('Unable to listen to RoboDK events')
+
+        events.COM.settimeout(None)
+        return events
+
+    def Subscribe(self, robots: List['Item'], fields: List[str] = ['joints'], rate_hz: float = 50, callback=None) -> 'Subscription':
+        """Subscribes to the joints, pose and speed of a list of robots. Samples are retrieved on dedicated connections, so this Robolink instance remains available, and are provided through an iterator or a callback.
+
+        A dedicated event channel listens to EVENT_ROBOT_MOVED: the robots are sampled at rate_hz while they move, with one request for all robots and fields per sample, and one last sample is taken after they stop.
+        Each sample is a dictionary with the time of the sample (time.time(), in seconds) and one list per field, with one value per robot:
+
+        - 'joints': robot joints (:class:`~robodk.robomath.Mat`, see :func:`Item.Joints() <robodk.robolink.Item.Joints>`)
+        - 'pose': pose of the active tool with respect to the active reference frame (see :func:`Item.Pose() <robodk.robolink.Item.Pose>`)
+        - 'speed': joint speeds in deg/s or mm/s, calculated from the joints of the previous sample (zero for the first sample)
+
+        Requires RoboDK v5.6.4 or later. An exception is raised if the event channel can't be started.
+
+        :param robots: list of robots
+        :type robots: list of :class:`.Item`
+        :param fields: values to sample: 'joints', 'pose' and/or 'speed'
+        :type fields: list of str
+        :param rate_hz: maximum number of samples per second
+        :type rate_hz: float
+        :param callback: function called with each sample from the sampling thread. If None, samples are queued and retrieved by iterating the subscription.
+        :type callback: callable
+
+        Example:
+
+        .. code-block:: python
+
+            from robodk.robolink import *
+            RDK = Robolink()
+            robot = RDK.Item('', ITEM_TYPE_ROBOT)
+            with RDK.Subscribe([robot], ['joints', 'speed'], rate_hz=100) as subscription:
+                for sample in subscription:
+                    print(sample['time'], sample['joints'][0].list(), sample['speed'][0])
+
+        .. seealso:: :class:`~robodk.robolink.Subscription`, :func:`~robodk.robolink.Robolink.Joints`
+        """
+        for field in fields:
+            if field not in ['joints', 'pose', 'speed']:
+                raise InputError('Unknown subscription field: ' + str(field))
+        if rate_hz <= 0:
+            raise InputError('The subscription rate must be positive')
+
+        events = self._events_connect([EVENT_ROBOT_MOVED])
+        try:
+            link = Robolink(self.IP, self.PORT, close_std_out=True, com_object=self._customCOM, skipstatus=self._SkipStatus)
+        except Exception:
+            events.Disconnect()
+            raise
+        link.POSEH = self.POSEH
+        return Subscription(link, events, list(robots), list(fields), rate_hz, callback)
+
+    def ClearCache(self):
+        """Clears the values stored in the cache of item metadata (see :func:`~robodk.robolink.Robolink.setCache`).
+
+        .. seealso:: :func:`~robodk.robolink.Robolink.setCache`
+        """
+        self._cache_invalidate()
+
+    def _cache_get(self, ptr: int, key):
+        """Returns the cached value of an item (None if the value is not cached)"""
+        cache = self._cache
+        if cache is None:
+            return None
+        return cache.get((ptr, key))
+
+    def _cache_set(self, gen: int, ptr: int, key, value):
+        """Stores a value in the cache. The value is ignored if the cache was invalidated since gen (_cache_gen) was retrieved, before sending the request."""
+        with self._cache_lock:
+            if self._cache is not None and gen == self._cache_gen:
+                self._cache[(ptr, key)] = value
+
+    def _cache_invalidate(self, ptr: int = None, key=None):
+        """Removes the cached values of an item (or all the values if ptr is None)"""
+        with self._cache_lock:
+            self._cache_gen += 1
+            if self._cache is None:
+                return
+            if ptr is None and key is None:
+                self._cache.clear()
+            else:
+                for k in list(self._cache.keys()):
+                    if (ptr is None or k[0] == ptr) and (key is None or k[1] == key):
+                        del self._cache[k]
+
+    def _cache_listen(self, events: 'Robolink'):
+        """Receives the RoboDK events that invalidate the cache until the event connection is closed"""
+        try:
+            while True:
+                evt = events._rec_int()
+                ptr, itemtype = struct.unpack('>Qi', events._recv_exact(12))
+                if evt == EVENT_ITEM_RENAMED:
+                    events._rec_line()
+                    self._cache_invalidate(ptr, 'name')
+                elif evt == EVENT_TOOL_MODIFIED:
+                    self._cache_invalidate(key='tool')
+                else:
+                    self._cache_invalidate()
+        except Exception:
+            pass
+        finally:
+            # Cached values can't be trusted without events
+            with self._cache_lock:
+                if self._cache_events is events:
+                    self._cache = None
+                    self._cache_events = None
+                    self._cache_gen += 1
+
     def NewLink(self):
         """Reconnect the API using a different communication link."""
         try:
@@ -1366,6 +2141,7 @@ class Robolink:
                     self.COM = self._customCOM()
                 else:
                     self.COM = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._com_reset()
 
                 if self.NODELAY:
                     self.COM.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
@@ -1501,6 +2277,7 @@ class Robolink:
                         self.COM = self._customCOM()
                     else:
                         self.COM = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    self._com_reset()
 
                     if self.NODELAY:
                         self.COM.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
@@ -1646,6 +2423,67 @@ class Robolink:
             self._check_status()
             return retlist
 
+    def TreeSnapshot(self) -> 'TreeSnapshot':
+        """Returns a snapshot of the station tree: the type, name, parent, pose and visibility of every item, with the requests for all the items sent back to back.
+        The snapshot provides lookups by name, type and parent and can be used by :mod:`~robodk.robolinkutils` functions such as :func:`~robodk.robolinkutils.getAncestors`.
+
+        The snapshot is not updated when the station changes. A :class:`PipelineError` is raised if the values of some items can't be retrieved.
+
+        Example:
+
+        .. code-block:: python
+
+            from robodk.robolink import *
+            RDK = Robolink()
+            tree = RDK.TreeSnapshot()
+            for robot in tree.ItemList(ITEM_TYPE_ROBOT):
+                print(tree.Name(robot) + ' is attached to ' + tree.Name(tree.Parent(robot)))
+                print(tree.Pose(robot))
+
+        .. seealso:: :class:`~robodk.robolink.TreeSnapshot`, :func:`~robodk.robolink.Robolink.ItemList`
+        """
+        snapshot = TreeSnapshot(self if self._item_link is None else self._item_link)
+        items = self.ItemList()
+        errors = []
+        while items:
+            with self._lock:
+                self._check_connection()
+                gen = self._cache_gen
+
+                def send_one(i):
+                    for command in ['G_Name', 'G_Parent', 'G_Hlocal', 'G_Visible']:
+                        self._send_line(command)
+                        self._send_item(items[i])
+
+                def rec_one(i):
+                    # All the replies are read before raising errors, otherwise the next replies would be misread
+                    name = self._rec_line()
+                    self._check_status_collect(errors, 'Name', items[i])
+                    parent = self._rec_item()
+                    self._check_status_collect(errors, 'Parent', items[i])
+                    pose = self._rec_poseh() if self.POSEH else self._rec_pose()
+                    self._check_status_collect(errors, 'Pose', items[i])
+                    visible = self._rec_int()
+                    self._check_status_collect(errors, 'Visible', items[i])
+                    return name, parent, pose, visible
+
+                replies = self._exchange_batch(len(items), send_one, rec_one)
+
+            if errors:
+                raise PipelineError(errors)
+
+            parents = []
+            for item, (name, parent, pose, visible) in zip(items, replies):
+                snapshot._add(item, name, parent, pose, visible)
+                self._cache_set(gen, item.item, 'name', name)
+                self._cache_set(gen, item.item, 'parent', (parent.item, parent.type))
+                parents.append(parent)
+
+            # Parents that are not listed by ItemList, such as the station
+            items = list({parent.item: parent for parent in parents if parent.item != 0 and parent not in snapshot}.values())
+
+        return snapshot
+
     def ItemUserPick(self, message: str = "Pick one item", itemtype_or_list: Union[int, List['Item']] = None) -> 'Item':
         """Shows a RoboDK popup to select one Item from the open station.
         An item type (ITEM_TYPE_*) can be specified to filter desired items. If no type is specified, all items are selectable.
@@ -1815,7 +2653,7 @@ class Robolink:
             self._send_line(command)
             self._send_item(item)
             self._send_int(flags)
-            self._check_status()
+            self._check_status_deferred('setFlagsItem')
 
     def getFlagsItem(self, item: 'Item') -> int:
         """Retrieve current item flags. Item flags allow defining how much access the user has to item-specific features. Use FLAG_ITEM_* flags to set one or more flags.
@@ -1896,11 +2734,7 @@ class Robolink:
             self._send_line(command)
             self._send_item(item)
             self._send_int(1 if copy_childs else 0)
-            if self._SkipStatus:
-                self.COM.flush()
-                return
-
-            self._check_status()
+            self._check_status_deferred('Copy', skippable=True)
 
     def Paste(self, paste_to: 'Item' = 0, paste_times: int = 1) -> Union['Item', List['Item']]:
         """Paste the copied item as a dependency of another item (same as Ctrl+V). Paste should be used after Copy(). It returns the newly created item.
@@ -1981,33 +2815,58 @@ class Robolink:
             self._check_status()
             return newitem
 
-    def AddShape(self, triangle_points: Union[List[list], List[robomath.Mat], robomath.Mat], add_to: 'Item' = 0, override_shapes: False = False) -> 'Item':
+    def AddShape(self, triangle_points: Union[List[list], List[robomath.Mat], robomath.Mat], add_to: 'Item' = 0, override_shapes: False = False, decimate: float = 0, max_triangles: int = 0) -> 'Item':
         """Adds a shape provided triangle coordinates. Triangles must be provided as a list of vertices. A vertex normal can be provided optionally.
 
+        Multiple shapes can be added at once by providing a list of shapes. Each shape can be followed by its color as a list of 4 floats [R,G,B,A] (0 to 1 values).
+        Shapes provided as NumPy arrays are encoded in one vectorized step, which is much faster for large meshes.
+
         :param triangle_points: List of vertices grouped by triangles.
-        :type triangle_points: :class:`~robodk.robomath.Mat` (3xN or 6xN matrix, N must be multiple of 3 because vertices must be stacked by groups of 3)
+        :type triangle_points: :class:`~robodk.robomath.Mat` (3xN or 6xN matrix, N must be multiple of 3 because vertices must be stacked by groups of 3), numpy.ndarray (Nx3 or Nx6), or a list of shapes and colors
         :param parent: item to attach the newly added geometry (optional)
         :type parent: :class:`.Item`
         :param override_shapes: Set to True to fill the object with a new shape
         :type override_shapes: bool
+        :param decimate: Simplify each shape before it is added: vertices closer than this distance (in mm) are merged (requires NumPy, see :func:`~robodk.robomesh.Mesh.decimate`)
+        :type decimate: float
+        :param max_triangles: Simplify each shape before it is added so that it has this number of triangles or less (requires NumPy, see :func:`~robodk.robomesh.Mesh.decimate`)
+        :type max_triangles: int
         :return: added object/shape (0 if failed)
         :rtype: :class:`.Item`
 
+        Example:
+
+        .. code-block:: python
+
+            # Add a mesh of 2 colored shapes (one row per vertex)
+            vertices = numpy.load('mesh.npy')  # Nx3 array
+            part = RDK.AddShape([vertices[:300000], [1, 0, 0, 1], vertices[300000:], [0, 0, 1, 1]])
+
+            # Add a coarse version of the mesh for collision checking
+            part_coarse = RDK.AddShape(vertices, decimate=2)
+
         .. seealso:: :func:`~robodk.robolink.Robolink.ProjectPoints`, :func:`~robodk.robolink.Robolink.AddCurve`, :func:`~robodk.robolink.Robolink.AddPoints`
         """
 
+        if decimate > 0 or max_triangles > 0:
+            triangle_points = _decimate_shapes(triangle_points, decimate, max_triangles)
+
+        if _is_numpy(triangle_points):
+            # Shapes provided as NumPy arrays are sent as floats
+            triangle_points = [triangle_points]
+
         if isinstance(triangle_points, list):
-            if len(triangle_points) > 0 and isinstance(triangle_points[0], robomath.Mat):
+            if len(triangle_points) > 0 and _is_shape(triangle_points[0]):
                 # Check special case where we send multiple shapes in one shot
                 list_shapes = []
                 list_colours = []
                 idx = 0
                 while idx < len(triangle_points):
-                    if isinstance(triangle_points[idx], robomath.Mat):
+                    if _is_shape(triangle_points[idx]):
                         list_shapes.append(triangle_points[idx])
                     else:
                         # list of 4 floats assumed
-                        list_colours.append(triangle_points[idx])
+                        list_colours.append([float(c) for c in triangle_points[idx]])
 
                     idx = idx + 1
 
@@ -2019,23 +2878,11 @@ class Robolink:
                         # this will use default colour
                         list_colours.append([0.6, 0.6, 0.6, 1])
 
-                    data = []
-                    data.append(struct.pack('<Q', len(list_shapes)))
-
-                    for shape, color in zip(list_shapes, list_colours):
-                        # sz1 = len(shape.rows)
-                        sz2 = len(shape.rows[0])
-                        ntriangles = int(sz2 / 3)
-                        data.append(struct.pack('<Q', ntriangles))
-                        data.append(struct.pack('<4f', *(color[:4])))
-                        lst2 = list(map(list, zip(*shape.rows)))
-                        data.extend([struct.pack('<3f', *(r[:3])) for r in lst2])
-
                     import tempfile
                     with tempfile.TemporaryDirectory() as td:
                         filetemp = os.path.join(td, 'AddedObject.rdkcadv')
                         with open(filetemp, 'wb') as fid:
-                            fid.write(b''.join(data))
+                            _write_rdkcadv(fid, list_shapes, list_colours)
                         newitem = self.AddFile(filetemp)
 
                     return newitem
@@ -2055,7 +2902,7 @@ class Robolink:
                         self._send_int(1 if override_shapes else 0)
                         self._send_int(len(list_shapes))
                         for shape, color in zip(list_shapes, list_colours):
-                            self._send_matrix(shape)
+                            self._send_matrix(shape.T if _is_numpy(shape) else shape)
                             self._send_array(color)
 
                     else:
@@ -2065,17 +2912,9 @@ class Robolink:
                         self._send_item(add_to)
                         self._send_int(1 if override_shapes else 0)
                         self._send_int(len(list_shapes))
-                        data = []
                         for shape, color in zip(list_shapes, list_colours):
-                            data.append(self._send_matrix_float_data(shape))
-                            data.append(self._send_array_float_data(color))
-
-                        data_all = b''.join(data)
-                        data_size = len(data_all)
-                        w = 0
-                        b_sz = 4096 * 2
-                        while w < data_size:
-                            w += self.COM.send(data_all[w:min(w + b_sz, data_size)])
+                            self._send_shape_float(shape)
+                            self._tx_buf += self._send_array_float_data(color)
 
                     newitem = self._rec_item()
                     self._check_status()
@@ -2101,7 +2940,7 @@ class Robolink:
         """Adds a curve provided point coordinates. The provided points must be a list of vertices. A vertex normal can be provided optionally.
 
         :param curve_points: List of points defining the curve
-        :type curve_points: :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide curve normals as ijk vectors)
+        :type curve_points: :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide curve normals as ijk vectors), or numpy.ndarray (Nx3 or Nx6)
         :param reference_object: item to attach the newly added geometry (optional)
         :type reference_object: :class:`.Item`
         :param add_to_ref: If True, the curve will be added as part of the object in the RoboDK item tree (a reference object must be provided)
@@ -2124,7 +2963,7 @@ class Robolink:
         .. seealso:: :func:`~robodk.robolink.Robolink.ProjectPoints`, :func:`~robodk.robolink.Robolink.AddShape`, :func:`~robodk.robolink.Robolink.AddPoints`
         """
         if isinstance(curve_points, list):
-            if isinstance(curve_points[0], robomath.Mat) or (isinstance(curve_points[0], list) and isinstance(curve_points[0][0], list)):
+            if isinstance(curve_points[0], robomath.Mat) or (isinstance(curve_points[0], list) and isinstance(curve_points[0][0], list)) or (_is_numpy(curve_points[0]) and curve_points[0].ndim == 2):
                 # Multiple curves
                 with self._lock:
                     self._require_build(23750)
@@ -2136,7 +2975,7 @@ class Robolink:
                     self._send_int(projection_type)
                     self._send_int(len(curve_points))
                     for c in curve_points:
-                        self._send_matrix(c)
+                        self._send_matrix(c.T if _is_numpy(c) else c)
 
                     newitem = self._rec_item()
                     self._check_status()
@@ -2144,6 +2983,8 @@ class Robolink:
                 return newitem
 
             curve_points = robomath.Mat(curve_points).tr()
+        elif _is_numpy(curve_points):
+            curve_points = curve_points.T
         elif not isinstance(curve_points, robomath.Mat):
             raise Exception("curve_points must be a 3xN or 6xN list or matrix")
 
@@ -2159,17 +3000,19 @@ class Robolink:
             self._check_status()
             return newitem
 
-    def AddPoints(self, points: Union[List[float], robomath.Mat], reference_object: 'Item' = 0, add_to_ref: bool = False, projection_type: int = PROJECTION_ALONG_NORMAL_RECALC) -> 'Item':
+    def AddPoints(self, points: Union[List[float], robomath.Mat], reference_object: 'Item' = 0, add_to_ref: bool = False, projection_type: int = PROJECTION_ALONG_NORMAL_RECALC, voxel_size: float = 0) -> 'Item':
         """Adds a list of points to an object. The provided points must be a list of vertices. A vertex normal can be provided optionally.
         
         :param points: list of points or matrix
-        :type points: :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide point normals as ijk vectors)
+        :type points: :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide point normals as ijk vectors), or numpy.ndarray (Nx3 or Nx6)
         :param reference_object: item to attach the newly added geometry (optional)
         :type reference_object: :class:`.Item`
         :param add_to_ref: If True, the points will be added as part of the object in the RoboDK item tree (a reference object must be provided)
         :type add_to_ref: bool
         :param projection_type: type of projection. Use the PROJECTION_* flags.
         :type projection_type: int
+        :param voxel_size: Downsample the points before they are added: points in the same voxel of this size (in mm) are replaced by their average (requires NumPy, see :func:`~robodk.robomesh.downsamplePoints`)
+        :type voxel_size: float
         :return: added object/shape (0 if failed)
         :rtype: :class:`.Item`
 
@@ -2196,10 +3039,17 @@ class Robolink:
             
             
         """
+        if voxel_size > 0:
+            from robodk import robomesh
+            points = robomesh.downsamplePoints(points, voxel_size)
+
         with self._lock:
             if isinstance(points, list):
                 points = robomath.Mat(points).tr()
 
+            elif _is_numpy(points):
+                points = points.T
+
             elif not isinstance(points, robomath.Mat):
                 raise Exception("points must be a 3xN or 6xN list or matrix")
             self._check_connection()
@@ -2221,7 +3071,7 @@ class Robolink:
         This function wors with relative coordinates. The points must be relative to the coordinate system where the object is attached to. And the returned points are relative to the reference frame of the same object provided.
 
         :param points: list of points to project
-        :type points: list of points (XYZ or XYZijk list of floats), or :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide point normals as ijk vectors)
+        :type points: list of points (XYZ or XYZijk list of floats), :class:`~robodk.robomath.Mat` (3xN matrix, or 6xN to provide point normals as ijk vectors), or numpy.ndarray (Nx3 or Nx6). Projected points are returned as a NumPy array of the same layout if a NumPy array is provided.
         :param object_project: object to project the points
         :type object_project: :class:`.Item`
         :param projection_type: Type of projection. For example: PROJECTION_ALONG_NORMAL_RECALC will project along the point normal and recalculate the normal vector on the surface projected.
@@ -2232,9 +3082,12 @@ class Robolink:
         For maximum performance results you should provide the points as a 6xN matrix.
 
         The difference between ProjectPoints and AddPoints is that ProjectPoints does not add the points to the RoboDK station.
+
+        .. seealso:: :func:`~robodk.robolinkutils.projectPoints` to project large lists of points in parallel
         """
         with self._lock:
             islist = False
+            isnumpy = _is_numpy(points)
             if isinstance(points, list):
                 islist = True
                 points = robomath.Mat(points).tr()
@@ -2242,6 +3095,9 @@ class Robolink:
                 if points.size(0) != 6 and points.size(1) == 6:
                     points = points.tr()
 
+            elif isnumpy:
+                points = points.T
+
             elif not isinstance(points, robomath.Mat):
                 raise Exception("points must be a 3xN or 6xN list or matrix")
             self._check_connection()
@@ -2251,11 +3107,13 @@ class Robolink:
             self._send_item(object_project)
             self._send_int(projection_type)
             self.COM.settimeout(max(timeout, self.TIMEOUT))
-            projected_points = self._rec_matrix()  # will wait here
+            projected_points = self._rec_matrix(isnumpy)  # will wait here
             self.COM.settimeout(self.TIMEOUT)
             self._check_status()
             if islist:
                 projected_points = list(projected_points)
+            elif isnumpy:
+                projected_points = projected_points.T
             return projected_points
 
 
@@ -2265,11 +3123,7 @@ class Robolink:
             self._require_build(12938)
             self._check_connection()
             self._send_line('RemoveStn')
-            if self._SkipStatus:
-                self.COM.flush()
-                return
-
-            self._check_status()
+            self._check_status_deferred('CloseStation', skippable=True)
 
     def Delete(self, item_list: Union['Item', List['Item']]):
         """Remove a list of items.
@@ -2289,7 +3143,7 @@ class Robolink:
                 self._send_item(itm)
                 itm.item = 0
 
-            self._check_status()
+            self._check_status_deferred('Delete')
 
     def Save(self, filename: str, itemsave: 'Item' = 0):
         """Save an item or a station to a file (formats supported include RDK, STL, ROBOT, TOOL, ...). If no item is provided, the open station is saved.
@@ -2663,7 +3517,7 @@ class Robolink:
             command = 'Render'
             self._send_line(command)
             self._send_int(auto_render)
-            self._check_status()
+            self._check_status_deferred('Render')
 
     def Update(self):
         """Update the screen. This updates the position of all robots and internal links according to previously set values.
@@ -2870,7 +3724,7 @@ class Robolink:
             command = 'SimulateSpeed'
             self._send_line(command)
             self._send_int(speed * 1000)
-            self._check_status()
+            self._check_status_deferred('setSimulationSpeed')
 
     def SimulationSpeed(self):
         """Return the simulation speed. A simulation speed of 1 means real-time simulation.
@@ -3037,7 +3891,7 @@ class Robolink:
                 self._send_line(str(param))
                 self._send_line(str(value).replace('\n', ' '))
 
-            self._check_status()
+            self._check_status_deferred('setParam')
 
     def Command(self, cmd: str, value: Union[str, Dict, robomath.Mat, 'Item'] = '', skip_result: bool = False) -> Union[str, List[robomath.Mat]]:
         """Send a special command. These commands are meant to have a specific effect in RoboDK, such as changing a specific setting or provoke specific events.
@@ -3091,7 +3945,7 @@ class Robolink:
                 import json
                 value = json.dumps(value)
 
-            elif type(value) == robomath.Mat:
+            elif type(value) == robomath.Mat or _is_numpy(value):
                 # Special 2D matrix write/read
                 self._check_connection()
                 command = 'G_Gen_Mat'
@@ -3125,7 +3979,7 @@ class Robolink:
                 self._send_line(command)
                 self._send_line(str(cmd))
                 self._send_line(value)
-                self.COM.flush()
+                self._send_flush()
                 return None
 
             else:
@@ -3181,13 +4035,13 @@ class Robolink:
             command = 'S_ActiveStn'
             self._send_line(command)
             self._send_item(stn)
-            self._check_status()
+            self._check_status_deferred('setActiveStation')
 
     def ShowSequence(self, matrix: Union[robomath.Mat, List[robomath.Mat]], display_type: int = SEQUENCE_DISPLAY_DEFAULT, timeout: float = -1):
         """Displays a sequence of joints or poses in RoboDK.
 
         :param matrix: list of joints as a matrix or as a list of joint arrays, a list of poses, or a sequence of instructions (same sequence that was supported with RoKiSim).
-        :type matrix: list of list of float, a matrix of joints as a :class:`~robodk.robomath.Mat` or a list of poses as :class:`~robodk.robomath.Mat`
+        :type matrix: list of list of float, a matrix of joints as a :class:`~robodk.robomath.Mat` or a list of poses as :class:`~robodk.robomath.Mat`. NumPy arrays of joints (N x nDOFs) or poses (N x 4 x 4) are also accepted.
         :param display_type: display options (SEQUENCE_DISPLAY_*). Use -1 to use default.
         :type display_type: int, optional
         :param timeout: display timeout, in milliseconds. Use -1 to use default.
@@ -3323,7 +4177,7 @@ class Robolink:
             for i in range(len(items)):
                 self._send_item(items[i])
                 self._send_pose(poses[i])
-            self._check_status()
+            self._check_status_deferred('setPoses')
 
     def setPosesAbs(self, items: List['Item'], poses: List[robomath.Mat]):
         """Set the absolute positions (poses) of a list of items with respect to the station reference. For example, the position of an object/frame/target with respect to its parent.
@@ -3345,7 +4199,65 @@ class Robolink:
             for i in range(len(items)):
                 self._send_item(items[i])
                 self._send_pose(poses[i])
-            self._check_status()
+            self._check_status_deferred('setPosesAbs')
+
+    def Poses(self, items: List['Item'], as_numpy: bool = False) -> List[robomath.Mat]:
+        """Returns the relative positions (poses) of a list of items with respect to their parent. This is the same as calling Pose() for each item, with the requests for all the items sent back to back.
+
+        :param items: list of items
+        :type items: list of :class:`.Item`
+        :param as_numpy: Set to True to return the poses as a NumPy array of shape (N, 4, 4)
+        :type as_numpy: bool
+
+        .. code-block:: python
+
+            objects = RDK.ItemList(ITEM_TYPE_OBJECT)
+            for obj, pose in zip(objects, RDK.Poses(objects)):
+                print(pose.Pos())
+
+        .. seealso:: :func:`Item.Pose() <robodk.robolink.Item.Pose>`, :func:`~robodk.robolink.Robolink.setPoses`, :func:`~robodk.robolink.Robolink.PosesAbs`
+        """
+        return self._get_poses_batch(items, 'G_Hlocal', as_numpy)
+
+    def PosesAbs(self, items: List['Item'], as_numpy: bool = False) -> List[robomath.Mat]:
+        """Returns the absolute positions (poses) of a list of items with respect to the station reference. This is the same as calling PoseAbs() for each item, with the requests for all the items sent back to back.
+
+        :param items: list of items
+        :type items: list of :class:`.Item`
+        :param as_numpy: Set to True to return the poses as a NumPy array of shape (N, 4, 4)
+        :type as_numpy: bool
+
+        .. seealso:: :func:`Item.PoseAbs() <robodk.robolink.Item.PoseAbs>`, :func:`~robodk.robolink.Robolink.setPosesAbs`, :func:`~robodk.robolink.Robolink.Poses`
+        """
+        return self._get_poses_batch(items, 'G_Hlocal_Abs', as_numpy)
+
+    def Names(self, items: List['Item']) -> List[str]:
+        """Returns the names of a list of items. This is the same as calling Name() for each item, with the requests for all the items sent back to back.
+
+        .. seealso:: :func:`Item.Name() <robodk.robolink.Item.Name>`, :func:`~robodk.robolink.Robolink.Poses`
+        """
+        return self._get_batch(items, 'G_Name', self._rec_line, 'name')
+
+    def Types(self, items: List['Item']) -> List[int]:
+        """Returns the types (ITEM_TYPE_*) of a list of items. This is the same as calling Type() for each item, with the requests for all the items sent back to back.
+
+        .. seealso:: :func:`Item.Type() <robodk.robolink.Item.Type>`, :func:`~robodk.robolink.Robolink.Poses`
+        """
+        return self._get_batch(items, 'G_Item_Type', self._rec_int, 'type')
+
+    def Colors(self, items: List['Item']) -> List[List[float]]:
+        """Returns the colors of a list of items (objects, tools or robots) in the format [R,G,B,A]. This is the same as calling Color() for each item, with the requests for all the items sent back to back.
+
+        .. seealso:: :func:`Item.Color() <robodk.robolink.Item.Color>`, :func:`~robodk.robolink.Robolink.Poses`
+        """
+        return self._get_batch(items, 'G_Color', lambda: self._rec_array().tolist())
+
+    def Visibles(self, items: List['Item']) -> List[int]:
+        """Returns the visibility of a list of items (1 if the item is visible, otherwise 0). This is the same as calling Visible() for each item, with the requests for all the items sent back to back.
+
+        .. seealso:: :func:`Item.Visible() <robodk.robolink.Item.Visible>`, :func:`~robodk.robolink.Robolink.Poses`
+        """
+        return self._get_batch(items, 'G_Visible', self._rec_int)
 
     def Joints(self, robot_item_list: List['Item']) -> List[robomath.Mat]:
         """Return the current joints of a list of robots.
@@ -3384,7 +4296,7 @@ class Robolink:
                 self._send_item(robot_item_list[i])
                 self._send_array(joints_list[i])
 
-            self._check_status()
+            self._check_status_deferred('setJoints')
 
     def CalibrateTool(self, poses_xyzwpr: Union[List[robomath.Mat], List[List[float]]], input_format: int = EULER_RX_RY_RZ, algorithm: int = CALIBRATE_TCP_BY_POINT, robot: 'Item' = None, tool: 'Item' = None) -> Tuple[List[float], List[float], List[float]]:
         """Calibrate a TCP given a list of poses/joints and following a specific algorithm/method.
@@ -3548,7 +4460,7 @@ class Robolink:
             command = 'S_ViewPose'
             self._send_line(command)
             self._send_pose(pose)
-            self._check_status()
+            self._check_status_deferred('setViewPose')
 
     def ViewPose(self) -> robomath.Mat:
         """Get the pose of the world reference frame with respect to the view (camera/screen)"""
@@ -4069,11 +4981,7 @@ class Robolink:
             for itm in list_items:
                 self._send_item(itm)
 
-            if self._SkipStatus:
-                self.COM.flush()
-                return self
-
-            self._check_status()
+            self._check_status_deferred('setSelection', skippable=True)
 
     def MergeItems(self, list_items: List['Item'] = []) -> 'Item':
         """Merge multiple object items as one. A new object is created and returned. Provided objects are deleted.
@@ -4138,7 +5046,7 @@ class Robolink:
                     self._send_item(custom_objects[i])
                     self._send_int(custom_ref_flags[i])
 
-            self._check_status()
+            self._check_status_deferred('setInteractiveMode')
 
     def CursorXYZ(self, x_coord: int = -1, y_coord: int = -1) -> Tuple[List[float], 'Item']:
         """Returns the position of the cursor as XYZ coordinates (by default), or the 3D position of a given set of 2D coordinates of the window (x & y coordinates in pixels from the top left corner)
@@ -4171,11 +5079,13 @@ class Robolink:
             self._check_status()
             return xyz, item
 
-    def GetPoints(self, feature_type: int = FEATURE_HOVER_OBJECT_MESH) -> Tuple['Item', int, int, str, List[List[float]]]:
+    def GetPoints(self, feature_type: int = FEATURE_HOVER_OBJECT_MESH, as_numpy: bool = False) -> Tuple['Item', int, int, str, List[List[float]]]:
         """Retrieves the object under the mouse cursor.
 
         :param feature_type: set to FEATURE_HOVER_OBJECT_MESH to retrieve object under the mouse cursor, the selected feature and mesh, or FEATURE_HOVER_OBJECT if you don't need the mesh (faster).
         :type feature_type: int
+        :param as_numpy: set to True to retrieve the mesh as a NumPy array with one row per point (Nx6)
+        :type as_numpy: bool
 
         :return: Object under the mouse cursor, selected feature, feature id, list of points and description
 
@@ -4214,8 +5124,8 @@ class Robolink:
             self._send_int(feature_id)
             points = None
             if feature_type == FEATURE_HOVER_OBJECT_MESH:
-                points = self._rec_matrix()
-                points = list(points)
+                points = self._rec_matrix(as_numpy)
+                points = points.T if as_numpy else list(points)
 
             object = self._rec_item()
             is_frame = self._rec_int() > 0
@@ -4331,16 +5241,838 @@ class Robolink:
             return result > 0
 
 
-class Item:
-    """The Item class represents an item in RoboDK station. An item can be a robot, a frame, a tool, an object, a target, ... any item visible in the station tree.
-    An item can also be seen as a node where other items can be attached to (child items).
-    Every item has one parent item/node and can have one or more child items/nodes.
+class _PoolLease:
+    """Assignment of a RobolinkPool connection to a thread. The connection is returned to the pool when the thread ends."""
 
-    RoboDK Items are automatically created and retrieved by generated by :class:`.Robolink` methods such as :func:`~robodk.robolink.Robolink.Item` and :func:`~robodk.robolink.Robolink.ItemUserPick`
+    def __init__(self, pool: 'RobolinkPool', index: int):
+        self.pool = pool
+        self.index = index
 
-    .. seealso:: :func:`~robodk.robolink.Robolink.Item`, :func:`~robodk.robolink.Robolink.ItemUserPick`
+    def __del__(self):
+        with self.pool._pool_lock:
+            self.pool._pool_threads[self.index] -= 1
 
-    .. code-block:: python
+
+class TreeSnapshot:
+    """Snapshot of the station tree retrieved with :func:`Robolink.TreeSnapshot`. It holds the type, name, parent, pose and visibility of every item.
+
+    Items are looked up without communicating with RoboDK. The values are not updated when the station changes: retrieve a new snapshot instead.
+    Methods that take an item raise an :class:`InputError` if the item is not in the snapshot.
+
+    .. seealso:: :func:`Robolink.TreeSnapshot`
+    """
+
+    def __init__(self, link: 'Robolink'):
+        self.link = link
+        self._items = []
+        self._names = []
+        self._parents = []  # parent items
+        self._poses = []
+        self._visible = []
+        self._index = {}  # item pointer -> index
+        self._by_name = {}  # name -> list of indexes
+        self._by_type = {}  # type -> list of indexes
+        self._by_parent = {}  # parent pointer -> list of indexes
+
+    def _add(self, item: 'Item', name: str, parent: 'Item', pose: robomath.Mat, visible: int):
+        i = len(self._items)
+        self._items.append(item)
+        self._names.append(name)
+        self._parents.append(parent)
+        self._poses.append(pose)
+        self._visible.append(visible)
+        self._index[item.item] = i
+        self._by_name.setdefault(name, []).append(i)
+        self._by_type.setdefault(item.type, []).append(i)
+        self._by_parent.setdefault(parent.item, []).append(i)
+
+    def _i(self, item: 'Item') -> int:
+        """Returns the index of an item"""
+        i = self._index.get(item.item)
+        if i is None:
+            raise InputError("Item is not in the snapshot")
+        return i
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __contains__(self, item: 'Item') -> bool:
+        return item is not None and item.item in self._index
+
+    def __repr__(self) -> str:
+        return "RoboDK tree snapshot (%i items)" % len(self._items)
+
+    def Item(self, name: str, itemtype: int = None) -> 'Item':
+        """Returns the first item with a given name (and type). The item is not valid if it is not found.
+
+        :param name: name of the item
+        :type name: str
+        :param itemtype: type of the item (ITEM_TYPE_*)
+        :type itemtype: int
+        """
+        for i in self._by_name.get(name, []):
+            if itemtype is None or self._items[i].type == itemtype:
+                return self._items[i]
+        return Item(self.link, 0)
+
+    def ItemList(self, filter: int = None, list_names: bool = False) -> Union[List['Item'], List[str]]:
+        """Returns the items of the snapshot, optionally filtered by type (ITEM_TYPE_*), in the same order as :func:`Robolink.ItemList`.
+
+        :param filter: (optional) Filter the list by a specific item type (ITEM_TYPE_*)
+        :type filter: int
+        :param list_names: (optional) Set to True to return a list of names instead of a list of :class:`.Item`
+        :type list_names: bool
+        """
+        indexes = range(len(self._items)) if filter is None else self._by_type.get(filter, [])
+        if list_names:
+            return [self._names[i] for i in indexes]
+        return [self._items[i] for i in indexes]
+
+    def Type(self, item: 'Item') -> int:
+        """Returns the type of an item"""
+        return self._items[self._i(item)].type
+
+    def Name(self, item: 'Item') -> str:
+        """Returns the name of an item"""
+        return self._names[self._i(item)]
+
+    def Parent(self, item: 'Item') -> 'Item':
+        """Returns the parent of an item (not valid for the station)"""
+        return self._parents[self._i(item)]
+
+    def Childs(self, item: 'Item') -> List['Item']:
+        """Returns the items attached to an item"""
+        self._i(item)
+        return [self._items[i] for i in self._by_parent.get(item.item, [])]
+
+    def Pose(self, item: 'Item') -> robomath.Mat:
+        """Returns the pose of an item with respect to its parent (a copy)"""
+        return self._poses[self._i(item)].copy()
+
+    def Visible(self, item: 'Item') -> int:
+        """Returns the visibility of an item"""
+        return self._visible[self._i(item)]
+
+
+class Subscription:
+    """Subscription to the joints, pose and speed of a list of robots, started with :func:`Robolink.Subscribe`.
+    Iterate the subscription to retrieve the samples (the iteration blocks until the next sample). Close the subscription to stop sampling and close its connections.
+
+    If the sampling connection fails, the iteration stops and raises the error.
+
+    .. seealso:: :func:`Robolink.Subscribe`
+    """
+
+    def __init__(self, link: 'Robolink', events: 'Robolink', robots: List['Item'], fields: List[str], rate_hz: float, callback=None):
+        import queue
+        self.link = link
+        self.robots = robots
+        self.fields = fields
+        self.rate_hz = rate_hz
+        self.callback = callback
+        self.error = None
+        self._events = events
+        self._closed = False
+        self._moved = threading.Event()
+        self._samples = queue.Queue()
+        self._last = None  # time and joints of the last sample
+        self._event_thread = threading.Thread(target=self._listen)
+        self._event_thread.daemon = True
+        self._event_thread.start()
+        self._sample_thread = threading.Thread(target=self._run)
+        self._sample_thread.daemon = True
+        self._sample_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def __iter__(self):
+        while True:
+            sample = self._samples.get()
+            if sample is None:
+                if self.error is not None:
+                    raise self.error
+                return
+            yield sample
+
+    def Close(self):
+        """Stops sampling and closes the connections of the subscription. Iterations stop after the queued samples."""
+        if self._closed:
+            return
+        self._closed = True
+        self._moved.set()
+        try:
+            # Unblock the event thread before closing the socket
+            import socket
+            self._events.COM.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        self._events.Disconnect()
+        if self._sample_thread is not threading.current_thread():
+            self._sample_thread.join()
+        self.link.Disconnect()
+
+    def _listen(self):
+        """Receives the robot movement events until the event connection is closed"""
+        try:
+            while True:
+                self._events._rec_int()
+                self._events._rec_item()
+                self._moved.set()
+        except Exception:
+            pass
+
+    def _run(self):
+        """Samples the robots while they move, up to rate_hz"""
+        period = 1.0 / self.rate_hz
+        next_time = time.perf_counter()
+        moving = True  # take a first sample
+        try:
+            while not self._closed:
+                if not moving:
+                    self._moved.wait()
+
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                if self._closed:
+                    break
+
+                # Keep sampling for one more period after the last movement
+                moving = self._moved.is_set()
+                self._moved.clear()
+                sample = self._sample()
+                if self.callback is not None:
+                    self.callback(sample)
+                else:
+                    self._samples.put(sample)
+                next_time = max(next_time + period, time.perf_counter())
+
+        except Exception as e:
+            if not self._closed:
+                self.error = e
+        finally:
+            self._samples.put(None)
+
+    def _sample(self) -> dict:
+        """Retrieves the requested values of all the robots in one exchange with RoboDK"""
+        link = self.link
+        get_joints = 'joints' in self.fields or 'speed' in self.fields
+        get_pose = 'pose' in self.fields
+        joints = []
+        poses = []
+        with link._lock:
+            link._check_connection()
+            if get_joints:
+                link._send_line('G_ThetasList')
+                link._send_int(len(self.robots))
+                for robot in self.robots:
+                    link._send_item(robot)
+            if get_pose:
+                for robot in self.robots:
+                    link._send_line('G_Hlocal')
+                    link._send_item(robot)
+
+            if get_joints:
+                for robot in self.robots:
+                    joints.append(link._rec_array())
+                link._check_status()
+            if get_pose:
+                for robot in self.robots:
+                    poses.append(link._rec_poseh() if link.POSEH else link._rec_pose())
+                    link._check_status()
+
+        sample = {'time': time.time()}
+        if 'joints' in self.fields:
+            sample['joints'] = joints
+        if get_pose:
+            sample['pose'] = poses
+        if 'speed' in self.fields:
+            joints_list = [robot_joints.list() for robot_joints in joints]
+            if self._last is None:
+                sample['speed'] = [[0.0] * len(robot_joints) for robot_joints in joints_list]
+            else:
+                last_time, last_joints = self._last
+                dt = max(sample['time'] - last_time, 1e-9)
+                sample['speed'] = [[(j - j0) / dt for j, j0 in zip(robot_joints, robot_joints0)] for robot_joints, robot_joints0 in zip(joints_list, last_joints)]
+            self._last = (sample['time'], joints_list)
+        return sample
+
+
+class ProgramBuilder:
+    """Builds a program client side and uploads its instructions to RoboDK at once.
+
+    Instructions (moves, speed and rounding changes, tool and frame changes, IO, pauses and code) are stored in compact arrays until :func:`Upload` sends them back to back.
+
+    By default, moves given as poses or joints are added to the program without target items. Set add_targets to True to create a hidden target for each move instead.
+    Circular moves (MoveC) given as poses or joints always use hidden targets.
+
+    :param link: Robolink instance
+    :type link: :class:`Robolink`
+    :param program: name of the new program or an existing program to add the instructions to
+    :type program: str or :class:`.Item`
+    :param robot: robot used by the program and its targets
+    :type robot: :class:`.Item`
+    :param add_targets: set to True to create a hidden target item for each move given as a pose or joints
+    :type add_targets: bool
+
+    Example:
+
+    .. code-block:: python
+
+        from robodk.robolink import *
+        from robodk.robomath import *
+        RDK = Robolink()
+        robot = RDK.Item('', ITEM_TYPE_ROBOT)
+        builder = ProgramBuilder(RDK, 'Path', robot)
+        builder.setSpeed(200)
+        builder.setRounding(1)
+        builder.MoveJ(robot.JointsHome())
+        builder.MoveL([robot.Pose() * transl(i, 0, 0) for i in range(20000)])
+        builder.setDO('OUT1', 1)
+        program, indexes = builder.Upload()
+
+    .. seealso:: :func:`Robolink.AddProgram`
+    """
+
+    _OP_MOVE = 0
+    _OP_MOVEC = 1
+    _OP_SPEED = 2
+    _OP_ROUNDING = 3
+    _OP_TOOL = 4
+    _OP_FRAME = 5
+    _OP_DO = 6
+    _OP_AO = 7
+    _OP_PAUSE = 8
+    _OP_CODE = 9
+
+    _TARGET_JOINTS = 1
+    _TARGET_POSE = 2
+    _TARGET_ITEM = 3
+
+    def __init__(self, link: 'Robolink', program: Union[str, 'Item'], robot: 'Item' = None, add_targets: bool = False):
+        from array import array
+        self.link = link
+        self.program = program
+        self.robot = robot
+        self.add_targets = add_targets
+        self._ops = array('b')  # operation of each instruction
+        self._starts = array('q')  # index of the first value of each instruction
+        self._values = array('d')  # values of all instructions (poses are stored column by column)
+        self._objects = []  # items and strings, referenced by index in the values
+
+    def __len__(self):
+        return len(self._ops)
+
+    def _add(self, op: int, values: List[float]):
+        self._ops.append(op)
+        self._starts.append(len(self._values))
+        self._values.extend(values)
+
+    def _object(self, obj) -> int:
+        self._objects.append(obj)
+        return len(self._objects) - 1
+
+    def _target(self, target) -> List[float]:
+        """Encodes a target as [target type, values...]"""
+        if isinstance(target, Item):
+            return [self._TARGET_ITEM, self._object(target)]
+        if isinstance(target, robomath.PoseH):
+            return [self._TARGET_POSE] + list(target._d)
+        if _is_numpy(target):
+            if target.shape == (4, 4):
+                return [self._TARGET_POSE] + target.T.ravel().tolist()
+            return [self._TARGET_JOINTS] + target.ravel().tolist()
+        if isinstance(target, robomath.Mat):
+            if target.size() == (4, 4):
+                return [self._TARGET_POSE] + sum(target.Cols(), [])
+            return [self._TARGET_JOINTS] + target.list()
+        return [self._TARGET_JOINTS] + [float(j) for j in target]
+
+    def _move(self, movetype: int, target):
+        if _is_numpy(target) and target.ndim == 3:
+            # Poses, Nx4x4
+            import numpy as np
+            for values in np.ascontiguousarray(np.swapaxes(target, 1, 2), dtype=float).reshape(-1, 16):
+                self._add(self._OP_MOVE, [movetype, self._TARGET_POSE] + values.tolist())
+        elif _is_numpy(target) and target.ndim == 2 and target.shape != (4, 4):
+            # Joints, NxnDOF
+            for values in target:
+                self._add(self._OP_MOVE, [movetype, self._TARGET_JOINTS] + values.tolist())
+        elif isinstance(target, (list, tuple)) and len(target) > 0 and not isinstance(target[0], (int, float)):
+            for target_i in target:
+                self._add(self._OP_MOVE, [movetype] + self._target(target_i))
+        else:
+            self._add(self._OP_MOVE, [movetype] + self._target(target))
+        return self
+
+    def MoveJ(self, target: Union['Item', List[float], robomath.Mat]) -> 'ProgramBuilder':
+        """Adds joint moves. The target can be a target item, the robot joints, a pose, a list of targets, or a NumPy array of poses (Nx4x4) or joints (NxnDOF)."""
+        return self._move(MOVE_TYPE_JOINT, target)
+
+    def MoveL(self, target: Union['Item', List[float], robomath.Mat]) -> 'ProgramBuilder':
+        """Adds linear moves. The target can be a target item, the robot joints, a pose, a list of targets, or a NumPy array of poses (Nx4x4) or joints (NxnDOF)."""
+        return self._move(MOVE_TYPE_LINEAR, target)
+
+    def MoveC(self, target1: Union['Item', List[float], robomath.Mat], target2: Union['Item', List[float], robomath.Mat]) -> 'ProgramBuilder':
+        """Adds a circular move through target1 to target2"""
+        values1 = self._target(target1)
+        self._add(self._OP_MOVEC, [len(values1)] + values1 + self._target(target2))
+        return self
+
+    def setSpeed(self, speed_linear: float, speed_joints: float = -1, accel_linear: float = -1, accel_joints: float = -1) -> 'ProgramBuilder':
+        """Adds a speed change, see :func:`Item.setSpeed() <robodk.robolink.Item.setSpeed>`"""
+        self._add(self._OP_SPEED, [speed_linear, speed_joints, accel_linear, accel_joints])
+        return self
+
+    def setRounding(self, rounding_mm: float) -> 'ProgramBuilder':
+        """Adds a rounding change, see :func:`Item.setRounding() <robodk.robolink.Item.setRounding>`"""
+        self._add(self._OP_ROUNDING, [rounding_mm])
+        return self
+
+    def setPoseTool(self, tool: Union['Item', robomath.Mat]) -> 'ProgramBuilder':
+        """Adds a tool change (tool item or pose), see :func:`Item.setPoseTool() <robodk.robolink.Item.setPoseTool>`"""
+        self._add(self._OP_TOOL, self._target(tool))
+        return self
+
+    def setPoseFrame(self, frame: Union['Item', robomath.Mat]) -> 'ProgramBuilder':
+        """Adds a reference frame change (frame item or pose), see :func:`Item.setPoseFrame() <robodk.robolink.Item.setPoseFrame>`"""
+        self._add(self._OP_FRAME, self._target(frame))
+        return self
+
+    def setDO(self, io_var: Union[int, str], io_value: Union[int, float, str]) -> 'ProgramBuilder':
+        """Adds a digital output change, see :func:`Item.setDO() <robodk.robolink.Item.setDO>`"""
+        self._add(self._OP_DO, [self._object(str(io_var)), self._object(str(io_value))])
+        return self
+
+    def setAO(self, io_var: Union[int, str], io_value: Union[int, float, str]) -> 'ProgramBuilder':
+        """Adds an analog output change, see :func:`Item.setAO() <robodk.robolink.Item.setAO>`"""
+        self._add(self._OP_AO, [self._object(str(io_var)), self._object(str(io_value))])
+        return self
+
+    def Pause(self, time_ms: float = -1) -> 'ProgramBuilder':
+        """Adds a pause (-1 waits for the user), see :func:`Item.Pause() <robodk.robolink.Item.Pause>`"""
+        self._add(self._OP_PAUSE, [time_ms])
+        return self
+
+    def RunInstruction(self, code: str, run_type: int = INSTRUCTION_CALL_PROGRAM) -> 'ProgramBuilder':
+        """Adds a program call, code, message or comment, see :func:`Item.RunInstruction() <robodk.robolink.Item.RunInstruction>`"""
+        self._add(self._OP_CODE, [self._object(code), run_type])
+        return self
+
+    def _instruction(self, i: int):
+        """Returns the operation and the values of instruction i"""
+        end = self._starts[i + 1] if i + 1 < len(self._starts) else len(self._values)
+        return self._ops[i], self._values[self._starts[i]:end]
+
+    def _needs_target(self, op: int, target_type: float) -> bool:
+        return target_type != self._TARGET_ITEM and (op == self._OP_MOVEC or self.add_targets)
+
+    def Upload(self) -> Tuple['Item', List[int]]:
+        """Creates the program (if a name was provided) and uploads the instructions. The instructions stay in the builder, so the builder can be uploaded to several programs.
+        Raises a :class:`PipelineError` with all the instructions that failed, after all the instructions are sent.
+
+        :return: the program item and the index of the program instruction created for each instruction of the builder
+        :rtype: tuple of (:class:`.Item`, list of int)
+        """
+        link = self.link
+        robot = self.robot if self.robot is not None else 0
+        if isinstance(self.program, Item):
+            program = self.program
+            program_name = program.Name()
+            first_index = program.InstructionCount()
+        else:
+            program = link.AddProgram(self.program, robot)
+            program_name = self.program
+            first_index = 0
+
+        # Targets given as poses or joints that need a target item: (instruction, offset of the target values)
+        target_refs = []
+        for i in range(len(self)):
+            op, values = self._instruction(i)
+            if op == self._OP_MOVE and self._needs_target(op, values[1]):
+                target_refs.append((i, 1))
+            elif op == self._OP_MOVEC:
+                offset2 = 1 + int(values[0])
+                for offset in [1, offset2]:
+                    if self._needs_target(op, values[offset]):
+                        target_refs.append((i, offset))
+
+        errors = []
+        with link._lock:
+            link._check_connection()
+
+            def send_target(j):
+                link._send_line('Add_TARGET')
+                link._send_line('%s Target %i' % (program_name, j + 1))
+                link._send_item(0)
+                link._send_item(robot)
+
+            def rec_target(j):
+                target = link._rec_item()
+                link._check_status()
+                return target
+
+            targets = dict(zip(target_refs, link._exchange_batch(len(target_refs), send_target, rec_target)))
+            replies = {}  # instruction -> list of (command, reads an int before the status)
+
+            def send_target_values(command_list, target, target_values):
+                if target_values[0] == self._TARGET_JOINTS:
+                    link._send_line('S_Thetas')
+                    link._send_array(list(target_values[1:]))
+                    link._send_item(target)
+                    link._send_line('S_Target_As_JT')
+                    link._send_item(target)
+                    calls = ['setJoints', 'setAsJointTarget']
+                else:
+                    link._send_line('S_Hlocal')
+                    link._send_item(target)
+                    link._send_pose(robomath.PoseH.fromCols(target_values[1:17]))
+                    link._send_line('S_Target_As_RT')
+                    link._send_item(target)
+                    calls = ['setPose', 'setAsCartesianTarget']
+                link._send_line('S_Visible')
+                link._send_item(target)
+                link._send_int(0)
+                link._send_int(-1)
+                if not link._SkipStatus:
+                    # RoboDK does not send the status of these commands in skipstatus mode
+                    command_list += [(call, False) for call in calls + ['setVisible']]
+
+            def target_item(i, offset, target_values):
+                if target_values[0] == self._TARGET_ITEM:
+                    return self._objects[int(target_values[1])]
+                return targets[(i, offset)]
+
+            def send_one(i):
+                op, values = self._instruction(i)
+                command_list = replies[i] = []
+                if op == self._OP_MOVE:
+                    movetype = int(values[0])
+                    target_values = values[1:]
+                    if target_values[0] == self._TARGET_ITEM or (i, 1) in targets:
+                        target = target_item(i, 1, target_values)
+                        if target_values[0] != self._TARGET_ITEM:
+                            send_target_values(command_list, target, target_values)
+                        link._send_line('Add_INSMOVE')
+                        link._send_item(target)
+                        link._send_item(program)
+                        link._send_int(movetype)
+                        command_list.append(('MoveJ' if movetype == MOVE_TYPE_JOINT else 'MoveL', False))
+                    else:
+                        link._send_line('MoveX')
+                        link._send_int(movetype)
+                        link._send_int(int(target_values[0]))
+                        link._send_array(list(target_values[1:]))
+                        link._send_item(0)
+                        link._send_item(program)
+                        command_list.append(('MoveJ' if movetype == MOVE_TYPE_JOINT else 'MoveL', False))
+
+                elif op == self._OP_MOVEC:
+                    offset2 = 1 + int(values[0])
+                    items = []
+                    for offset, target_values in [(1, values[1:offset2]), (offset2, values[offset2:])]:
+                        target = target_item(i, offset, target_values)
+                        if target_values[0] != self._TARGET_ITEM:
+                            send_target_values(command_list, target, target_values)
+                        items.append(target)
+                    link._send_line('Add_INSMOVEC')
+                    link._send_item(items[0])
+                    link._send_item(items[1])
+                    link._send_item(program)
+                    command_list.append(('MoveC', False))
+
+                elif op == self._OP_SPEED:
+                    link._send_line('S_Speed4')
+                    link._send_item(program)
+                    link._send_array(list(values))
+                    command_list.append(('setSpeed', False))
+
+                elif op == self._OP_ROUNDING:
+                    link._send_line('S_ZoneData')
+                    link._send_int(values[0] * 1000)
+                    link._send_item(program)
+                    command_list.append(('setRounding', False))
+
+                elif op in [self._OP_TOOL, self._OP_FRAME]:
+                    if values[0] == self._TARGET_ITEM:
+                        link._send_line('S_Tool_ptr' if op == self._OP_TOOL else 'S_Link_ptr')
+                        link._send_item(self._objects[int(values[1])])
+                    else:
+                        link._send_line('S_Tool' if op == self._OP_TOOL else 'S_Frame')
+                        link._send_pose(robomath.PoseH.fromCols(values[1:17]))
+                    link._send_item(program)
+                    command_list.append(('setPoseTool' if op == self._OP_TOOL else 'setPoseFrame', False))
+
+                elif op in [self._OP_DO, self._OP_AO]:
+                    link._send_line('setDO' if op == self._OP_DO else 'setAO')
+                    link._send_item(program)
+                    link._send_line(self._objects[int(values[0])])
+                    link._send_line(self._objects[int(values[1])])
+                    command_list.append(('setDO' if op == self._OP_DO else 'setAO', False))
+
+                elif op == self._OP_PAUSE:
+                    link._send_line('RunPause')
+                    link._send_item(program)
+                    link._send_int(values[0] * 1000.0)
+                    command_list.append(('Pause', False))
+
+                elif op == self._OP_CODE:
+                    link._send_line('RunCode2')
+                    link._send_item(program)
+                    link._send_line(self._objects[int(values[0])].replace('\r\n', '<<br>>').replace('\n', '<<br>>'))
+                    link._send_int(int(values[1]))
+                    command_list.append(('RunInstruction', True))
+
+            def rec_one(i):
+                for call, rec_int in replies.pop(i):
+                    if rec_int:
+                        link._rec_int()
+                    link._check_status_collect(errors, call, program)
+
+            link._exchange_batch(len(self), send_one, rec_one)
+
+        if errors:
+            raise PipelineError(errors)
+
+        return program, list(range(first_index, first_index + len(self)))
+
+
+class _MatrixStream:
+    """Matrix received in chunks of columns on a dedicated connection. send_request(link) sends the request on the dedicated connection and subclasses receive the data that follows the matrix."""
+
+    def __init__(self, link: 'Robolink', send_request, chunk_size: int, as_numpy: bool, timeout: float = None):
+        self.chunk_size = max(1, int(chunk_size))
+        self.as_numpy = as_numpy
+        self.timeout = timeout
+        self.shape = None
+        self.link = Robolink(link.IP, link.PORT, close_std_out=True, com_object=link._customCOM, skipstatus=link._SkipStatus)
+        with self.link._lock:
+            # RoboDK starts the calculation when it receives the request
+            send_request(self.link)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def __iter__(self):
+        link = self.link
+        if link is None:
+            return
+
+        try:
+            if self.timeout is not None:
+                link.COM.settimeout(max(self.timeout, link.TIMEOUT))
+            nrows = link._rec_int()
+            ncols = link._rec_int()
+            self.shape = (nrows, ncols)
+            for start in range(0, ncols, self.chunk_size):
+                yield self._rec_chunk(link, nrows, min(self.chunk_size, ncols - start))
+
+            self._rec_tail(link)
+            link._check_status()
+        finally:
+            self.Close()
+
+    def Close(self):
+        """Closes the dedicated connection. Chunks that were not consumed are discarded."""
+        if self.link is not None:
+            self.link.Disconnect()
+            self.link = None
+
+    def _rec_chunk(self, link: 'Robolink', nrows: int, ncols: int):
+        """Receives ncols columns of the matrix"""
+        return link._rec_matrix_values(nrows, ncols, self.as_numpy)
+
+    def _rec_tail(self, link: 'Robolink'):
+        """Receives the data sent after the matrix"""
+        pass
+
+
+class JointListStream(_MatrixStream):
+    """Joint list of a program received in chunks, see :func:`Item.InstructionListJointsStream`.
+    Iterate the stream to retrieve the chunks: each chunk is a matrix with one column per entry (joints, error, mm step, deg step, move id, ...), as returned by :func:`Item.InstructionListJoints`.
+
+    The stream can be iterated once. The dedicated connection is closed when all the chunks are consumed, when the iteration stops early or when :func:`Close` is called.
+
+    :ivar str message: human readable error message (available once all the chunks are consumed)
+    :ivar int status: status of the program, negative if there are program issues (available once all the chunks are consumed)
+    :ivar tuple shape: number of rows and entries of the complete joint list (available once the first chunk is received)
+    """
+
+    def __init__(self, program: 'Item', params: List[float], chunk_size: int = 1000, as_numpy: bool = False):
+        self.program = program
+        self.params = params
+        self.message = None
+        self.status = None
+
+        def send_request(link):
+            link._send_line('G_ProgJointList')
+            link._send_item(program)
+            link._send_array(params)
+            link._send_line('')
+
+        super().__init__(program.link, send_request, chunk_size, as_numpy, 3600)
+
+    def _rec_tail(self, link):
+        self.status = link._rec_int()
+        self.message = link._rec_line()
+
+
+class PointsStream(_MatrixStream):
+    """Points of an object received in chunks, see :func:`Item.GetPointsStream`.
+    Iterate the stream to retrieve the chunks: each chunk is a list of points [XYZijk] (a NumPy array with one row per point if as_numpy is True).
+
+    The stream can be iterated once. The dedicated connection is closed when all the chunks are consumed, when the iteration stops early or when :func:`Close` is called.
+
+    :ivar str name: name of the feature (available once all the chunks are consumed)
+    :ivar tuple shape: number of values per point and number of points (available once the first chunk is received)
+    """
+
+    def __init__(self, item: 'Item', feature_type: int, feature_id: int = 0, chunk_size: int = 100000, as_numpy: bool = False):
+        self.item = item
+        self.feature_type = feature_type
+        self.feature_id = feature_id
+        self.name = None
+
+        def send_request(link):
+            link._send_line('G_ObjPoint')
+            link._send_item(item)
+            link._send_int(feature_type)
+            link._send_int(feature_id)
+
+        super().__init__(item.link, send_request, chunk_size, as_numpy)
+
+    def _rec_chunk(self, link, nrows, ncols):
+        if self.as_numpy:
+            # Points are sent one after the other: one row per point
+            return link._rec_doubles_numpy(nrows * ncols).reshape(ncols, nrows)
+        values = struct.unpack('>' + str(nrows * ncols) + 'd', link._recv_exact(8 * nrows * ncols))
+        return [list(values[i:i + nrows]) for i in range(0, nrows * ncols, nrows)]
+
+    def _rec_tail(self, link):
+        self.name = link._rec_line()
+
+
+class RobolinkPool:
+    """Pool of Robolink connections to the same RoboDK instance, for multithreaded applications.
+
+    The pool opens a number of API sockets (Robolink instances) and lends one to each thread that uses it, so threads can communicate with RoboDK in parallel instead of waiting for each other.
+    Each thread keeps its connection until it ends or calls :func:`RobolinkPool.Release`. Threads share connections if there are more threads than connections.
+
+    The pool can be used as a :class:`Robolink`: calls are forwarded to the connection of the calling thread.
+    Items retrieved through the pool are bound to the pool, so they can be shared between threads.
+
+    :param size: Number of connections
+    :type size: int
+
+    Other arguments are passed to :class:`Robolink` to create the first connection (which may start RoboDK). The other connections use the same IP and port.
+
+    Example:
+
+    .. code-block:: python
+
+        from robodk.robolink import *
+        import threading
+
+        RDK = RobolinkPool(3)
+        robot = RDK.Item('', ITEM_TYPE_ROBOT)
+        io_monitor = RDK.Item('IO Monitor')
+
+        def poll_joints():
+            while True:
+                print(robot.Joints().list())  # runs on its own connection
+
+        def poll_io():
+            while True:
+                print(io_monitor.getParam('DI'))
+
+        threading.Thread(target=poll_joints, daemon=True).start()
+        threading.Thread(target=poll_io, daemon=True).start()
+
+    .. seealso:: :class:`Robolink`, :func:`Robolink.NewLink`
+    """
+
+    def __init__(self, size: int = 4, robodk_ip: str = 'localhost', port: int = None, args: List[str] = [], robodk_path: str = None, close_std_out: bool = False, quit_on_close: bool = False, com_object=None, skipstatus: bool = False):
+        self._pool_lock = threading.RLock()
+        self._pool_local = threading.local()
+        self._pool_links = []
+        self._pool_threads = []  # number of threads using each connection
+        first = Robolink(robodk_ip, port, args, robodk_path, close_std_out, quit_on_close, com_object, skipstatus)
+        self._pool_add(first)
+        for i in range(1, max(1, size)):
+            # Each connection is verified when it connects (see Robolink._verify_connection)
+            self._pool_add(Robolink(first.IP, first.PORT, close_std_out=close_std_out, com_object=com_object, skipstatus=skipstatus))
+
+    def _pool_add(self, link: Robolink):
+        link._item_link = self
+        self._pool_links.append(link)
+        self._pool_threads.append(0)
+
+    def __getattr__(self, name: str):
+        if name.startswith('__') or name.startswith('_pool'):
+            raise AttributeError(name)
+        return getattr(self.Link(), name)
+
+    def __repr__(self) -> str:
+        return "RobolinkPool with %i connections" % len(self._pool_links)
+
+    def __len__(self) -> int:
+        return len(self._pool_links)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Disconnect()
+
+    def Link(self) -> Robolink:
+        """Returns the connection (:class:`Robolink`) assigned to the calling thread. A connection is assigned on the first call."""
+        lease = getattr(self._pool_local, 'lease', None)
+        if lease is None:
+            with self._pool_lock:
+                index = self._pool_threads.index(min(self._pool_threads))
+                self._pool_threads[index] += 1
+                lease = _PoolLease(self, index)
+            self._pool_local.lease = lease
+        return self._pool_links[lease.index]
+
+    def Links(self) -> List[Robolink]:
+        """Returns the list of connections of the pool"""
+        return list(self._pool_links)
+
+    def Release(self):
+        """Returns the connection used by the calling thread to the pool. The thread gets a connection again the next time it uses the pool."""
+        self._pool_local.lease = None
+
+    def Disconnect(self):
+        """Closes all the connections of the pool"""
+        for link in reversed(self._pool_links):
+            link.Disconnect()
+
+    def Finish(self):
+        """Closes all the connections of the pool"""
+        self.Disconnect()
+
+
+class Item:
+    """The Item class represents an item in RoboDK station. An item can be a robot, a frame, a tool, an object, a target, ... any item visible in the station tree.
+    An item can also be seen as a node where other items can be attached to (child items).
+    Every item has one parent item/node and can have one or more child items/nodes.
+
+    RoboDK Items are automatically created and retrieved by generated by :class:`.Robolink` methods such as :func:`~robodk.robolink.Robolink.Item` and :func:`~robodk.robolink.Robolink.ItemUserPick`
+
+    .. seealso:: :func:`~robodk.robolink.Robolink.Item`, :func:`~robodk.robolink.Robolink.ItemUserPick`
+
+    .. code-block:: python
 
             from robodk.robolink import *   # Import the robolink library
             RDK = Robolink()                # Connect to the RoboDK API (RoboDK starts if it has not started
@@ -4394,8 +6126,9 @@ class Item:
 
     def RDK(self) -> 'Robolink':
         """Returns the RoboDK link Robolink(). It is important to have different links (Robolink) for multithreaded applications.
+        Use a :class:`RobolinkPool` to share items between threads that run in parallel.
 
-        .. seealso:: :func:`~robodk.robolink.Robolink.Finish`
+        .. seealso:: :func:`~robodk.robolink.Robolink.Finish`, :class:`~robodk.robolink.RobolinkPool`
         """
         return self.link
 
@@ -4406,13 +6139,19 @@ class Item:
 
         .. seealso:: :func:`~robodk.robolink.Robolink.Item`
         """
+        itemtype = self.link._cache_get(self.item, 'type')
+        if itemtype is not None:
+            return itemtype
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_Item_Type'
             self.link._send_line(command)
             self.link._send_item(self)
             itemtype = self.link._rec_int()
             self.link._check_status()
+            self.link._cache_set(gen, self.item, 'type', itemtype)
             return itemtype
 
     def Copy(self, copy_children: bool = True):
@@ -4503,11 +6242,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.item = 0
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return
-
-            self.link._check_status()
+            self.link._check_status_deferred('Delete', self, skippable=True)
 
     def Valid(self, check_deleted: bool = False) -> bool:
         """Checks if the item is valid.
@@ -4551,11 +6286,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_item(parent)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setParent', self, skippable=True)
             return self
 
     def setParentStatic(self, parent: 'Item') -> 'Item':
@@ -4573,11 +6304,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_item(parent)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setParentStatic', self, skippable=True)
             return self
 
     def AttachClosest(self, keyword: str = '', tolerance_mm: float = -1, list_objects: List['Item'] = []) -> 'Item':
@@ -4640,20 +6367,26 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_item(parent)
-            self.link._check_status()
+            self.link._check_status_deferred('DetachAll', self)
 
     def Parent(self) -> 'Item':
         """Return the parent item of this item (:class:`.Item`)
 
         .. seealso:: :func:`~robodk.robolink.Item.Childs`
         """
+        parent = self.link._cache_get(self.item, 'parent')
+        if parent is not None:
+            return Item(self.link, *parent)
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_Parent'
             self.link._send_line(command)
             self.link._send_item(self)
             parent = self.link._rec_item()
             self.link._check_status()
+            self.link._cache_set(gen, self.item, 'parent', (parent.item, parent.type))
             return parent
 
     def Childs(self) -> List['Item']:
@@ -4662,8 +6395,13 @@ class Item:
 
         .. seealso:: :func:`~robodk.robolink.Item.Parent`
         """
+        childs = self.link._cache_get(self.item, 'childs')
+        if childs is not None:
+            return [Item(self.link, ptr, itemtype) for ptr, itemtype in childs]
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_Childs'
             self.link._send_line(command)
             self.link._send_item(self)
@@ -4672,6 +6410,7 @@ class Item:
             for i in range(nitems):
                 itemlist.append(self.link._rec_item())
             self.link._check_status()
+            self.link._cache_set(gen, self.item, 'childs', [(itm.item, itm.type) for itm in itemlist])
             return itemlist
 
     #%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -4764,11 +6503,7 @@ class Item:
             self.link._send_item(self)
             self.link._send_int(visible)
             self.link._send_int(visible_frame)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setVisible', self, skippable=True)
             return self
 
     def Name(self) -> str:
@@ -4780,13 +6515,19 @@ class Item:
 
         .. seealso:: :func:`~robodk.robolink.Item.setName`
         """
+        name = self.link._cache_get(self.item, 'name')
+        if name is not None:
+            return name
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_Name'
             self.link._send_line(command)
             self.link._send_item(self)
             name = self.link._rec_line()
             self.link._check_status()
+            self.link._cache_set(gen, self.item, 'name', name)
             return name
 
     def setName(self, name: str) -> 'Item':
@@ -4803,11 +6544,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_line(name)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setName', self, skippable=True)
             return self
 
     def setValue(self, varname: str, value: Union[str, robomath.Mat] = None):
@@ -4871,11 +6608,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_pose(pose)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setPose', self, skippable=True)
             return self
 
     def Pose(self) -> robomath.Mat:
@@ -4895,7 +6628,7 @@ class Item:
             command = 'G_Hlocal'
             self.link._send_line(command)
             self.link._send_item(self)
-            pose = self.link._rec_pose()
+            pose = self.link._rec_poseh() if self.link.POSEH else self.link._rec_pose()
             self.link._check_status()
             return pose
 
@@ -4923,7 +6656,7 @@ class Item:
             self.link._send_item(self)
             self.link._send_pose(pose)
             self.link._send_int(1 if apply else 0)
-            self.link._check_status()
+            self.link._check_status_deferred('setGeometryPose', self)
 
     def GeometryPose(self) -> robomath.Mat:
         """Returns the position (pose as :class:`~robodk.robomath.Mat`) the object geometry with respect to its own reference frame. This procedure works for tools and objects.
@@ -4950,11 +6683,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_pose(pose)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setPoseAbs', self, skippable=True)
             return self
 
     def PoseAbs(self) -> robomath.Mat:
@@ -4997,7 +6726,7 @@ class Item:
             command = 'G_Hlocal_Abs'
             self.link._send_line(command)
             self.link._send_item(self)
-            pose = self.link._rec_pose()
+            pose = self.link._rec_poseh() if self.link.POSEH else self.link._rec_pose()
             self.link._check_status()
             return pose
 
@@ -5031,7 +6760,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_array([tolerance] + fromcolor + tocolor)
-            self.link._check_status()
+            self.link._check_status_deferred('Recolor', self)
 
     def setColor(self, tocolor: List[float]):
         """Set the color of an object, tool or robot.
@@ -5049,7 +6778,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_array(tocolor)
-            self.link._check_status()
+            self.link._check_status_deferred('setColor', self)
 
     def setColorShape(self, tocolor: List[float], shape_id: int):
         """Set the color of an object shape. It can also be used for tools.
@@ -5070,7 +6799,7 @@ class Item:
             self.link._send_item(self)
             self.link._send_int(shape_id)
             self.link._send_array(tocolor)
-            self.link._check_status()
+            self.link._check_status_deferred('setColorShape', self)
 
     def setColorCurve(self, tocolor: List[float], curve_id: int = -1):
         """Set the color of a curve object. It can also be used for tools.
@@ -5091,7 +6820,7 @@ class Item:
             self.link._send_item(self)
             self.link._send_int(curve_id)
             self.link._send_array(tocolor)
-            self.link._check_status()
+            self.link._check_status_deferred('setColorCurve', self)
 
     def Color(self) -> List[float]:
         """Return the color of an :class:`.Item` (object, tool or robot). If the item has multiple colors it returns the first color available).
@@ -5157,12 +6886,12 @@ class Item:
                 return None
 
     #"""Object specific calls"""
-    def AddShape(self, triangle_points: Union[List[list], List[robomath.Mat], robomath.Mat]) -> 'Item':
+    def AddShape(self, triangle_points: Union[List[list], List[robomath.Mat], robomath.Mat], decimate: float = 0, max_triangles: int = 0) -> 'Item':
         """Adds a shape to the object provided some triangle coordinates. Triangles must be provided as a list of vertices. A vertex normal can be optionally provided.
 
         .. seealso:: :func:`~robodk.robolink.Robolink.AddShape`
         """
-        return self.link.AddShape(triangle_points, self)
+        return self.link.AddShape(triangle_points, self, decimate=decimate, max_triangles=max_triangles)
 
     def AddCurve(self, curve_points: Union[List[list], List[robomath.Mat], robomath.Mat], add_to_ref: bool = False, projection_type: int = PROJECTION_ALONG_NORMAL_RECALC) -> 'Item':
         """Adds a curve provided point coordinates. The provided points must be a list of vertices. A vertex normal can be provided optionally.
@@ -5171,12 +6900,12 @@ class Item:
         """
         return self.link.AddCurve(curve_points, self, add_to_ref, projection_type)
 
-    def AddPoints(self, points: Union[List[float], robomath.Mat], add_to_ref: bool = False, projection_type: int = PROJECTION_ALONG_NORMAL_RECALC) -> 'Item':
+    def AddPoints(self, points: Union[List[float], robomath.Mat], add_to_ref: bool = False, projection_type: int = PROJECTION_ALONG_NORMAL_RECALC, voxel_size: float = 0) -> 'Item':
         """Adds a list of points to an object. The provided points must be a list of vertices. A vertex normal can be provided optionally.
 
         .. seealso:: :func:`~robodk.robolink.Robolink.AddPoints`
         """
-        return self.link.AddPoints(points, self, add_to_ref, projection_type)
+        return self.link.AddPoints(points, self, add_to_ref, projection_type, voxel_size)
 
     def ProjectPoints(self, points: Union[List[float], robomath.Mat], projection_type: int = PROJECTION_ALONG_NORMAL_RECALC) -> Union[List[float], robomath.Mat]:
         """Projects a point or a list of points to the object given its coordinates. The provided points must be a list of [XYZ] coordinates. Optionally, a vertex normal can be provided [XYZijk].
@@ -5219,13 +6948,15 @@ class Item:
             self.link._check_status()
             return is_selected, feature_type, feature_id
 
-    def GetPoints(self, feature_type: int = FEATURE_SURFACE, feature_id: int = 0) -> Tuple[List[List[float]], str]:
+    def GetPoints(self, feature_type: int = FEATURE_SURFACE, feature_id: int = 0, as_numpy: bool = False) -> Tuple[List[List[float]], str]:
         """Retrieves the point under the mouse cursor, a curve or the 3D points of an object. The points are provided in [XYZijk] format in relative coordinates. The XYZ are the local point coordinate and ijk is the normal of the surface.
 
         :param feature_type: set to FEATURE_SURFACE to retrieve the point under the mouse cursor, FEATURE_CURVE to retrieve the list of points for that wire, or FEATURE_POINT to retrieve the list of points.
         :type feature_type: int
         :param feature_id: used only if FEATURE_CURVE is specified, it allows retrieving the appropriate curve id of an object
         :type feature_id: int
+        :param as_numpy: set to True to retrieve the points as a NumPy array with one row per point (Nx6), decoded without intermediate Python objects
+        :type as_numpy: bool
 
         :return: List of points
 
@@ -5291,7 +7022,7 @@ class Item:
                 time.sleep(0.1)
 
 
-        .. seealso:: :func:`~robodk.robolink.Item.SelectedFeature`, :func:`~robodk.robolink.Item.GetCurves`, 
+        .. seealso:: :func:`~robodk.robolink.Item.SelectedFeature`, :func:`~robodk.robolink.Item.GetCurves`, :func:`~robodk.robolink.Item.GetPointsStream`
         """
         if feature_type >= FEATURE_HOVER_OBJECT_MESH:
             raise Exception("Invalid feature type. Use FEATURE_SURFACE, FEATURE_MESH or equivalent.")
@@ -5303,14 +7034,50 @@ class Item:
             self.link._send_item(self)
             self.link._send_int(feature_type)
             self.link._send_int(feature_id)
-            points = self.link._rec_matrix()
+            points = self.link._rec_matrix(as_numpy)
             feature_name = self.link._rec_line()
             self.link._check_status()
+            if as_numpy:
+                # View of the received buffer with one row per point
+                return points.T, feature_name
             return list(points), feature_name
 
-    def GetCurves(self) -> List[Tuple[robomath.Mat, str]]:
+    def GetPointsStream(self, feature_type: int = FEATURE_OBJECT_MESH, feature_id: int = 0, chunk_size: int = 100000, as_numpy: bool = False) -> 'PointsStream':
+        """Retrieves the points of :func:`~robodk.robolink.Item.GetPoints` as a stream of chunks of up to chunk_size points, so large meshes can be processed in bounded memory.
+
+        The points are retrieved on a dedicated connection, so this Robolink instance can be used while the chunks are processed.
+        Chunks are received from RoboDK as they are consumed. The name of the feature is available once all the chunks are consumed.
+
+        :param chunk_size: maximum number of points of each chunk
+        :type chunk_size: int
+        :param as_numpy: set to True to receive each chunk as a NumPy array with one row per point (Nx6)
+        :type as_numpy: bool
+
+        The other parameters are the same as :func:`~robodk.robolink.Item.GetPoints`.
+
+        Example:
+
+        .. code-block:: python
+
+            # Bounding box of the mesh of an object
+            bbox_min = numpy.full(3, numpy.inf)
+            bbox_max = numpy.full(3, -numpy.inf)
+            for points in part.GetPointsStream(FEATURE_OBJECT_MESH, chunk_size=50000, as_numpy=True):
+                bbox_min = numpy.minimum(bbox_min, points[:, :3].min(axis=0))
+                bbox_max = numpy.maximum(bbox_max, points[:, :3].max(axis=0))
+
+        .. seealso:: :class:`~robodk.robolink.PointsStream`, :func:`~robodk.robolink.Item.GetPoints`
+        """
+        if feature_type >= FEATURE_HOVER_OBJECT_MESH:
+            raise Exception("Invalid feature type. Use FEATURE_SURFACE, FEATURE_MESH or equivalent.")
+        return PointsStream(self, feature_type, feature_id, chunk_size, as_numpy)
+
+    def GetCurves(self, as_numpy: bool = False) -> List[Tuple[robomath.Mat, str]]:
         """Retrieve the curves object. The points are provided in [XYZijk] format in relative coordinates. The XYZ are the local point coordinate and ijk is the normal of the surface.
 
+        :param as_numpy: set to True to retrieve the points of each curve as a NumPy array with one row per point (Nx6)
+        :type as_numpy: bool
+
         :return: List of points for each curve as a list
         
         
@@ -5344,12 +7111,12 @@ class Item:
             curve_id = 0
             while True:
                 # Retrieve the curve points
-                points, curve_name = self.GetPoints(FEATURE_CURVE, curve_id)
+                points, curve_name = self.GetPoints(FEATURE_CURVE, curve_id, as_numpy)
                 npoints = len(points)                
                 if npoints == 0:
                     break
                 
-                allcurves.append([robomath.Mat(points).tr(), curve_name])
+                allcurves.append([points if as_numpy else robomath.Mat(points).tr(), curve_name])
                 curve_id = curve_id + 1
 
             return allcurves
@@ -5364,10 +7131,9 @@ class Item:
             ncrv = self.link._rec_int()
             allcurves = []
             for i in range(ncrv):
-                points = self.link._rec_matrix()
+                points = self.link._rec_matrix(as_numpy)
                 curve_name = self.link._rec_line()
-                print(curve_name)
-                allcurves.append([points, curve_name])
+                allcurves.append([points.T if as_numpy else points, curve_name])
                 
             self.link._check_status()
             return allcurves
@@ -5431,11 +7197,7 @@ class Item:
             command = 'S_Target_As_RT'
             self.link._send_line(command)
             self.link._send_item(self)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setAsCartesianTarget', self, skippable=True)
             return self
 
     def setAsJointTarget(self) -> 'Item':
@@ -5448,11 +7210,7 @@ class Item:
             command = 'S_Target_As_JT'
             self.link._send_line(command)
             self.link._send_item(self)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setAsJointTarget', self, skippable=True)
             return self
 
     def isJointTarget(self) -> bool:
@@ -5565,7 +7323,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_array(joints)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('setJointsHome', self)
             return self
 
     def ObjectLink(self, link_id: int = 0) -> 'Item':
@@ -5605,14 +7363,20 @@ class Item:
 
         .. seealso:: :func:`~robodk.robolink.Item.setLink`, :func:`~robodk.robolink.Item.getLinks`
         """
+        item = self.link._cache_get(self.item, ('link', type_linked))
+        if item is not None:
+            return Item(self.link, *item)
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_LinkType'
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_int(type_linked)
             item = self.link._rec_item()
             self.link._check_status()
+            self.link._cache_set(gen, self.item, ('link', type_linked), (item.item, item.type))
             return item
 
     def getLinks(self, type_linked: int = ITEM_TYPE_ROBOT) -> List['Item']:
@@ -5648,7 +7412,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(item)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('setLink', self)
             return self
 
     def setJoints(self, joints: robomath.Mat):
@@ -5665,11 +7429,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_array(joints)
             self.link._send_item(self)
-            if self.link._SkipStatus:
-                self.link.COM.flush()
-                return self
-
-            self.link._check_status()
+            self.link._check_status_deferred('setJoints', self, skippable=True)
             return self
 
     def JointLimits(self) -> Tuple[robomath.Mat, robomath.Mat, float]:
@@ -5705,7 +7465,7 @@ class Item:
             self.link._send_item(self)
             self.link._send_array(lower_limit)
             self.link._send_array(upper_limit)
-            self.link._check_status()
+            self.link._check_status_deferred('setJointLimits', self)
 
     def setRobot(self, robot: 'Item' = None):
         """Assigns a specific robot to a program, target or robot machining project.
@@ -5728,7 +7488,7 @@ class Item:
                 self.link._send_line(command)
                 self.link._send_item(self)
                 self.link._send_item(robot)
-                self.link._check_status()
+                self.link._check_status_deferred('setRobot', self)
                 return self
 
     def setPoseFrame(self, frame: Union['Item', robomath.Mat]):
@@ -5750,7 +7510,7 @@ class Item:
                 self.link._send_line(command)
                 self.link._send_pose(frame)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('setPoseFrame', self)
             return self
 
     def setPoseTool(self, tool: Union['Item', robomath.Mat]):
@@ -5771,7 +7531,7 @@ class Item:
                 self.link._send_line(command)
                 self.link._send_pose(tool)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('setPoseTool', self)
             return self
 
     def PoseTool(self) -> robomath.Mat:
@@ -5779,13 +7539,19 @@ class Item:
 
         .. seealso:: :func:`~robodk.robolink.Item.setPoseTool`, :func:`~robodk.robolink.Item.Pose`, :func:`~robodk.robolink.Item.PoseFrame`
         """
+        pose = self.link._cache_get(self.item, 'tool')
+        if pose is not None:
+            return pose.copy()
+
         with self.link._lock:
             self.link._check_connection()
+            gen = self.link._cache_gen
             command = 'G_Tool'
             self.link._send_line(command)
             self.link._send_item(self)
             pose = self.link._rec_pose()
             self.link._check_status()
+            self.link._cache_set(gen, self.item, 'tool', pose.copy())
             return pose
 
     def PoseFrame(self) -> robomath.Mat:
@@ -5891,7 +7657,7 @@ class Item:
         :param reference: Optionally provide the reference frame used to calculate the forward kinematics. If this parameter is ignored it will use the robot base frame.
         :type reference: :class:`~robodk.robomath.Mat`
 
-        .. seealso:: :func:`~robodk.robolink.Item.SolveIK`, :func:`~robodk.robolink.Item.SolveIK_All`, :func:`~robodk.robolink.Item.JointsConfig`
+        .. seealso:: :func:`~robodk.robolink.Item.SolveIK`, :func:`~robodk.robolink.Item.SolveIK_All`, :func:`~robodk.robolink.Item.JointsConfig`, :func:`~robodk.robolink.Item.SolveFK_Batch`
 
         Example:
 
@@ -5937,7 +7703,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_array(joints)
             self.link._send_item(self)
-            pose = self.link._rec_pose()
+            pose = self.link._rec_poseh() if self.link.POSEH else self.link._rec_pose()
             self.link._check_status()
             if tool is not None:
                 pose = pose * tool
@@ -6054,6 +7820,217 @@ class Item:
             self.link._check_status()
             return joints_list
 
+    def SolveFK_Batch(self, joints_list: Union[robomath.Mat, List[List[float]]], tool: robomath.Mat = None, reference: robomath.Mat = None, solutions_ok: List[bool] = None, as_numpy: bool = None) -> List[robomath.Mat]:
+        """Calculate the forward kinematics of the robot for a list of robot joints in a single exchange with RoboDK.
+        The result is the same as calling :func:`~robodk.robolink.Item.SolveFK` for each set of joints, but much faster for large lists.
+
+        :param joints_list: list of robot joints: a NumPy array of shape (N, nDOFs), a :class:`~robodk.robomath.Mat` of size nDOFs x N (one column per set of joints) or a list of joints
+        :type joints_list: list of list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Optionally provide the tool used to calculate the forward kinematics. If this parameter is ignored it will use the robot flange.
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Optionally provide the reference frame used to calculate the forward kinematics. If this parameter is ignored it will use the robot base frame.
+        :type reference: :class:`~robodk.robomath.Mat`
+        :param solutions_ok: Optionally provide a list to retrieve the status of each solution: True if the joints are valid for the robot, False otherwise
+        :type solutions_ok: list
+        :param as_numpy: Return the poses as a NumPy array of shape (N, 4, 4). By default, a NumPy array is returned if joints_list is a NumPy array.
+        :type as_numpy: bool
+        :return: list of poses (:class:`~robodk.robomath.Mat`) or NumPy array of shape (N, 4, 4)
+
+        .. seealso:: :func:`~robodk.robolink.Item.SolveFK`, :func:`~robodk.robolink.Item.SolveIK_Batch`, :func:`~robodk.robolink.Item.JointsConfig_Batch`
+        """
+        if as_numpy is None:
+            as_numpy = _is_numpy(joints_list)
+        joints_rows = _joints_rows(joints_list)
+        link = self.link
+        with link._lock:
+            link._require_build(6535)
+            link._check_connection()
+            command = 'G_LFK'
+            link._send_line(command)
+            link._send_int(len(joints_rows))
+
+            def send_one(i):
+                link._send_array(joints_rows[i])
+                link._send_item(self)
+
+            def rec_one(i):
+                pose = link._recv_exact(16 * 8) if as_numpy else link._rec_pose()
+                return pose, link._rec_int()
+
+            replies = link._exchange_batch(len(joints_rows), send_one, rec_one)
+            link._check_status()
+
+        if solutions_ok is not None:
+            solutions_ok.extend([status > 0 for pose, status in replies])
+
+        if as_numpy:
+            import numpy as np
+            poses = np.frombuffer(b''.join([pose for pose, status in replies]), dtype='>f8').reshape(-1, 4, 4).transpose(0, 2, 1).astype(float)
+            if tool is not None:
+                poses = poses @ _poses_numpy(tool)[0]
+            if reference is not None:
+                poses = np.linalg.inv(_poses_numpy(reference)[0]) @ poses
+            return poses
+
+        poses = [pose for pose, status in replies]
+        if tool is not None:
+            tool = robomath.Mat(tool.tolist()) if _is_numpy(tool) else tool
+            poses = [pose * tool for pose in poses]
+        if reference is not None:
+            reference_inv = robomath.invH(robomath.Mat(reference.tolist()) if _is_numpy(reference) else reference)
+            poses = [reference_inv * pose for pose in poses]
+        return poses
+
+    def SolveIK_Batch(self, poses: Union[List[robomath.Mat], robomath.Mat], joints_approx: Union[robomath.Mat, List[float], List[List[float]]] = None, tool: robomath.Mat = None, reference: robomath.Mat = None, as_numpy: bool = None) -> List[robomath.Mat]:
+        """Calculates the inverse kinematics for a list of poses in a single exchange with RoboDK.
+        The result is the same as calling :func:`~robodk.robolink.Item.SolveIK` for each pose, but much faster for large lists (for example, to check the reachability of a path or a workspace).
+
+        :param poses: list of poses of the robot flange with respect to the robot base frame (unless you provide the tool and/or reference): a list of :class:`~robodk.robomath.Mat` or a NumPy array of shape (N, 4, 4)
+        :type poses: list of :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param joints_approx: Preferred joint solution, for all poses (one set of joints) or for each pose (one set of joints per pose). Leave blank to return the closest match to the current robot position.
+        :type joints_approx: list of float, list of list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Tool pose with respect to the robot flange (TCP)
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Reference pose (reference frame with respect to the robot base)
+        :type reference: :class:`~robodk.robomath.Mat`
+        :param as_numpy: Return the joints as a NumPy array of shape (N, nDOFs). Poses without a solution are filled with NaN. By default, a NumPy array is returned if poses is a NumPy array.
+        :type as_numpy: bool
+        :return: list of joints (a joints array of size 1 or less means there is no solution, same as SolveIK) or NumPy array of shape (N, nDOFs)
+
+        Example:
+
+        .. code-block:: python
+
+            poses = [robot_pose * rotz(angle * pi / 180) for angle in range(0, 360, 5)]
+            joints_list = robot.SolveIK_Batch(poses, None, robot.PoseTool(), robot.PoseFrame())
+            reachable = [pose for pose, joints in zip(poses, joints_list) if len(joints.list()) > 1]
+
+        .. seealso:: :func:`~robodk.robolink.Item.SolveIK`, :func:`~robodk.robolink.Item.SolveIK_All_Batch`, :func:`~robodk.robolink.Item.SolveFK_Batch`
+        """
+        if as_numpy is None:
+            as_numpy = _is_numpy(poses)
+        link = self.link
+        count, send_pose = _batch_pose_sender(link, poses, tool, reference)
+        joints_rows = None
+        if joints_approx is not None:
+            if isinstance(joints_approx, list) and len(joints_approx) > 0 and not hasattr(joints_approx[0], '__len__'):
+                joints_rows = [joints_approx]
+            else:
+                joints_rows = _joints_rows(joints_approx)
+            if len(joints_rows) == 1:
+                joints_rows = joints_rows * count
+            elif len(joints_rows) != count:
+                raise Exception('The number of approximated joints must match the number of poses')
+
+        with link._lock:
+            link._check_connection()
+            if joints_rows is None:
+                link._require_build(6535)
+                command = 'G_LIK'
+            else:
+                link._require_build(7399)
+                command = 'G_LIK_jnts'
+            link._send_line(command)
+            link._send_int(count)
+
+            def send_one(i):
+                send_pose(i)
+                if joints_rows is not None:
+                    link._send_array(joints_rows[i])
+                link._send_item(self)
+
+            def rec_one(i):
+                nvalues = link._rec_int()
+                if nvalues <= 0:
+                    return []
+                return list(struct.unpack('>' + str(nvalues) + 'd', link._recv_exact(8 * nvalues)))
+
+            joints_list = link._exchange_batch(count, send_one, rec_one)
+            link._check_status()
+
+        if not as_numpy:
+            return [robomath.Mat(joints if joints else [0]) for joints in joints_list]
+
+        import numpy as np
+        ndofs = max([len(joints) for joints in joints_list] + [0])
+        result = np.full((count, ndofs), np.nan)
+        for i, joints in enumerate(joints_list):
+            if len(joints) > 1:
+                result[i, :len(joints)] = joints
+        return result
+
+    def SolveIK_All_Batch(self, poses: Union[List[robomath.Mat], robomath.Mat], tool: robomath.Mat = None, reference: robomath.Mat = None, as_numpy: bool = None) -> List[robomath.Mat]:
+        """Calculates all the inverse kinematics solutions for a list of poses in a single exchange with RoboDK.
+        The result is the same as calling :func:`~robodk.robolink.Item.SolveIK_All` for each pose.
+
+        :param poses: list of poses of the robot flange with respect to the robot base frame (unless you provide the tool and/or reference): a list of :class:`~robodk.robomath.Mat` or a NumPy array of shape (N, 4, 4)
+        :type poses: list of :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param tool: Tool pose with respect to the robot flange (TCP)
+        :type tool: :class:`~robodk.robomath.Mat`
+        :param reference: Reference pose (reference frame with respect to the robot base)
+        :type reference: :class:`~robodk.robomath.Mat`
+        :param as_numpy: Return each list of solutions as a NumPy array of shape (M, nDOFs) instead of a 2D matrix [nDOFs x M]. By default, NumPy arrays are returned if poses is a NumPy array.
+        :type as_numpy: bool
+        :return: list of solutions for each pose
+
+        .. seealso:: :func:`~robodk.robolink.Item.SolveIK_All`, :func:`~robodk.robolink.Item.SolveIK_Batch`
+        """
+        if as_numpy is None:
+            as_numpy = _is_numpy(poses)
+        link = self.link
+        count, send_pose = _batch_pose_sender(link, poses, tool, reference)
+        with link._lock:
+            link._require_build(7399)
+            link._check_connection()
+            command = 'G_LIK_cmpl'
+            link._send_line(command)
+            link._send_int(count)
+
+            def send_one(i):
+                send_pose(i)
+                link._send_item(self)
+
+            solutions = link._exchange_batch(count, send_one, lambda i: link._rec_matrix(as_numpy))
+            link._check_status()
+
+        if as_numpy:
+            solutions = [sols.T for sols in solutions]
+        return solutions
+
+    def JointsConfig_Batch(self, joints_list: Union[robomath.Mat, List[List[float]]], as_numpy: bool = None) -> List[robomath.Mat]:
+        """Returns the robot configuration state for a list of robot joints in a single exchange with RoboDK.
+        The result is the same as calling :func:`~robodk.robolink.Item.JointsConfig` for each set of joints: [REAR, LOWERARM, FLIP, turns].
+
+        :param joints_list: list of robot joints: a NumPy array of shape (N, nDOFs), a :class:`~robodk.robomath.Mat` of size nDOFs x N (one column per set of joints) or a list of joints
+        :type joints_list: list of list of float, :class:`~robodk.robomath.Mat` or numpy.ndarray
+        :param as_numpy: Return the configurations as a NumPy array of shape (N, 4). By default, a NumPy array is returned if joints_list is a NumPy array.
+        :type as_numpy: bool
+
+        .. seealso:: :func:`~robodk.robolink.Item.JointsConfig`, :func:`~robodk.robolink.Item.SolveIK_Batch`
+        """
+        if as_numpy is None:
+            as_numpy = _is_numpy(joints_list)
+        joints_rows = _joints_rows(joints_list)
+        link = self.link
+        with link._lock:
+            link._require_build(7399)
+            link._check_connection()
+            command = 'G_LThetas_Config'
+            link._send_line(command)
+            link._send_int(len(joints_rows))
+
+            def send_one(i):
+                link._send_array(joints_rows[i])
+                link._send_item(self)
+
+            configs = link._exchange_batch(len(joints_rows), send_one, lambda i: link._rec_array())
+            link._check_status()
+
+        if as_numpy:
+            import numpy as np
+            return np.asarray([config.list() for config in configs], dtype=float).reshape(len(configs), -1)
+        return configs
+
     def FilterTarget(self, pose: robomath.Mat, joints_approx: Union[robomath.Mat, List[float]] = None) -> Tuple[robomath.Mat, robomath.Mat]:
         """Filters a target to improve accuracy. This option requires a calibrated robot.
         
@@ -6202,7 +8179,7 @@ class Item:
             self.link._send_line(remote_path)
             self.link._send_line(ftp_user)
             self.link._send_line(ftp_pass)
-            self.link._check_status()
+            self.link._check_status_deferred('setConnectionParams', self)
             return self
 
     def ConnectedState(self) -> Tuple[int, str]:
@@ -6486,7 +8463,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_array([float(speed_linear), float(speed_joints), float(accel_linear), float(accel_joints)])
-            self.link._check_status()
+            self.link._check_status_deferred('setSpeed', self)
             return self
 
     def setAcceleration(self, accel_linear: float):
@@ -6539,7 +8516,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_int(rounding_mm * 1000)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('setRounding', self)
             return self
 
     def setZoneData(self, zonedata: float):
@@ -6553,7 +8530,7 @@ class Item:
         """Displays a sequence of joints or poses in RoboDK.
 
         :param matrix: list of joints as a matrix or as a list of joint arrays, a list of poses, or a sequence of instructions (same sequence that was supported with RoKiSim).
-        :type matrix: list of list of float, a matrix of joints as a :class:`~robodk.robomath.Mat` or a list of poses as :class:`~robodk.robomath.Mat`
+        :type matrix: list of list of float, a matrix of joints as a :class:`~robodk.robomath.Mat` or a list of poses as :class:`~robodk.robomath.Mat`. NumPy arrays of joints (N x nDOFs) or poses (N x 4 x 4) are also accepted.
         :param display_type: display options (SEQUENCE_DISPLAY_*). Use -1 to use default.
         :type display_type: int, optional
         :param timeout: display timeout, in milliseconds. Use -1 to use default.
@@ -6603,7 +8580,18 @@ class Item:
 
         display_ghost_joints = display_type & SEQUENCE_DISPLAY_ROBOT_JOINTS if display_type > 0 else False
         with self.link._lock:
-            if type(matrix) == list and (len(matrix) == 0 or type(matrix[0]) == robomath.Mat or display_ghost_joints):
+            if _is_numpy(matrix) and matrix.ndim == 3:
+                # poses as a NumPy array (N x 4 x 4)
+                self.link._check_connection()
+                command = 'Show_SeqPoses'
+                self.link._send_line(command)
+                self.link._send_item(self)
+                self.link._send_array([display_type, timeout])
+                self.link._send_int(matrix.shape[0])
+                self.link._send_raw(_f8_columns(matrix))
+                self.link._check_status()
+
+            elif type(matrix) == list and (len(matrix) == 0 or type(matrix[0]) == robomath.Mat or display_ghost_joints):
                 # poses assumed
                 self.link._check_connection()
                 command = 'Show_SeqPoses'
@@ -6626,7 +8614,7 @@ class Item:
                 self.link._check_connection()
                 command = 'Show_Seq'
                 self.link._send_line(command)
-                self.link._send_matrix(matrix)
+                self.link._send_matrix(matrix.T if _is_numpy(matrix) else matrix)
                 self.link._send_item(self)
                 self.link._check_status()
 
@@ -6730,7 +8718,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_int(accurate)
-            self.link._check_status()
+            self.link._check_status_deferred('setAccuracyActive', self)
 
     def AccuracyActive(self) -> bool:
         """Returns True if the accurate kinematics are being used. Accurate kinematics are available after a robot calibration.
@@ -6765,7 +8753,7 @@ class Item:
             if tool_cog is not None:
                 values += tool_cog
             self.link._send_array(values)
-            self.link._check_status()
+            self.link._check_status_deferred('setParamRobotTool', self)
 
     def FilterProgram(self, filestr: str) -> Tuple[int, str]:
         """Filter a program file to improve accuracy for a specific robot. The robot must have been previously calibrated.
@@ -6837,7 +8825,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_int(program_run_type)
-            self.link._check_status()
+            self.link._check_status_deferred('setRunType', self)
 
     def RunType(self) -> int:
         """Get the Run Type of a program to specify if a program made using the GUI will be run in simulation mode or on the real robot ("Run on robot" option).
@@ -7084,7 +9072,7 @@ class Item:
             self.link._send_line(path_icon)
             self.link._send_line(cmd_run_on_robot)
             self.link._send_int(blocking)
-            self.link._check_status()
+            self.link._check_status_deferred('customInstruction', self)
 
     def addMoveJ(self, itemtarget: 'Item'):
         """
@@ -7105,7 +9093,7 @@ class Item:
             self.link._send_item(itemtarget)
             self.link._send_item(self)
             self.link._send_int(1)
-            self.link._check_status()
+            self.link._check_status_deferred('addMoveJ', self)
 
     def addMoveL(self, itemtarget: 'Item'):
         """
@@ -7126,7 +9114,7 @@ class Item:
             self.link._send_item(itemtarget)
             self.link._send_item(self)
             self.link._send_int(2)
-            self.link._check_status()
+            self.link._check_status_deferred('addMoveL', self)
 
     def addMoveSearch(self, itemtarget: 'Item'):
         """
@@ -7147,7 +9135,7 @@ class Item:
             self.link._send_item(itemtarget)
             self.link._send_item(self)
             self.link._send_int(5)
-            self.link._check_status()
+            self.link._check_status_deferred('addMoveSearch', self)
 
     def addMoveC(self, itemtarget1: 'Item', itemtarget2: 'Item'):
         """
@@ -7168,7 +9156,7 @@ class Item:
             self.link._send_item(itemtarget1)
             self.link._send_item(itemtarget2)
             self.link._send_item(self)
-            self.link._check_status()
+            self.link._check_status_deferred('addMoveC', self)
 
     def ShowInstructions(self, show: bool = True):
         """Show or hide instruction items of a program in the RoboDK tree
@@ -7184,7 +9172,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_int(1 if show else 0)
-            self.link._check_status()
+            self.link._check_status_deferred('ShowInstructions', self)
 
     def ShowTargets(self, show: bool = True):
         """Show or hide targets of a program in the RoboDK tree
@@ -7200,7 +9188,7 @@ class Item:
             self.link._send_line(command)
             self.link._send_item(self)
             self.link._send_int(1 if show else 0)
-            self.link._check_status()
+            self.link._check_status_deferred('ShowTargets', self)
 
     def InstructionCount(self) -> int:
         """Return the number of instructions of a program.
@@ -7316,7 +9304,103 @@ class Item:
                 self.link._send_int(isjointtarget)
                 self.link._send_pose(target)
                 self.link._send_array(joints)
-            self.link._check_status()
+            self.link._check_status_deferred('setInstruction', self)
+
+    def Instructions(self, ins_ids: List[int] = None) -> List[Tuple[str, int, int, int, robomath.Mat, robomath.Mat]]:
+        """Returns a list of program instructions: (name, instype, movetype, isjointtarget, target, joints). This is the same as calling Instruction() for each instruction, with the requests for all the instructions sent back to back.
+        Raises a :class:`PipelineError` with all the instructions that failed, after all the replies are received.
+
+        :param ins_ids: indexes of the instructions to return (all the instructions by default)
+        :type ins_ids: list of int
+
+        Example:
+
+        .. code-block:: python
+
+            # Convert all joint moves to linear moves
+            instructions = program.Instructions()
+            for i, (name, instype, movetype, isjointtarget, target, joints) in enumerate(instructions):
+                if instype == INS_TYPE_MOVE and movetype == MOVE_TYPE_JOINT:
+                    instructions[i] = (name, instype, MOVE_TYPE_LINEAR, isjointtarget, target, joints)
+            program.setInstructions(instructions)
+
+        .. seealso:: :func:`~robodk.robolink.Item.setInstructions`, :func:`~robodk.robolink.Item.Instruction`, :func:`~robodk.robolink.Item.InstructionCount`
+        """
+        if ins_ids is None:
+            ins_ids = range(self.InstructionCount())
+        ins_ids = list(ins_ids)
+
+        errors = []
+        with self.link._lock:
+            self.link._check_connection()
+
+            def send_one(i):
+                self.link._send_line('Prog_GIns')
+                self.link._send_item(self)
+                self.link._send_int(ins_ids[i])
+
+            def rec_one(i):
+                name = self.link._rec_line()
+                instype = self.link._rec_int()
+                movetype = None
+                isjointtarget = None
+                target = None
+                joints = None
+                if instype == INS_TYPE_MOVE:
+                    movetype = self.link._rec_int()
+                    isjointtarget = self.link._rec_int()
+                    target = self.link._rec_poseh() if self.link.POSEH else self.link._rec_pose()
+                    joints = self.link._rec_array()
+                self.link._check_status_collect(errors, 'Instruction', self)
+                return name, instype, movetype, isjointtarget, target, joints
+
+            instructions = self.link._exchange_batch(len(ins_ids), send_one, rec_one)
+
+        if errors:
+            raise PipelineError(errors)
+        return instructions
+
+    def setInstructions(self, instructions: List[Tuple[str, int, int, int, robomath.Mat, robomath.Mat]], ins_ids: List[int] = None):
+        """Updates a list of program instructions, given in the format returned by :func:`~robodk.robolink.Item.Instructions`. This is the same as calling setInstruction() for each instruction, with the instructions sent back to back.
+        Raises a :class:`PipelineError` with all the instructions that failed, after all the instructions are sent.
+
+        :param instructions: instructions to set
+        :type instructions: list of tuple
+        :param ins_ids: indexes of the instructions to update (the first instructions of the program by default)
+        :type ins_ids: list of int
+
+        .. seealso:: :func:`~robodk.robolink.Item.Instructions`, :func:`~robodk.robolink.Item.setInstruction`
+        """
+        if ins_ids is None:
+            ins_ids = range(len(instructions))
+        ins_ids = list(ins_ids)
+        if len(ins_ids) != len(instructions):
+            raise Exception('The number of instruction ids must match the number of instructions')
+
+        errors = []
+        with self.link._lock:
+            self.link._check_connection()
+
+            def send_one(i):
+                name, instype, movetype, isjointtarget, target, joints = instructions[i][:6]
+                self.link._send_line('Prog_SIns')
+                self.link._send_item(self)
+                self.link._send_int(ins_ids[i])
+                self.link._send_line(name)
+                self.link._send_int(instype)
+                if instype == INS_TYPE_MOVE:
+                    self.link._send_int(movetype)
+                    self.link._send_int(isjointtarget)
+                    self.link._send_pose(target)
+                    self.link._send_array(joints)
+
+            def rec_one(i):
+                self.link._check_status_collect(errors, 'setInstruction', self)
+
+            self.link._exchange_batch(len(ins_ids), send_one, rec_one)
+
+        if errors:
+            raise PipelineError(errors)
 
     def Update(self, check_collisions: int = COLLISION_OFF, timeout_sec: float = 3600, mm_step: float = -1, deg_step: float = -1) -> Tuple[float, float, float, float, str]:
         """Updates a program and returns the estimated time and the number of valid instructions.
@@ -7385,7 +9469,7 @@ class Item:
             self.link._check_status()
             return insmat, errors
 
-    def InstructionListJoints(self, mm_step: float = 10, deg_step: float = 5, save_to_file: str = None, collision_check: int = COLLISION_OFF, flags: int = 0, time_step: float = 0.1) -> Tuple[str, robomath.Mat, int]:
+    def InstructionListJoints(self, mm_step: float = 10, deg_step: float = 5, save_to_file: str = None, collision_check: int = COLLISION_OFF, flags: int = 0, time_step: float = 0.1, as_numpy: bool = False) -> Tuple[str, robomath.Mat, int]:
         """Returns a list of joints an MxN matrix, where M is the number of robot axes plus 4 columns. Linear moves are rounded according to the smoothing parameter set inside the program.
 
         :param mm_step: step in mm to split the linear movements
@@ -7400,6 +9484,8 @@ class Item:
         :type flags: int
         :param time_step: (optional) set the time step in seconds for time based calculation
         :type time_step: float
+        :param as_numpy: (optional) return the joint list as a NumPy array with one column per entry, decoded without copying the received data
+        :type as_numpy: bool
         :return: [message (str), joint_list (:class:`~robodk.robomath.Mat`), status (int)]
 
         Outputs:
@@ -7434,7 +9520,7 @@ class Item:
             self.link.COM.settimeout(max(3600, self.link.TIMEOUT))
             if save_to_file is None:
                 self.link._send_line('')
-                joint_list = self.link._rec_matrix()
+                joint_list = self.link._rec_matrix(as_numpy)
             else:
                 self.link._send_line(save_to_file)
 
@@ -7444,6 +9530,36 @@ class Item:
             self.link._check_status()
             return error_msg, joint_list, error_code
 
+    def InstructionListJointsStream(self, mm_step: float = 10, deg_step: float = 5, collision_check: int = COLLISION_OFF, flags: int = 0, time_step: float = 0.1, chunk_size: int = 1000, as_numpy: bool = False) -> 'JointListStream':
+        """Returns the joint list of :func:`~robodk.robolink.Item.InstructionListJoints` as a stream of chunks of up to chunk_size entries (columns), so long joint lists can be processed in bounded memory.
+
+        The joint list is retrieved on a dedicated connection, so this Robolink instance can be used while the chunks are processed.
+        Chunks are received from RoboDK as they are consumed: RoboDK waits while the consumer processes the previous chunks. The message and the status are available once all the chunks are consumed.
+        Note that RoboDK sends the first chunk once the whole program is simulated.
+
+        :param chunk_size: maximum number of entries (columns) of each chunk
+        :type chunk_size: int
+        :param as_numpy: set to True to receive each chunk as a NumPy array with one column per entry
+        :type as_numpy: bool
+
+        The other parameters are the same as :func:`~robodk.robolink.Item.InstructionListJoints`.
+
+        Example:
+
+        .. code-block:: python
+
+            stream = program.InstructionListJointsStream(flags=4, time_step=0.002, chunk_size=5000, as_numpy=True)
+            for chunk in stream:
+                joints = chunk[:6, :]
+                errors = chunk[6, :]
+                print(chunk.shape)
+
+            print(stream.message, stream.status)
+
+        .. seealso:: :class:`~robodk.robolink.JointListStream`, :func:`~robodk.robolink.Item.InstructionListJoints`
+        """
+        return JointListStream(self, [mm_step, deg_step, float(collision_check), float(flags), float(time_step)], chunk_size, as_numpy)
+
     def getParam(self, param: str):
         """Get custom binary data from this item. Use setParam(str, bytes) to set the data.
 
@@ -7610,7 +9726,7 @@ class Item:
                 self.link._send_item(self)
                 self.link._send_line(str(param))
                 self.link._send_line(value)
-                self.link.COM.flush()
+                self.link._send_flush()
                 return None
 
             else:
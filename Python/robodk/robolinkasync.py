@@ -0,0 +1,569 @@
+# Copyright 2015-2026 - RoboDK Inc. - https://robodk.com/
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# --------------------------------------------
+# --------------- DESCRIPTION ----------------
+"""This module implements an asyncio client for the RoboDK API.
+
+AsyncRobolink and AsyncItem provide awaitable versions of the most common :class:`~robodk.robolink.Robolink` and :class:`~robodk.robolink.Item` calls.
+Commands use the same wire encoding as Robolink. Requests are written as soon as they are issued and the replies are read in order,
+so many coroutines can keep requests in flight on one or more API sockets.
+
+RoboDK must be running: AsyncRobolink does not start RoboDK (use :class:`~robodk.robolink.Robolink` to start it).
+
+.. code-block:: python
+
+    import asyncio
+    from robodk.robolinkasync import AsyncRobolink
+    from robodk.robolink import ITEM_TYPE_ROBOT
+
+    async def main():
+        async with AsyncRobolink(connections=2) as RDK:
+            robot = await RDK.Item('', ITEM_TYPE_ROBOT)
+            joints, pose = await asyncio.gather(robot.Joints(), robot.Pose())
+            print(joints, pose)
+
+    asyncio.run(main())
+
+More information about the RoboDK API for Python here:
+
+* https://robodk.com/doc/en/RoboDK-API.html
+* https://robodk.com/doc/en/PythonAPI/index.html
+"""
+# --------------------------------------------
+import asyncio
+import os
+import socket
+import struct
+import sys
+
+from robodk import robolink, robomath
+from robodk.robolink import MOVE_TYPE_JOINT, MOVE_TYPE_LINEAR, ITEM_TYPE_PROGRAM, COLLISION_OFF
+
+if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
+    # Python 3.5+ type hints. Type hints are stripped for <3.5
+    from typing import List, Union, Tuple
+
+
+class _Frame:
+    """Outgoing command. It uses the same encoding as the Robolink._send_* helpers."""
+
+    _send_line = robolink.Robolink._send_line
+    _send_int = robolink.Robolink._send_int
+    _send_ptr = robolink.Robolink._send_ptr
+    _send_pose = robolink.Robolink._send_pose
+    _send_xyz = robolink.Robolink._send_xyz
+    _send_array = robolink.Robolink._send_array
+    _send_matrix = robolink.Robolink._send_matrix
+    _send_bytes = robolink.Robolink._send_bytes
+    _cache = None
+
+    def __init__(self, command: str):
+        self._tx_buf = bytearray()
+        self._send_line(command)
+
+    def _send_item(self, item: Union[int, 'AsyncItem', robolink.Item]):
+        if isinstance(item, AsyncItem):
+            item = item.item
+        robolink.Robolink._send_item(self, item)
+
+
+class _AsyncConnection:
+    """One API socket. Requests are written in order and their replies are read in the same order."""
+
+    def __init__(self, link: 'AsyncRobolink', reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.link = link
+        self.reader = reader
+        self.writer = writer
+        self.inflight = 0  # number of requests waiting for a reply
+        self.error = None  # set if the communication can't be recovered
+        self._last_reply = None  # future of the last request in the queue
+
+    async def request(self, frame: _Frame, parser, timeout: float):
+        """Sends a command and waits for its turn to parse the reply with the parser coroutine"""
+        if self.error is not None:
+            raise Exception('Communication problems: ' + self.error)
+
+        # Writing and queuing the reply must not yield to other requests
+        previous = self._last_reply
+        reply_done = asyncio.get_running_loop().create_future()
+        self._last_reply = reply_done
+        self.inflight += 1
+        self.writer.write(frame._tx_buf)
+        try:
+            await self.writer.drain()
+            if previous is not None:
+                await previous
+
+            return await asyncio.wait_for(parser(self), timeout)
+
+        except (asyncio.CancelledError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError) as e:
+            # The reply (or part of it) is still pending: the replies of this socket can't be matched anymore
+            self.close('request interrupted (' + type(e).__name__ + ')')
+            raise
+
+        finally:
+            self.inflight -= 1
+            reply_done.set_result(None)
+            if self._last_reply is reply_done:
+                self._last_reply = None
+
+    def close(self, reason: str = 'connection closed'):
+        if self.error is None:
+            self.error = reason
+        self.writer.close()
+
+    async def rec_line(self) -> str:
+        line = await self.reader.readuntil(b'\n')
+        return line[:-1].decode('utf-8')
+
+    async def rec_int(self) -> int:
+        return struct.unpack('>i', await self.reader.readexactly(4))[0]
+
+    async def rec_item(self) -> 'AsyncItem':
+        item, itemtype = struct.unpack('>Qi', await self.reader.readexactly(12))
+        return AsyncItem(self.link, item, itemtype)
+
+    async def rec_pose(self) -> robomath.Mat:
+        posenums = struct.unpack('>16d', await self.reader.readexactly(16 * 8))
+        pose = robomath.Mat(4, 4)
+        cnt = 0
+        for j in range(4):
+            for i in range(4):
+                pose.rows[i][j] = posenums[cnt]
+                cnt = cnt + 1
+        return pose
+
+    async def rec_array(self) -> robomath.Mat:
+        nvalues = await self.rec_int()
+        if nvalues > 0:
+            values = list(struct.unpack('>' + str(nvalues) + 'd', await self.reader.readexactly(8 * nvalues)))
+        else:
+            values = [0]
+        return robomath.Mat(values)
+
+    async def rec_matrix(self) -> robomath.Mat:
+        size1 = await self.rec_int()
+        size2 = await self.rec_int()
+        recvsize = size1 * size2 * 8
+        if recvsize <= 0:
+            return robomath.Mat(0, 0)
+
+        matnums = struct.unpack('>' + str(size1 * size2) + 'd', await self.reader.readexactly(recvsize))
+        mat = robomath.Mat(size1, size2)
+        cnt = 0
+        for j in range(size2):
+            for i in range(size1):
+                mat.rows[i][j] = matnums[cnt]
+                cnt = cnt + 1
+        return mat
+
+    async def check_status(self) -> int:
+        """Same as Robolink._check_status"""
+        link = self.link
+        status = await self.rec_int()
+        if status == 0:
+            link.LAST_STATUS_MESSAGE = ''
+            return status
+
+        if status == -1:
+            link.LAST_STATUS_MESSAGE = 'Communication problems'
+            raise Exception(link.LAST_STATUS_MESSAGE)
+
+        if status > 0 and status < 10:
+            link.LAST_STATUS_MESSAGE = 'Unknown error'
+            if status == 1:
+                link.LAST_STATUS_MESSAGE = 'Invalid item provided: The item identifier provided is not valid or it does not exist.'
+            elif status == 2:  # output warning
+                link.LAST_STATUS_MESSAGE = await self.rec_line()
+                print('WARNING: ' + link.LAST_STATUS_MESSAGE)
+                if link._RAISE_EXCEPTION_ON_WARNING:
+                    raise Exception('WARNING: ' + link.LAST_STATUS_MESSAGE)
+                return 0
+            elif status == 3:  # output error
+                link.LAST_STATUS_MESSAGE = await self.rec_line()
+            elif status == 9:
+                link.LAST_STATUS_MESSAGE = 'Invalid license. Purchase a license online (www.robodk.com) or contact us at info@robodk.com.'
+            raise Exception(link.LAST_STATUS_MESSAGE)
+
+        if status < 100:
+            link.LAST_STATUS_MESSAGE = await self.rec_line()
+            if status == 10:
+                raise robolink.TargetReachError(link.LAST_STATUS_MESSAGE)
+            elif status == 11:
+                raise robolink.StoppedError(link.LAST_STATUS_MESSAGE)
+            elif status == 12:
+                raise robolink.InputError(link.LAST_STATUS_MESSAGE)
+            elif status == 13:
+                raise robolink.LicenseError(link.LAST_STATUS_MESSAGE)
+            raise Exception(link.LAST_STATUS_MESSAGE)
+
+        link.LAST_STATUS_MESSAGE = 'Problems running function'
+        raise Exception(link.LAST_STATUS_MESSAGE)
+
+
+class AsyncRobolink:
+    """Asyncio link with RoboDK. It mirrors the most common :class:`~robodk.robolink.Robolink` calls as coroutines.
+
+    Each request is sent as soon as it is awaited and replies are matched in order, so concurrent coroutines do not wait for each other's round trips.
+    Use more than one connection to avoid that long calls (such as a blocking MoveJ) delay other requests: RoboDK processes the commands of each socket in order.
+
+    :param str robodk_ip: IP of the computer running RoboDK (localhost by default)
+    :param int port: API port (ROBODK_API_PORT environment variable or 20500 by default)
+    :param int connections: Number of API sockets to open
+
+    .. seealso:: :class:`~robodk.robolink.Robolink`, :class:`AsyncItem`
+    """
+
+    # checks that provided items exist in memory and poses are homogeneous
+    SAFE_MODE: int = 1
+
+    # if AUTO_UPDATE is 1, updating and rendering objects the 3D the scene will be delayed until 100 ms after the last call
+    AUTO_UPDATE: int = 0
+
+    # timeout for communication, in seconds
+    TIMEOUT: float = 10
+
+    # Maximum size of a line received from RoboDK, in bytes
+    LINE_LIMIT: int = 16 * 1024 * 1024
+
+    # Raise an exception when a warning message is provided by RoboDK
+    _RAISE_EXCEPTION_ON_WARNING: bool = False
+
+    BUILD: int = 0  # This variable holds the build id and is used for version checking
+
+    # Remember last status message
+    LAST_STATUS_MESSAGE: str = ''
+
+    def __init__(self, robodk_ip: str = 'localhost', port: int = None, connections: int = 1):
+        if port is None:
+            port = int(os.environ.get('ROBODK_API_PORT', robolink.Robolink.PORT_START))
+
+        self.IP = robodk_ip
+        self.PORT = port
+        self.CONNECTIONS = max(1, int(connections))
+        self._conns = []
+
+    def __repr__(self) -> str:
+        return "AsyncRobolink %s:%i (%i connections)" % (self.IP, self.PORT, len(self._conns))
+
+    async def __aenter__(self):
+        await self.Connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.Disconnect()
+
+    async def Connect(self) -> int:
+        """Open the API sockets and verify the connection with RoboDK. Returns the number of connections."""
+        await self.Disconnect()
+        for i in range(self.CONNECTIONS):
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self.IP, self.PORT, limit=self.LINE_LIMIT), self.TIMEOUT)
+            sock = writer.get_extra_info('socket')
+            if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+                # Commands are written in one block: do not delay small commands
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            conn = _AsyncConnection(self, reader, writer)
+            self._conns.append(conn)
+            await self._verify_connection(conn)
+
+        return len(self._conns)
+
+    async def Disconnect(self):
+        """Close all API sockets"""
+        conns = self._conns
+        self._conns = []
+        for conn in conns:
+            conn.close()
+        for conn in conns:
+            try:
+                await conn.writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _verify_connection(self, conn: _AsyncConnection) -> bool:
+        """Verify that we are connected to the RoboDK API server"""
+        frame = _Frame('RDK_API')
+        frame._send_array([self.SAFE_MODE, self.AUTO_UPDATE, 0])
+
+        async def parse(c):
+            response = await c.rec_line()
+            await c.rec_int()  # API version
+            self.BUILD = await c.rec_int()
+            await c.check_status()
+            return response
+
+        if await conn.request(frame, parse, self.TIMEOUT) != 'RDK_API':
+            raise Exception('Unable to connect: unexpected response from the RoboDK API')
+        return True
+
+    async def _request(self, frame: _Frame, parser, timeout: float = None):
+        """Sends a command on the least busy connection and returns the result of the parser coroutine"""
+        conns = [c for c in self._conns if c.error is None]
+        if not conns:
+            if self._conns:
+                raise Exception('Communication problems: ' + self._conns[0].error)
+            await self.Connect()
+            conns = self._conns
+
+        conn = min(conns, key=lambda c: c.inflight)
+        return await conn.request(frame, parser, self.TIMEOUT if timeout is None else max(timeout, self.TIMEOUT))
+
+    async def Item(self, name: str, itemtype: int = None) -> 'AsyncItem':
+        """Returns an item by its name. See :func:`Robolink.Item() <robodk.robolink.Robolink.Item>`."""
+        if type(name) is not str:
+            raise Exception("Invalid name: provide a name as a string. Item names are visible in the RoboDK tree.")
+
+        if itemtype is None:
+            frame = _Frame('G_Item')
+            frame._send_line(name)
+        else:
+            frame = _Frame('G_Item2')
+            frame._send_line(name)
+            frame._send_int(itemtype)
+
+        async def parse(c):
+            item = await c.rec_item()
+            await c.check_status()
+            return item
+
+        return await self._request(frame, parse)
+
+    async def ItemList(self, filter: int = None, list_names: bool = False) -> Union[List['AsyncItem'], List[str]]:
+        """Returns a list of items (list of names or items) of all available items in the station. See :func:`Robolink.ItemList() <robodk.robolink.Robolink.ItemList>`."""
+        if list_names:
+            frame = _Frame('G_List_Items' if filter is None else 'G_List_Items_Type')
+        else:
+            frame = _Frame('G_List_Items_ptr' if filter is None else 'G_List_Items_Type_ptr')
+        if filter is not None:
+            frame._send_int(filter)
+
+        async def parse(c):
+            count = await c.rec_int()
+            retlist = []
+            for i in range(count):
+                retlist.append(await (c.rec_line() if list_names else c.rec_item()))
+            await c.check_status()
+            return retlist
+
+        return await self._request(frame, parse)
+
+
+class AsyncItem:
+    """Item of the RoboDK station used with an :class:`AsyncRobolink` link. Methods are coroutines that mirror :class:`~robodk.robolink.Item`.
+
+    .. seealso:: :func:`AsyncRobolink.Item`, :func:`AsyncRobolink.ItemList`
+    """
+
+    def __init__(self, link: AsyncRobolink, ptr_item: int = 0, itemtype: int = -1):
+        self.link = link
+        self.item = ptr_item
+        self.type = itemtype
+
+    def __repr__(self) -> str:
+        if self.Valid():
+            return ("RoboDK async item (%i) of type %i" % (self.item, int(self.type)))
+        else:
+            return "RoboDK async item (INVALID)"
+
+    def __hash__(self) -> int:
+        return int(self.item)
+
+    def __eq__(self, other: 'AsyncItem') -> bool:
+        if other is None:
+            return False
+        return self.item == other.item
+
+    def __ne__(self, other: 'AsyncItem') -> bool:
+        return not self.__eq__(other)
+
+    def RDK(self) -> AsyncRobolink:
+        """Returns the AsyncRobolink link of this item"""
+        return self.link
+
+    def Valid(self) -> bool:
+        """Checks if the item pointer is valid (it does not check if the item still exists in the station)"""
+        return self.item != 0
+
+    def toItem(self, link: robolink.Robolink) -> robolink.Item:
+        """Returns the same item bound to a synchronous :class:`~robodk.robolink.Robolink` link"""
+        return robolink.Item(link, self.item, self.type)
+
+    async def Type(self) -> int:
+        """Return the type of the item (ITEM_TYPE_*)"""
+        frame = _Frame('G_Item_Type')
+        frame._send_item(self)
+
+        async def parse(c):
+            itemtype = await c.rec_int()
+            await c.check_status()
+            return itemtype
+
+        return await self.link._request(frame, parse)
+
+    async def Name(self) -> str:
+        """Returns the name of the item"""
+        frame = _Frame('G_Name')
+        frame._send_item(self)
+
+        async def parse(c):
+            name = await c.rec_line()
+            await c.check_status()
+            return name
+
+        return await self.link._request(frame, parse)
+
+    async def Pose(self) -> robomath.Mat:
+        """Returns the pose of the item with respect to its parent. See :func:`Item.Pose() <robodk.robolink.Item.Pose>`."""
+        frame = _Frame('G_Hlocal')
+        frame._send_item(self)
+
+        async def parse(c):
+            pose = await c.rec_pose()
+            await c.check_status()
+            return pose
+
+        return await self.link._request(frame, parse)
+
+    async def setPose(self, pose: robomath.Mat) -> 'AsyncItem':
+        """Set the pose of the item with respect to its parent. See :func:`Item.setPose() <robodk.robolink.Item.setPose>`."""
+        frame = _Frame('S_Hlocal')
+        frame._send_item(self)
+        frame._send_pose(pose)
+
+        async def parse(c):
+            await c.check_status()
+            return self
+
+        return await self.link._request(frame, parse)
+
+    async def Joints(self) -> robomath.Mat:
+        """Return the current joints of a robot or the joints of a target. See :func:`Item.Joints() <robodk.robolink.Item.Joints>`."""
+        frame = _Frame('G_Thetas')
+        frame._send_item(self)
+
+        async def parse(c):
+            joints = await c.rec_array()
+            await c.check_status()
+            return joints
+
+        return await self.link._request(frame, parse)
+
+    async def setJoints(self, joints: Union[robomath.Mat, List[float]]) -> 'AsyncItem':
+        """Set the current joints of a robot or the joints of a target. See :func:`Item.setJoints() <robodk.robolink.Item.setJoints>`."""
+        frame = _Frame('S_Thetas')
+        frame._send_array(joints)
+        frame._send_item(self)
+
+        async def parse(c):
+            await c.check_status()
+            return self
+
+        return await self.link._request(frame, parse)
+
+    async def SolveIK(self, pose: robomath.Mat, joints_approx: Union[robomath.Mat, List[float]] = None, tool: robomath.Mat = None, reference: robomath.Mat = None) -> robomath.Mat:
+        """Calculates the inverse kinematics for a given pose. See :func:`Item.SolveIK() <robodk.robolink.Item.SolveIK>`."""
+        if tool is not None:
+            pose = pose * robomath.invH(tool)
+        if reference is not None:
+            pose = reference * pose
+
+        if joints_approx is None:
+            frame = _Frame('G_IK')
+            frame._send_pose(pose)
+        else:
+            frame = _Frame('G_IK_jnts')
+            frame._send_pose(pose)
+            frame._send_array(joints_approx)
+        frame._send_item(self)
+
+        async def parse(c):
+            joints = await c.rec_array()
+            await c.check_status()
+            return joints
+
+        return await self.link._request(frame, parse)
+
+    async def WaitMove(self, timeout: float = 360000):
+        """Waits until the robot finishes its movement. See :func:`Item.WaitMove() <robodk.robolink.Item.WaitMove>`."""
+        frame = _Frame('WaitMove')
+        frame._send_item(self)
+
+        async def parse(c):
+            await c.check_status()
+            await c.check_status()  # will wait here
+
+        await self.link._request(frame, parse, timeout)
+
+    async def _moveX(self, target: Union['AsyncItem', List[float], robomath.Mat], movetype: int, blocking: bool = True):
+        """Same as Robolink._moveX. The robot first finishes any previous movement."""
+        frame = _Frame('WaitMove')
+        frame._send_item(self)
+        frame._send_line('MoveXb' if blocking else 'MoveX')
+        frame._send_int(movetype)
+        if isinstance(target, (AsyncItem, robolink.Item)):  # target is an item
+            frame._send_int(3)
+            frame._send_array([])
+            frame._send_item(target)
+        elif isinstance(target, list) or target.size() != (4, 4):  # target are joints
+            frame._send_int(1)
+            frame._send_array(target)
+            frame._send_item(0)
+        elif target.size() == (4, 4):  # target is a pose
+            frame._send_int(2)
+            mattr = target.tr()
+            frame._send_array(mattr.rows[0] + mattr.rows[1] + mattr.rows[2] + mattr.rows[3])
+            frame._send_item(0)
+        else:
+            raise Exception('Invalid input values')
+        frame._send_item(self)
+
+        async def parse(c):
+            await c.check_status()  # WaitMove
+            await c.check_status()
+            await c.check_status()  # MoveX
+            if blocking:
+                await c.check_status()  # will wait here
+
+        await self.link._request(frame, parse, 360000)
+
+    async def MoveJ(self, target: Union['AsyncItem', List[float], robomath.Mat], blocking: bool = True):
+        """Move a robot to a specific target ("Move Joint" mode). See :func:`Item.MoveJ() <robodk.robolink.Item.MoveJ>`.
+        Awaiting a blocking movement holds the connection used until the movement finishes: use more than one connection to run other requests meanwhile."""
+        if self.type == ITEM_TYPE_PROGRAM:
+            raise Exception('Adding instructions to programs is not supported by AsyncItem. Use Item.MoveJ instead.')
+        await self._moveX(target, MOVE_TYPE_JOINT, blocking)
+
+    async def MoveL(self, target: Union['AsyncItem', List[float], robomath.Mat], blocking: bool = True):
+        """Move a robot to a specific target ("Move Linear" mode). See :func:`Item.MoveL() <robodk.robolink.Item.MoveL>`.
+        Awaiting a blocking movement holds the connection used until the movement finishes: use more than one connection to run other requests meanwhile."""
+        if self.type == ITEM_TYPE_PROGRAM:
+            raise Exception('Adding instructions to programs is not supported by AsyncItem. Use Item.MoveL instead.')
+        await self._moveX(target, MOVE_TYPE_LINEAR, blocking)
+
+    async def InstructionListJoints(self, mm_step: float = 10, deg_step: float = 5, save_to_file: str = None, collision_check: int = COLLISION_OFF, flags: int = 0, time_step: float = 0.1) -> Tuple[str, robomath.Mat, int]:
+        """Returns the list of joints of a program as a (message, joint list, status) tuple. See :func:`Item.InstructionListJoints() <robodk.robolink.Item.InstructionListJoints>`."""
+        frame = _Frame('G_ProgJointList')
+        frame._send_item(self)
+        frame._send_array([mm_step, deg_step, float(collision_check), float(flags), float(time_step)])
+        frame._send_line('' if save_to_file is None else save_to_file)
+
+        async def parse(c):
+            joint_list = save_to_file
+            if save_to_file is None:
+                joint_list = await c.rec_matrix()
+            error_code = await c.rec_int()
+            error_msg = await c.rec_line()
+            await c.check_status()
+            return error_msg, joint_list, error_code
+
+        return await self.link._request(frame, parse, 3600)
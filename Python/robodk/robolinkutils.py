@@ -54,7 +54,23 @@ def getLinks(item: robolink.Item, type_linked: int = robolink.ITEM_TYPE_ROBOT) -
     return links
 
 
-def getAncestors(item: robolink.Item, parent_types: List[int] = None) -> List[robolink.Item]:
+def _itemType(item: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> int:
+    """Returns the type of an item from the snapshot or from the item itself (items returned by RoboDK hold their type), otherwise from RoboDK"""
+    if snapshot is not None and item in snapshot:
+        return snapshot.Type(item)
+    if item.type != -1:
+        return item.type
+    return item.Type()
+
+
+def _itemParent(item: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> robolink.Item:
+    """Returns the parent of an item from the snapshot if it is available, otherwise from RoboDK"""
+    if snapshot is not None and item in snapshot:
+        return snapshot.Parent(item)
+    return item.Parent()
+
+
+def getAncestors(item: robolink.Item, parent_types: List[int] = None, snapshot: robolink.TreeSnapshot = None) -> List[robolink.Item]:
     """
     Get the list of parents of an Item up to the Station, with type filtering (i.e. [ITEM_TYPE_FRAME, ITEM_TYPE_ROBOT, ..]).
     By default, it will return all parents of an Item with no regard to their type, ordered from the Item's parent to the Station.
@@ -63,6 +79,8 @@ def getAncestors(item: robolink.Item, parent_types: List[int] = None) -> List[ro
     :type item: :class:`.Item`
     :param parent_types: The parent allowed types, such as ITEM_TYPE_FRAME, defaults to None
     :type parent_types: list of ITEM_TYPE_*, optional
+    :param snapshot: Tree snapshot used to look up the parents without communicating with RoboDK (see :func:`~robodk.robolink.Robolink.TreeSnapshot`), defaults to None
+    :type snapshot: :class:`~robodk.robolink.TreeSnapshot`, optional
 
     :return: A list of parents, ordered from the Item's parent to the Station.
     :rtype: list of :class:`.Item`
@@ -73,22 +91,22 @@ def getAncestors(item: robolink.Item, parent_types: List[int] = None) -> List[ro
 
     parent = item
     parents = []
-    while (parent is not None and parent.Type() not in [robolink.ITEM_TYPE_STATION, -1]):
-        parent = parent.Parent()
+    while (parent is not None and _itemType(parent, snapshot) not in [robolink.ITEM_TYPE_STATION, -1]):
+        parent = _itemParent(parent, snapshot)
 
         if parent_types is None:
             parents.append(parent)
             continue
 
         for parent_type in parent_types:
-            if parent.Type() == parent_type:
+            if _itemType(parent, snapshot) == parent_type:
                 parents.append(parent)
                 break
 
     return parents
 
 
-def getLowestCommonAncestor(item1: robolink.Item, item2: robolink.Item) -> robolink.Item:
+def getLowestCommonAncestor(item1: robolink.Item, item2: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> robolink.Item:
     """
     Finds the lowest common ancestor (LCA) between two Items in the Station's tree.
 
@@ -96,14 +114,16 @@ def getLowestCommonAncestor(item1: robolink.Item, item2: robolink.Item) -> robol
     :type item1: :class:`.Item`
     :param item2: The second Item
     :type item2: :class:`.Item`
+    :param snapshot: Tree snapshot used to look up the parents without communicating with RoboDK (see :func:`~robodk.robolink.Robolink.TreeSnapshot`), defaults to None
+    :type snapshot: :class:`~robodk.robolink.TreeSnapshot`, optional
 
     :return: The lowest common ancestor (LCA)
     :rtype: :class:`.Item`
     """
 
     # Make an ordered list of parents. Iter on it until the parent differs.. and you get the lowest common ancestor (LCA)
-    parents1 = getAncestors(item1)
-    parents2 = getAncestors(item2)
+    parents1 = getAncestors(item1, snapshot=snapshot)
+    parents2 = getAncestors(item2, snapshot=snapshot)
 
     lca = None
     size = min(len(parents1), len(parents2))
@@ -118,16 +138,128 @@ def getLowestCommonAncestor(item1: robolink.Item, item2: robolink.Item) -> robol
     return lca
 
 
-def getAncestorPose(item_child: robolink.Item, item_parent: robolink.Item) -> robomath.Mat:
+def _exchange(link: robolink.Robolink, requests: List[Tuple[str, robolink.Item, Any]]) -> list:
+    """Sends a list of requests (command, item, argument) back to back and returns the replies, see Robolink._exchange_batch.
+    Supported commands: G_Hlocal, G_Hlocal_Abs and G_Tool (pose), G_Thetas (joints), G_LinkType (argument: link type) and G_FK (argument: joints).
+    A PipelineError is raised with the failed requests once all the replies are received."""
+    if not requests:
+        return []
+
+    errors = []
+
+    def send_one(i):
+        command, item, arg = requests[i]
+        link._send_line(command)
+        if command == 'G_FK':
+            link._send_array(arg)
+        link._send_item(item)
+        if command == 'G_LinkType':
+            link._send_int(arg)
+
+    def rec_one(i):
+        command = requests[i][0]
+        if command == 'G_Thetas':
+            reply = link._rec_array()
+        elif command == 'G_LinkType':
+            reply = link._rec_item()
+        else:
+            reply = link._rec_pose()
+        link._check_status_collect(errors, command, requests[i][1])
+        return reply
+
+    with link._lock:
+        link._check_connection()
+        replies = link._exchange_batch(len(requests), send_one, rec_one)
+
+    if errors:
+        raise robolink.PipelineError(errors)
+    return replies
+
+
+def _localPoses(link: robolink.Robolink, items: List[robolink.Item], abs_items: List[robolink.Item] = [], snapshot: robolink.TreeSnapshot = None) -> Tuple[dict, dict]:
+    """Retrieves the pose of each item with respect to its parent (as composed by getAncestorPose) and the absolute pose of abs_items.
+    The requests of all items are sent in two exchanges with RoboDK. Returns two dictionaries {item pointer: pose}, for items and abs_items."""
+    requests = []
+    handlers = []
+    local = {}
+    absolute = {}
+    robots = {}  # robot pointer -> [robot, linked robot, joints]
+    axes_links = set()  # pointers of the robots linked to synchronized axes
+
+    def request(command, item, arg, handler):
+        requests.append((command, item, arg))
+        handlers.append(handler)
+
+    for item in items:
+        if item.item in local or item.item in robots:
+            continue
+
+        item_type = _itemType(item, snapshot)
+        if item_type in [robolink.ITEM_TYPE_TOOL]:
+            request('G_Tool', item, None, lambda pose, ptr=item.item: local.__setitem__(ptr, pose))
+
+        elif item_type in [robolink.ITEM_TYPE_ROBOT]:
+            robot = robots[item.item] = [item, None, None]
+            request('G_LinkType', item, robolink.ITEM_TYPE_ROBOT, lambda linked, robot=robot: robot.__setitem__(1, linked))
+            request('G_Thetas', item, None, lambda joints, robot=robot: robot.__setitem__(2, joints.list()))
+
+        elif snapshot is not None and item in snapshot:
+            local[item.item] = snapshot.Pose(item)
+
+        else:
+            request('G_Hlocal', item, None, lambda pose, ptr=item.item: local.__setitem__(ptr, pose))
+
+    for item in abs_items:
+        request('G_Hlocal_Abs', item, None, lambda pose, ptr=item.item: absolute.__setitem__(ptr, pose))
+
+    if robots:
+        # Synchronized axes are linked to their robot (see getLinks)
+        for axes in link.ItemList(robolink.ITEM_TYPE_ROBOT_AXES):
+            request('G_LinkType', axes, robolink.ITEM_TYPE_ROBOT, lambda linked: axes_links.add(linked.item))
+
+    for handler, reply in zip(handlers, _exchange(link, requests)):
+        handler(reply)
+
+    requests = []
+    for robot, linked, joints in robots.values():
+        if linked != robot:
+            # The pose of robots driven by another robot is not part of the chain
+            local[robot.item] = robomath.eye(4)
+            continue
+
+        if robot.item in axes_links:
+            raise robolink.InputError("This function does not support synchronized axis")
+
+        requests.append(('G_FK', robot, joints))
+
+    for (command, robot, joints), pose in zip(requests, _exchange(link, requests)):
+        local[robot.item] = pose
+
+    return local, absolute
+
+
+def _composePoses(chain: List[robolink.Item], local: dict) -> robomath.Mat:
+    """Composes the local poses of a chain of items, ordered from the child to the parent"""
+    pose_wrt = robomath.eye(4)
+    for item in reversed(chain):  # this format is to ease debugging
+        pose_wrt *= local[item.item]
+    return pose_wrt
+
+
+def getAncestorPose(item_child: robolink.Item, item_parent: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> robomath.Mat:
     """
     Gets the pose between two Items that have a hierarchical relationship in the Station's tree.
     There can be N Items between the two.
     This function will throw an error for synchronized axis.
 
+    The poses, tools and robot joints of all the Items in between are retrieved in a single exchange with RoboDK (two if there are robots) and composed locally.
+
     :param item_child: The child Item
     :type item_child: :class:`.Item`
     :param item_parent: The parent Item
     :type item_parent: :class:`.Item`
+    :param snapshot: Tree snapshot used to look up the parents, types and poses without communicating with RoboDK (see :func:`~robodk.robolink.Robolink.TreeSnapshot`), defaults to None. Robots and tools are still retrieved from RoboDK.
+    :type snapshot: :class:`~robodk.robolink.TreeSnapshot`, optional
 
     :return: The pose from the child to the parent
     :rtype: :class:`robomath.Mat`
@@ -136,38 +268,17 @@ def getAncestorPose(item_child: robolink.Item, item_parent: robolink.Item) -> ro
     if item_child == item_parent:
         return robomath.eye(4)
 
-    parents = getAncestors(item_child)
+    parents = getAncestors(item_child, snapshot=snapshot)
     if item_parent not in parents:
         return None
 
     items = [item_child] + parents
-    idx = items.index(item_parent)
-    poses = []
-    for i in range(idx - 1, -1, -1):
-        if items[i].Type() in [robolink.ITEM_TYPE_TOOL]:
-            poses.append(items[i].PoseTool())
-
-        elif items[i].Type() in [robolink.ITEM_TYPE_ROBOT]:
-            if items[i].getLink(robolink.ITEM_TYPE_ROBOT) != items[i]:
-                continue
-
-            axes_links = getLinks(items[i], robolink.ITEM_TYPE_ROBOT_AXES)
-            if axes_links:
-                raise robolink.InputError("This function does not support synchronized axis")
+    chain = items[:items.index(item_parent)]
+    local, _ = _localPoses(item_child.RDK(), chain, snapshot=snapshot)
+    return _composePoses(chain, local)
 
-            joints = items[i].Joints().list()
-            poses.append(items[i].SolveFK(joints))
 
-        else:
-            poses.append(items[i].Pose())
-
-    pose_wrt = robomath.eye(4)
-    for pose in poses:  # this format is to ease debugging
-        pose_wrt *= pose
-    return pose_wrt
-
-
-def getPoseWrt(item1: robolink.Item, item2: robolink.Item) -> robomath.Mat:
+def getPoseWrt(item1: robolink.Item, item2: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> robomath.Mat:
     """
     Gets the pose of an Item (item1) with respect to an another Item (item2).
 
@@ -182,24 +293,66 @@ def getPoseWrt(item1: robolink.Item, item2: robolink.Item) -> robomath.Mat:
     :type item1: :class:`robolink.Item`
     :param item2: The second Item
     :type item2: :class:`robolink.Item`
+    :param snapshot: Tree snapshot used to look up the parents and types without communicating with RoboDK, defaults to None
+    :type snapshot: :class:`~robodk.robolink.TreeSnapshot`, optional
 
     :return: The pose from the source Item to the second Item
     :rtype: :class:`robomath.Mat`
+
+    .. seealso:: :func:`getPosesWrt`
     """
 
     if item1 == item2:
         return robomath.eye(4)
 
-    pose1 = item1.PoseAbs()
-    pose2 = item2.PoseAbs()
+    return getPosesWrt([item1], item2, snapshot)[0]
+
+
+def getPosesWrt(items: List[robolink.Item], reference: robolink.Item, snapshot: robolink.TreeSnapshot = None) -> List[robomath.Mat]:
+    """
+    Gets the poses of a list of Items with respect to another Item (reference). This is the same as calling :func:`getPoseWrt` for each Item.
+    The absolute poses of all the Items are retrieved in a single exchange with RoboDK (two if there are robots) and the relative poses are calculated locally.
+
+    Robots and tools are located by walking up the Station's tree: provide a snapshot or enable the metadata cache (see :func:`~robodk.robolink.Robolink.setCache`) to avoid these round trips when the poses are requested periodically.
+
+    .. code-block:: python
+
+        parts = RDK.ItemList(ITEM_TYPE_OBJECT)
+        camera = RDK.Item('Camera', ITEM_TYPE_FRAME)
+        while True:
+            poses = getPosesWrt(parts, camera)
 
-    if item1.Type() in [robolink.ITEM_TYPE_ROBOT, robolink.ITEM_TYPE_TOOL]:
-        pose1 = getAncestorPose(item1, item1.RDK().ActiveStation())
+    :param items: The source Items
+    :type items: list of :class:`robolink.Item`
+    :param reference: The reference Item
+    :type reference: :class:`robolink.Item`
+    :param snapshot: Tree snapshot used to look up the parents and types without communicating with RoboDK, defaults to None
+    :type snapshot: :class:`~robodk.robolink.TreeSnapshot`, optional
 
-    if item2.Type() in [robolink.ITEM_TYPE_ROBOT, robolink.ITEM_TYPE_TOOL]:
-        pose2 = getAncestorPose(item2, item2.RDK().ActiveStation())
+    :return: The poses from each source Item to the reference Item
+    :rtype: list of :class:`robomath.Mat`
 
-    return pose2.inv() * pose1
+    .. seealso:: :func:`getPoseWrt`
+    """
+
+    chains = {}  # robot and tool pointers -> items from the robot or tool to the Station (excluded)
+    abs_items = []
+    for item in list(items) + [reference]:
+        if item.item in chains:
+            continue
+        if _itemType(item, snapshot) in [robolink.ITEM_TYPE_ROBOT, robolink.ITEM_TYPE_TOOL]:
+            chain = [item] + getAncestors(item, snapshot=snapshot)
+            chains[item.item] = chain[:-1] if _itemType(chain[-1], snapshot) == robolink.ITEM_TYPE_STATION else chain
+        else:
+            abs_items.append(item)
+
+    chain_items = [chain_item for chain in chains.values() for chain_item in chain]
+    local, absolute = _localPoses(reference.RDK(), chain_items, abs_items, snapshot)
+    for ptr, chain in chains.items():
+        absolute[ptr] = _composePoses(chain, local)
+
+    reference_inv = robomath.invH(absolute[reference.item])
+    return [robomath.eye(4) if item == reference else reference_inv * absolute[item.item] for item in items]
 
 
 def setPoseAbsIK(item: robolink.Item, pose_abs: robomath.Mat):
@@ -273,5 +426,135 @@ def SolveIK_Conf(robot: robolink.Item, pose: robomath.Mat, toolpose: robomath.Ma
     return joint_solutions
 
 
+def projectPoints(links: Union[robolink.Robolink, robolink.RobolinkPool, List[robolink.Robolink]], points: Union[List[List[float]], robomath.Mat], object_project: Union[robolink.Item, List[robolink.Item]], projection_type: int = robolink.PROJECTION_ALONG_NORMAL_RECALC, chunk_size: int = 5000, timeout: float = 30, progress=None, failed_chunks: list = None) -> Tuple[Union[List[List[float]], robomath.Mat], List[bool]]:
+    """Projects a large list of points to an object, see :func:`~robodk.robolink.Robolink.ProjectPoints`.
+    The points are split in chunks that are projected in parallel over several API connections (or several RoboDK instances that have the same station). The projected points are returned in the same order.
+
+    RoboDK returns null points for the points that can't be projected: these points are flagged in the returned mask and their coordinates are set to NaN.
+    The points of the chunks that fail (for example, if a connection times out) are flagged the same way. A connection that fails is reconnected and it is not used for the remaining chunks.
+
+    :param links: connections used to project the points: a :class:`~robodk.robolink.RobolinkPool` or a list of :class:`~robodk.robolink.Robolink`, one thread is used per connection
+    :type links: :class:`~robodk.robolink.RobolinkPool`
+    :param points: list of points (XYZ or XYZijk), :class:`~robodk.robomath.Mat` (3xN or 6xN) or numpy.ndarray (Nx3 or Nx6)
+    :type points: list of list of float
+    :param object_project: object to project the points. Provide one item per connection if the connections are linked to different RoboDK instances.
+    :type object_project: :class:`~robodk.robolink.Item`
+    :param projection_type: type of projection (PROJECTION_* flags)
+    :type projection_type: int
+    :param chunk_size: maximum number of points projected by each request
+    :type chunk_size: int
+    :param timeout: maximum time to wait for the projection of each chunk, in seconds
+    :type timeout: float
+    :param progress: function called with the number of points projected and the total number of points each time a chunk is projected (it is called from the projection threads)
+    :type progress: callable
+    :param failed_chunks: Optionally provide a list to retrieve the chunks that could not be projected as (first point index, last point index + 1, exception) tuples
+    :type failed_chunks: list
+    :return: projected points in the same layout as the provided points, and a mask of the points that were projected (list of bool, or a NumPy array if points is a NumPy array)
+
+    Example:
+
+    .. code-block:: python
+
+        RDK = RobolinkPool(4)
+        part = RDK.Item('Part', ITEM_TYPE_OBJECT)
+        projected, mask = robolinkutils.projectPoints(RDK, points_numpy, part, progress=lambda done, total: print('%i/%i' % (done, total)))
+        projected = projected[mask]
+    """
+    import threading
+
+    if isinstance(links, robolink.RobolinkPool):
+        links = links.Links()
+    elif isinstance(links, robolink.Robolink):
+        links = [links]
+    objects = object_project if isinstance(object_project, list) else [object_project] * len(links)
+    if len(objects) != len(links):
+        raise robolink.InputError("Provide one object per connection")
+
+    isnumpy = robolink._is_numpy(points)
+    ismat = isinstance(points, robomath.Mat)
+    if isnumpy:
+        import numpy as np
+        rows = points
+    else:
+        rows = points.tr().rows if ismat else [list(p) for p in points]
+    npoints = len(rows)
+    nvalues = rows.shape[1] if isnumpy else (len(rows[0]) if npoints > 0 else 0)
+    chunks = [(start, min(start + chunk_size, npoints)) for start in range(0, npoints, max(1, chunk_size))]
+
+    results = [None] * len(chunks)
+    errors = {}  # chunk index -> exception
+    state = {'next': 0, 'done': 0}
+    lock = threading.Lock()
+
+    def project(link, item):
+        while True:
+            with lock:
+                if state['next'] >= len(chunks):
+                    return
+                index = state['next']
+                state['next'] += 1
+
+            start, end = chunks[index]
+            try:
+                chunk = rows[start:end] if isnumpy else robomath.Mat(rows[start:end]).tr()
+                result = link.ProjectPoints(chunk, item, projection_type, timeout)
+            except Exception as e:
+                # The connection may be out of sync (for example, after a timeout): reconnect it for its next user and stop using it
+                with lock:
+                    errors[index] = e
+                link.COM.close()
+                link.NewLink()
+                return
+
+            if (result.shape if isnumpy else tuple(reversed(result.size()))) != (end - start, nvalues):
+                with lock:
+                    errors[index] = Exception('Unexpected size of the projected points: %s' % str(result.shape if isnumpy else result.size()))
+                continue
+            results[index] = result
+
+            with lock:
+                state['done'] += end - start
+                done = state['done']
+            if progress is not None:
+                progress(done, npoints)
+
+    threads = [threading.Thread(target=project, args=(link, item)) for link, item in zip(links, objects)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if failed_chunks is not None:
+        # Chunks left when all the connections failed are reported with the error of the last failed chunk
+        last_error = errors[max(errors)] if errors else None
+        for index, (start, end) in enumerate(chunks):
+            if results[index] is None:
+                failed_chunks.append((start, end, errors.get(index, last_error)))
+
+    # Reassemble the chunks: chunks that failed are None and null points were not projected
+    if isnumpy:
+        projected = np.full((npoints, nvalues), np.nan)
+        mask = np.zeros(npoints, dtype=bool)
+        for (start, end), result in zip(chunks, results):
+            if result is not None:
+                projected[start:end] = result
+                mask[start:end] = np.any(result != 0, axis=1)
+        projected[~mask] = np.nan
+        return projected, mask
+
+    projected = []
+    mask = []
+    for (start, end), result in zip(chunks, results):
+        result = result.tr().rows if result is not None else [[0.0] * nvalues] * (end - start)
+        for point in result:
+            valid = any(v != 0 for v in point)
+            mask.append(valid)
+            projected.append(list(point) if valid else [float('nan')] * nvalues)
+
+    if ismat:
+        return robomath.Mat(projected).tr() if projected else robomath.Mat(nvalues, 0), mask
+    return projected, mask
+
+
 if __name__ == "__main__":
     pass
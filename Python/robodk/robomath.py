@@ -29,8 +29,10 @@ More information about the RoboDK API for Python here:
 """
 # --------------------------------------------
 import sys
+import os
 import math
 import time
+from array import array
 
 if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
     # Python 3.5+ type hints. Type hints are stripped for <3.5
@@ -41,6 +43,8 @@ if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
 
 pi: float = math.pi  #: PI
 
+_EYE_COLS = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]  # Identity matrix, column major
+
 
 def pause(seconds: float):
     """
@@ -319,7 +323,7 @@ def RelTool(target_pose: 'Mat', x: float, y: float, z: float, rx: float = 0, ry:
 
     .. seealso:: :func:`~robodk.robomath.Offset`, :func:`~robodk.robomath.transl`, :func:`~robodk.robomath.rotx`, :func:`~robodk.robomath.roty`, :func:`~robodk.robomath.rotz`
     """
-    if type(target_pose) != Mat:
+    if not isinstance(target_pose, (Mat, PoseH)):
         target_pose = target_pose.Pose()
     new_target = target_pose * transl(x, y, z) * rotx(rx * pi / 180) * roty(ry * pi / 180) * rotz(rz * pi / 180)
     return new_target
@@ -348,7 +352,7 @@ def Offset(target_pose: 'Mat', x: float, y: float, z: float, rx: float = 0, ry:
 
     .. seealso:: :func:`~robodk.robomath.RelTool`, :func:`~robodk.robomath.transl`, :func:`~robodk.robomath.rotx`, :func:`~robodk.robomath.roty`, :func:`~robodk.robomath.rotz`
     """
-    if type(target_pose) != Mat:
+    if not isinstance(target_pose, (Mat, PoseH)):
         # item object assumed:
         target_pose = target_pose.Pose()
     if not target_pose.isHomogeneous():
@@ -1342,6 +1346,56 @@ class MatrixError(Exception):
     pass
 
 
+#----------------------------------------------------
+#--------      Mat backend     ---------------
+_numpy = None  # NumPy module used by Mat operations, False to use the pure Python implementation (None if not initialized yet)
+
+
+def setMatBackend(backend: str = None):
+    """Select the implementation used by :class:`.Mat` operations (products, inverse, transpose, ...).
+
+    With the 'numpy' backend, the result of these operations is stored as a NumPy array of float64 until the rows are accessed, which is much faster for pose operations.
+    The values of the resulting rows are floats, even if the operands hold integers.
+    The 'list' backend uses lists of Python lists only.
+
+    :param backend: 'numpy', 'list', or None to use NumPy when it is installed (default). The default can be set with the ROBODK_MAT_BACKEND environment variable.
+    :type backend: str
+    """
+    global _numpy
+    explicit = backend is not None
+    if backend is None:
+        backend = os.environ.get('ROBODK_MAT_BACKEND', 'numpy')
+
+    if backend == 'list':
+        _numpy = False
+        return
+    elif backend != 'numpy':
+        raise Exception(MatrixError, "Invalid Mat backend: " + str(backend))
+
+    try:
+        import numpy
+        _numpy = numpy
+    except ImportError:
+        if explicit:
+            raise
+        _numpy = False
+
+
+def getMatBackend() -> str:
+    """Returns the implementation used by :class:`.Mat` operations: 'numpy' or 'list'
+
+    .. seealso:: :func:`~robodk.robomath.setMatBackend`
+    """
+    return 'numpy' if _np() else 'list'
+
+
+def _np():
+    """Returns the NumPy module if the NumPy backend is used"""
+    if _numpy is None:
+        setMatBackend()
+    return _numpy
+
+
 class Mat(object):
     """Mat is a matrix object. The main purpose of this object is to represent a pose in the 3D space (position and orientation).
 
@@ -1395,6 +1449,8 @@ class Mat(object):
         :param ncols: Number of columns (required if rows is an integer).
         :type ncols: int
         """
+        self._a = None
+        self._rows = None
         if ncols is None:
             if rows is None:
                 m = 4
@@ -1403,6 +1459,10 @@ class Mat(object):
             else:
                 if isinstance(rows, Mat):
                     rows = rows.copy().rows
+                elif type(rows).__module__ == 'numpy' and _np():
+                    array = _numpy.array(rows, dtype=float)
+                    self._a = array if array.ndim == 2 else array.reshape(-1, 1)
+                    return
                 m = len(rows)
                 transpose = 0
                 if isinstance(rows, list) and len(rows) == 0:
@@ -1435,6 +1495,43 @@ class Mat(object):
 
             self.rows = [[0] * n for x in range(m)]
 
+    @property
+    def rows(self) -> List[List[float]]:
+        """Matrix data as a list of rows (list of list of float). The rows can be modified in place."""
+        if self._rows is None:
+            # Data stored as a NumPy array: the list of rows becomes the matrix data
+            self._rows = self._a.tolist()
+            self._a = None
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows: List[List[float]]):
+        self._rows = rows
+        self._a = None
+
+    def __getstate__(self):
+        # Same state as matrices stored as lists (NumPy is not required to load it)
+        return {'rows': self.rows}
+
+    def __setstate__(self, state):
+        self._a = None
+        self._rows = state['rows']
+
+    @staticmethod
+    def _fromArray(array) -> 'Mat':
+        """Creates a matrix that stores a 2D NumPy array of float64 (not copied)"""
+        mat = Mat.__new__(Mat)
+        mat._rows = None
+        mat._a = array
+        return mat
+
+    def _array(self):
+        """Returns the matrix as a NumPy array of float64. The array must not be modified: it may be the matrix data."""
+        if self._a is not None:
+            return self._a
+        # The rows may be modified at any time, they can't be cached as an array
+        return _numpy.array(self._rows, dtype=float)
+
     def __iter__(self):
         if self.size(0) == 0 or self.size(1) == 0:
             return iter([])
@@ -1447,32 +1544,33 @@ class Mat(object):
         :return: A new instance of Mat that is a copy of this instance.
         :rtype: Mat
         """
-        sz = self.size()
-        newmat = Mat(sz[0], sz[1])
-        for i in range(sz[0]):
-            for j in range(sz[1]):
-                newmat[i, j] = self[i, j]
-        return newmat
+        if self._a is not None:
+            return Mat._fromArray(self._a.copy())
+        return Mat([list(row) for row in self._rows])
 
     def fromNumpy(ndarray) -> 'Mat':
         """Convert a numpy array to a Mat matrix"""
+        if _np():
+            return Mat(ndarray)
         return Mat(ndarray.tolist())
 
     def toNumpy(self):
         """Return a copy of the Mat matrix as a numpy array"""
         import numpy
-        return numpy.asarray(self.rows, float)
+        if self._a is not None:
+            return self._a.copy()
+        return numpy.asarray(self._rows, float)
 
     def __len__(self) -> int:
         """Return the number of columns"""
-        return len(self.rows[0])
+        return self.size(1)
 
     def ColsCount(self) -> int:
         """Return the number of coumns. Same as len().
 
         .. seealso:: :func:`~Mat.Cols`, :func:`~Mat.Rows`, :func:`~Mat.RowsCount`
         """
-        return len(self.rows[0])
+        return self.size(1)
 
     def RowsCount(self) -> int:
         """Return the number of rows
@@ -1480,7 +1578,7 @@ class Mat(object):
         .. seealso:: :func:`~Mat.Cols`, :func:`~Mat.Rows`, :func:`~Mat.ColsCount`
 
         """
-        return len(self.rows)
+        return self.size(0)
 
     def Cols(self) -> List[List[float]]:
         """Retrieve the matrix as a list of columns (list of list of float).
@@ -1515,6 +1613,8 @@ class Mat(object):
         return self.rows[n]
 
     def __getitem__(self, idx: Union[int, slice, Tuple[slice, slice]]) -> 'Mat':
+        if self._a is not None:
+            return self._getitem_array(idx)
         if isinstance(idx, int):  #integer A[1]
             return tr(Mat(self.rows[idx]))
         elif isinstance(idx, slice):  #one slice: A[1:3]
@@ -1549,7 +1649,33 @@ class Mat(object):
                 cm = cm + 1
             return newmat
 
+    def _getitem_array(self, idx):
+        """Same as __getitem__ for matrices stored as a NumPy array"""
+        array = self._a
+        if isinstance(idx, tuple):
+            idx1, idx2 = idx
+            if isinstance(idx1, int) and isinstance(idx2, int):
+                return array.item(idx1, idx2)
+        else:
+            idx1 = idx
+            idx2 = slice(None)
+            if isinstance(idx1, int):  #integer A[1] returns a row
+                idx1 = idx1 % array.shape[0]
+                return Mat._fromArray(array[idx1:idx1 + 1].copy())
+
+        if isinstance(idx1, int):
+            idx1 = idx1 % array.shape[0]
+            idx1 = slice(idx1, idx1 + 1)
+        if isinstance(idx2, int):
+            idx2 = idx2 % array.shape[1]
+            idx2 = slice(idx2, idx2 + 1)
+        return Mat._fromArray(array[idx1, idx2].copy())
+
     def __setitem__(self, idx, item):
+        if self._a is not None and isinstance(idx, tuple) and isinstance(idx[0], int) and isinstance(idx[1], int) and (isinstance(item, float) or isinstance(item, int)):
+            self._a[idx] = item
+            return
+
         if isinstance(item, float) or isinstance(item, int):
             item = Mat([[item]])
         elif isinstance(item, list):
@@ -1588,6 +1714,10 @@ class Mat(object):
         if len(newm) != itmsz[0] or len(newn) != itmsz[1]:
             raise Exception(MatrixError, "Submatrix indices does not match the new matrix sizes", itmsz[0], "x", itmsz[1], "<-", newm, "x", newn)
         #newmat = Mat(newm,newn)
+        if self._a is not None:
+            self._a[_numpy.ix_(rg1, rg2)] = item._array()
+            return
+
         cm = 0
         for i in rg1:
             cn = 0
@@ -1614,8 +1744,10 @@ class Mat(object):
 
     def tr(self) -> 'Mat':
         """Returns the transpose of the matrix"""
-        if len(self.rows) == 0 or len(self.rows[0]) == 0:
+        if self.size(0) == 0 or self.size(1) == 0:
             return Mat(0, 0)
+        if _np():
+            return Mat._fromArray(_numpy.ascontiguousarray(self._array().T))
         # mat = Mat([list(item) for item in zip(*self.rows)])
         mat = Mat(list(map(list, zip(*self.rows))))
         return mat
@@ -1628,11 +1760,14 @@ class Mat(object):
         :type dim: int
         :return: The size of the matrix as a tuple (rows, columns), or the size of the specified dimension.
         """
-        m = len(self.rows)
-        if m > 0:
-            n = len(self.rows[0])
+        if self._a is not None:
+            m, n = self._a.shape
         else:
-            n = 0
+            m = len(self._rows)
+            if m > 0:
+                n = len(self._rows[0])
+            else:
+                n = 0
 
         if dim is None:
             return (m, n)
@@ -1693,6 +1828,15 @@ class Mat(object):
         """Add a matrix to this matrix and
         return the new matrix. It doesn't modify
         the current matrix"""
+        if _np():
+            # Same operands as the list backend: no broadcasting
+            if isinstance(mat, Mat):
+                if self.size() != mat.size():
+                    raise Exception(MatrixError, "Can not add matrices of sifferent sizes!")
+                return Mat._fromArray(self._array() + mat._array())
+            if isinstance(mat, int) or isinstance(mat, float):
+                return Mat._fromArray(self._array() + mat)
+            raise Exception(MatrixError, "Invalid addition")
         if isinstance(mat, int) or isinstance(mat, float):
             m, n = self.size()
             result = Mat(m, n)
@@ -1715,6 +1859,15 @@ class Mat(object):
         """Subtract a matrix from this matrix and
         return the new matrix. It doesn't modify
         the current matrix"""
+        if _np():
+            # Same operands as the list backend: no broadcasting
+            if isinstance(mat, Mat):
+                if self.size() != mat.size():
+                    raise Exception(MatrixError, "Can not subtract matrices of sifferent sizes!")
+                return Mat._fromArray(self._array() - mat._array())
+            if isinstance(mat, int) or isinstance(mat, float):
+                return Mat._fromArray(self._array() - mat)
+            raise Exception(MatrixError, "Invalid subtraction")
         if isinstance(mat, int) or isinstance(mat, float):
             m, n = self.size()
             result = Mat(m, n)
@@ -1737,6 +1890,12 @@ class Mat(object):
         """Multiply a matrix with this matrix and
         return the new matrix. It doesn't modify
         the current matrix"""
+        if isinstance(mat, PoseH):
+            if self.size() == (4, 4) and self[3, 0] == 0 and self[3, 1] == 0 and self[3, 2] == 0 and self[3, 3] == 1:
+                return PoseH(self) * mat
+            mat = mat.toMat()
+        if _np():
+            return self._mul_array(mat)
         if isinstance(mat, int) or isinstance(mat, float):
             m, n = self.size()
             mulmat = Mat(m, n)
@@ -1769,6 +1928,25 @@ class Mat(object):
                     mulmat.rows[x][y] = sum([item[0] * item[1] for item in zip(self.rows[x], mat_t.rows[y])])
             return mulmat
 
+    def _mul_array(self, mat) -> 'Mat':
+        """Same as __mul__ using NumPy"""
+        array = self._array()
+        if isinstance(mat, int) or isinstance(mat, float):
+            return Mat._fromArray(array * mat)
+        if isinstance(mat, list):  #case of a matrix times a vector
+            szvect = len(mat)
+            m, n = array.shape
+            if szvect + 1 == m and n == m:
+                return (array[:-1, :-1] @ _numpy.asarray(mat, dtype=float) + array[:-1, -1]).tolist()
+            elif szvect == m and n == m:
+                return (array @ _numpy.asarray(mat, dtype=float)).tolist()
+            else:
+                raise Exception(MatrixError, "Invalid product")
+        mat_array = mat._array()
+        if array.shape[1] != mat_array.shape[0]:
+            raise Exception(MatrixError, "Matrices cannot be multipled (unexpected size)!")
+        return Mat._fromArray(array @ mat_array)
+
     def eye(self, m: int = 4) -> 'Mat':
         """Make identity matrix of size (mxm)"""
         rows = [[0] * m for x in range(m)]
@@ -1788,6 +1966,9 @@ class Mat(object):
         m, n = self.size()
         if m != 4 or n != 4:
             return False
+        if _np():
+            rot = self._array()[:3, :3]
+            return float(_numpy.abs(rot @ rot.T - _numpy.eye(3)).sum()) <= 1e-4
         #if self[3,:] != Mat([[0.0,0.0,0.0,1.0]]):
         #    return False
         test = self[0:3, 0:3]
@@ -1855,6 +2036,13 @@ class Mat(object):
         """
         if not self.isHomogeneous():
             raise Exception(MatrixError, "Pose matrix is not homogeneous. invH() can only compute the inverse of a homogeneous matrix")
+        if _np():
+            array = self._array()
+            inverse = _numpy.zeros((4, 4))
+            inverse[:3, :3] = array[:3, :3].T
+            inverse[:3, 3] = -(inverse[:3, :3] @ array[:3, 3])
+            inverse[3, 3] = 1
+            return Mat._fromArray(inverse)
         Hout = self.tr()
         Hout[3, 0:3] = Mat([[0, 0, 0]])
         Hout[0:3, 3] = (Hout[0:3, 0:3] * self[0:3, 3]) * (-1)
@@ -1889,7 +2077,9 @@ class Mat(object):
         :rtype: List[float]
         """
         # return self[0:3, 3].tolist()
-        return [self.rows[0][3], self.rows[1][3], self.rows[2][3]]
+        if self._a is not None:
+            return self._a[:3, 3].tolist()
+        return [self._rows[0][3], self._rows[1][3], self._rows[2][3]]
 
     def VX(self) -> List[float]:
         """
@@ -1899,7 +2089,9 @@ class Mat(object):
         :rtype: List[float]
         """
         # return self[0:3, 0].tolist()
-        return [self.rows[0][0], self.rows[1][0], self.rows[2][0]]
+        if self._a is not None:
+            return self._a[:3, 0].tolist()
+        return [self._rows[0][0], self._rows[1][0], self._rows[2][0]]
 
     def VY(self) -> List[float]:
         """
@@ -1909,7 +2101,9 @@ class Mat(object):
         :rtype: List[float]
         """
         # return self[0:3, 1].tolist()
-        return [self.rows[0][1], self.rows[1][1], self.rows[2][1]]
+        if self._a is not None:
+            return self._a[:3, 1].tolist()
+        return [self._rows[0][1], self._rows[1][1], self._rows[2][1]]
 
     def VZ(self) -> List[float]:
         """
@@ -1919,7 +2113,9 @@ class Mat(object):
         :rtype: List[float]
         """
         # return self[0:3, 2].tolist()
-        return [self.rows[0][2], self.rows[1][2], self.rows[2][2]]
+        if self._a is not None:
+            return self._a[:3, 2].tolist()
+        return [self._rows[0][2], self._rows[1][2], self._rows[2][2]]
 
     def Rot33(self):
         """Returns the sub 3x3 rotation matrix"""
@@ -1937,9 +2133,12 @@ class Mat(object):
         if type(newpos) == Mat:
             newpos = list(newpos)[0]
 
-        self.rows[0][3] = newpos[0]
-        self.rows[1][3] = newpos[1]
-        self.rows[2][3] = newpos[2]
+        if self._a is not None:
+            self._a[:3, 3] = newpos[:3]
+            return self
+        self._rows[0][3] = newpos[0]
+        self._rows[1][3] = newpos[1]
+        self._rows[2][3] = newpos[2]
         return self
 
     def setVX(self, v_xyz: Union[List[float], 'Mat']) -> 'Mat':
@@ -1955,9 +2154,12 @@ class Mat(object):
             v_xyz = list(v_xyz)[0]
 
         v_xyz = normalize3(v_xyz)
-        self.rows[0][0] = v_xyz[0]
-        self.rows[1][0] = v_xyz[1]
-        self.rows[2][0] = v_xyz[2]
+        if self._a is not None:
+            self._a[:3, 0] = v_xyz
+            return self
+        self._rows[0][0] = v_xyz[0]
+        self._rows[1][0] = v_xyz[1]
+        self._rows[2][0] = v_xyz[2]
         return self
 
     def setVY(self, v_xyz: Union[List[float], 'Mat']) -> 'Mat':
@@ -1973,9 +2175,12 @@ class Mat(object):
             v_xyz = list(v_xyz)[0]
 
         v_xyz = normalize3(v_xyz)
-        self.rows[0][1] = v_xyz[0]
-        self.rows[1][1] = v_xyz[1]
-        self.rows[2][1] = v_xyz[2]
+        if self._a is not None:
+            self._a[:3, 1] = v_xyz
+            return self
+        self._rows[0][1] = v_xyz[0]
+        self._rows[1][1] = v_xyz[1]
+        self._rows[2][1] = v_xyz[2]
         return self
 
     def setVZ(self, v_xyz: Union[List[float], 'Mat']) -> 'Mat':
@@ -1991,9 +2196,12 @@ class Mat(object):
             v_xyz = list(v_xyz)[0]
 
         v_xyz = normalize3(v_xyz)
-        self.rows[0][2] = v_xyz[0]
-        self.rows[1][2] = v_xyz[1]
-        self.rows[2][2] = v_xyz[2]
+        if self._a is not None:
+            self._a[:3, 2] = v_xyz
+            return self
+        self._rows[0][2] = v_xyz[0]
+        self._rows[1][2] = v_xyz[1]
+        self._rows[2][2] = v_xyz[2]
         return self
 
     def translationPose(self) -> 'Mat':
@@ -2028,5 +2236,253 @@ class Mat(object):
                 file.write('\n')
 
 
+class PoseH(object):
+    """PoseH is a compact 4x4 homogeneous matrix (pose). It stores the 16 values of the matrix in column major order, the same layout used by the RoboDK API.
+
+    PoseH provides the same pose operations as :class:`.Mat` (product, inverse, Pos, VX, VY, VZ, indexing, ...) with less memory and faster products and inverse.
+    The last row of the matrix is assumed to be [0, 0, 0, 1]. PoseH and :class:`.Mat` can be mixed in products.
+
+    Set Robolink.POSEH to True to retrieve poses as PoseH in :func:`~robodk.robolink.Item.Pose`, :func:`~robodk.robolink.Item.PoseAbs` and :func:`~robodk.robolink.Item.SolveFK`.
+
+    Example:
+
+        .. code-block:: python
+
+            pose = PoseH(transl(100, 200, 300) * rotz(pi / 2))
+            pose_inv = pose.invH()
+            print(pose.Pos())
+            mat = pose.toMat()
+    """
+    __slots__ = ('_d',)
+
+    def __init__(self, pose: Union['Mat', 'PoseH', List[List[float]]] = None):
+        """
+        :param pose: 4x4 matrix to copy (:class:`.Mat`, PoseH or list of rows). The identity matrix is used by default.
+        """
+        if pose is None:
+            self._d = array('d', _EYE_COLS)
+        elif isinstance(pose, PoseH):
+            self._d = array('d', pose._d)
+        else:
+            rows = pose.rows if isinstance(pose, Mat) else pose
+            if len(rows) != 4 or any([len(row) != 4 for row in rows]):
+                raise Exception(MatrixError, "A PoseH must be a 4x4 matrix")
+            self._d = array('d', [rows[i][j] for j in range(4) for i in range(4)])
+
+    @staticmethod
+    def fromCols(values: List[float]) -> 'PoseH':
+        """Creates a pose from 16 values in column major order"""
+        pose = PoseH.__new__(PoseH)
+        pose._d = array('d', values)
+        return pose
+
+    @staticmethod
+    def fromBytes(data: bytes) -> 'PoseH':
+        """Creates a pose from 16 big endian doubles in column major order (RoboDK API format)"""
+        pose = PoseH.__new__(PoseH)
+        pose._d = array('d')
+        pose._d.frombytes(data)
+        if sys.byteorder == 'little':
+            pose._d.byteswap()
+        return pose
+
+    def toBytes(self) -> bytes:
+        """Returns the pose as 16 big endian doubles in column major order (RoboDK API format)"""
+        if sys.byteorder == 'little':
+            data = array('d', self._d)
+            data.byteswap()
+            return data.tobytes()
+        return self._d.tobytes()
+
+    def toMat(self) -> 'Mat':
+        """Returns the pose as a :class:`.Mat`"""
+        return Mat(self.rows)
+
+    def toNumpy(self):
+        """Return a copy of the pose as a numpy array"""
+        import numpy
+        return numpy.frombuffer(self._d, dtype=float).reshape(4, 4).T.copy()
+
+    @property
+    def rows(self) -> List[List[float]]:
+        """Pose as a list of rows (a copy: modifying the list does not modify the pose)"""
+        d = self._d
+        return [[d[0], d[4], d[8], d[12]], [d[1], d[5], d[9], d[13]], [d[2], d[6], d[10], d[14]], [d[3], d[7], d[11], d[15]]]
+
+    def Rows(self) -> List[List[float]]:
+        """Get the pose as a list of rows"""
+        return self.rows
+
+    def Cols(self) -> List[List[float]]:
+        """Get the pose as a list of columns"""
+        d = self._d.tolist()
+        return [d[0:4], d[4:8], d[8:12], d[12:16]]
+
+    def list2(self) -> list:
+        """Returns the pose as list of lists (one list per column)"""
+        return self.Cols()
+
+    def list(self) -> List[float]:
+        """Returns the first column of the pose as a list"""
+        return self._d[0:4].tolist()
+
+    def tolist(self) -> List[float]:
+        """Returns the first column of the pose as a list"""
+        return self._d[0:4].tolist()
+
+    def __iter__(self):
+        return iter(self.Cols())
+
+    def __len__(self) -> int:
+        """Return the number of columns"""
+        return 4
+
+    def size(self, dim: int = None) -> Union[int, Tuple[int, int]]:
+        """Returns the size of the matrix (4, 4)"""
+        if dim is None:
+            return (4, 4)
+        return 4
+
+    def copy(self) -> 'PoseH':
+        """Creates a copy of the pose"""
+        return PoseH.fromCols(self._d)
+
+    def tr(self) -> 'Mat':
+        """Returns the transpose of the matrix"""
+        return Mat(self.Cols())
+
+    def isHomogeneous(self) -> bool:
+        """Checks if the rotation of the pose is orthonormal"""
+        return self.toMat().isHomogeneous()
+
+    def __getitem__(self, idx):
+        if isinstance(idx, tuple) and isinstance(idx[0], int) and isinstance(idx[1], int):
+            return self._d[(idx[1] % 4) * 4 + idx[0] % 4]
+        return self.toMat()[idx]
+
+    def __setitem__(self, idx, item):
+        if isinstance(idx, tuple) and isinstance(idx[0], int) and isinstance(idx[1], int) and (isinstance(item, float) or isinstance(item, int)):
+            self._d[(idx[1] % 4) * 4 + idx[0] % 4] = item
+            return
+        mat = self.toMat()
+        mat[idx] = item
+        self._d = PoseH(mat)._d
+
+    def __mul__(self, other: Union['PoseH', 'Mat', List[float], float]) -> Union['PoseH', 'Mat', List[float]]:
+        """Multiply this pose with another pose, a matrix, a point [x,y,z] or a scalar.
+        Poses multiplied by a PoseH or a homogeneous 4x4 :class:`.Mat` return a PoseH."""
+        if isinstance(other, Mat):
+            if other.size() != (4, 4) or other[3, 0] != 0 or other[3, 1] != 0 or other[3, 2] != 0 or other[3, 3] != 1:
+                return self.toMat() * other
+            other = PoseH(other)
+        elif isinstance(other, list):
+            a0, a1, a2, _, a4, a5, a6, _, a8, a9, a10, _, a12, a13, a14, _ = self._d
+            if len(other) == 3:
+                x, y, z = other
+                return [a0 * x + a4 * y + a8 * z + a12, a1 * x + a5 * y + a9 * z + a13, a2 * x + a6 * y + a10 * z + a14]
+            return self.toMat() * other
+        elif not isinstance(other, PoseH):
+            return self.toMat() * other
+
+        a0, a1, a2, _, a4, a5, a6, _, a8, a9, a10, _, a12, a13, a14, _ = self._d
+        b = other._d
+        result = []
+        for j in (0, 4, 8):
+            x, y, z = b[j], b[j + 1], b[j + 2]
+            result += [a0 * x + a4 * y + a8 * z, a1 * x + a5 * y + a9 * z, a2 * x + a6 * y + a10 * z, 0.0]
+        x, y, z = b[12], b[13], b[14]
+        result += [a0 * x + a4 * y + a8 * z + a12, a1 * x + a5 * y + a9 * z + a13, a2 * x + a6 * y + a10 * z + a14, 1.0]
+        return PoseH.fromCols(result)
+
+    def invH(self) -> 'PoseH':
+        """Returns the inverse of the pose (rigid transformation inverse: the rotation is assumed to be orthonormal)"""
+        a0, a1, a2, _, a4, a5, a6, _, a8, a9, a10, _, x, y, z, _ = self._d
+        tx = -(a0 * x + a1 * y + a2 * z)
+        ty = -(a4 * x + a5 * y + a6 * z)
+        tz = -(a8 * x + a9 * y + a10 * z)
+        return PoseH.fromCols([a0, a4, a8, 0.0, a1, a5, a9, 0.0, a2, a6, a10, 0.0, tx, ty, tz, 1.0])
+
+    def inv(self) -> 'PoseH':
+        """Returns the inverse of the pose"""
+        return self.invH()
+
+    def Pos(self) -> List[float]:
+        """Returns the translation vector [X, Y, Z]"""
+        return self._d[12:15].tolist()
+
+    def VX(self) -> List[float]:
+        """Returns the X axis vector [Xx, Xy, Xz]"""
+        return self._d[0:3].tolist()
+
+    def VY(self) -> List[float]:
+        """Returns the Y axis vector [Yx, Yy, Yz]"""
+        return self._d[4:7].tolist()
+
+    def VZ(self) -> List[float]:
+        """Returns the Z axis vector [Zx, Zy, Zz]"""
+        return self._d[8:11].tolist()
+
+    def Rot33(self) -> 'Mat':
+        """Returns the sub 3x3 rotation matrix"""
+        return self.toMat()[0:3, 0:3]
+
+    def _setCol(self, col: int, values: Union[List[float], 'Mat']):
+        if isinstance(values, Mat):
+            values = list(values)[0]
+        self._d[col * 4:col * 4 + 3] = array('d', values[:3])
+        return self
+
+    def setPos(self, newpos: Union[List[float], 'Mat']) -> 'PoseH':
+        """Sets the translation vector [X, Y, Z]"""
+        return self._setCol(3, newpos)
+
+    def setVX(self, v_xyz: Union[List[float], 'Mat']) -> 'PoseH':
+        """Sets the X axis vector (the vector is normalized)"""
+        return self._setCol(0, normalize3(list(v_xyz)[0] if isinstance(v_xyz, Mat) else v_xyz))
+
+    def setVY(self, v_xyz: Union[List[float], 'Mat']) -> 'PoseH':
+        """Sets the Y axis vector (the vector is normalized)"""
+        return self._setCol(1, normalize3(list(v_xyz)[0] if isinstance(v_xyz, Mat) else v_xyz))
+
+    def setVZ(self, v_xyz: Union[List[float], 'Mat']) -> 'PoseH':
+        """Sets the Z axis vector (the vector is normalized)"""
+        return self._setCol(2, normalize3(list(v_xyz)[0] if isinstance(v_xyz, Mat) else v_xyz))
+
+    def translationPose(self) -> 'PoseH':
+        """Return the translation pose of this pose. The rotation returned is set to identity"""
+        return PoseH().setPos(self.Pos())
+
+    def rotationPose(self) -> 'PoseH':
+        """Return the rotation pose of this pose. The position returned is set to [0,0,0]"""
+        return self.copy().setPos([0, 0, 0])
+
+    def RelTool(self, x: float, y: float, z: float, rx: float = 0, ry: float = 0, rz: float = 0) -> 'PoseH':
+        """Calculates a relative target with respect to the tool coordinates. See :func:`~robodk.robomath.RelTool`."""
+        return RelTool(self, x, y, z, rx, ry, rz)
+
+    def Offset(self, x: float, y: float, z: float, rx: float = 0, ry: float = 0, rz: float = 0) -> 'PoseH':
+        """Calculates a relative target with respect to this pose. See :func:`~robodk.robomath.Offset`."""
+        return PoseH(Offset(self, x, y, z, rx, ry, rz))
+
+    def __eq__(self, other: Union['PoseH', 'Mat']) -> bool:
+        """Test equality"""
+        if other is None:
+            return False
+        if not isinstance(other, (PoseH, Mat)):
+            return NotImplemented
+        return pose_is_similar(self, other)
+
+    def __ne__(self, other: Union['PoseH', 'Mat']) -> bool:
+        return not (self == other)
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return str(self.toMat())
+
+    def __repr__(self) -> str:
+        return repr(self.toMat())
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,503 @@
+# Copyright 2015-2026 - RoboDK Inc. - https://robodk.com/
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# --------------------------------------------
+# --------------- DESCRIPTION ----------------
+"""This module reads triangle meshes (STL, PLY and OBJ files) and prepares them to be added to RoboDK with :func:`~robodk.robolink.Robolink.AddShape`.
+
+Binary STL and PLY files are memory-mapped and decoded with NumPy, so large files are read at disk speed. ASCII files are supported too.
+Meshes can be modified before they are added to RoboDK (vertex welding, decimation, normals, transformations and bounding boxes) and point clouds can be downsampled.
+Calculations are vectorized with NumPy, which is required by this module (pip install robodk[mesh]).
+
+Example:
+
+.. code-block:: python
+
+    from robodk.robolink import *
+    from robodk import robomesh
+
+    RDK = Robolink()
+    mesh = robomesh.readMesh(r'C:/Users/Name/Desktop/scan.stl')
+    mesh = mesh.weld(0.01)
+    print(mesh.bounds())
+
+    part = RDK.AddShape(mesh.triangles(normals=True))
+
+More information about the RoboDK API for Python here:
+
+* https://robodk.com/doc/en/RoboDK-API.html
+* https://robodk.com/doc/en/PythonAPI/index.html
+"""
+# --------------------------------------------
+import sys
+import os
+import re
+from robodk import robomath
+
+import numpy as np
+
+if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
+    # Python 3.5+ type hints. Type hints are stripped for <3.5
+    from typing import List, Union, Tuple
+
+# Record of a triangle in binary STL files
+_STL_TRIANGLE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+# PLY property types
+_PLY_TYPES = {
+    'char': 'i1',
+    'int8': 'i1',
+    'uchar': 'u1',
+    'uint8': 'u1',
+    'short': 'i2',
+    'int16': 'i2',
+    'ushort': 'u2',
+    'uint16': 'u2',
+    'int': 'i4',
+    'int32': 'i4',
+    'uint': 'u4',
+    'uint32': 'u4',
+    'float': 'f4',
+    'float32': 'f4',
+    'double': 'f8',
+    'float64': 'f8',
+}
+
+
+class Mesh(object):
+    """Triangle mesh defined by an array of vertices and an array of faces (vertex indexes of each triangle).
+
+    :param vertices: vertex coordinates, one row per vertex (Vx3 array)
+    :type vertices: numpy.ndarray
+    :param faces: vertex indexes of each triangle (Tx3 array). If None, vertices are grouped by triangles (3 consecutive vertices per triangle).
+    :type faces: numpy.ndarray
+    :param normals: vertex normals, one row per vertex (Vx3 array, optional)
+    :type normals: numpy.ndarray
+    """
+
+    def __init__(self, vertices, faces=None, normals=None):
+        self.vertices = np.asarray(vertices).reshape(-1, 3)
+        if not np.issubdtype(self.vertices.dtype, np.floating):
+            self.vertices = self.vertices.astype(float)
+        self.faces = None if faces is None else np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+        self.normals = None if normals is None else np.asarray(normals).reshape(-1, 3)
+        if self.faces is None and self.vertices.shape[0] % 3 != 0:
+            raise Exception('The number of vertices must be a multiple of 3 if faces are not provided')
+
+    @staticmethod
+    def fromTriangles(triangles) -> 'Mesh':
+        """Creates a mesh from a list of vertices grouped by triangles, as provided to :func:`~robodk.robolink.Robolink.AddShape`.
+
+        :param triangles: Nx3 or Nx6 array (xyz or xyzijk vertices) or 3xN or 6xN :class:`~robodk.robomath.Mat`
+        """
+        if isinstance(triangles, robomath.Mat):
+            triangles = np.asarray(triangles.rows, dtype=float).T
+        triangles = np.asarray(triangles)
+        if triangles.ndim != 2 or triangles.shape[1] not in (3, 6):
+            raise Exception('Triangles must be provided as Nx3 or Nx6 arrays')
+        return Mesh(triangles[:, :3], normals=triangles[:, 3:] if triangles.shape[1] == 6 else None)
+
+    def __len__(self) -> int:
+        """Returns the number of triangles"""
+        return self.vertices.shape[0] // 3 if self.faces is None else self.faces.shape[0]
+
+    def __repr__(self):
+        return 'Mesh(%i vertices, %i triangles)' % (self.vertices.shape[0], len(self))
+
+    def _faces(self) -> np.ndarray:
+        """Returns the vertex indexes of each triangle (Tx3 array)"""
+        if self.faces is None:
+            return np.arange(self.vertices.shape[0]).reshape(-1, 3)
+        return self.faces
+
+    def _corners(self, values: np.ndarray) -> np.ndarray:
+        """Returns the per-vertex values of the 3 corners of each triangle (Tx3x3 array)"""
+        if self.faces is None:
+            return values.reshape(-1, 3, 3)
+        return values[self.faces]
+
+    def triangles(self, normals: bool = False) -> np.ndarray:
+        """Returns the vertices grouped by triangles, one row per vertex. The result can be provided to :func:`~robodk.robolink.Robolink.AddShape`.
+
+        :param normals: set to True to add the vertex normals (Nx6 array). Face normals are used if the mesh has no vertex normals.
+        :type normals: bool
+        :return: Nx3 or Nx6 array, N is 3 times the number of triangles
+        """
+        xyz = self.vertices if self.faces is None else self.vertices[self.faces].reshape(-1, 3)
+        if not normals:
+            return xyz
+
+        if self.normals is not None:
+            ijk = self.normals if self.faces is None else self.normals[self.faces].reshape(-1, 3)
+        else:
+            ijk = np.repeat(self.faceNormals(), 3, axis=0)
+        return np.hstack([xyz, ijk.astype(xyz.dtype, copy=False)])
+
+    def _faceCross(self) -> np.ndarray:
+        """Returns the cross product of the edges of each triangle (the norm is twice the area of the triangle)"""
+        corners = self._corners(self.vertices)
+        return np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+
+    def faceAreas(self) -> np.ndarray:
+        """Returns the area of each triangle"""
+        return 0.5 * np.linalg.norm(self._faceCross(), axis=1)
+
+    def faceNormals(self) -> np.ndarray:
+        """Returns the unit normal of each triangle (Tx3 array). The normal of degenerated triangles is null.
+        Normals follow the right hand rule with the order of the vertices."""
+        return _unitRows(self._faceCross())
+
+    def vertexNormals(self) -> np.ndarray:
+        """Returns the unit normal of each vertex (Vx3 array), as the average of the normals of the triangles that share the vertex, weighted by the area of the triangles"""
+        cross = self._faceCross()
+        faces = self._faces().ravel()
+        normals = np.empty((self.vertices.shape[0], 3))
+        for k in range(3):
+            normals[:, k] = np.bincount(faces, weights=np.repeat(cross[:, k], 3), minlength=self.vertices.shape[0])
+        return _unitRows(normals)
+
+    def bounds(self) -> np.ndarray:
+        """Returns the bounding box of the mesh as a 2x3 array: [[xmin, ymin, zmin], [xmax, ymax, zmax]]"""
+        if self.vertices.shape[0] == 0:
+            return np.zeros((2, 3))
+        return np.array([self.vertices.min(axis=0), self.vertices.max(axis=0)], dtype=float)
+
+    def weld(self, tolerance: float = 0, remove_degenerated: bool = True) -> 'Mesh':
+        """Returns a mesh where the vertices closer than a tolerance are merged (shared by the triangles that use them).
+
+        :param tolerance: vertices are merged if they fall in the same cell of a grid of this size (in mm). If 0, only identical vertices are merged.
+        :type tolerance: float
+        :param remove_degenerated: set to True to remove the triangles that have merged vertices
+        :type remove_degenerated: bool
+        """
+        if tolerance > 0:
+            index, inverse = _uniqueRows(np.floor(self.vertices / tolerance + 0.5).astype(np.int64))
+        else:
+            index, inverse = _uniqueRows(self.vertices + 0.0)  # + 0.0 merges -0.0 and 0.0
+        faces = inverse[self._faces()]
+        if remove_degenerated:
+            faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])]
+        return Mesh(self.vertices[index], faces, None if self.normals is None else self.normals[index])
+
+    def decimate(self, tolerance: float = 0, max_triangles: int = None) -> 'Mesh':
+        """Returns a simplified mesh, using vertex clustering: the vertices that fall in the same cell of a grid are replaced by their average and the triangles that collapse are removed.
+        Simplified meshes are useful for collision checking, where the geometry does not need to be accurate.
+
+        :param tolerance: size of the cells of the grid (in mm)
+        :type tolerance: float
+        :param max_triangles: maximum number of triangles. The size of the cells is increased (starting from the tolerance) until the mesh has max_triangles or less.
+        :type max_triangles: int
+        """
+        if max_triangles is None:
+            return self._cluster(tolerance) if tolerance > 0 else self
+        if len(self) <= max_triangles:
+            return self
+
+        # Bisection of the cell size: the number of triangles decreases with the size of the cells
+        bounds = self.bounds()
+        high = max(float(np.linalg.norm(bounds[1] - bounds[0])), tolerance, 1e-9)
+        mesh = self._cluster(high)
+        low = tolerance if tolerance > 0 else high * 1e-6
+        if tolerance > 0:
+            candidate = self._cluster(tolerance)
+            if len(candidate) <= max_triangles:
+                return candidate
+        for i in range(24):
+            size = (low * high)**0.5
+            candidate = self._cluster(size)
+            if len(candidate) <= max_triangles:
+                high = size
+                mesh = candidate
+            else:
+                low = size
+            if high < low * 1.02:
+                break
+        return mesh
+
+    def _cluster(self, size: float) -> 'Mesh':
+        """Returns the mesh simplified by vertex clustering with a given cell size (see :func:`decimate`)"""
+        index, inverse = _uniqueRows(np.floor(self.vertices / size).astype(np.int64))
+        nclusters = index.shape[0]
+        count = np.bincount(inverse, minlength=nclusters)[:, None]
+        vertices = np.column_stack([np.bincount(inverse, weights=self.vertices[:, k], minlength=nclusters) for k in range(3)]) / count
+        normals = None
+        if self.normals is not None:
+            normals = _unitRows(np.column_stack([np.bincount(inverse, weights=self.normals[:, k], minlength=nclusters) for k in range(3)]))
+
+        # Remove collapsed and duplicated triangles, then the vertices that are not used
+        faces = inverse[self._faces()]
+        faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])]
+        index, inverse = _uniqueRows(np.sort(faces, axis=1))
+        faces = faces[np.sort(index)]
+        used, faces = np.unique(faces, return_inverse=True)
+        faces = faces.reshape(-1, 3)
+        vertices = vertices[used].astype(self.vertices.dtype)
+        return Mesh(vertices, faces, None if normals is None else normals[used].astype(self.normals.dtype))
+
+    def transform(self, pose: robomath.Mat) -> 'Mesh':
+        """Returns the mesh with the vertices moved by a pose (the mesh is defined with respect to the pose reference)
+
+        :param pose: pose as a :class:`~robodk.robomath.Mat` or 4x4 NumPy array
+        :type pose: :class:`~robodk.robomath.Mat`
+        """
+        pose = np.asarray(pose if isinstance(pose, np.ndarray) else pose.rows, dtype=float)
+        rot = pose[:3, :3].T
+        vertices = self.vertices @ rot.astype(self.vertices.dtype) + pose[:3, 3].astype(self.vertices.dtype)
+        normals = None if self.normals is None else self.normals @ rot.astype(self.normals.dtype)
+        return Mesh(vertices, self.faces, normals)
+
+
+def _unitRows(values: np.ndarray) -> np.ndarray:
+    """Normalizes the rows of a Nx3 array (null rows are not modified)"""
+    norm = np.linalg.norm(values, axis=1, keepdims=True)
+    return np.divide(values, norm, out=np.zeros_like(values), where=norm > 0)
+
+
+def downsamplePoints(points, voxel_size: float) -> np.ndarray:
+    """Downsamples a point cloud with a voxel grid: the points that fall in the same voxel are replaced by their average. Normals (ijk) are averaged too.
+    The result can be provided to :func:`~robodk.robolink.Robolink.AddPoints`.
+
+    :param points: Nx3 or Nx6 array (xyz or xyzijk points) or 3xN or 6xN :class:`~robodk.robomath.Mat`
+    :param voxel_size: size of the voxels (in mm)
+    :type voxel_size: float
+    :return: Mx3 or Mx6 array, with one point per voxel
+    """
+    if isinstance(points, robomath.Mat):
+        points = np.asarray(points.rows, dtype=float).T
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] not in (3, 6):
+        raise Exception('Points must be provided as Nx3 or Nx6 arrays')
+    if points.shape[0] == 0:
+        return points
+
+    index, inverse = _uniqueRows(np.floor(points[:, :3] / voxel_size).astype(np.int64))
+    nvoxels = index.shape[0]
+    result = np.column_stack([np.bincount(inverse, weights=points[:, k], minlength=nvoxels) for k in range(points.shape[1])])
+    result[:, :3] /= np.bincount(inverse, minlength=nvoxels)[:, None]
+    if points.shape[1] == 6:
+        result[:, 3:] = _unitRows(result[:, 3:])
+    return result
+
+
+def _uniqueRows(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the index of the first occurrence of each unique row of a Vx3 array and the index of the unique row of each row.
+    Integer rows are packed in a single integer when possible, which is much faster to sort."""
+    if keys.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    if np.issubdtype(keys.dtype, np.integer):
+        keys = keys - keys.min(axis=0)
+        extent = keys.max(axis=0) + 1
+        if float(extent[0]) * float(extent[1]) * float(extent[2]) < 2.0**62:
+            unique, index, inverse = np.unique((keys[:, 0] * extent[1] + keys[:, 1]) * extent[2] + keys[:, 2], return_index=True, return_inverse=True)
+            return index, inverse.ravel()
+
+    keys = np.ascontiguousarray(keys)
+    unique, index, inverse = np.unique(keys.view(np.dtype((np.void, keys.dtype.itemsize * 3))).ravel(), return_index=True, return_inverse=True)
+    return index, inverse.ravel()
+
+
+def _fanTriangles(polygons: List[List[int]]) -> np.ndarray:
+    """Splits polygons (lists of vertex indexes) in triangles sharing the first vertex of each polygon (Tx3 array)"""
+    faces = [(poly[0], poly[i], poly[i + 1]) for poly in polygons for i in range(1, len(poly) - 1)]
+    return np.array(faces, dtype=np.int64).reshape(-1, 3)
+
+
+def readSTL(filepath: str) -> Mesh:
+    """Reads an STL file (binary or ASCII). Binary files are memory-mapped. Vertices are grouped by triangles (faces are not shared, see :func:`Mesh.weld`).
+
+    :param filepath: path of the STL file
+    :type filepath: str
+    """
+    size = os.path.getsize(filepath)
+    if size >= 84:
+        with open(filepath, 'rb') as fid:
+            fid.seek(80)
+            ntriangles = int(np.frombuffer(fid.read(4), dtype='<u4')[0])
+        if size == 84 + ntriangles * _STL_TRIANGLE.itemsize:
+            if ntriangles == 0:
+                return Mesh(np.zeros((0, 3), dtype=np.float32))
+            records = np.memmap(filepath, dtype=_STL_TRIANGLE, mode='r', offset=84, shape=(ntriangles,))
+            return Mesh(np.array(records['vertices']).reshape(-1, 3))
+
+    # ASCII STL
+    with open(filepath, 'rb') as fid:
+        data = fid.read()
+    if not data.lstrip().startswith(b'solid'):
+        raise Exception('Invalid STL file: ' + filepath)
+    values = re.findall(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)', data)
+    return Mesh(np.array(values, dtype=bytes).astype(float).reshape(-1, 3))
+
+
+def _readPlyHeader(fid) -> Tuple[str, list]:
+    """Reads the header of a PLY file. Returns the format and the list of elements as (name, count, properties).
+    Each property is (name, type) or (name, count type, index type) for list properties."""
+    if fid.readline().strip() != b'ply':
+        raise Exception('Invalid PLY file')
+
+    ply_format = None
+    elements = []
+    while True:
+        line = fid.readline()
+        if not line:
+            raise Exception('Invalid PLY file: end_header not found')
+        words = line.decode('ascii', 'replace').split()
+        if not words or words[0] in ('comment', 'obj_info'):
+            continue
+        if words[0] == 'end_header':
+            return ply_format, elements
+        if words[0] == 'format':
+            ply_format = words[1]
+        elif words[0] == 'element':
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == 'property':
+            if words[1] == 'list':
+                elements[-1][2].append((words[4], _PLY_TYPES[words[2]], _PLY_TYPES[words[3]]))
+            else:
+                elements[-1][2].append((words[2], _PLY_TYPES[words[1]]))
+
+
+def _plyFaces(data, offset: int, count: int, prop: tuple, byteorder: str) -> Tuple[np.ndarray, int]:
+    """Decodes the faces of a binary PLY file. Returns the faces (Tx3 array) and the offset after the faces.
+    Faces are decoded in one step if all faces are triangles. Other polygons are split in triangles."""
+    name, count_type, index_type = prop
+    count_dtype = np.dtype(byteorder + count_type)
+    index_dtype = np.dtype(byteorder + index_type)
+    triangle = np.dtype([('n', count_dtype), ('v', index_dtype, (3,))])
+    if count == 0:
+        return np.zeros((0, 3), dtype=np.int64), offset
+
+    if offset + count * triangle.itemsize <= len(data):
+        records = np.frombuffer(data, dtype=triangle, count=count, offset=offset)
+        if np.all(records['n'] == 3):
+            return records['v'].astype(np.int64), offset + count * triangle.itemsize
+
+    # Polygons with a different number of vertices
+    polygons = []
+    for i in range(count):
+        nvertices = int(np.frombuffer(data, dtype=count_dtype, count=1, offset=offset)[0])
+        offset += count_dtype.itemsize
+        polygons.append(np.frombuffer(data, dtype=index_dtype, count=nvertices, offset=offset).tolist())
+        offset += nvertices * index_dtype.itemsize
+    return _fanTriangles(polygons), offset
+
+
+def readPLY(filepath: str) -> Mesh:
+    """Reads a PLY file (binary or ASCII). Binary files are memory-mapped. Vertex normals (nx, ny, nz) are read if they are available.
+    Polygons are split in triangles.
+
+    :param filepath: path of the PLY file
+    :type filepath: str
+    """
+    with open(filepath, 'rb') as fid:
+        ply_format, elements = _readPlyHeader(fid)
+        offset = fid.tell()
+
+    vertices = None
+    normals = None
+    faces = None
+    if ply_format == 'ascii':
+        with open(filepath, 'rb') as fid:
+            fid.seek(offset)
+            lines = fid.read().split(b'\n')
+        line_id = 0
+        for name, count, props in elements:
+            rows = [line.split() for line in lines[line_id:line_id + count]]
+            line_id += count
+            if name == 'vertex':
+                names = [prop[0] for prop in props]
+                values = np.array([row[:len(names)] for row in rows], dtype=bytes).astype(float).reshape(count, len(names))
+                vertices = values[:, [names.index(axis) for axis in 'xyz']]
+                if all(axis in names for axis in ('nx', 'ny', 'nz')):
+                    normals = values[:, [names.index(axis) for axis in ('nx', 'ny', 'nz')]]
+            elif name == 'face':
+                if all(len(row) == 4 and row[0] == b'3' for row in rows):
+                    faces = np.array(rows, dtype=bytes).astype(np.int64)[:, 1:].reshape(-1, 3)
+                else:
+                    faces = _fanTriangles([[int(v) for v in row[1:1 + int(row[0])]] for row in rows])
+
+    elif ply_format in ('binary_little_endian', 'binary_big_endian'):
+        byteorder = '<' if ply_format == 'binary_little_endian' else '>'
+        data = np.memmap(filepath, dtype=np.uint8, mode='r')
+        for name, count, props in elements:
+            lists = [prop for prop in props if len(prop) == 3]
+            if name == 'face' and len(props) == 1 and lists:
+                faces, offset = _plyFaces(data, offset, count, props[0], byteorder)
+                continue
+            if lists:
+                if vertices is not None and faces is not None:
+                    break  # elements after the geometry are not used
+                raise Exception('PLY elements with list properties are not supported: ' + name)
+
+            record = np.dtype([(prop[0], byteorder + prop[1]) for prop in props])
+            if name == 'vertex':
+                values = np.frombuffer(data, dtype=record, count=count, offset=offset)
+                vertices = np.column_stack([values[axis] for axis in 'xyz'])
+                if all(axis in record.names for axis in ('nx', 'ny', 'nz')):
+                    normals = np.column_stack([values[axis] for axis in ('nx', 'ny', 'nz')])
+            offset += count * record.itemsize
+
+    else:
+        raise Exception('Unsupported PLY format: ' + str(ply_format))
+
+    if vertices is None:
+        raise Exception('No vertices found in PLY file: ' + filepath)
+    if faces is None:
+        faces = np.zeros((0, 3), dtype=np.int64)
+    return Mesh(vertices, faces, normals)
+
+
+def readOBJ(filepath: str) -> Mesh:
+    """Reads the vertices and faces of a Wavefront OBJ file. Polygons are split in triangles. Texture coordinates and normals of the faces are ignored.
+
+    :param filepath: path of the OBJ file
+    :type filepath: str
+    """
+    with open(filepath, 'rb') as fid:
+        data = fid.read()
+
+    vertices = np.array(re.findall(rb'^v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)', data, re.MULTILINE), dtype=bytes).astype(float).reshape(-1, 3)
+    polygons = []
+    for line in re.findall(rb'^f[ \t]+(.+)$', data, re.MULTILINE):
+        indexes = [int(word.split(b'/')[0]) for word in line.split()]
+        # Indexes start at 1, negative indexes are relative to the last vertex
+        polygons.append([i - 1 if i > 0 else vertices.shape[0] + i for i in indexes])
+    return Mesh(vertices, _fanTriangles(polygons))
+
+
+def readMesh(filepath: str) -> Mesh:
+    """Reads a mesh file given its extension (STL, PLY or OBJ)
+
+    :param filepath: path of the mesh file
+    :type filepath: str
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    readers = {'.stl': readSTL, '.ply': readPLY, '.obj': readOBJ}
+    if ext not in readers:
+        raise Exception('Unsupported mesh file: ' + filepath)
+    return readers[ext](filepath)
+
+
+def writeSTL(filepath: str, mesh: Mesh):
+    """Writes a mesh to a binary STL file
+
+    :param filepath: path of the STL file
+    :type filepath: str
+    :param mesh: mesh to save
+    :type mesh: :class:`Mesh`
+    """
+    records = np.zeros(len(mesh), dtype=_STL_TRIANGLE)
+    records['normal'] = mesh.faceNormals()
+    records['vertices'] = mesh.triangles().reshape(-1, 3, 3)
+    with open(filepath, 'wb') as fid:
+        fid.write(b'RoboDK binary STL'.ljust(80, b' '))
+        fid.write(np.array([len(mesh)], dtype='<u4').tobytes())
+        records.tofile(fid)
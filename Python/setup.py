@@ -109,6 +109,8 @@ setup(
     extras_require={
         'apps': ['PySide2==5.15.*'],
         'cv': ['opencv-contrib-python', 'numpy'],
+        'kinematics': ['numpy'],
+        'mesh': ['numpy'],
         'lint': ['astroid'],
     },
 
@@ -0,0 +1,860 @@
+"""Minimal RoboDK API server used to test the Python API without running RoboDK.
+
+It implements the RoboDK API handshake and a small subset of commands over a simple station model.
+Start it with FakeRoboDK().start() and connect with Robolink(robodk_ip='127.0.0.1', port=server.port)
+"""
+import socket
+import struct
+import threading
+import time
+
+ITEM_TYPE_STATION = 1
+ITEM_TYPE_ROBOT = 2
+ITEM_TYPE_FRAME = 3
+ITEM_TYPE_OBJECT = 5
+ITEM_TYPE_TARGET = 6
+ITEM_TYPE_PROGRAM = 8
+
+# Commands that RoboDK does not acknowledge with a status in skipstatus mode
+SKIP_STATUS_COMMANDS = {'Copy2', 'RemoveStn', 'S_Selection', 'Remove', 'S_Parent', 'S_Parent_Static', 'S_Visible', 'S_Name', 'S_Hlocal', 'S_Hlocal_Abs', 'S_Target_As_RT', 'S_Target_As_JT', 'S_Thetas'}
+
+
+def eye_cols():
+    """Identity pose as 16 doubles (column major, same as the API wire format)"""
+    return [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def mul_cols(pose1, pose2):
+    """Product of two poses given as 16 doubles (column major)"""
+    return [sum(pose1[k * 4 + i] * pose2[j * 4 + k] for k in range(4)) for j in range(4) for i in range(4)]
+
+
+class FakeItem:
+
+    def __init__(self, ptr, name, itemtype, parent=None):
+        self.ptr = ptr
+        self.name = name
+        self.type = itemtype
+        self.parent = parent
+        self.pose = eye_cols()
+        self.visible = 1
+        self.joints = []
+        self.joint_limits = ([-180.0] * 6, [180.0] * 6)
+        self.pose_tool = eye_cols()
+        self.color = [0.5, 0.5, 0.5, 1.0]
+        self.instructions = []  # program instructions as tuples (command, values...)
+        self.instruction_names = {}  # instruction index -> name set with Prog_SIns
+        self.joint_target = False
+        self.points = []  # mesh points [x, y, z, i, j, k] returned by G_ObjPoint
+        self.curves = []  # curves as tuples (name, points)
+        self.shapes = []  # shapes added with AddShape or .rdkcadv files as tuples (n1, n2, values column major, color)
+        self.fk = None  # optional forward kinematics: joints -> 16 doubles (column major)
+        self.valid = True  # set to False to make G_Name and G_Hlocal_Abs fail for this item
+
+
+class _Conn:
+    """Blocking reader/writer for one client connection"""
+
+    def __init__(self, sock, server):
+        self.sock = sock
+        self.rfile = sock.makefile('rb')
+        self.server = server
+        self.out = []
+        self.skipstatus = False  # set by the CMD_START handshake
+        self.command = None  # command being processed
+        self.event_filter = None  # events reported to an event connection (None: all events)
+
+    def read(self, n):
+        data = self.rfile.read(n)
+        if len(data) < n:
+            raise EOFError()
+        return data
+
+    def rec_line(self):
+        line = self.rfile.readline()
+        if not line:
+            raise EOFError()
+        return line[:-1].decode('utf-8')
+
+    def rec_int(self):
+        return struct.unpack('>i', self.read(4))[0]
+
+    def rec_ptr(self):
+        return struct.unpack('>Q', self.read(8))[0]
+
+    def rec_pose(self):
+        return list(struct.unpack('>16d', self.read(128)))
+
+    def rec_array(self):
+        n = self.rec_int()
+        return list(struct.unpack('>%id' % n, self.read(8 * n))) if n > 0 else []
+
+    def rec_matrix(self):
+        n1 = self.rec_int()
+        n2 = self.rec_int()
+        return n1, n2, list(struct.unpack('>%id' % (n1 * n2), self.read(8 * n1 * n2))) if n1 * n2 > 0 else []
+
+    def send(self, data):
+        self.out.append(data)
+
+    def send_line(self, line):
+        self.send(line.encode('utf-8') + b'\n')
+
+    def send_int(self, value):
+        self.send(struct.pack('>i', value))
+
+    def send_item(self, item):
+        if item is None:
+            self.send(struct.pack('>Qi', 0, -1))
+        else:
+            self.send(struct.pack('>Qi', item.ptr, item.type))
+
+    def send_pose(self, pose):
+        self.send(struct.pack('>16d', *pose))
+
+    def send_array(self, values):
+        self.send_int(len(values))
+        if values:
+            self.send(struct.pack('>%id' % len(values), *values))
+
+    def send_matrix(self, n1, n2, values):
+        self.send_int(n1)
+        self.send_int(n2)
+        if values:
+            self.send(struct.pack('>%id' % len(values), *values))
+
+    def status(self, code=0, message=None):
+        if self.skipstatus and self.command in SKIP_STATUS_COMMANDS:
+            self.flush()
+            return
+        self.send_int(code)
+        if message is not None:
+            self.send_line(message)
+        self.flush()
+
+    def flush(self):
+        data = b''.join(self.out)
+        self.out = []
+        if self.server.trickle:
+            # Send one byte at a time to force short reads on the client side
+            for i in range(len(data)):
+                self.sock.sendall(data[i:i + 1])
+        else:
+            self.sock.sendall(data)
+
+
+class FakeRoboDK:
+    """Threaded fake RoboDK API server.
+
+    :param trickle: send replies one byte at a time (forces short reads in the client)
+    """
+
+    def __init__(self, trickle=False, delay=0):
+        self.trickle = trickle
+        self.delay = delay
+        self.commands = []  # log of received commands
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.items = {}
+        self._next_ptr = 1000
+        self.station = self.add_item('Station', ITEM_TYPE_STATION, None)
+        self.params = {}
+        self.event_conns = []  # connections listening to events (RDK_EVT or RDK_EVT_FILTER)
+        self.event_filter = None  # events requested by the last RDK_EVT_FILTER command (None after RDK_EVT: all events)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(16)
+        self.port = self.sock.getsockname()[1]
+        self._running = False
+
+    def add_item(self, name, itemtype, parent=None):
+        with self.lock:
+            self._next_ptr += 8
+            item = FakeItem(self._next_ptr, name, itemtype, parent)
+            self.items[item.ptr] = item
+            return item
+
+    def start(self):
+        self._running = True
+        t = threading.Thread(target=self._accept_loop)
+        t.daemon = True
+        t.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                client, addr = self.sock.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.connections += 1
+            t = threading.Thread(target=self._serve, args=(client,))
+            t.daemon = True
+            t.start()
+
+    def _serve(self, client):
+        conn = _Conn(client, self)
+        try:
+            while True:
+                cmd = conn.rec_line()
+                with self.lock:
+                    self.commands.append(cmd)
+                conn.command = cmd
+                if self.delay:
+                    time.sleep(self.delay)
+                handler = getattr(self, 'cmd_' + cmd, None)
+                if handler is None:
+                    conn.status(3, 'Unknown command: ' + cmd)
+                    continue
+                handler(conn)
+        except (EOFError, OSError):
+            pass
+        finally:
+            client.close()
+
+    def send_event(self, event, item=None, line=None, data=b''):
+        """Sends an event to the connections listening to events, followed by the event data (a line or raw bytes)"""
+        for conn in list(self.event_conns):
+            if conn.event_filter is not None and event not in conn.event_filter:
+                continue
+            conn.send_int(event)
+            conn.send_item(item)
+            if line is not None:
+                conn.send_line(line)
+            conn.send(data)
+            try:
+                conn.flush()
+            except OSError:
+                self.event_conns.remove(conn)
+
+    def _item(self, conn):
+        return self.items.get(conn.rec_ptr())
+
+    # ------------------------------------------------------------------
+    # Supported commands
+    def cmd_RDK_API(self, conn):
+        conn.rec_array()
+        conn.send_line('RDK_API')
+        conn.send_int(1)
+        conn.send_int(30000)
+        conn.status()
+
+    def cmd_CMD_START(self, conn):
+        # Legacy handshake used in skipstatus mode: "SAFE_MODE AUTO_UPDATE [SKIPSTATUS]", no reply if skipstatus is set
+        flags = conn.rec_line().split()
+        conn.skipstatus = len(flags) > 2 and flags[2] == '1'
+        if not conn.skipstatus:
+            conn.send_line('READY')
+            conn.flush()
+
+    def cmd_S_Color(self, conn):
+        item = self._item(conn)
+        item.color = conn.rec_array()
+        conn.status()
+
+    def cmd_RDK_EVT(self, conn):
+        conn.rec_int()
+        self.event_filter = None
+        self._start_events(conn)
+
+    def cmd_RDK_EVT_FILTER(self, conn):
+        self.event_filter = conn.event_filter = [conn.rec_int() for i in range(conn.rec_int())]
+        conn.rec_int()
+        self._start_events(conn)
+
+    def _start_events(self, conn):
+        conn.send_line('RDK_EVT')
+        conn.send_int(1)
+        # Events sent once the client receives the reply must be reported
+        self.event_conns.append(conn)
+        conn.status()
+
+    def cmd_G_Item(self, conn):
+        name = conn.rec_line()
+        found = [i for i in self.items.values() if i.name == name]
+        conn.send_item(found[0] if found else None)
+        conn.status()
+
+    def cmd_G_Item2(self, conn):
+        name = conn.rec_line()
+        itemtype = conn.rec_int()
+        found = [i for i in self.items.values() if (i.name == name or not name) and i.type == itemtype]
+        conn.send_item(found[0] if found else None)
+        conn.status()
+
+    def cmd_G_List_Items_ptr(self, conn):
+        items = [i for i in self.items.values() if i.type != ITEM_TYPE_STATION]
+        conn.send_int(len(items))
+        for i in items:
+            conn.send_item(i)
+        conn.status()
+
+    def cmd_G_List_Items(self, conn):
+        items = [i for i in self.items.values() if i.type != ITEM_TYPE_STATION]
+        conn.send_int(len(items))
+        for i in items:
+            conn.send_line(i.name)
+        conn.status()
+
+    def cmd_G_List_Items_Type_ptr(self, conn):
+        itemtype = conn.rec_int()
+        items = [i for i in self.items.values() if i.type == itemtype]
+        conn.send_int(len(items))
+        for i in items:
+            conn.send_item(i)
+        conn.status()
+
+    def cmd_G_Item_Type(self, conn):
+        item = self._item(conn)
+        conn.send_int(item.type if item else -1)
+        conn.status()
+
+    def cmd_G_Name(self, conn):
+        item = self._item(conn)
+        if not item.valid:
+            conn.send_line('')
+            conn.status(3, 'Invalid item')
+            return
+        conn.send_line(item.name)
+        conn.status()
+
+    def cmd_S_Name(self, conn):
+        item = self._item(conn)
+        item.name = conn.rec_line()
+        conn.status()
+
+    def cmd_G_Parent(self, conn):
+        item = self._item(conn)
+        conn.send_item(item.parent)
+        conn.status()
+
+    def cmd_G_Childs(self, conn):
+        item = self._item(conn)
+        childs = [i for i in self.items.values() if i.parent is item]
+        conn.send_int(len(childs))
+        for i in childs:
+            conn.send_item(i)
+        conn.status()
+
+    def cmd_S_Parent(self, conn):
+        item = self._item(conn)
+        item.parent = self._item(conn)
+        conn.status()
+
+    def cmd_G_Tool(self, conn):
+        item = self._item(conn)
+        conn.send_pose(item.pose_tool)
+        conn.status()
+
+    def cmd_G_Visible(self, conn):
+        item = self._item(conn)
+        conn.send_int(item.visible)
+        conn.status()
+
+    def cmd_G_Color(self, conn):
+        item = self._item(conn)
+        conn.send_array(item.color)
+        conn.status()
+
+    def cmd_S_Visible(self, conn):
+        item = self._item(conn)
+        item.visible = conn.rec_int()
+        conn.rec_int()
+        conn.status()
+
+    def cmd_G_Hlocal(self, conn):
+        item = self._item(conn)
+        conn.send_pose(item.pose)
+        conn.status()
+
+    def cmd_G_Hlocal_Abs(self, conn):
+        item = self._item(conn)
+        if not item.valid:
+            conn.send_pose(eye_cols())
+            conn.status(3, 'Invalid item')
+            return
+        pose = eye_cols()
+        while item is not None and item.type != ITEM_TYPE_STATION:
+            pose = mul_cols(item.pose, pose)
+            item = item.parent
+        conn.send_pose(pose)
+        conn.status()
+
+    def cmd_S_Hlocal(self, conn):
+        item = self._item(conn)
+        pose = conn.rec_pose()
+        if item is None:
+            conn.status(1)
+            return
+        item.pose = pose
+        conn.status()
+
+    def cmd_S_Hlocals(self, conn):
+        for i in range(conn.rec_int()):
+            item = self._item(conn)
+            item.pose = conn.rec_pose()
+        conn.status()
+
+    def cmd_G_Thetas(self, conn):
+        item = self._item(conn)
+        conn.send_array(item.joints)
+        conn.status()
+
+    def cmd_G_ThetasList(self, conn):
+        for i in range(conn.rec_int()):
+            item = self._item(conn)
+            conn.send_array(item.joints)
+        conn.status()
+
+    def cmd_S_Thetas(self, conn):
+        joints = conn.rec_array()
+        item = self._item(conn)
+        item.joints = joints
+        conn.status()
+
+    def cmd_G_LinkType(self, conn):
+        item = self._item(conn)
+        itemtype = conn.rec_int()
+        conn.send_item(item if item is not None and item.type == itemtype else None)
+        conn.status()
+
+    def cmd_G_FK(self, conn):
+        joints = conn.rec_array()
+        item = self._item(conn)
+        if item.fk is not None:
+            conn.send_pose(item.fk(joints))
+        else:
+            conn.send_pose(eye_cols()[:12] + joints[:3] + [1.0])
+        conn.status()
+
+    # Programs
+    def cmd_Add_PROG(self, conn):
+        name = conn.rec_line()
+        self._item(conn)
+        conn.send_item(self.add_item(name, ITEM_TYPE_PROGRAM, self.station))
+        conn.status()
+
+    def cmd_Prog_Nins(self, conn):
+        item = self._item(conn)
+        conn.send_int(len(item.instructions))
+        conn.status()
+
+    def cmd_Prog_GIns(self, conn):
+        program = self._item(conn)
+        ins_id = conn.rec_int()
+        if ins_id >= len(program.instructions):
+            conn.send_line('')
+            conn.send_int(-1)
+            conn.status(3, 'Invalid instruction id')
+            return
+        ins = program.instructions[ins_id]
+        if ins[0] == 'MoveX':
+            movetype, target_type, values = ins[1:]
+            conn.send_line(program.instruction_names.get(ins_id, 'MoveJ' if movetype == 1 else 'MoveL'))
+            conn.send_int(0)  # INS_TYPE_MOVE
+            conn.send_int(movetype)
+            conn.send_int(1 if target_type == 1 else 0)
+            conn.send_pose(values if target_type == 2 else eye_cols())
+            conn.send_array(values if target_type == 1 else [])
+        else:
+            conn.send_line(program.instruction_names.get(ins_id, ins[0]))
+            conn.send_int(ins[2] if ins[0] == 'Prog_SIns' else 8)  # INS_TYPE_CODE
+        conn.status()
+
+    def cmd_Prog_SIns(self, conn):
+        program = self._item(conn)
+        ins_id = conn.rec_int()
+        name = conn.rec_line()
+        instype = conn.rec_int()
+        if instype == 0:
+            movetype = conn.rec_int()
+            isjointtarget = conn.rec_int()
+            pose = conn.rec_pose()
+            joints = conn.rec_array()
+            ins = ('MoveX', movetype, 1 if isjointtarget else 2, joints if isjointtarget else pose)
+        else:
+            ins = ('Prog_SIns', name, instype)
+        if ins_id >= len(program.instructions):
+            conn.status(3, 'Invalid instruction id')
+            return
+        program.instructions[ins_id] = ins
+        program.instruction_names[ins_id] = name
+        conn.status()
+
+    def cmd_Add_TARGET(self, conn):
+        name = conn.rec_line()
+        parent = self._item(conn)
+        self._item(conn)
+        conn.send_item(self.add_item(name, ITEM_TYPE_TARGET, parent or self.station))
+        conn.status()
+
+    def cmd_S_Target_As_JT(self, conn):
+        self._item(conn).joint_target = True
+        conn.status()
+
+    def cmd_S_Target_As_RT(self, conn):
+        self._item(conn).joint_target = False
+        conn.status()
+
+    def cmd_Add_INSMOVE(self, conn):
+        target = self._item(conn)
+        program = self._item(conn)
+        program.instructions.append(('Add_INSMOVE', target, conn.rec_int()))
+        conn.status()
+
+    def cmd_Add_INSMOVEC(self, conn):
+        target1 = self._item(conn)
+        target2 = self._item(conn)
+        program = self._item(conn)
+        program.instructions.append(('Add_INSMOVEC', target1, target2))
+        conn.status()
+
+    def cmd_S_Speed4(self, conn):
+        program = self._item(conn)
+        program.instructions.append(('S_Speed4', conn.rec_array()))
+        conn.status()
+
+    def cmd_S_ZoneData(self, conn):
+        value = conn.rec_int()
+        self._item(conn).instructions.append(('S_ZoneData', value))
+        conn.status()
+
+    def cmd_S_Tool(self, conn):
+        pose = conn.rec_pose()
+        self._item(conn).instructions.append(('S_Tool', pose))
+        conn.status()
+
+    def cmd_S_Tool_ptr(self, conn):
+        tool = self._item(conn)
+        self._item(conn).instructions.append(('S_Tool_ptr', tool))
+        conn.status()
+
+    def cmd_S_Frame(self, conn):
+        pose = conn.rec_pose()
+        self._item(conn).instructions.append(('S_Frame', pose))
+        conn.status()
+
+    def cmd_S_Link_ptr(self, conn):
+        frame = self._item(conn)
+        self._item(conn).instructions.append(('S_Link_ptr', frame))
+        conn.status()
+
+    def cmd_setDO(self, conn):
+        program = self._item(conn)
+        io_var, io_value = conn.rec_line(), conn.rec_line()
+        if not io_var:
+            conn.status(3, 'Invalid IO')
+            return
+        program.instructions.append(('setDO', io_var, io_value))
+        conn.status()
+
+    def cmd_setAO(self, conn):
+        program = self._item(conn)
+        program.instructions.append(('setAO', conn.rec_line(), conn.rec_line()))
+        conn.status()
+
+    def cmd_RunPause(self, conn):
+        program = self._item(conn)
+        program.instructions.append(('RunPause', conn.rec_int()))
+        conn.status()
+
+    def cmd_RunCode2(self, conn):
+        program = self._item(conn)
+        program.instructions.append(('RunCode2', conn.rec_line(), conn.rec_int()))
+        conn.send_int(0)
+        conn.status()
+
+    def cmd_WaitMove(self, conn):
+        self._item(conn)
+        conn.status()
+        conn.status()
+
+    def _move(self, conn, blocking):
+        movetype = conn.rec_int()
+        target_type = conn.rec_int()
+        values = conn.rec_array()
+        conn.rec_ptr()  # target item
+        robot = self._item(conn)
+        if robot.type == ITEM_TYPE_PROGRAM:
+            robot.instructions.append(('MoveX', movetype, target_type, values))
+        elif target_type == 1:
+            robot.joints = values
+        conn.status()
+        if blocking:
+            conn.status()
+
+    def cmd_MoveX(self, conn):
+        self._move(conn, False)
+
+    def cmd_MoveXb(self, conn):
+        self._move(conn, True)
+
+    def cmd_G_IK(self, conn):
+        # Fake kinematics: the joints are the XYZ translation followed by zeros
+        pose = conn.rec_pose()
+        self._item(conn)
+        conn.send_array(pose[12:15] + [0.0, 0.0, 0.0])
+        conn.status()
+
+    def cmd_G_IK_jnts(self, conn):
+        pose = conn.rec_pose()
+        conn.rec_array()
+        self._item(conn)
+        conn.send_array(pose[12:15] + [0.0, 0.0, 0.0])
+        conn.status()
+
+    # Batch kinematics: one exchange per item, in lockstep with the client
+    def cmd_G_LFK(self, conn):
+        # Fake kinematics: the translation is given by the first 3 joints
+        for i in range(conn.rec_int()):
+            joints = conn.rec_array()
+            item = self._item(conn)
+            if item.fk is not None:
+                conn.send_pose(item.fk(joints))
+            else:
+                conn.send_pose(eye_cols()[:12] + joints[:3] + [1.0])
+            # Valid solutions may be reported with any positive status
+            if not all(abs(j) <= 1000 for j in joints):
+                conn.send_int(0)
+            else:
+                conn.send_int(2 if joints[1] > 500 else 1)
+            conn.flush()
+        conn.status()
+
+    def cmd_G_RobLimits(self, conn):
+        item = self._item(conn)
+        conn.send_array(item.joint_limits[0])
+        conn.send_array(item.joint_limits[1])
+        conn.send_int(0)
+        conn.status()
+
+    def _fake_ik(self, pose):
+        # Poses with a negative X are not reachable
+        return pose[12:15] + [0.0, 0.0, 0.0] if pose[12] >= 0 else []
+
+    def cmd_G_LIK(self, conn):
+        for i in range(conn.rec_int()):
+            pose = conn.rec_pose()
+            self._item(conn)
+            conn.send_array(self._fake_ik(pose))
+            conn.flush()
+        conn.status()
+
+    def cmd_G_LIK_jnts(self, conn):
+        for i in range(conn.rec_int()):
+            pose = conn.rec_pose()
+            joints_approx = conn.rec_array()
+            self._item(conn)
+            joints = self._fake_ik(pose)
+            if joints:
+                joints[3:] = joints_approx[3:6]
+            conn.send_array(joints)
+            conn.flush()
+        conn.status()
+
+    def cmd_G_LIK_cmpl(self, conn):
+        for i in range(conn.rec_int()):
+            pose = conn.rec_pose()
+            self._item(conn)
+            joints = self._fake_ik(pose)
+            if joints:
+                # Two solutions, one per column
+                conn.send_matrix(6, 2, joints + [-j for j in joints])
+            else:
+                conn.send_matrix(0, 0, [])
+            conn.flush()
+        conn.status()
+
+    def cmd_G_LThetas_Config(self, conn):
+        for i in range(conn.rec_int()):
+            joints = conn.rec_array()
+            self._item(conn)
+            conn.send_array([float(j < 0) for j in joints[:3]] + [0.0])
+            conn.flush()
+        conn.status()
+
+    def cmd_G_ProgJointList(self, conn):
+        self._item(conn)
+        conn.rec_array()
+        path = conn.rec_line()
+        npoints = 100
+        if not path:
+            conn.send_matrix(10, npoints, [float(i) for i in range(10 * npoints)])
+        conn.send_int(npoints)
+        conn.send_line('Success')
+        conn.status()
+
+    def cmd_G_Params(self, conn):
+        conn.send_int(len(self.params))
+        for k, v in self.params.items():
+            conn.send_line(k)
+            conn.send_line(v)
+        conn.status()
+
+    def cmd_S_Param(self, conn):
+        key = conn.rec_line()
+        self.params[key] = conn.rec_line()
+        conn.status()
+
+    def cmd_G_Param(self, conn):
+        key = conn.rec_line()
+        conn.send_line(self.params.get(key, 'UNKNOWN ' + key))
+        conn.status()
+
+    def cmd_G_DataParam(self, conn):
+        key = conn.rec_line()
+        data = self.params.get(key, '').encode('utf-8')
+        conn.send(struct.pack('>I', len(data)))
+        conn.send(data)
+        conn.status()
+
+    def cmd_G_Gen_Mat(self, conn):
+        # Echo the matrix back (used to test large matrix transfers)
+        conn.rec_ptr()
+        conn.rec_line()
+        n1, n2, values = conn.rec_matrix()
+        conn.send_int(1)
+        conn.send_matrix(n1, n2, values)
+        conn.status()
+
+    def cmd_ProjectPoints(self, conn):
+        # Project the points on the plane Z=0. Points with a negative X can't be projected (null points).
+        n1, n2, values = conn.rec_matrix()
+        self._item(conn)
+        conn.rec_int()
+        for j in range(n2):
+            values[j * n1 + 2] = 0.0
+            if values[j * n1] < 0:
+                values[j * n1:(j + 1) * n1] = [0.0] * n1
+        conn.send_matrix(n1, n2, values)
+        conn.status()
+
+    # Geometry
+    def _add_shapes(self, parent, override, shapes):
+        if parent is None or parent.type != ITEM_TYPE_OBJECT:
+            parent = self.add_item('Object', ITEM_TYPE_OBJECT, self.station)
+        if override:
+            parent.shapes = []
+        parent.shapes.extend(shapes)
+        return parent
+
+    def cmd_AddShape2(self, conn):
+        n1, n2, values = conn.rec_matrix()
+        parent = self._item(conn)
+        override = conn.rec_int()
+        conn.send_item(self._add_shapes(parent, override, [(n1, n2, values, [])]))
+        conn.status()
+
+    def cmd_AddShape4(self, conn):
+        parent = self._item(conn)
+        override = conn.rec_int()
+        shapes = []
+        for i in range(conn.rec_int()):
+            n1, n2, values = conn.rec_matrix()
+            shapes.append((n1, n2, values, conn.rec_array()))
+        conn.send_item(self._add_shapes(parent, override, shapes))
+        conn.status()
+
+    def cmd_AddShape5(self, conn):
+        # Same as AddShape4 with floats
+        parent = self._item(conn)
+        override = conn.rec_int()
+        shapes = []
+        for i in range(conn.rec_int()):
+            n1 = conn.rec_int()
+            n2 = conn.rec_int()
+            values = list(struct.unpack('>%if' % (n1 * n2), conn.read(4 * n1 * n2)))
+            ncolor = conn.rec_int()
+            shapes.append((n1, n2, values, list(struct.unpack('>%if' % ncolor, conn.read(4 * ncolor)))))
+        conn.send_item(self._add_shapes(parent, override, shapes))
+        conn.status()
+
+    def cmd_AddPoints(self, conn):
+        n1, n2, values = conn.rec_matrix()
+        parent = self._item(conn)
+        conn.rec_int()
+        conn.rec_int()
+        conn.send_item(self._add_shapes(parent, False, [(n1, n2, values, [])]))
+        conn.status()
+
+    def cmd_Add(self, conn):
+        filename = conn.rec_line()
+        self._item(conn)
+        shapes = []
+        if filename.endswith('.rdkcadv'):
+            with open(filename, 'rb') as fid:
+                data = fid.read()
+            offset = 8
+            for i in range(struct.unpack_from('<Q', data)[0]):
+                ntriangles = struct.unpack_from('<Q', data, offset)[0]
+                color = list(struct.unpack_from('<4f', data, offset + 8))
+                values = list(struct.unpack_from('<%if' % (9 * ntriangles), data, offset + 24))
+                offset += 24 + 36 * ntriangles
+                shapes.append((3, 3 * ntriangles, values, color))
+        conn.send_item(self._add_shapes(None, False, shapes))
+        conn.status()
+
+    def _send_points(self, conn, points):
+        conn.send_matrix(6 if points else 0, len(points), [v for point in points for v in point])
+
+    def cmd_G_ObjPoint(self, conn):
+        item = self._item(conn)
+        feature_type = conn.rec_int()
+        feature_id = conn.rec_int()
+        if item is None:
+            # Object under the mouse cursor: the first object
+            item = next((i for i in self.items.values() if i.type == ITEM_TYPE_OBJECT), None)
+            if feature_type == 10:
+                self._send_points(conn, item.points)
+            conn.send_item(item)
+            conn.send_int(0)
+            conn.send_int(7)
+            conn.send_int(0)
+            conn.send_line('Mesh')
+        elif feature_type == 2:
+            name, points = item.curves[feature_id] if feature_id < len(item.curves) else ('', [])
+            self._send_points(conn, points)
+            conn.send_line(name)
+        else:
+            self._send_points(conn, item.points)
+            conn.send_line('Mesh')
+        conn.status()
+
+    def cmd_G_ObjCurves(self, conn):
+        item = self._item(conn)
+        conn.rec_int()
+        conn.send_int(len(item.curves))
+        for name, points in item.curves:
+            self._send_points(conn, points)
+            conn.send_line(name)
+        conn.status()
+
+    def cmd_Show_SeqPoses(self, conn):
+        self._item(conn)
+        conn.rec_array()
+        self.sequence = [conn.rec_pose() for i in range(conn.rec_int())]
+        conn.status()
+
+    def cmd_Show_Seq(self, conn):
+        self.sequence = conn.rec_matrix()
+        self._item(conn)
+        conn.status()
+
+    def cmd_SCMD(self, conn):
+        cmd = conn.rec_line()
+        value = conn.rec_line()
+        if cmd == 'Error':
+            conn.send_line('')
+            conn.status(3, 'Error: ' + value)
+            return
+        conn.send_line('OK')
+        conn.status()
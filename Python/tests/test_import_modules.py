@@ -1,11 +1,13 @@
 
 import unittest
 import importlib
+import importlib.util
 
 class TestImport(unittest.TestCase):
 
-    modules = ['robodk.robolink', 'robodk.robomath','robodk.robodialogs','robodk.robofileio','robodk.roboapps']
+    modules = ['robodk.robolink', 'robodk.robomath','robodk.robodialogs','robodk.robofileio','robodk.roboapps','robodk.robolinkasync','robodk.robokinematics','robodk.roboevents','robodk.robomesh']
     legacy = ['robodk', 'robolink']
+    numpy_modules = ['robodk.robokinematics', 'robodk.robomesh']  # modules that require NumPy (optional dependency)
 
     def setUp(self):
         import sys
@@ -18,7 +20,11 @@ class TestImport(unittest.TestCase):
         return super().setUp()
 
     def test_import_all(self):
+        has_numpy = importlib.util.find_spec('numpy') is not None
         for m in self.modules:
+            if m in self.numpy_modules and not has_numpy:
+                print("-> Skipping " + m + " (NumPy is not installed)")
+                continue
             print("-> Importing " + m)
             try:
                 importlib.import_module(m)
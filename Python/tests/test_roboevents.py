@@ -0,0 +1,109 @@
+"""Test the RoboDK event client against a fake RoboDK API server"""
+import struct
+import threading
+import time
+import unittest
+
+from robodk import robolink, robomath
+from robodk.roboevents import RobolinkEvents, KeyEvent, ItemMovedEvent, ItemRenamedEvent
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT
+
+
+class TestRobolinkEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.part = self.server.add_item('Part', ITEM_TYPE_OBJECT, self.frame)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        self.events = RobolinkEvents(self.rdk)
+        return super().setUp()
+
+    def tearDown(self):
+        self.events.Stop()
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def collect(self, event_type, count):
+        """Registers a handler and returns the list of received events and an event set after count events"""
+        received = []
+        done = threading.Event()
+
+        def handler(event):
+            received.append(event)
+            if len(received) >= count:
+                done.set()
+
+        self.events.addHandler(handler, event_type)
+        return received, done
+
+    def test_typed_events(self):
+        keys, keys_done = self.collect(robolink.EVENT_KEY, 1)
+        renamed, renamed_done = self.collect(robolink.EVENT_ITEM_RENAMED, 1)
+        self.events.Start()
+        self.assertEqual(sorted(self.server.event_filter), [robolink.EVENT_KEY, robolink.EVENT_ITEM_RENAMED])
+
+        self.server.send_event(robolink.EVENT_KEY, data=struct.pack('>iii', 1, 65, 0))
+        self.server.send_event(robolink.EVENT_ITEM_RENAMED, self.part, 'Renamed')
+        self.assertTrue(keys_done.wait(5))
+        self.assertTrue(renamed_done.wait(5))
+
+        self.assertIsInstance(keys[0], KeyEvent)
+        self.assertTrue(keys[0].pressed)
+        self.assertEqual(keys[0].key, 65)
+        self.assertIsInstance(renamed[0], ItemRenamedEvent)
+        self.assertEqual(renamed[0].name, 'Renamed')
+
+        # Items are bound to the Robolink instance of the client
+        self.assertIs(renamed[0].item.link, self.rdk)
+        self.assertEqual(renamed[0].item.Name(), 'Part')
+
+    def test_coalesce(self):
+        gate = threading.Event()
+        moved, moved_done = self.collect(robolink.EVENT_ITEM_MOVED_POSE, 1)
+        self.events.addHandler(lambda event: gate.wait(5), robolink.EVENT_ITEM_MOVED_POSE)
+        self.events.Start()
+
+        for i in range(50):
+            pose = sum(robomath.transl(i, 0, 0).Cols(), [])
+            self.server.send_event(robolink.EVENT_ITEM_MOVED_POSE, self.part, data=struct.pack('>i16d', 16, *pose))
+        time.sleep(0.2)
+        gate.set()
+
+        # The events received while the handler was busy are dispatched once
+        for i in range(200):
+            if moved[-1].pose.Pos() == [49, 0, 0]:
+                break
+            time.sleep(0.01)
+        self.assertIsInstance(moved[-1], ItemMovedEvent)
+        self.assertEqual(moved[-1].pose.Pos(), [49, 0, 0])
+        self.assertLess(len(moved), 10)
+
+    def test_all_events(self):
+        received, done = self.collect(None, 2)
+        self.events.Start()
+        # All events are requested with RDK_EVT (RDK_EVT_FILTER requires RoboDK v5.6.4)
+        self.assertIn('RDK_EVT', self.server.commands)
+        self.assertNotIn('RDK_EVT_FILTER', self.server.commands)
+        self.assertIsNone(self.server.event_filter)
+        self.server.send_event(robolink.EVENT_ITEM_CHANGED)
+        self.server.send_event(robolink.EVENT_STATION_CHANGED)
+        self.assertTrue(done.wait(5))
+        self.assertEqual([event.type for event in received], [robolink.EVENT_ITEM_CHANGED, robolink.EVENT_STATION_CHANGED])
+        self.assertFalse(received[0].item.Valid())
+
+    def test_filter(self):
+        events = self.rdk._events_connect([robolink.EVENT_KEY])
+        try:
+            self.assertEqual(self.server.commands[-1], 'RDK_EVT_FILTER')
+            # Events that are not in the filter are not reported
+            self.server.send_event(robolink.EVENT_ITEM_CHANGED)
+            self.server.send_event(robolink.EVENT_KEY, data=struct.pack('>iii', 1, 65, 0))
+            self.assertEqual(events._rec_int(), robolink.EVENT_KEY)
+        finally:
+            events.Disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Test the local robot kinematics (robokinematics module)"""
+import math
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_ROBOT
+
+try:
+    import numpy as np
+    from robodk.robokinematics import RobotKinematics
+except ImportError:
+    np = None
+
+d2r = math.pi / 180
+
+# Classic DH table of a 6 axis robot with a spherical wrist: [rz, tx, tz, rx]
+DH_TABLE = [
+    [0, 150, 450, -90 * d2r],
+    [-90 * d2r, 600, 0, 0],
+    [0, 120, 0, -90 * d2r],
+    [0, 0, 640, 90 * d2r],
+    [0, 0, 0, -90 * d2r],
+    [0, 0, 100, 0],
+]
+
+# DHM table with a shoulder offset: [rx, tx, tz, rz]
+DHM_TABLE = [
+    [0, 0, 0, 0],
+    [-90 * d2r, 100, 0, -90 * d2r],
+    [0, 500, 80, 0],
+    [-90 * d2r, 50, 400, 0],
+    [90 * d2r, 0, 0, 0],
+    [-90 * d2r, 0, 90, 180 * d2r],
+]
+BASE = robomath.transl(10, 20, 300) * robomath.rotz(0.3)
+TOOL = robomath.transl(0, 5, 30) * robomath.rotx(0.2)
+
+
+def fake_fk(joints):
+    """Reference forward kinematics with robomath (joint 3 moves in the opposite direction)"""
+    senses = [1, 1, -1, 1, 1, 1]
+    pose = BASE
+    for row, joint, sense in zip(DHM_TABLE, joints, senses):
+        pose = pose * robomath.dhm(row[0], row[1], row[2], row[3] + sense * joint * d2r)
+    pose = pose * TOOL
+    return [pose[i, j] for j in range(4) for i in range(4)]
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestRobotKinematics(unittest.TestCase):
+
+    def setUp(self):
+        self.kin = RobotKinematics(DH_TABLE, modified=False, lower_limits=[-180] * 6, upper_limits=[180] * 6)
+        self.joints = np.random.default_rng(1).uniform(-150, 150, (200, 6))
+
+    def test_fk(self):
+        joints = [10, 20, -30, 40, 50, 60]
+        pose = robomath.eye(4)
+        for row, joint in zip(DH_TABLE, joints):
+            pose = pose * robomath.dh(row[0] + joint * d2r, row[1], row[2], row[3])
+        result = self.kin.SolveFK(joints)
+        self.assertIsInstance(result, robomath.Mat)
+        np.testing.assert_allclose(result.rows, pose.rows, atol=1e-9)
+
+        # Vectorized, with tool and reference
+        tool = robomath.transl(0, 0, 50)
+        reference = robomath.transl(100, 0, 0)
+        poses = self.kin.SolveFK(np.array([joints] * 3), tool, reference)
+        self.assertEqual(poses.shape, (3, 4, 4))
+        np.testing.assert_allclose(poses[2], (robomath.invH(reference) * pose * tool).rows, atol=1e-9)
+
+    def test_ik(self):
+        poses = self.kin.SolveFK(self.joints)
+        solutions = self.kin.SolveIK_All(poses)
+        self.assertEqual(solutions.shape, (200, 8, 6))
+        for i in range(8):
+            valid = ~np.isnan(solutions[:, i]).any(axis=1)
+            np.testing.assert_allclose(self.kin.SolveFK(solutions[valid, i]), poses[valid], atol=1e-6)
+
+        # The closest solution to the joints used to calculate the pose is the same set of joints
+        np.testing.assert_allclose(self.kin.SolveIK(poses, self.joints), self.joints, atol=1e-6)
+
+        joints = self.kin.SolveIK(robomath.Mat(poses[0].tolist()), self.joints[0].tolist())
+        np.testing.assert_allclose(joints.list(), self.joints[0], atol=1e-6)
+        self.assertEqual(len(self.kin.SolveIK(robomath.transl(5000, 0, 0)).list()), 0)
+        self.assertTrue(np.isnan(self.kin.SolveIK(np.array([robomath.transl(5000, 0, 0).rows]))).all())
+
+    def test_jacobian(self):
+        joints = self.joints[:5]
+        jac = self.kin.Jacobian(joints)
+        self.assertEqual(jac.shape, (5, 6, 6))
+        delta = 1e-6
+        for i in range(6):
+            joints2 = joints.copy()
+            joints2[:, i] += delta / d2r
+            speed = (self.kin.SolveFK(joints2)[:, :3, 3] - self.kin.SolveFK(joints)[:, :3, 3]) / delta
+            np.testing.assert_allclose(jac[:, :3, i], speed, atol=1e-3)
+
+    def test_config(self):
+        # All solutions of a pose have a different configuration
+        solutions = self.kin.SolveIK_All(self.kin.SolveFK(self.joints[1].tolist()))
+        self.assertEqual(solutions.size(), (6, 8))
+        configs = [tuple(self.kin.JointsConfig(joints).list()) for joints in solutions.Cols()]
+        self.assertEqual(len(set(configs)), 8)
+        self.assertEqual(self.kin.JointsConfig(np.array(solutions.Cols())).shape, (8, 4))
+
+    def test_from_item(self):
+        server = FakeRoboDK().start()
+        robot_fake = server.add_item('Robot', ITEM_TYPE_ROBOT, server.station)
+        robot_fake.fk = fake_fk
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=server.port)
+        try:
+            kin = RobotKinematics.fromItem(rdk.Item('Robot'))
+        finally:
+            rdk.Disconnect()
+            server.stop()
+
+        for joints in self.joints[:20]:
+            np.testing.assert_allclose(kin.SolveFK(joints.tolist()).rows, np.reshape(fake_fk(joints), (4, 4)).T, atol=1e-6)
+
+        poses = kin.SolveFK(self.joints)
+        np.testing.assert_allclose(kin.SolveFK(kin.SolveIK(poses, self.joints)), poses, atol=1e-6)
+
+    def test_from_item_orientation(self):
+        # Joint 6 is coupled with joints 4 and 5: the flange position is the same but the orientation is not
+        def coupled_fk(joints):
+            joints = list(joints)
+            joints[5] += 0.01 * joints[3] * joints[4]
+            pose = BASE
+            for row, joint in zip(DHM_TABLE, joints):
+                pose = pose * robomath.dhm(row[0], row[1], row[2], row[3] + joint * d2r)
+            return [pose[i, j] for j in range(4) for i in range(4)]
+
+        server = FakeRoboDK().start()
+        robot_fake = server.add_item('Robot', ITEM_TYPE_ROBOT, server.station)
+        robot_fake.fk = coupled_fk
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=server.port)
+        try:
+            with self.assertRaises(Exception) as ctx:
+                RobotKinematics.fromItem(rdk.Item('Robot'))
+            self.assertIn('deg', str(ctx.exception))
+        finally:
+            rdk.Disconnect()
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
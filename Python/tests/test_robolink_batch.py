@@ -0,0 +1,194 @@
+"""Test the batch kinematics calls against a fake RoboDK API server"""
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT, ITEM_TYPE_ROBOT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestRobolinkBatch(unittest.TestCase):
+
+    window = None
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.server.add_item('Robot', ITEM_TYPE_ROBOT, frame)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        if self.window is not None:
+            self.rdk.BATCH_WINDOW = self.window
+        self.robot = self.rdk.Item('Robot')
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_fk(self):
+        joints_list = [[i, 2 * i, 3 * i, 0, 0, 0] for i in range(300)]
+        joints_list[5][0] = 5000
+        solutions_ok = []
+        poses = self.robot.SolveFK_Batch(joints_list, solutions_ok=solutions_ok)
+        self.assertEqual(len(poses), 300)
+        self.assertEqual(poses[10], robomath.transl(10, 20, 30))
+        self.assertEqual(solutions_ok.count(False), 1)
+        self.assertFalse(solutions_ok[5])
+        self.assertEqual(self.server.commands.count('G_LFK'), 1)
+
+        # One column per set of joints, same result as SolveFK
+        tool = robomath.transl(0, 0, 100)
+        reference = robomath.transl(10, 0, 0)
+        poses = self.robot.SolveFK_Batch(robomath.Mat(joints_list[:3]).tr(), tool, reference)
+        self.assertEqual(poses[2], robomath.transl(-8, 4, 106))
+
+    def test_ik(self):
+        poses = [robomath.transl(i - 2, 0, 0) for i in range(300)]
+        joints_list = self.robot.SolveIK_Batch(poses)
+        self.assertEqual(len(joints_list), 300)
+        self.assertLessEqual(len(joints_list[0].list()), 1)
+        self.assertEqual(joints_list[10].list(), [8, 0, 0, 0, 0, 0])
+
+        # Tool and reference are applied the same way as SolveIK
+        tool = robomath.transl(0, 0, 100)
+        reference = robomath.transl(10, 0, 0)
+        joints_list = self.robot.SolveIK_Batch(poses[5:6], [0, 0, 0, 4, 5, 6], tool, reference)
+        self.assertEqual(joints_list[0].list(), [13, 0, -100, 4, 5, 6])
+        self.assertEqual(self.server.commands.count('G_LIK_jnts'), 1)
+
+        with self.assertRaises(Exception):
+            self.robot.SolveIK_Batch(poses[:3], [[0] * 6, [0] * 6])
+        self.assertEqual(self.robot.Name(), 'Robot')
+
+    def test_ik_all(self):
+        solutions = self.robot.SolveIK_All_Batch([robomath.transl(1, 2, 3), robomath.transl(-1, 2, 3)])
+        self.assertEqual(solutions[0].size(), (6, 2))
+        self.assertEqual(solutions[0].Cols()[1], [-1, -2, -3, 0, 0, 0])
+        self.assertEqual(len(solutions[1]), 0)
+
+    def test_config(self):
+        configs = self.robot.JointsConfig_Batch([[-1, 2, -3, 0, 0, 0], [1, 2, 3, 0, 0, 0]])
+        self.assertEqual([c.list() for c in configs], [[1, 0, 1, 0], [0, 0, 0, 0]])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy(self):
+        joints = np.zeros((200, 6))
+        joints[:, 0] = np.arange(200)
+        poses = self.robot.SolveFK_Batch(joints)
+        self.assertEqual(poses.shape, (200, 4, 4))
+        self.assertEqual(poses[7, 0, 3], 7)
+
+        poses[:, 0, 3] -= 1
+        joints_ik = self.robot.SolveIK_Batch(poses)
+        self.assertEqual(joints_ik.shape, (200, 6))
+        self.assertTrue(np.isnan(joints_ik[0]).all())
+        np.testing.assert_array_equal(joints_ik[1:, 0], np.arange(199))
+
+        # NumPy poses and Mat poses give the same result
+        tool = robomath.transl(0, 5, 0)
+        joints_mat = self.robot.SolveIK_Batch([robomath.Mat(p.tolist()) for p in poses[1:5]], None, tool)
+        joints_np = self.robot.SolveIK_Batch(poses[1:5], None, tool)
+        np.testing.assert_allclose(joints_np, [j.list() for j in joints_mat])
+
+        solutions = self.robot.SolveIK_All_Batch(poses[:2])
+        self.assertEqual(solutions[0].shape, (0, 0))
+        self.assertEqual(solutions[1].shape, (2, 6))
+
+        configs = self.robot.JointsConfig_Batch(-joints)
+        self.assertEqual(configs.shape, (200, 4))
+
+
+class TestRobolinkBatchWindow(TestRobolinkBatch):
+    """Same tests with a small number of requests in flight"""
+
+    window = 3
+
+
+class TestItemGetters(unittest.TestCase):
+
+    window = None
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        frame.pose = sum(robomath.transl(0, 0, 100).Cols(), [])
+        for i in range(300):
+            part = self.server.add_item('Part %i' % i, ITEM_TYPE_OBJECT, frame)
+            part.pose = sum(robomath.transl(i, 0, 0).Cols(), [])
+            part.visible = i % 2
+            part.color = [i / 300, 0.0, 1.0, 1.0]
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        if self.window is not None:
+            self.rdk.BATCH_WINDOW = self.window
+        self.parts = self.rdk.ItemList(ITEM_TYPE_OBJECT)
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_getters(self):
+        poses = self.rdk.Poses(self.parts)
+        self.assertEqual(len(poses), 300)
+        self.assertEqual(poses[10], robomath.transl(10, 0, 0))
+        self.assertEqual(self.rdk.PosesAbs(self.parts)[10], robomath.transl(10, 0, 100))
+        self.assertEqual(self.rdk.Names(self.parts)[:2], ['Part 0', 'Part 1'])
+        self.assertEqual(set(self.rdk.Types(self.parts)), {ITEM_TYPE_OBJECT})
+        self.assertEqual(self.rdk.Visibles(self.parts)[:4], [0, 1, 0, 1])
+        self.assertEqual(self.rdk.Colors(self.parts)[150], [0.5, 0.0, 1.0, 1.0])
+        self.assertEqual(self.rdk.Poses([]), [])
+
+        self.rdk.POSEH = True
+        self.assertIsInstance(self.rdk.Poses(self.parts)[0], robomath.PoseH)
+
+    def test_getters_errors(self):
+        self.server.items[self.parts[10].item].valid = False
+        with self.assertRaises(robolink.PipelineError) as ctx:
+            self.rdk.Names(self.parts)
+        self.assertEqual(len(ctx.exception.errors), 1)
+        self.assertEqual(ctx.exception.errors[0][0], 'G_Name')
+        self.assertIs(ctx.exception.errors[0][1], self.parts[10])
+
+        # The replies of the other items were received
+        self.assertEqual(self.parts[11].Name(), 'Part 11')
+        self.assertEqual(self.parts[11].Type(), ITEM_TYPE_OBJECT)
+
+    def test_exchange_errors(self):
+        self.server.items[self.parts[10].item].valid = False
+
+        def send_one(i):
+            self.rdk._send_line('G_Name')
+            self.rdk._send_item(self.parts[i])
+
+        def rec_one(i):
+            name = self.rdk._rec_line()
+            self.rdk._check_status()
+            return name
+
+        with self.rdk._lock:
+            with self.assertRaises(Exception) as ctx:
+                self.rdk._exchange_batch(len(self.parts), send_one, rec_one)
+        self.assertIn('Invalid item', str(ctx.exception))
+        self.assertEqual(self.parts[11].Name(), 'Part 11')
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_getters_numpy(self):
+        poses = self.rdk.PosesAbs(self.parts, as_numpy=True)
+        self.assertEqual(poses.shape, (300, 4, 4))
+        self.assertEqual(poses[10].tolist(), robomath.transl(10, 0, 100).rows)
+        self.assertEqual(self.rdk.Poses([], as_numpy=True).shape, (0, 4, 4))
+
+
+class TestItemGettersWindow(TestItemGetters):
+    """Same tests with a small number of requests in flight"""
+
+    window = 3
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Test the item metadata cache and its invalidation through RoboDK events"""
+import socket
+import time
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT, ITEM_TYPE_ROBOT
+
+
+class TestRobolinkCache(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.frame2 = self.server.add_item('Frame 2', ITEM_TYPE_FRAME, self.server.station)
+        self.part = self.server.add_item('Part', ITEM_TYPE_OBJECT, self.frame)
+        self.robot = self.server.add_item('Robot', ITEM_TYPE_ROBOT, self.frame)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        self.rdk.setCache()
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def commands(self):
+        """Returns the number of commands received by the server"""
+        self.rdk.PipelineSync()
+        return len(self.server.commands)
+
+    def wait_for(self, condition):
+        """Waits for the event thread to process an event"""
+        for i in range(200):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail('Event not processed')
+
+    def test_cached_values(self):
+        part = self.rdk.Item('Part')
+        frame = part.Parent()
+        robot = robolink.Item(self.rdk, str(self.robot.ptr))
+        self.assertEqual(frame.Childs(), [part, robot])
+        self.assertEqual(part.PoseTool(), robomath.eye(4))
+        ncommands = self.commands()
+
+        # Types and names were retrieved in bulk, other values are cached after the first call
+        self.assertEqual(part.Parent(), frame)
+        self.assertEqual(frame.Name(), 'Frame 1')
+        self.assertEqual(part.Name(), 'Part')
+        self.assertEqual(robot.type, ITEM_TYPE_ROBOT)
+        self.assertEqual(robolink.Item(self.rdk, str(self.robot.ptr)).type, ITEM_TYPE_ROBOT)
+        self.assertEqual(frame.Childs(), [part, robot])
+        self.assertEqual(frame.Childs()[1].type, ITEM_TYPE_ROBOT)
+        self.assertEqual(part.PoseTool(), robomath.eye(4))
+        self.assertEqual(self.commands(), ncommands)
+
+        # Returned values are copies
+        part.PoseTool().setPos([1, 2, 3])
+        part.Parent().item = 0
+        self.assertEqual(part.PoseTool(), robomath.eye(4))
+        self.assertEqual(part.Parent(), frame)
+
+    def test_local_changes(self):
+        part = self.rdk.Item('Part')
+        frame2 = self.rdk.Item('Frame 2')
+        self.assertEqual(part.Parent().Name(), 'Frame 1')
+        part.setName('Part 2')
+        self.assertEqual(part.Name(), 'Part 2')
+        part.setParent(frame2)
+        self.assertEqual(part.Parent(), frame2)
+
+    def test_events(self):
+        part = self.rdk.Item('Part')
+        self.assertEqual(part.Parent().Name(), 'Frame 1')
+
+        self.part.name = 'Renamed'
+        self.server.send_event(robolink.EVENT_ITEM_RENAMED, self.part, 'Renamed')
+        self.wait_for(lambda: part.Name() == 'Renamed')
+
+        self.part.parent = self.frame2
+        self.server.send_event(robolink.EVENT_ITEM_CHANGED)
+        self.wait_for(lambda: part.Parent().Name() == 'Frame 2')
+
+        self.part.pose_tool = sum(robomath.transl(1, 2, 3).Cols(), [])
+        self.server.send_event(robolink.EVENT_TOOL_MODIFIED, self.part)
+        self.wait_for(lambda: part.PoseTool().Pos() == [1, 2, 3])
+
+    def test_disabled(self):
+        part = self.rdk.Item('Part')
+        part.Name()
+        self.rdk.setCache(False)
+        self.assertIsNone(self.rdk._cache)
+        ncommands = self.commands()
+        part.Name()
+        self.assertEqual(self.commands(), ncommands + 1)
+
+        # The cache is disabled if the event connection is lost
+        self.rdk.setCache()
+        self.assertIsNotNone(self.rdk._cache)
+        for conn in self.server.event_conns:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+        self.wait_for(lambda: self.rdk._cache is None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+"""Test the Robolink communication layer against a fake RoboDK API server"""
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT
+
+
+class TestRobolinkCom(unittest.TestCase):
+
+    trickle = False
+
+    def setUp(self):
+        self.server = FakeRoboDK(trickle=self.trickle).start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.part = self.server.add_item('Part ' + 'x' * 300, ITEM_TYPE_OBJECT, self.frame)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_items(self):
+        items = self.rdk.ItemList()
+        self.assertEqual(len(items), 2)
+        names = self.rdk.ItemList(list_names=True)
+        self.assertEqual(names, ['Frame 1', self.part.name])
+        frame = self.rdk.Item('Frame 1')
+        self.assertEqual(frame.item, self.frame.ptr)
+        self.assertEqual(frame.type, ITEM_TYPE_FRAME)
+        self.assertEqual(frame.Name(), 'Frame 1')
+
+    def test_pose(self):
+        frame = self.rdk.Item('Frame 1')
+        pose = robomath.transl(10, 20, 30) * robomath.rotz(0.5)
+        frame.setPose(pose)
+        self.assertEqual(frame.Pose(), pose)
+
+    def test_long_line(self):
+        # Lines longer than the receive buffer must be handled
+        self.rdk.RECV_BUFFER_SIZE = 16
+        self.rdk._recv_reset()
+        self.rdk.setParam('Long', 'y' * 1000)
+        self.assertEqual(self.rdk.getParam('Long'), 'y' * 1000)
+        self.assertEqual(self.rdk.getParam('Long', False), b'y' * 1000)
+
+    def test_large_matrix(self):
+        mat = robomath.Mat([[float(i * 3 + j) for j in range(3)] for i in range(5000)]).tr()
+        result = self.rdk.Command('Echo', mat)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].size(), (3, 5000))
+        self.assertEqual(result[0].rows, mat.rows)
+
+    def test_matrix_numpy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('NumPy is not installed')
+        mat = robomath.Mat([[float(i * 3 + j) for j in range(3)] for i in range(5000)]).tr()
+        for backend in ['list', 'numpy']:
+            robomath.setMatBackend(backend)
+            try:
+                result = self.rdk.Command('Echo', mat)
+            finally:
+                robomath.setMatBackend()
+            self.assertEqual(result[0].rows, mat.rows)
+
+        program = self.rdk.Item('Frame 1')
+        msg, joints, status = program.InstructionListJoints(as_numpy=True)
+        self.assertEqual(status, 100)
+        self.assertIsInstance(joints, np.ndarray)
+        self.assertEqual(joints.shape, (10, 100))
+        self.assertEqual(joints[3, 2], 23)
+        self.assertTrue(joints.dtype.isnative)
+        msg, joints_mat, status = program.InstructionListJoints()
+        self.assertEqual(joints_mat.rows, joints.tolist())
+
+    def test_send_numpy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('NumPy is not installed')
+        frame = self.rdk.Item('Frame 1')
+        pose = robomath.transl(10, 20, 30) * robomath.rotz(0.5)
+        frame.setPose(robomath.Mat.fromNumpy(pose.toNumpy()))
+        self.assertEqual(frame.Pose(), pose)
+
+        points = np.arange(3000.0).reshape(-1, 6)
+        projected = self.rdk.ProjectPoints(points, frame)
+        self.assertEqual(projected.shape, (500, 6))
+        np.testing.assert_array_equal(projected[:, 3:], points[:, 3:])
+        np.testing.assert_array_equal(projected[:, 2], 0)
+        self.assertEqual(self.rdk.ProjectPoints(points.tolist(), frame), projected.tolist())
+
+        result = self.rdk.Command('Echo', points)
+        self.assertEqual(result[0].rows, points.tolist())
+
+        poses = np.array([(robomath.transl(i, 0, 0) * robomath.rotx(i)).rows for i in range(10)])
+        frame.ShowSequence(poses)
+        self.assertEqual(self.server.sequence[3], poses[3].T.flatten().tolist())
+        joints = np.arange(60.0).reshape(10, 6)
+        frame.ShowSequence(joints)
+        self.assertEqual(self.server.sequence, (6, 10, joints.flatten().tolist()))
+
+    def test_error(self):
+        with self.assertRaises(Exception):
+            self.rdk.Command('Error', 'test')
+        # The link must still be usable after an error
+        self.assertEqual(self.rdk.Item('Frame 1').Name(), 'Frame 1')
+
+    def test_send_coalescing(self):
+        # Each command must be sent to RoboDK in a single block
+        com = CountingCOM(self.rdk.COM)
+        self.rdk.COM = com
+        frame = self.rdk.Item('Frame 1')
+        part = self.rdk.Item(self.part.name)
+        self.assertEqual(com.sends, 2)
+
+        poses = [robomath.transl(1, 2, 3), robomath.rotx(0.1)]
+        self.rdk.setPoses([frame, part], poses)
+        self.assertEqual(com.sends, 3)
+        self.assertEqual(part.Pose(), poses[1])
+
+        # Incomplete commands are discarded and the link remains usable
+        with self.assertRaises(Exception):
+            self.rdk.setPoses([frame, part], [poses[0], None])
+        self.assertEqual(com.sends, 4)
+        self.assertEqual(frame.Name(), 'Frame 1')
+        self.assertEqual(com.sends, 5)
+
+    def test_pipeline(self):
+        com = CountingCOM(self.rdk.COM)
+        self.rdk.COM = com
+        frame = self.rdk.Item('Frame 1')
+        sends = com.sends
+        with self.rdk.pipeline():
+            for i in range(50):
+                frame.setPose(robomath.transl(i, 0, 0))
+            frame.setName('Frame 2')
+            # Commands are sent in one block when a reply is needed
+            self.assertEqual(com.sends, sends)
+            self.assertEqual(frame.Name(), 'Frame 2')
+            self.assertEqual(com.sends, sends + 1)
+
+        self.assertEqual(frame.Pose(), robomath.transl(49, 0, 0))
+        self.assertEqual(self.server.commands.count('S_Hlocal'), 50)
+
+    def test_pipeline_errors(self):
+        frame = self.rdk.Item('Frame 1')
+        invalid = robolink.Item(self.rdk, 12345, robolink.ITEM_TYPE_FRAME)
+        with self.assertRaises(robolink.PipelineError) as ctx:
+            with self.rdk.pipeline():
+                frame.setPose(robomath.transl(1, 2, 3))
+                invalid.setPose(robomath.transl(1, 2, 3))
+                # Errors are not raised while the pipeline is active
+                self.assertEqual(frame.Name(), 'Frame 1')
+                invalid.setPose(robomath.transl(1, 2, 3))
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(errors[0][0], 'setPose')
+        self.assertIs(errors[0][1], invalid)
+        self.assertEqual(frame.Pose(), robomath.transl(1, 2, 3))
+
+        # Errors are raised immediately outside pipeline mode
+        with self.assertRaises(Exception):
+            invalid.setPose(robomath.transl(1, 2, 3))
+        self.assertEqual(frame.Name(), 'Frame 1')
+
+    def test_pipeline_limit(self):
+        self.rdk.PIPELINE_MAX_PENDING = 8
+        self.rdk.PIPELINE_TX_SIZE = 256
+        frame = self.rdk.Item('Frame 1')
+        with self.rdk.pipeline():
+            for i in range(100):
+                frame.setPose(robomath.transl(0, i, 0))
+                self.assertLess(len(self.rdk._pending_status), 8)
+        self.assertEqual(frame.Pose(), robomath.transl(0, 99, 0))
+
+    def test_new_link(self):
+        frame = self.rdk.Item('Frame 1')
+        # Partial command left over by the previous connection
+        self.rdk._tx_buf += b'S_Name\n'
+        self.rdk.NewLink()
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(frame.Name(), 'Frame 1')
+        self.assertNotIn('S_Name', self.server.commands)
+
+    def test_skipstatus(self):
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port, skipstatus=True)
+        try:
+            frame = rdk.Item('Frame 1')
+            # RoboDK does not send the status of these commands in skipstatus mode
+            frame.setPose(robomath.transl(1, 2, 3))
+            frame.setName('Frame 2')
+            # Other setters are always acknowledged
+            frame.setColor([1, 0, 0])
+            self.assertEqual(frame.Name(), 'Frame 2')
+            self.assertEqual(frame.Type(), ITEM_TYPE_FRAME)
+            self.assertEqual(frame.Pose(), robomath.transl(1, 2, 3))
+            self.assertEqual(self.frame.color, [1, 0, 0, 1])
+        finally:
+            rdk.Disconnect()
+
+
+class CountingCOM:
+    """Communication object wrapper that counts the number of send calls"""
+
+    def __init__(self, com):
+        self.com = com
+        self.sends = 0
+
+    def sendall(self, data):
+        self.sends += 1
+        return self.com.sendall(data)
+
+    def send(self, data):
+        self.sends += 1
+        return self.com.send(data)
+
+    def __getattr__(self, name):
+        return getattr(self.com, name)
+
+
+class TestRobolinkComShortReads(TestRobolinkCom):
+    """Same tests when RoboDK replies arrive in very small segments"""
+
+    trickle = True
+
+
+if __name__ == '__main__':
+    unittest.main()
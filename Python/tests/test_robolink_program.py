@@ -0,0 +1,183 @@
+"""Test the program builder against a fake RoboDK API server"""
+import unittest
+
+from robodk import robolink, robomath
+from robodk.robolink import ProgramBuilder
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_ROBOT, ITEM_TYPE_TARGET
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestProgramBuilder(unittest.TestCase):
+
+    window = None
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.server.add_item('Robot', ITEM_TYPE_ROBOT, frame)
+        self.server.add_item('Target', ITEM_TYPE_TARGET, frame)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        if self.window is not None:
+            self.rdk.BATCH_WINDOW = self.window
+        self.robot = self.rdk.Item('Robot')
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def fake_program(self, program):
+        return self.server.items[program.item]
+
+    def test_instructions(self):
+        target = self.rdk.Item('Target')
+        pose = robomath.transl(10, 20, 30) * robomath.rotz(0.5)
+        builder = ProgramBuilder(self.rdk, 'Prog', self.robot)
+        builder.setSpeed(100, 20).setRounding(1.5)
+        builder.MoveJ([0, -90, 90, 0, 90, 0])
+        builder.MoveL(pose)
+        builder.MoveL(target)
+        builder.setPoseTool(robomath.transl(0, 0, 100))
+        builder.setPoseFrame(self.rdk.Item('Frame 1'))
+        builder.setDO('OUT1', 1)
+        builder.setAO(2, 0.5)
+        builder.Pause(500)
+        builder.RunInstruction('SetRPM(25000)', robolink.INSTRUCTION_INSERT_CODE)
+        self.assertEqual(len(builder), 11)
+
+        program, indexes = builder.Upload()
+        self.assertEqual(program.Name(), 'Prog')
+        self.assertEqual(indexes, list(range(11)))
+
+        instructions = self.fake_program(program).instructions
+        self.assertEqual(len(instructions), 11)
+        self.assertEqual(instructions[0], ('S_Speed4', [100, 20, -1, -1]))
+        self.assertEqual(instructions[1], ('S_ZoneData', 1500))
+        self.assertEqual(instructions[2], ('MoveX', robolink.MOVE_TYPE_JOINT, 1, [0, -90, 90, 0, 90, 0]))
+        self.assertEqual(instructions[3], ('MoveX', robolink.MOVE_TYPE_LINEAR, 2, sum(pose.Cols(), [])))
+        self.assertEqual(instructions[4][0], 'Add_INSMOVE')
+        self.assertEqual(instructions[4][1].ptr, target.item)
+        self.assertEqual(instructions[5], ('S_Tool', sum(robomath.transl(0, 0, 100).Cols(), [])))
+        self.assertEqual(instructions[6][0], 'S_Link_ptr')
+        self.assertEqual(instructions[7], ('setDO', 'OUT1', '1'))
+        self.assertEqual(instructions[8], ('setAO', '2', '0.5'))
+        self.assertEqual(instructions[9], ('RunPause', 500000))
+        self.assertEqual(instructions[10], ('RunCode2', 'SetRPM(25000)', robolink.INSTRUCTION_INSERT_CODE))
+
+        # Append to an existing program
+        program2, indexes = ProgramBuilder(self.rdk, program).Pause().Upload()
+        self.assertEqual(program2, program)
+        self.assertEqual(indexes, [11])
+
+    def test_targets(self):
+        builder = ProgramBuilder(self.rdk, 'Prog', self.robot, add_targets=True)
+        poses = [robomath.transl(i, 0, 0) for i in range(300)]
+        builder.MoveL(poses)
+        builder.MoveJ([1, 2, 3, 4, 5, 6])
+        builder.MoveC(robomath.transl(0, 10, 0), robomath.transl(10, 10, 0))
+        program, indexes = builder.Upload()
+        self.assertEqual(len(indexes), 302)
+
+        instructions = self.fake_program(program).instructions
+        self.assertEqual([ins[0] for ins in instructions], ['Add_INSMOVE'] * 301 + ['Add_INSMOVEC'])
+        target = instructions[10][1]
+        self.assertEqual(target.pose, sum(poses[10].Cols(), []))
+        self.assertEqual(target.visible, 0)
+        self.assertFalse(target.joint_target)
+        self.assertEqual(instructions[300][1].joints, [1, 2, 3, 4, 5, 6])
+        self.assertTrue(instructions[300][1].joint_target)
+        self.assertEqual(instructions[301][2].pose, sum(robomath.transl(10, 10, 0).Cols(), []))
+        self.assertEqual(len([item for item in self.server.items.values() if item.type == ITEM_TYPE_TARGET]), 1 + 303)
+
+    def test_targets_skipstatus(self):
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port, skipstatus=True)
+        try:
+            builder = ProgramBuilder(rdk, 'Prog', rdk.Item('Robot'), add_targets=True)
+            builder.MoveL([robomath.transl(i, 0, 0) for i in range(20)])
+            builder.MoveJ([1, 2, 3, 4, 5, 6])
+            builder.MoveC(robomath.transl(0, 10, 0), [1, 2, 3, 4, 5, 6])
+            program, indexes = builder.Upload()
+            self.assertEqual(len(indexes), 22)
+            self.assertEqual(program.Name(), 'Prog')
+        finally:
+            rdk.Disconnect()
+
+        instructions = self.fake_program(program).instructions
+        self.assertEqual(instructions[5][1].pose, sum(robomath.transl(5, 0, 0).Cols(), []))
+        self.assertTrue(instructions[21][2].joint_target)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy(self):
+        poses = np.tile(np.eye(4), (1000, 1, 1))
+        poses[:, 0, 3] = np.arange(1000)
+        joints = np.zeros((10, 6))
+        builder = ProgramBuilder(self.rdk, 'Prog', self.robot)
+        builder.MoveL(poses).MoveJ(joints)
+        program, indexes = builder.Upload()
+        instructions = self.fake_program(program).instructions
+        self.assertEqual(len(instructions), 1010)
+        self.assertEqual(instructions[999], ('MoveX', robolink.MOVE_TYPE_LINEAR, 2, sum(robomath.transl(999, 0, 0).Cols(), [])))
+        self.assertEqual(instructions[1000], ('MoveX', robolink.MOVE_TYPE_JOINT, 1, [0.0] * 6))
+
+    def test_errors(self):
+        builder = ProgramBuilder(self.rdk, 'Prog', self.robot)
+        builder.setDO('', 1).Pause(10).setDO('', 0)
+        with self.assertRaises(robolink.PipelineError) as cm:
+            builder.Upload()
+        self.assertEqual(len(cm.exception.errors), 2)
+
+        # The connection is still usable
+        self.assertEqual(self.robot.Name(), 'Robot')
+
+    def test_instructions_bulk(self):
+        builder = ProgramBuilder(self.rdk, 'Prog', self.robot)
+        builder.MoveJ([[i, 0, 0, 0, 0, 0] for i in range(500)])
+        builder.MoveL(robomath.transl(1, 2, 3))
+        builder.Pause(100)
+        program, indexes = builder.Upload()
+
+        instructions = program.Instructions()
+        self.assertEqual(len(instructions), 502)
+        name, instype, movetype, isjointtarget, target, joints = instructions[10]
+        self.assertEqual((name, instype, movetype, isjointtarget), ('MoveJ', robolink.INS_TYPE_MOVE, robolink.MOVE_TYPE_JOINT, 1))
+        self.assertEqual(joints.list(), [10, 0, 0, 0, 0, 0])
+        self.assertEqual(instructions[500][4], robomath.transl(1, 2, 3))
+        self.assertEqual(instructions[501][:2], ('RunPause', robolink.INS_TYPE_CODE))
+        self.assertEqual(instructions[501], program.Instruction(501))
+        subset = program.Instructions([500, 10])
+        self.assertEqual([ins[:5] for ins in subset], [instructions[500][:5], instructions[10][:5]])
+
+        # Convert the joint moves to linear moves
+        for i, ins in enumerate(instructions[:500]):
+            instructions[i] = ('*MoveL',) + ins[1:2] + (robolink.MOVE_TYPE_LINEAR,) + ins[3:]
+        program.setInstructions(instructions[:500])
+        fake = self.fake_program(program)
+        self.assertEqual(fake.instructions[10], ('MoveX', robolink.MOVE_TYPE_LINEAR, 1, [10, 0, 0, 0, 0, 0]))
+        self.assertEqual(program.Instructions([10])[0][:3], ('*MoveL', robolink.INS_TYPE_MOVE, robolink.MOVE_TYPE_LINEAR))
+
+        # Invalid instructions are reported after all the instructions are sent
+        with self.assertRaises(robolink.PipelineError) as cm:
+            program.setInstructions(instructions[:3], [0, 1000, 2])
+        self.assertEqual(len(cm.exception.errors), 1)
+        self.assertEqual(program.Instructions([2])[0][0], '*MoveL')
+
+        with self.assertRaises(robolink.PipelineError) as cm:
+            program.Instructions([0, 1000, 2, 2000])
+        self.assertEqual(len(cm.exception.errors), 2)
+        self.assertEqual(cm.exception.errors[0][0], 'Instruction')
+        self.assertEqual(program.Instructions([2])[0][0], '*MoveL')
+
+
+class TestProgramBuilderWindow(TestProgramBuilder):
+    """Same tests with a small number of requests in flight"""
+
+    window = 3
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Test adding and retrieving geometry (AddShape, GetPoints, GetCurves) against a fake RoboDK API server"""
+import struct
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_OBJECT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def floats(values):
+    """Rounds values to float32"""
+    return list(struct.unpack('%if' % len(values), struct.pack('%if' % len(values), *values)))
+
+
+class TestAddShape(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        # 2 triangles, one column per vertex (xyzijk)
+        self.cols = [[0.1 * i + j for j in range(6)] for i in range(6)]
+        self.mat = robomath.Mat(self.cols).tr()
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        robolink._SHAPE_CHUNK = 1 << 18
+        return super().tearDown()
+
+    def shapes(self, item):
+        self.assertEqual(item.type, ITEM_TYPE_OBJECT)
+        return self.server.items[item.item].shapes
+
+    def test_mat(self):
+        item = self.rdk.AddShape([self.mat, [1, 0, 0, 1], self.mat])
+        shapes = self.shapes(item)
+        self.assertEqual(len(shapes), 2)
+        self.assertEqual(shapes[0], (6, 6, floats(sum(self.cols, [])), [1, 0, 0, 1]))
+        self.assertEqual(shapes[1][3], [])
+
+        self.rdk.BUILD = 20000
+        shapes = self.shapes(self.rdk.AddShape([self.mat]))
+        self.assertEqual(shapes[0][:3], (6, 6, sum(self.cols, [])))
+
+    def test_file(self):
+        self.rdk._ADDSHAPE_VIA_FILE = True
+        shapes = self.shapes(self.rdk.AddShape([self.mat, [0, 1, 0, 1]]))
+        self.assertEqual(shapes, [(3, 6, floats([v for col in self.cols for v in col[:3]]), [0, 1, 0, 1])])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy(self):
+        robolink._SHAPE_CHUNK = 4
+        vertices = np.random.rand(30, 6)
+        expected = floats(vertices.ravel().tolist())
+        obj = self.rdk.AddShape(vertices)
+        self.assertEqual(self.shapes(obj), [(6, 30, expected, [])])
+
+        # Several shapes with colors, added to an existing object
+        item = obj.AddShape([vertices[:, :3], np.array([0, 0, 1, 1]), vertices])
+        self.assertEqual(item, obj)
+        shapes = self.shapes(obj)
+        self.assertEqual(len(shapes), 3)
+        self.assertEqual(shapes[1], (3, 30, floats(vertices[:, :3].ravel().tolist()), [0, 0, 1, 1]))
+        self.assertEqual(shapes[2], (6, 30, expected, []))
+
+        # Old versions of RoboDK receive doubles
+        self.rdk.BUILD = 20000
+        shapes = self.shapes(self.rdk.AddShape(vertices))
+        self.assertEqual(shapes[0][:3], (6, 30, vertices.ravel().tolist()))
+
+        # Shapes added through a file only provide the vertices
+        self.rdk.BUILD = 30000
+        self.rdk._ADDSHAPE_VIA_FILE = True
+        shapes = self.shapes(self.rdk.AddShape([vertices, [1, 1, 0, 1]]))
+        self.assertEqual(shapes, [(3, 30, floats(vertices[:, :3].ravel().tolist()), [1, 1, 0, 1])])
+
+        with self.assertRaises(Exception):
+            self.rdk.AddShape(np.zeros((9, 4)))
+
+
+class TestGetPoints(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.obj = self.server.add_item('Part', ITEM_TYPE_OBJECT, self.server.station)
+        self.obj.points = [[i, 2 * i, 3 * i, 0, 0, 1] for i in range(1000)]
+        self.obj.curves = [('Curve 1', self.obj.points[:10]), ('Curve 2', self.obj.points[10:15])]
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        self.part = self.rdk.Item('Part')
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_points(self):
+        points, name = self.part.GetPoints(robolink.FEATURE_OBJECT_MESH)
+        self.assertEqual((points, name), (self.obj.points, 'Mesh'))
+
+        stream = self.part.GetPointsStream(chunk_size=300)
+        chunks = list(stream)
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        self.assertEqual(sum(chunks, []), self.obj.points)
+        self.assertEqual(stream.name, 'Mesh')
+        self.assertEqual(stream.shape, (6, 1000))
+
+    def test_curves(self):
+        curves = self.part.GetCurves()
+        self.assertEqual([name for points, name in curves], ['Curve 1', 'Curve 2'])
+        self.assertEqual(curves[1][0].tr().rows, self.obj.points[10:15])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy(self):
+        points, name = self.part.GetPoints(robolink.FEATURE_OBJECT_MESH, as_numpy=True)
+        self.assertEqual(points.shape, (1000, 6))
+        self.assertTrue(points.flags.c_contiguous)
+        self.assertTrue(np.array_equal(points, self.obj.points))
+
+        with self.part.GetPointsStream(chunk_size=400, as_numpy=True) as stream:
+            chunks = list(stream)
+        self.assertEqual([chunk.shape for chunk in chunks], [(400, 6), (400, 6), (200, 6)])
+        self.assertTrue(np.array_equal(np.vstack(chunks), self.obj.points))
+
+        curves = self.part.GetCurves(as_numpy=True)
+        self.assertEqual([points.shape for points, name in curves], [(10, 6), (5, 6)])
+        self.assertTrue(np.array_equal(curves[0][0], self.obj.points[:10]))
+
+        self.rdk.BUILD = 20000
+        curves = self.part.GetCurves(as_numpy=True)
+        self.assertEqual([points.shape for points, name in curves], [(10, 6), (5, 6)])
+
+        item, feature_type, feature_id, name, points = self.rdk.GetPoints(robolink.FEATURE_HOVER_OBJECT_MESH, as_numpy=True)
+        self.assertEqual(item, self.part)
+        self.assertTrue(np.array_equal(points, self.obj.points))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Test the station tree snapshot against a fake RoboDK API server"""
+import unittest
+
+from robodk import robolink, robolinkutils, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_STATION, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT
+
+
+class TestTreeSnapshot(unittest.TestCase):
+
+    window = None
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.frame2 = self.server.add_item('Frame 2', ITEM_TYPE_FRAME, self.frame)
+        self.parts = [self.server.add_item('Part %i' % i, ITEM_TYPE_OBJECT, self.frame2 if i % 2 else self.frame) for i in range(300)]
+        self.frame.pose = sum(robomath.transl(10, 0, 0).Cols(), [])
+        self.frame2.pose = sum(robomath.rotz(0.5).Cols(), [])
+        self.parts[1].visible = 0
+        self.parts[1].pose = sum(robomath.transl(0, 0, 5).Cols(), [])
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        if self.window is not None:
+            self.rdk.BATCH_WINDOW = self.window
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_snapshot(self):
+        tree = self.rdk.TreeSnapshot()
+        self.assertEqual(len(tree), 303)
+        station = tree.ItemList(ITEM_TYPE_STATION)[0]
+        frame = tree.Item('Frame 1')
+        part = tree.Item('Part 1', ITEM_TYPE_OBJECT)
+        self.assertEqual(station.item, self.server.station.ptr)
+        self.assertEqual(tree.Name(part), 'Part 1')
+        self.assertEqual(tree.Type(part), ITEM_TYPE_OBJECT)
+        self.assertEqual(tree.Parent(part), tree.Item('Frame 2'))
+        self.assertEqual(tree.Parent(frame), station)
+        self.assertFalse(tree.Parent(station).Valid())
+        self.assertEqual(tree.Pose(part), robomath.transl(0, 0, 5))
+        self.assertEqual(tree.Visible(part), 0)
+        self.assertEqual(tree.Visible(frame), 1)
+        self.assertEqual(len(tree.Childs(frame)), 151)
+        self.assertEqual(len(tree.ItemList(ITEM_TYPE_OBJECT)), 300)
+        self.assertEqual(tree.ItemList(ITEM_TYPE_FRAME, True), ['Frame 1', 'Frame 2'])
+        self.assertFalse(tree.Item('Unknown').Valid())
+        self.assertIn(part, tree)
+        with self.assertRaises(robolink.InputError):
+            tree.Name(robolink.Item(self.rdk, 1))
+
+    def test_robolinkutils(self):
+        tree = self.rdk.TreeSnapshot()
+        part1 = tree.Item('Part 1')
+        part2 = tree.Item('Part 2')
+        ncommands = len(self.server.commands)
+        self.assertEqual(robolinkutils.getAncestors(part1, snapshot=tree), [tree.Item('Frame 2'), tree.Item('Frame 1'), tree.ItemList(ITEM_TYPE_STATION)[0]])
+        self.assertEqual(robolinkutils.getAncestors(part1, [ITEM_TYPE_FRAME], snapshot=tree), [tree.Item('Frame 2'), tree.Item('Frame 1')])
+        self.assertEqual(robolinkutils.getLowestCommonAncestor(part1, part2, snapshot=tree), tree.Item('Frame 1'))
+        pose = robolinkutils.getAncestorPose(part1, tree.Item('Frame 1'), snapshot=tree)
+        self.assertEqual(pose, robomath.rotz(0.5) * robomath.transl(0, 0, 5))
+        self.assertEqual(len(self.server.commands), ncommands)
+
+        # Same results without the snapshot
+        self.assertEqual(robolinkutils.getAncestorPose(part1, tree.Item('Frame 1')), pose)
+        self.assertEqual(robolinkutils.getLowestCommonAncestor(part1, part2), tree.Item('Frame 1'))
+
+    def test_errors(self):
+        self.parts[10].valid = False
+        with self.assertRaises(robolink.PipelineError) as ctx:
+            self.rdk.TreeSnapshot()
+        self.assertEqual(len(ctx.exception.errors), 1)
+        self.assertEqual(ctx.exception.errors[0][0], 'Name')
+        self.assertEqual(ctx.exception.errors[0][1].item, self.parts[10].ptr)
+
+        # The replies of the other items were received
+        frame = self.rdk.Item('Frame 1')
+        self.assertEqual(frame.Name(), 'Frame 1')
+        self.assertEqual(frame.Type(), ITEM_TYPE_FRAME)
+
+
+class TestTreeSnapshotWindow(TestTreeSnapshot):
+    """Same tests with a small number of requests in flight"""
+
+    window = 3
+
+
+if __name__ == '__main__':
+    unittest.main()
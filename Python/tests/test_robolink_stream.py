@@ -0,0 +1,57 @@
+"""Test the joint list stream of programs against a fake RoboDK API server"""
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_PROGRAM
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestJointListStream(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.server.add_item('Prog', ITEM_TYPE_PROGRAM, self.server.station)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        self.program = self.rdk.Item('Prog')
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def test_chunks(self):
+        message, expected, status = self.program.InstructionListJoints()
+        stream = self.program.InstructionListJointsStream(chunk_size=30)
+        chunks = list(stream)
+        self.assertEqual([chunk.size() for chunk in chunks], [(10, 30), (10, 30), (10, 30), (10, 10)])
+        self.assertEqual(stream.shape, (10, 100))
+        self.assertEqual(sum([chunk.tr().rows for chunk in chunks], []), expected.tr().rows)
+        self.assertEqual((stream.message, stream.status), (message, status))
+        self.assertIsNone(stream.link)
+        self.assertEqual(list(stream), [])
+
+    def test_early_stop(self):
+        with self.program.InstructionListJointsStream(chunk_size=10) as stream:
+            for chunk in stream:
+                # The main connection can be used while the chunks are processed
+                self.assertEqual(self.program.Name(), 'Prog')
+                break
+        self.assertIsNone(stream.link)
+        self.assertIsNone(stream.status)
+        self.assertEqual(self.program.InstructionListJoints()[2], 100)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy(self):
+        expected = self.program.InstructionListJoints(as_numpy=True)[1]
+        chunks = list(self.program.InstructionListJointsStream(chunk_size=64, as_numpy=True))
+        self.assertEqual([chunk.shape for chunk in chunks], [(10, 64), (10, 36)])
+        self.assertTrue(np.array_equal(np.hstack(chunks), expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
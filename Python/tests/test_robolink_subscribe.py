@@ -0,0 +1,80 @@
+"""Test the robot telemetry subscription against a fake RoboDK API server"""
+import threading
+import unittest
+
+from robodk import robolink, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_ROBOT
+
+
+class TestSubscribe(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.robot = self.server.add_item('Robot', ITEM_TYPE_ROBOT, frame)
+        self.robot.joints = [0.0] * 6
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def move(self, joints):
+        """Moves the fake robot and reports the movement"""
+        self.robot.joints = joints
+        self.robot.pose = sum(robomath.transl(*joints[:3]).Cols(), [])
+        self.server.send_event(robolink.EVENT_ROBOT_MOVED, self.robot)
+
+    def test_iterate(self):
+        robot = self.rdk.Item('Robot')
+        with self.rdk.Subscribe([robot], ['joints', 'pose', 'speed'], rate_hz=20) as subscription:
+            samples = iter(subscription)
+            first = next(samples)
+            self.assertEqual(first['joints'][0].list(), [0.0] * 6)
+            self.assertEqual(first['speed'][0], [0.0] * 6)
+
+            self.move([10.0, 0, 0, 0, 0, 0])
+            sample = next(samples)
+            self.assertEqual(sample['joints'][0].list()[0], 10.0)
+            self.assertEqual(sample['pose'][0], robomath.transl(10, 0, 0))
+            self.assertGreater(sample['speed'][0][0], 0)
+            self.assertGreaterEqual(sample['time'] - first['time'], 1 / 20 * 0.9)
+
+            # One more sample after the robot stops
+            sample = next(samples)
+            self.assertEqual(sample['speed'][0], [0.0] * 6)
+
+        # The iteration stops when the subscription is closed
+        self.assertEqual(list(samples), [])
+
+    def test_callback(self):
+        robot = self.rdk.Item('Robot')
+        received = []
+        done = threading.Event()
+
+        def callback(sample):
+            received.append(sample)
+            if len(received) >= 3:
+                done.set()
+
+        subscription = self.rdk.Subscribe([robot], ['joints'], rate_hz=100, callback=callback)
+        try:
+            self.move([1.0, 2.0, 3.0, 0, 0, 0])
+            self.assertTrue(done.wait(5))
+        finally:
+            subscription.Close()
+        self.assertNotIn('pose', received[0])
+        self.assertEqual(received[-1]['joints'][0].list()[:3], [1.0, 2.0, 3.0])
+
+        # The connection of the subscription does not block this instance
+        self.assertEqual(self.rdk.Item('Robot').Name(), 'Robot')
+
+    def test_invalid(self):
+        with self.assertRaises(robolink.InputError):
+            self.rdk.Subscribe([], ['torque'])
+
+
+if __name__ == '__main__':
+    unittest.main()
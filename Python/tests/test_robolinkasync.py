@@ -0,0 +1,95 @@
+"""Test the asyncio RoboDK API client against a fake RoboDK API server"""
+import asyncio
+import unittest
+
+from robodk import robolink, robomath
+from robodk.robolinkasync import AsyncRobolink, AsyncItem
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_ROBOT
+
+
+class TestAsyncRobolink(unittest.IsolatedAsyncioTestCase):
+
+    connections = 1
+
+    async def asyncSetUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.robot = self.server.add_item('Robot', ITEM_TYPE_ROBOT, self.frame)
+        self.robot.joints = [0.0] * 6
+        self.rdk = AsyncRobolink('127.0.0.1', self.server.port, connections=self.connections)
+        await self.rdk.Connect()
+
+    async def asyncTearDown(self):
+        await self.rdk.Disconnect()
+        self.server.stop()
+
+    async def test_items(self):
+        items = await self.rdk.ItemList()
+        self.assertEqual([i.item for i in items], [self.frame.ptr, self.robot.ptr])
+        self.assertEqual(await self.rdk.ItemList(list_names=True), ['Frame 1', 'Robot'])
+        robot = await self.rdk.Item('', ITEM_TYPE_ROBOT)
+        self.assertIsInstance(robot, AsyncItem)
+        self.assertEqual(robot.type, ITEM_TYPE_ROBOT)
+        self.assertEqual(await robot.Name(), 'Robot')
+        self.assertFalse((await self.rdk.Item('Missing')).Valid())
+
+    async def test_pose(self):
+        frame = await self.rdk.Item('Frame 1')
+        pose = robomath.transl(10, 20, 30) * robomath.rotz(0.5)
+        self.assertIs(await frame.setPose(pose), frame)
+        self.assertEqual(await frame.Pose(), pose)
+
+    async def test_concurrent(self):
+        # Many requests in flight: replies must be matched to their requests
+        frame = await self.rdk.Item('Frame 1')
+        robot = await self.rdk.Item('Robot')
+        poses = [robomath.transl(i, 0, 0) for i in range(50)]
+        results = await asyncio.gather(*[robot.SolveIK(p) for p in poses], frame.Name(), robot.Name())
+        for pose, joints in zip(poses, results[:50]):
+            self.assertEqual(joints.list(), [pose[0, 3], 0, 0, 0, 0, 0])
+        self.assertEqual(results[50:], ['Frame 1', 'Robot'])
+
+    async def test_move(self):
+        robot = await self.rdk.Item('Robot')
+        await robot.MoveJ([10, 20, 30, 40, 50, 60])
+        self.assertEqual((await robot.Joints()).list(), [10, 20, 30, 40, 50, 60])
+        await robot.setJoints([1, 2, 3, 4, 5, 6])
+        self.assertEqual((await robot.Joints()).list(), [1, 2, 3, 4, 5, 6])
+        joints = await robot.SolveIK(robomath.transl(1, 2, 3), [0] * 6, tool=robomath.eye(4))
+        self.assertEqual(joints.list(), [1, 2, 3, 0, 0, 0])
+
+    async def test_instruction_list(self):
+        robot = await self.rdk.Item('Robot')
+        msg, joint_list, status = await robot.InstructionListJoints()
+        self.assertEqual((msg, status), ('Success', 100))
+        self.assertEqual(joint_list.size(), (10, 100))
+        self.assertEqual(joint_list[3, 2], 23)
+
+    async def test_error(self):
+        invalid = AsyncItem(self.rdk, 12345, ITEM_TYPE_FRAME)
+        frame = await self.rdk.Item('Frame 1')
+        results = await asyncio.gather(invalid.setPose(robomath.eye(4)), frame.Name(), return_exceptions=True)
+        self.assertIsInstance(results[0], Exception)
+        self.assertEqual(results[1], 'Frame 1')
+
+    async def test_to_item(self):
+        robot = await self.rdk.Item('Robot')
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        try:
+            self.assertEqual(robot.toItem(rdk).Name(), 'Robot')
+        finally:
+            rdk.Disconnect()
+
+
+class TestAsyncRobolinkConnections(TestAsyncRobolink):
+    """Same tests with more than one API socket"""
+
+    connections = 3
+
+    async def test_connections(self):
+        self.assertEqual(len(self.rdk._conns), 3)
+        self.assertEqual(self.server.connections, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
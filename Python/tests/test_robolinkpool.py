@@ -0,0 +1,81 @@
+"""Test the pool of Robolink connections against a fake RoboDK API server"""
+import threading
+import time
+import unittest
+
+from robodk import robolink
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_ROBOT
+
+
+class TestRobolinkPool(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame 1', ITEM_TYPE_FRAME, self.server.station)
+        self.robot = self.server.add_item('Robot', ITEM_TYPE_ROBOT, self.frame)
+        self.robot.joints = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        self.pool = robolink.RobolinkPool(3, robodk_ip='127.0.0.1', port=self.server.port)
+        return super().setUp()
+
+    def tearDown(self):
+        self.pool.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def run_threads(self, target, nthreads):
+        threads = [threading.Thread(target=target) for i in range(nthreads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def test_connections(self):
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.server.connections, 3)
+        self.assertEqual(self.server.commands.count('RDK_API'), 3)
+
+    def test_items_bound_to_pool(self):
+        robot = self.pool.Item('Robot')
+        self.assertIs(robot.link, self.pool)
+        self.assertIs(robot.RDK(), self.pool)
+        self.assertEqual(robot.Joints().list(), self.robot.joints)
+        self.assertTrue(all(item.link is self.pool for item in self.pool.ItemList()))
+
+    def test_thread_links(self):
+        robot = self.pool.Item('Robot')
+        links = []
+        barrier = threading.Barrier(3)
+
+        def worker():
+            barrier.wait()
+            links.append(self.pool.Link())
+            self.assertEqual(robot.Name(), 'Robot')
+            barrier.wait()  # keep the connection until all threads got one
+
+        self.run_threads(worker, 3)
+        self.assertEqual(len(set(id(link) for link in links)), 3)
+
+    def test_parallel(self):
+        # Each command takes 50 ms: threads on different connections must not wait for each other
+        self.server.delay = 0.05
+        robot = self.pool.Item('Robot')
+
+        def worker():
+            for i in range(4):
+                self.assertEqual(robot.Joints().list(), self.robot.joints)
+
+        t0 = time.time()
+        self.run_threads(worker, 3)
+        self.assertLess(time.time() - t0, 3 * 4 * 0.05 * 0.75)
+
+    def test_release(self):
+        link = self.pool.Link()
+        self.assertIs(self.pool.Link(), link)
+        self.pool.Release()
+        self.assertEqual(sum(self.pool._pool_threads), 0)
+        self.pool.Link()
+        self.assertEqual(sum(self.pool._pool_threads), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+"""Test the batched tree utilities and the parallel projection of robolinkutils against a fake RoboDK API server"""
+import time
+import unittest
+
+from robodk import robolink, robolinkutils, robomath
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME, ITEM_TYPE_OBJECT, ITEM_TYPE_ROBOT
+
+
+class TestPosesWrt(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.frame = self.server.add_item('Frame A', ITEM_TYPE_FRAME, self.server.station)
+        self.frame.pose = sum(robomath.transl(100, 0, 0).Cols(), [])
+        self.robot = self.server.add_item('Robot', ITEM_TYPE_ROBOT, self.frame)
+        self.robot.joints = [10.0, 20.0, 30.0, 0.0, 0.0, 0.0]
+        self.tool = self.server.add_item('Tool', robolink.ITEM_TYPE_TOOL, self.robot)
+        self.tool.pose_tool = sum(robomath.transl(0, 0, 50).Cols(), [])
+        self.camera = self.server.add_item('Camera', ITEM_TYPE_FRAME, self.server.station)
+        self.camera.pose = sum((robomath.transl(0, 200, 0) * robomath.rotz(0.5)).Cols(), [])
+        self.parts = []
+        for i in range(50):
+            part = self.server.add_item('Part %i' % i, ITEM_TYPE_OBJECT, self.frame)
+            part.pose = sum(robomath.transl(i, 2 * i, 0).Cols(), [])
+            self.parts.append(part)
+        self.rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=self.server.port)
+        return super().setUp()
+
+    def tearDown(self):
+        self.rdk.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def assertPoseAlmostEqual(self, a, b):
+        for row_a, row_b in zip(a.rows, b.rows):
+            for va, vb in zip(row_a, row_b):
+                self.assertAlmostEqual(va, vb, places=9)
+
+    def test_poses_wrt(self):
+        parts = self.rdk.ItemList(ITEM_TYPE_OBJECT)
+        tool = self.rdk.Item('Tool')
+        camera = self.rdk.Item('Camera')
+        camera_inv = robomath.invH(robomath.transl(0, 200, 0) * robomath.rotz(0.5))
+        tool_abs = robomath.transl(100, 0, 0) * robomath.transl(10, 20, 30) * robomath.transl(0, 0, 50)
+
+        ncommands = len(self.server.commands)
+        poses = robolinkutils.getPosesWrt(parts + [tool, camera], camera)
+        self.assertLess(len(self.server.commands) - ncommands, len(parts) + 15)
+
+        self.assertEqual(len(poses), len(parts) + 2)
+        for i, pose in enumerate(poses[:len(parts)]):
+            self.assertPoseAlmostEqual(pose, camera_inv * robomath.transl(100 + i, 2 * i, 0))
+        self.assertPoseAlmostEqual(poses[-2], camera_inv * tool_abs)
+        self.assertEqual(poses[-1], robomath.eye(4))
+
+        # Same results as the single pose functions
+        self.assertPoseAlmostEqual(robolinkutils.getPoseWrt(tool, camera), poses[-2])
+        self.assertPoseAlmostEqual(robolinkutils.getPoseWrt(camera, tool), robomath.invH(poses[-2]))
+        self.assertPoseAlmostEqual(robolinkutils.getPoseWrt(parts[3], camera), poses[3])
+        self.assertPoseAlmostEqual(robolinkutils.getAncestorPose(tool, self.rdk.Item('Frame A')), robomath.transl(10, 20, 80))
+        self.assertIsNone(robolinkutils.getAncestorPose(tool, camera))
+
+    def test_snapshot(self):
+        tree = self.rdk.TreeSnapshot()
+        parts = tree.ItemList(ITEM_TYPE_OBJECT)
+        camera = tree.Item('Camera')
+        expected = robolinkutils.getPosesWrt(parts, camera)
+
+        # Only the absolute poses are requested
+        ncommands = len(self.server.commands)
+        poses = robolinkutils.getPosesWrt(parts, camera, snapshot=tree)
+        self.assertEqual(len(self.server.commands) - ncommands, len(parts) + 1)
+        self.assertEqual(poses, expected)
+
+    def test_errors(self):
+        parts = self.rdk.ItemList(ITEM_TYPE_OBJECT)
+        camera = self.rdk.Item('Camera')
+        self.parts[3].valid = False
+        with self.assertRaises(robolink.PipelineError) as ctx:
+            robolinkutils.getPosesWrt(parts, camera)
+        self.assertEqual(len(ctx.exception.errors), 1)
+        self.assertEqual(ctx.exception.errors[0][0], 'G_Hlocal_Abs')
+        self.assertEqual(ctx.exception.errors[0][1], parts[3])
+
+        # The replies of the other requests were received
+        self.assertEqual(camera.Name(), 'Camera')
+        self.assertEqual(camera.Pose(), robomath.transl(0, 200, 0) * robomath.rotz(0.5))
+
+
+class TestProjectPoints(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeRoboDK().start()
+        self.server.add_item('Part', ITEM_TYPE_OBJECT, self.server.station)
+        self.pool = robolink.RobolinkPool(3, robodk_ip='127.0.0.1', port=self.server.port)
+        self.part = self.pool.Item('Part')
+        # Points with a negative X can't be projected by the fake server
+        self.points = [[float(i % 50 - 5), float(i), 10.0, 0.0, 0.0, -1.0] for i in range(1000)]
+        return super().setUp()
+
+    def tearDown(self):
+        self.pool.Disconnect()
+        self.server.stop()
+        return super().tearDown()
+
+    def check(self, projected, mask):
+        self.assertEqual(len(mask), 1000)
+        for point, valid, projection in zip(self.points, mask, projected):
+            self.assertEqual(bool(valid), point[0] >= 0)
+            if valid:
+                self.assertEqual(list(projection), point[:2] + [0.0] + point[3:])
+            else:
+                self.assertTrue(all(v != v for v in projection))
+
+    def test_project(self):
+        reports = []
+        ncommands = len(self.server.commands)
+        projected, mask = robolinkutils.projectPoints(self.pool, self.points, self.part, chunk_size=64, progress=lambda done, total: reports.append((done, total)))
+        self.check(projected, mask)
+        self.assertEqual(self.server.commands[ncommands:].count('ProjectPoints'), 16)
+        self.assertEqual(sorted(reports)[-1], (1000, 1000))
+        self.assertEqual(len(reports), 16)
+
+        # Matrices and a single connection
+        projected, mask = robolinkutils.projectPoints(self.pool.Links()[0], robomath.Mat(self.points).tr(), self.part, chunk_size=300)
+        self.assertEqual(projected.size(), (6, 1000))
+        self.check(projected.tr().rows, mask)
+
+        with self.assertRaises(robolink.InputError):
+            robolinkutils.projectPoints(self.pool, self.points, [self.part])
+
+    def test_numpy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('NumPy is not installed')
+        projected, mask = robolinkutils.projectPoints(self.pool, np.array(self.points), self.part, chunk_size=100)
+        self.assertIsInstance(mask, np.ndarray)
+        self.check(projected, mask)
+
+    def test_timeout(self):
+        try:
+            import numpy as np
+            inputs = [self.points, np.array(self.points)]
+        except ImportError:
+            inputs = [self.points]
+
+        # The first connection is linked to a server that does not reply in time
+        slow_server = SlowProjectionRoboDK().start()
+        slow_server.add_item('Part', ITEM_TYPE_OBJECT, slow_server.station)
+        try:
+            for points in inputs:
+                slow_link = robolink.Robolink(robodk_ip='127.0.0.1', port=slow_server.port)
+                slow_link._setTimeout(0.2)
+                links = [slow_link] + self.pool.Links()
+                objects = [slow_link.Item('Part')] + [self.part] * len(self.pool.Links())
+                failed_chunks = []
+                try:
+                    projected, mask = robolinkutils.projectPoints(links, points, objects, chunk_size=64, timeout=0.2, failed_chunks=failed_chunks)
+                    # The connection that timed out was reconnected
+                    self.assertEqual(slow_link.Item('Part').Name(), 'Part')
+                finally:
+                    slow_link.Disconnect()
+
+                self.assertEqual(len(failed_chunks), 1)
+                start, end, error = failed_chunks[0]
+                self.assertEqual(end - start, 64)
+                self.assertIsInstance(error, OSError)
+                self.assertFalse(any(mask[start:end]))
+                self.assertTrue(all(v != v for v in projected[start]))
+                self.assertEqual(sum(1 for valid in mask if valid), sum(1 for point in self.points if point[0] >= 0) - sum(1 for point in self.points[start:end] if point[0] >= 0))
+        finally:
+            slow_server.stop()
+
+    def test_wrong_size(self):
+        server = ShortProjectionRoboDK().start()
+        server.add_item('Part', ITEM_TYPE_OBJECT, server.station)
+        link = robolink.Robolink(robodk_ip='127.0.0.1', port=server.port)
+        try:
+            failed_chunks = []
+            projected, mask = robolinkutils.projectPoints(link, self.points, link.Item('Part'), chunk_size=64, failed_chunks=failed_chunks)
+        finally:
+            link.Disconnect()
+            server.stop()
+
+        # The first chunk is missing one point (a single connection projects the chunks in order)
+        self.assertEqual([chunk[:2] for chunk in failed_chunks], [(0, 64)])
+        self.assertFalse(any(mask[:64]))
+        self.assertEqual(sum(1 for valid in mask if valid), sum(1 for point in self.points[64:] if point[0] >= 0))
+
+
+class ShortProjectionRoboDK(FakeRoboDK):
+    """Fake server that drops the last projected point of the first ProjectPoints request"""
+
+    def cmd_ProjectPoints(self, conn):
+        first = self.commands.count('ProjectPoints') == 1
+        send_matrix = conn.send_matrix
+        conn.send_matrix = lambda n1, n2, values: send_matrix(n1, n2 - 1, values[:n1 * (n2 - 1)]) if first else send_matrix(n1, n2, values)
+        try:
+            super().cmd_ProjectPoints(conn)
+        finally:
+            del conn.send_matrix
+
+
+class SlowProjectionRoboDK(FakeRoboDK):
+    """Fake server that replies to ProjectPoints after 1 second"""
+
+    def cmd_ProjectPoints(self, conn):
+        time.sleep(1)
+        super().cmd_ProjectPoints(conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Test that the NumPy and the pure Python implementations of Mat give the same results"""
+import unittest
+
+from robodk import robomath
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def operations():
+    """Run Mat operations and return the results as lists"""
+    pose1 = robomath.transl(10, 20, 30) * robomath.rotx(0.3) * robomath.roty(-0.2)
+    pose2 = robomath.KUKA_2_Pose([100, -50, 300, 10, 20, 30])
+    results = []
+    results.append((pose1 * pose2).rows)
+    results.append(pose1.invH().rows)
+    results.append((pose1 * pose1.invH()).rows)
+    results.append(pose1.tr().rows)
+    results.append(pose1[0:3, 0:3].rows)
+    results.append(pose1[1].rows)
+    results.append(pose1[:, 3].rows)
+    results.append(pose1[-1, :].rows)
+    results.append(pose1[0, 3])
+    results.append((pose1 + pose2).rows)
+    results.append((pose1 - pose2).rows)
+    results.append((pose1 * 2.0).rows)
+    results.append(pose1 * [1, 2, 3])
+    results.append(pose1 * [1, 2, 3, 1])
+    results.append(pose1.Pos() + pose1.VX() + pose1.VY() + pose1.VZ())
+    results.append(robomath.Pose_2_TxyzRxyz(pose1 * pose2))
+    results.append(robomath.pose_2_quaternion(pose2.invH()))
+    results.append(pose1.catV(pose2).catH(robomath.Mat(8, 1)).rows)
+    results.append(robomath.Mat([[1, 2, 3], [4, 5, 6]]).tr().list2())
+    results.append([pose.rows for pose in robomath.Pose_Split(pose1, pose2, 100)])
+
+    pose3 = pose1 * pose2
+    pose3.setPos([1, 2, 3])
+    pose3[0:3, 0:3] = robomath.rotz(0.5)[0:3, 0:3]
+    pose3[3, 3] = 1
+    results.append(pose3.rows)
+    results.append(pose1 == pose1 * robomath.eye(4))
+    return results
+
+
+class TestMatBackend(unittest.TestCase):
+
+    def tearDown(self):
+        robomath.setMatBackend()
+        return super().tearDown()
+
+    def assertAlmostEqualNested(self, a, b):
+        if isinstance(a, list):
+            self.assertEqual(len(a), len(b))
+            for ai, bi in zip(a, b):
+                self.assertAlmostEqualNested(ai, bi)
+        else:
+            self.assertAlmostEqual(a, b, places=9)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_same_results(self):
+        robomath.setMatBackend('list')
+        self.assertEqual(robomath.getMatBackend(), 'list')
+        expected = operations()
+        robomath.setMatBackend('numpy')
+        self.assertEqual(robomath.getMatBackend(), 'numpy')
+        self.assertAlmostEqualNested(operations(), expected)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_rows(self):
+        robomath.setMatBackend('numpy')
+        pose = robomath.transl(1, 2, 3) * robomath.rotz(0.1)
+        # Rows are lists of Python floats and can be modified in place
+        rows = pose.rows
+        self.assertIsInstance(rows, list)
+        self.assertIsInstance(rows[0], list)
+        self.assertIs(type(rows[0][3]), float)
+        rows[0][3] = 50
+        self.assertEqual(pose.Pos(), [50, 2, 3])
+        self.assertEqual((pose * robomath.eye(4)).Pos(), [50, 2, 3])
+
+        mat = robomath.Mat.fromNumpy(numpy.arange(6.0).reshape(2, 3))
+        self.assertEqual(mat.size(), (2, 3))
+        self.assertEqual(mat.rows, [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(mat.tr().toNumpy().shape, (3, 2))
+
+    def test_add_operands(self):
+        backends = ['list', 'numpy'] if numpy is not None else ['list']
+        for backend in backends:
+            robomath.setMatBackend(backend)
+            mat = robomath.Mat([[1, 2], [3, 4]])
+            self.assertEqual((mat + mat).rows, [[2, 4], [6, 8]])
+            self.assertEqual((mat - 1).rows, [[0, 1], [2, 3]])
+            # No broadcasting: vectors and matrices of a different size are rejected
+            for other in [[1, 2], robomath.Mat([[1, 2]])]:
+                with self.assertRaises(Exception):
+                    mat + other
+                with self.assertRaises(Exception):
+                    mat - other
+
+    def test_list_backend(self):
+        robomath.setMatBackend('list')
+        pose = robomath.transl(1, 2, 3) * robomath.rotz(0.1)
+        self.assertIsNone(pose._a)
+        self.assertEqual(pose.invH().invH(), pose)
+
+
+if __name__ == '__main__':
+    unittest.main()
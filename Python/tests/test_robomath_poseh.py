@@ -0,0 +1,80 @@
+"""Test the PoseH compact pose class against Mat"""
+import struct
+import unittest
+
+from robodk import robolink, robomath
+from robodk.robomath import PoseH
+from fake_robodk import FakeRoboDK, ITEM_TYPE_FRAME
+
+
+class TestPoseH(unittest.TestCase):
+
+    def setUp(self):
+        self.mat1 = robomath.transl(10, 20, 30) * robomath.rotx(0.3) * robomath.roty(-0.2)
+        self.mat2 = robomath.KUKA_2_Pose([100, -50, 300, 10, 20, 30])
+        self.pose1 = PoseH(self.mat1)
+        self.pose2 = PoseH(self.mat2)
+        return super().setUp()
+
+    def assertPoseAlmostEqual(self, a, b):
+        for row_a, row_b in zip(a.rows, b.rows):
+            for va, vb in zip(row_a, row_b):
+                self.assertAlmostEqual(va, vb, places=9)
+
+    def test_operations(self):
+        self.assertPoseAlmostEqual(self.pose1 * self.pose2, self.mat1 * self.mat2)
+        self.assertPoseAlmostEqual(self.pose1.invH(), self.mat1.invH())
+        self.assertPoseAlmostEqual(self.pose1 * self.pose1.invH(), robomath.eye(4))
+        self.assertPoseAlmostEqual(self.pose1.tr(), self.mat1.tr())
+        self.assertEqual(self.pose1.Pos(), self.mat1.Pos())
+        self.assertEqual(self.pose1.VX() + self.pose1.VY() + self.pose1.VZ(), self.mat1.VX() + self.mat1.VY() + self.mat1.VZ())
+        self.assertEqual(self.pose1[1, 3], self.mat1[1, 3])
+        self.assertEqual(self.pose1.size(), (4, 4))
+        self.assertTrue(self.pose1.isHomogeneous())
+        self.assertEqual(self.pose1, self.mat1)
+        for a, b in zip(self.pose1 * [1, 2, 3], self.mat1 * [1, 2, 3]):
+            self.assertAlmostEqual(a, b)
+
+        pose = self.pose1.copy()
+        pose.setPos([1, 2, 3])
+        pose[0, 0] = 5
+        self.assertEqual(pose.Pos(), [1, 2, 3])
+        self.assertEqual(pose[0, 0], 5)
+        self.assertEqual(self.pose1.Pos(), self.mat1.Pos())
+
+    def test_mat_interop(self):
+        # Products with homogeneous matrices return a PoseH
+        self.assertIsInstance(self.pose1 * self.mat2, PoseH)
+        self.assertIsInstance(self.mat1 * self.pose2, PoseH)
+        self.assertPoseAlmostEqual(self.pose1 * self.mat2, self.mat1 * self.mat2)
+        self.assertPoseAlmostEqual(self.mat1 * self.pose2, self.mat1 * self.mat2)
+        self.assertPoseAlmostEqual(robomath.invH(self.pose1), self.mat1.invH())
+        self.assertPoseAlmostEqual(robomath.RelTool(self.pose1, 10, 0, 5, rz=30), robomath.RelTool(self.mat1, 10, 0, 5, rz=30))
+        self.assertIsInstance(self.pose1.toMat(), robomath.Mat)
+        self.assertEqual(self.pose1.toMat(), self.mat1)
+
+    def test_bytes(self):
+        data = struct.pack('>16d', *[self.mat1[i, j] for j in range(4) for i in range(4)])
+        self.assertEqual(self.pose1.toBytes(), data)
+        self.assertEqual(len(data), 128)
+        self.assertEqual(PoseH.fromBytes(data).rows, self.mat1.rows)
+
+    def test_robolink(self):
+        server = FakeRoboDK().start()
+        server.add_item('Frame 1', ITEM_TYPE_FRAME, server.station)
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=server.port)
+        try:
+            frame = rdk.Item('Frame 1')
+            frame.setPose(self.pose1)
+            self.assertIsInstance(frame.Pose(), robomath.Mat)
+            rdk.POSEH = True
+            pose = frame.Pose()
+            self.assertIsInstance(pose, PoseH)
+            self.assertEqual(pose.rows, self.mat1.rows)
+        finally:
+            rdk.Disconnect()
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""Test the mesh readers and tools of robomesh"""
+import os
+import struct
+import tempfile
+import unittest
+
+from robodk import robolink, robomath
+
+try:
+    import numpy as np
+    from robodk import robomesh
+except ImportError:
+    np = None
+
+# Unit cube: 8 corners and 12 triangles (counter clockwise seen from outside)
+CORNERS = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+FACES = [[0, 2, 1], [0, 3, 2], [4, 5, 6], [4, 6, 7], [0, 1, 5], [0, 5, 4], [1, 2, 6], [1, 6, 5], [2, 3, 7], [2, 7, 6], [3, 0, 4], [3, 4, 7]]
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestRoboMesh(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cube = robomesh.Mesh(np.array(CORNERS, dtype=float), FACES)
+        return super().setUp()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        return super().tearDown()
+
+    def path(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as fid:
+            fid.write(data)
+        return path
+
+    def assertCube(self, mesh):
+        self.assertEqual(len(mesh), 12)
+        self.assertTrue(np.allclose(mesh.triangles(), self.cube.triangles()))
+
+    def test_mesh(self):
+        cube = self.cube
+        self.assertEqual(cube.triangles().shape, (36, 3))
+        triangles = cube.triangles(normals=True)
+        self.assertEqual(triangles.shape, (36, 6))
+        self.assertTrue(np.allclose(triangles[:3, 3:], [0, 0, -1]))
+        self.assertTrue(np.allclose(cube.faceAreas(), 0.5))
+        self.assertTrue(np.allclose(cube.bounds(), [[0, 0, 0], [1, 1, 1]]))
+
+        # Normals point outwards
+        normals = cube.vertexNormals()
+        self.assertTrue(np.allclose(np.linalg.norm(normals, axis=1), 1))
+        self.assertTrue(np.all(np.sum((np.array(CORNERS) - 0.5) * normals, axis=1) > 0.5))
+        centers = triangles[:, :3].reshape(-1, 3, 3).mean(axis=1)
+        self.assertTrue(np.all(np.sum((centers - 0.5) * cube.faceNormals(), axis=1) > 0))
+
+        moved = cube.transform(robomath.transl(10, 0, 0) * robomath.rotz(np.pi / 2))
+        self.assertTrue(np.allclose(moved.bounds(), [[9, 0, 0], [10, 1, 1]]))
+
+    def test_weld(self):
+        soup = robomesh.Mesh.fromTriangles(self.cube.triangles())
+        self.assertIsNone(soup.faces)
+        self.assertEqual(soup.vertices.shape, (36, 3))
+        welded = soup.weld()
+        self.assertEqual(welded.vertices.shape, (8, 3))
+        self.assertCube(welded)
+
+        # Close vertices are merged with a tolerance, collapsed triangles are removed
+        noisy = robomesh.Mesh(soup.vertices + np.random.default_rng(0).uniform(-1e-4, 1e-4, soup.vertices.shape))
+        self.assertEqual(noisy.weld().vertices.shape, (36, 3))
+        self.assertEqual(noisy.weld(0.01).vertices.shape, (8, 3))
+        self.assertEqual(len(robomesh.Mesh.fromTriangles(self.cube.triangles() * 1e-3).weld(0.01)), 0)
+
+        # Matrices used by AddShape
+        mat = robomath.Mat(self.cube.triangles(normals=True).tolist()).tr()
+        mesh = robomesh.Mesh.fromTriangles(mat)
+        self.assertEqual(mesh.normals.shape, (36, 3))
+        self.assertCube(mesh)
+
+    def test_decimate(self):
+        # Grid of 20x20 squares on the plane Z=0
+        n = 21
+        x, y = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+        corners = (y * n + x).astype(int)[:-1, :-1].ravel()
+        faces = np.concatenate([np.column_stack([corners, corners + 1, corners + n + 1]), np.column_stack([corners, corners + n + 1, corners + n])])
+        grid = robomesh.Mesh(np.column_stack([x.ravel(), y.ravel(), np.zeros(n * n)]), faces)
+        self.assertEqual(len(grid), 800)
+
+        coarse = grid.decimate(4)
+        self.assertLess(len(coarse), 100)
+        self.assertGreater(len(coarse), 0)
+        self.assertTrue(np.allclose(coarse.vertices[:, 2], 0))
+        self.assertTrue(np.all(coarse.faceNormals()[:, 2] > 0.99))
+        self.assertIs(grid.decimate(), grid)
+
+        for target in [400, 100, 10]:
+            mesh = grid.decimate(max_triangles=target)
+            self.assertLessEqual(len(mesh), target)
+            self.assertGreater(len(mesh), target // 4)
+        self.assertIs(grid.decimate(max_triangles=1000), grid)
+
+        # Normals are averaged
+        soup = robomesh.Mesh.fromTriangles(grid.triangles(normals=True))
+        self.assertTrue(np.allclose(soup.decimate(4).normals, [0, 0, 1]))
+
+    def test_downsample(self):
+        points = np.random.default_rng(1).uniform(0, 10, (5000, 3))
+        sampled = robomesh.downsamplePoints(points, 5)
+        self.assertEqual(sampled.shape, (8, 3))
+        self.assertTrue(np.allclose(np.sort(sampled[:, 0]), [2.5] * 4 + [7.5] * 4, atol=0.5))
+
+        normals = np.tile([0, 0, 2.0], (5000, 1))
+        sampled = robomesh.downsamplePoints(robomath.Mat(np.hstack([points, normals]).T.tolist()), 2)
+        self.assertEqual(sampled.shape, (125, 6))
+        self.assertTrue(np.allclose(sampled[:, 3:], [0, 0, 1]))
+
+    def test_stl(self):
+        path = os.path.join(self.tmp.name, 'cube.stl')
+        robomesh.writeSTL(path, self.cube)
+        self.assertEqual(os.path.getsize(path), 84 + 12 * 50)
+        mesh = robomesh.readMesh(path)
+        self.assertEqual(mesh.vertices.dtype, np.float32)
+        self.assertCube(mesh)
+
+        lines = ['solid cube']
+        for tri in self.cube.triangles().reshape(-1, 3, 3):
+            lines += ['facet normal 0 0 0', 'outer loop'] + ['vertex %g %g %g' % tuple(v) for v in tri] + ['endloop', 'endfacet']
+        lines.append('endsolid cube')
+        self.assertCube(robomesh.readSTL(self.path('ascii.stl', '\n'.join(lines).encode())))
+
+    def test_ply(self):
+        # Binary PLY with normals
+        header = ['ply', 'format binary_little_endian 1.0', 'comment cube', 'element vertex 8', 'property float x', 'property float y', 'property float z', 'property float nx', 'property float ny', 'property float nz', 'element face 12', 'property list uchar int vertex_indices', 'end_header']
+        data = ('\n'.join(header) + '\n').encode()
+        data += np.hstack([CORNERS, self.cube.vertexNormals()]).astype('<f4').tobytes()
+        data += b''.join(struct.pack('<B3i', 3, *face) for face in FACES)
+        mesh = robomesh.readPLY(self.path('cube.ply', data))
+        self.assertCube(mesh)
+        self.assertTrue(np.allclose(mesh.normals, self.cube.vertexNormals()))
+
+        # Big endian PLY with quads
+        quads = [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+        header = ['ply', 'format binary_big_endian 1.0', 'element vertex 8', 'property double x', 'property double y', 'property double z', 'element face 6', 'property list uchar int vertex_indices', 'end_header']
+        data = ('\n'.join(header) + '\n').encode() + np.array(CORNERS, dtype='>f8').tobytes()
+        data += b''.join(struct.pack('>B4i', 4, *quad) for quad in quads)
+        mesh = robomesh.readPLY(self.path('quads.ply', data))
+        self.assertEqual(len(mesh), 12)
+        self.assertTrue(np.allclose(mesh.faceAreas().sum(), 6))
+        self.assertEqual(mesh.weld().vertices.shape, (8, 3))
+
+        # ASCII PLY
+        header = ['ply', 'format ascii 1.0', 'element vertex 8', 'property float x', 'property float y', 'property float z', 'element face 12', 'property list uchar int vertex_indices', 'end_header']
+        lines = header + ['%g %g %g' % tuple(v) for v in CORNERS] + ['3 %i %i %i' % tuple(f) for f in FACES]
+        self.assertCube(robomesh.readMesh(self.path('ascii.ply', '\n'.join(lines).encode())))
+
+    def test_obj(self):
+        lines = ['# cube', 'o cube'] + ['v %g %g %g' % tuple(v) for v in CORNERS] + ['vn 0 0 1']
+        lines += ['f %i//1 %i//1 %i//1' % tuple(i + 1 for i in f) for f in FACES[:6]]
+        lines += ['f %i %i %i' % tuple(i - 8 for i in f) for f in FACES[6:]]
+        self.assertCube(robomesh.readMesh(self.path('cube.obj', '\n'.join(lines).encode())))
+
+        with self.assertRaises(Exception):
+            robomesh.readMesh(self.path('cube.3mf', b''))
+
+    def test_addshape(self):
+        from fake_robodk import FakeRoboDK
+        server = FakeRoboDK().start()
+        rdk = robolink.Robolink(robodk_ip='127.0.0.1', port=server.port)
+        try:
+            item = rdk.AddShape(self.cube.triangles(normals=True))
+            n1, n2, values, color = server.items[item.item].shapes[0]
+            self.assertEqual((n1, n2), (6, 36))
+            self.assertTrue(np.allclose(values, self.cube.triangles(normals=True).ravel()))
+
+            # Simplified before they are added
+            grid = np.random.default_rng(2).uniform(0, 100, (3000, 3))
+            item = rdk.AddShape([robomesh.Mesh(grid).triangles(), [1, 0, 0, 1]], max_triangles=50)
+            n1, n2, values, color = server.items[item.item].shapes[-1]
+            self.assertEqual(n1, 3)
+            self.assertLessEqual(n2, 150)
+            self.assertEqual(color, [1, 0, 0, 1])
+
+            item = item.AddPoints(grid, voxel_size=50)
+            n1, n2, values, color = server.items[item.item].shapes[-1]
+            self.assertEqual((n1, n2), (3, 8))
+        finally:
+            rdk.Disconnect()
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()